@@ -0,0 +1,8 @@
+"""Throughput benchmarks for the extraction pipelines against the offline LLM stand-in."""
+
+from amplifier.benchmarks.metrics import BenchmarkResult
+from amplifier.benchmarks.metrics import StageTimer
+from amplifier.benchmarks.metrics import find_regressions
+from amplifier.benchmarks.runner import main as run_benchmarks
+
+__all__ = ["BenchmarkResult", "StageTimer", "find_regressions", "run_benchmarks"]
@@ -0,0 +1,6 @@
+"""Entry point for the pipeline benchmarks."""
+
+from .runner import main
+
+if __name__ == "__main__":
+    main()
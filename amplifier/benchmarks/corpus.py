@@ -0,0 +1,79 @@
+"""Deterministic synthetic markdown inputs for the benchmarks."""
+
+import random
+from pathlib import Path
+
+_WORDS = [
+    "agent",
+    "architecture",
+    "batch",
+    "boundary",
+    "cache",
+    "client",
+    "concurrency",
+    "context",
+    "contract",
+    "cost",
+    "data",
+    "design",
+    "event",
+    "extraction",
+    "feedback",
+    "graph",
+    "index",
+    "insight",
+    "interface",
+    "knowledge",
+    "latency",
+    "memory",
+    "model",
+    "module",
+    "pattern",
+    "pipeline",
+    "pool",
+    "prompt",
+    "queue",
+    "resilience",
+    "retry",
+    "schema",
+    "session",
+    "stage",
+    "storage",
+    "stream",
+    "synthesis",
+    "system",
+    "test",
+    "throughput",
+    "token",
+    "tool",
+    "trade-off",
+    "workflow",
+]
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(8, 20))).capitalize() + "."
+
+
+def write_corpus(directory: Path, count: int, seed: int = 0, sections: int = 6) -> list[Path]:
+    """Write ``count`` markdown articles with headings, paragraphs, lists and code blocks.
+
+    Returns:
+        Paths of the written files, in order
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    files = []
+    for index in range(count):
+        title = f"{rng.choice(_WORDS).title()} {rng.choice(_WORDS)} notes {index + 1}"
+        parts = [f"# {title}", _sentence(rng)]
+        for section in range(sections):
+            parts.append(f"## {rng.choice(_WORDS).title()} {rng.choice(_WORDS)} {section + 1}")
+            parts.extend(" ".join(_sentence(rng) for _ in range(rng.randint(3, 6))) for _ in range(2))
+            parts.append("\n".join(f"- {_sentence(rng)}" for _ in range(3)))
+            if section % 2 == 0:
+                parts.append(f"```python\ndef {rng.choice(_WORDS).replace('-', '_')}_{section}(x):\n    return x\n```")
+        path = directory / f"article_{index + 1:04d}.md"
+        path.write_text("\n\n".join(parts) + "\n", encoding="utf-8")
+        files.append(path)
+    return files
@@ -0,0 +1,131 @@
+"""Measurements collected by a benchmark run and the regression check against a baseline."""
+
+import math
+import resource
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from functools import wraps
+from pathlib import Path
+from typing import Any
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile, 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class StageTimer:
+    """Durations of individual operations grouped by stage name."""
+
+    def __init__(self):
+        self.durations: dict[str, list[float]] = {}
+
+    def record(self, stage: str, seconds: float) -> None:
+        self.durations.setdefault(stage, []).append(seconds)
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    @contextmanager
+    def wrap(self, owner: Any, method: str, stage: str) -> Iterator[None]:
+        """Time every call of an async method on a class or instance while the block runs."""
+        original = getattr(owner, method)
+
+        @wraps(original)
+        async def timed(*args, **kwargs):
+            with self.time(stage):
+                return await original(*args, **kwargs)
+
+        setattr(owner, method, timed)
+        try:
+            yield
+        finally:
+            setattr(owner, method, original)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        return {
+            stage: {
+                "count": len(values),
+                "p50_ms": round(percentile(values, 50) * 1000, 1),
+                "p95_ms": round(percentile(values, 95) * 1000, 1),
+            }
+            for stage, values in sorted(self.durations.items())
+        }
+
+
+@dataclass
+class BenchmarkResult:
+    """Outcome of one pipeline benchmark."""
+
+    name: str
+    unit: str
+    items: int
+    seconds: float
+    items_per_sec: float
+    peak_rss_mb: float
+    bytes_written: int  # Growth of the benchmark's working directory during the run
+    llm_calls: int
+    llm_errors: int
+    stages: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BenchmarkResult":
+        return cls(**data)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def dir_bytes(path: Path) -> int:
+    """Total size of the files under a directory."""
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def find_regressions(
+    results: list[BenchmarkResult], baseline: dict[str, BenchmarkResult], max_regression: float
+) -> list[str]:
+    """Metrics that got worse than the baseline by more than ``max_regression`` (a fraction).
+
+    Throughput may not drop, and stage p95 latency, peak RSS and bytes written
+    may not grow, beyond the allowance. Benchmarks missing from the baseline
+    are not checked.
+    """
+    problems = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        if result.items_per_sec < base.items_per_sec * (1 - max_regression):
+            problems.append(
+                f"{result.name}: {result.unit}/sec {result.items_per_sec:.2f} < baseline {base.items_per_sec:.2f}"
+            )
+        checks = [("peak RSS MB", result.peak_rss_mb, base.peak_rss_mb)]
+        checks.append(("bytes written", result.bytes_written, base.bytes_written))
+        for stage, stats in result.stages.items():
+            if stage in base.stages:
+                checks.append((f"{stage} p95 ms", stats["p95_ms"], base.stages[stage]["p95_ms"]))
+        for metric, value, base_value in checks:
+            if base_value and value > base_value * (1 + max_regression):
+                problems.append(f"{result.name}: {metric} {value} > baseline {base_value}")
+    return problems
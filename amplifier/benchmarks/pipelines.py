@@ -0,0 +1,79 @@
+"""The pipelines the suite can run, each against a synthetic corpus and the offline LLM stand-in."""
+
+from collections.abc import Awaitable
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .metrics import StageTimer
+
+
+@dataclass
+class BenchContext:
+    """What a pipeline benchmark gets to work with."""
+
+    workdir: Path  # Current directory of the worker, also holds the data directory
+    corpus_dir: Path
+    items: int
+    concurrency: int
+    strategy: str
+    timer: StageTimer
+
+
+async def article_processor(ctx: BenchContext) -> int:
+    """ArticleProcessor.process_articles over the corpus."""
+    from amplifier.content_loader import ContentLoader
+    from amplifier.knowledge_synthesis.article_processor import ArticleProcessor
+
+    articles = list(ContentLoader().load_all(quiet=True))
+    processor = ArticleProcessor(strategy=ctx.strategy)
+    with ctx.timer.wrap(processor, "_extract_article", "extract article"):
+        await processor.process_articles(articles, concurrency=ctx.concurrency)
+    return len(articles)
+
+
+async def knowledge_sync(ctx: BenchContext) -> int:
+    """The ``knowledge_synthesis sync`` command: content scan, status checks, extraction and events."""
+    from amplifier.knowledge_synthesis.article_processor import ArticleProcessor
+    from amplifier.knowledge_synthesis.cli import _sync_content_resilient
+
+    with ctx.timer.wrap(ArticleProcessor, "_extract_article", "extract article"):
+        await _sync_content_resilient(None, retry_partial=True, strategy=ctx.strategy, concurrency=ctx.concurrency)
+    return ctx.items
+
+
+async def idea_synthesis(ctx: BenchContext) -> int:
+    """The idea_synthesis example: summarize, synthesize themes, expand."""
+    from amplifier.ccsdk_toolkit.examples.idea_synthesis.cli import run_synthesis
+
+    await run_synthesis(
+        directory=ctx.corpus_dir,
+        pattern="*.md",
+        recursive=True,
+        limit=None,
+        resume_id=None,
+        output_dir=ctx.workdir / "idea_synthesis_output",
+        json_output=True,
+        verbose=False,
+        notify=False,
+    )
+    return ctx.items
+
+
+async def tips_synthesizer(ctx: BenchContext) -> int:
+    """The tips_synthesizer scenario without human review checkpoints."""
+    from scenarios.tips_synthesizer.synthesizer import TipsSynthesizer
+
+    synthesizer = TipsSynthesizer(
+        input_dir=ctx.corpus_dir, output_file=ctx.workdir / "tips.md", max_iterations=2, interactive=False
+    )
+    await synthesizer.run()
+    return ctx.items
+
+
+BENCHMARKS: dict[str, tuple[str, Callable[[BenchContext], Awaitable[int]]]] = {
+    "article_processor": ("articles", article_processor),
+    "knowledge_sync": ("articles", knowledge_sync),
+    "idea_synthesis": ("files", idea_synthesis),
+    "tips_synthesizer": ("files", tips_synthesizer),
+}
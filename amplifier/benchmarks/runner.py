@@ -0,0 +1,211 @@
+"""
+Benchmark Runner
+
+Runs each pipeline benchmark in its own worker process (so peak RSS belongs to
+one pipeline) against a fresh data directory, a synthetic corpus and the
+offline LLM stand-in, then prints throughput, per-stage latency, memory and
+disk figures. With ``--baseline`` it doubles as a CI perf gate.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import click
+
+from .corpus import write_corpus
+from .metrics import BenchmarkResult
+from .metrics import StageTimer
+from .metrics import dir_bytes
+from .metrics import find_regressions
+from .metrics import peak_rss_mb
+from .pipelines import BENCHMARKS
+from .pipelines import BenchContext
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@click.group()
+def cli():
+    """Throughput benchmarks for the extraction pipelines, no live Claude calls."""
+
+
+@cli.command("list")
+def list_benchmarks():
+    """List the available benchmarks."""
+    for name, (unit, run) in BENCHMARKS.items():
+        click.echo(f"{name:20} {unit:9} {(run.__doc__ or '').strip()}")
+
+
+@cli.command()
+@click.argument("names", nargs=-1, type=click.Choice(list(BENCHMARKS)))
+@click.option("--items", default=20, type=click.IntRange(min=1), help="Corpus size (default: 20)")
+@click.option("--concurrency", default=4, type=click.IntRange(min=1), help="Articles in flight (default: 4)")
+@click.option("--strategy", default="focused", type=click.Choice(["focused", "combined", "hybrid"]))
+@click.option("--latency", default="lognormal:0.05,0.5", help="Offline time to first token distribution")
+@click.option("--tokens-per-second", default=4000.0, help="Offline streaming rate")
+@click.option("--connect-seconds", default=0.02, help="Offline client start-up time")
+@click.option("--error-rate", default=0.0, help="Offline probability of a failed response")
+@click.option("--seed", default=0, help="Seed for the corpus and the offline stand-in")
+@click.option("--output", type=click.Path(path_type=Path), help="Write results as JSON")
+@click.option("--baseline", type=click.Path(exists=True, path_type=Path), help="Fail on regressions against this")
+@click.option("--max-regression", default=0.25, help="Allowed fraction of regression against the baseline")
+@click.option("--keep", is_flag=True, help="Keep the working directories")
+@click.option("--verbose", is_flag=True, help="Show worker output")
+def run(
+    names: tuple[str, ...],
+    items: int,
+    concurrency: int,
+    strategy: str,
+    latency: str,
+    tokens_per_second: float,
+    connect_seconds: float,
+    error_rate: float,
+    seed: int,
+    output: Path | None,
+    baseline: Path | None,
+    max_regression: float,
+    keep: bool,
+    verbose: bool,
+):
+    """Run benchmarks (default: all) and report articles/sec, p95 per stage, peak RSS and bytes written.
+
+    The defaults model a fast backend so a run takes seconds; use --latency
+    lognormal:1.5,0.5 --tokens-per-second 150 for production-like timings.
+    """
+    env = {
+        **os.environ,
+        "AMPLIFIER_LLM_BACKEND": "offline",
+        "AMPLIFIER_OFFLINE_LATENCY": latency,
+        "AMPLIFIER_OFFLINE_TOKENS_PER_SECOND": str(tokens_per_second),
+        "AMPLIFIER_OFFLINE_CONNECT_SECONDS": str(connect_seconds),
+        "AMPLIFIER_OFFLINE_ERROR_RATE": str(error_rate),
+        "AMPLIFIER_OFFLINE_SEED": str(seed),
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")])),
+    }
+
+    results = []
+    failed = []
+    for name in names or BENCHMARKS:
+        workdir = Path(tempfile.mkdtemp(prefix=f"amplifier-bench-{name}-"))
+        result_file = workdir / "result.json"
+        worker_env = {
+            **env,
+            "AMPLIFIER_DATA_DIR": str(workdir / "data"),
+            "AMPLIFIER_CONTENT_DIRS": str(workdir / "corpus"),
+        }
+        command = [sys.executable, "-m", "amplifier.benchmarks", "worker", name, "--result", str(result_file)]
+        command += ["--items", str(items), "--concurrency", str(concurrency), "--strategy", strategy]
+        command += ["--seed", str(seed)]
+
+        click.echo(f"Running {name}...", err=True)
+        output_target = None if verbose else subprocess.DEVNULL
+        completed = subprocess.run(command, cwd=workdir, env=worker_env, stdout=output_target, stderr=output_target)
+        if completed.returncode == 0 and result_file.exists():
+            results.append(BenchmarkResult.from_dict(json.loads(result_file.read_text())))
+        else:
+            failed.append(name)
+            click.echo(f"  {name} failed (exit {completed.returncode}), rerun with --verbose --keep", err=True)
+
+        if keep:
+            click.echo(f"  Working directory: {workdir}", err=True)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    _print_results(results)
+
+    if output:
+        output.write_text(json.dumps({r.name: r.to_dict() for r in results}, indent=2))
+        click.echo(f"\nResults written to {output}")
+
+    regressions = []
+    if baseline:
+        base = {name: BenchmarkResult.from_dict(data) for name, data in json.loads(baseline.read_text()).items()}
+        regressions = find_regressions(results, base, max_regression)
+        if regressions:
+            click.echo(f"\nRegressions beyond {max_regression:.0%} of {baseline}:")
+            for problem in regressions:
+                click.echo(f"  ✗ {problem}")
+        else:
+            click.echo(f"\nNo regressions beyond {max_regression:.0%} of {baseline}")
+
+    if failed or regressions:
+        sys.exit(1)
+
+
+@cli.command(hidden=True)
+@click.argument("name", type=click.Choice(list(BENCHMARKS)))
+@click.option("--result", "result_file", required=True, type=click.Path(path_type=Path))
+@click.option("--items", default=20)
+@click.option("--concurrency", default=4)
+@click.option("--strategy", default="focused")
+@click.option("--seed", default=0)
+def worker(name: str, result_file: Path, items: int, concurrency: int, strategy: str, seed: int):
+    """Run one benchmark in this process (started by ``run``)."""
+    from amplifier.ccsdk_toolkit.core.offline import get_offline_llm
+    from amplifier.ccsdk_toolkit.core.offline import offline_enabled
+    from amplifier.ccsdk_toolkit.core.pool import run_pooled
+
+    if not offline_enabled():
+        raise click.ClickException("Benchmarks only run against the offline stand-in (AMPLIFIER_LLM_BACKEND=offline)")
+
+    workdir = Path.cwd()
+    unit, pipeline = BENCHMARKS[name]
+    ctx = BenchContext(
+        workdir=workdir,
+        corpus_dir=workdir / "corpus",
+        items=items,
+        concurrency=concurrency,
+        strategy=strategy,
+        timer=StageTimer(),
+    )
+    write_corpus(ctx.corpus_dir, items, seed)
+
+    bytes_before = dir_bytes(workdir)
+    started = time.perf_counter()
+    processed = asyncio.run(run_pooled(pipeline(ctx)))
+    seconds = time.perf_counter() - started
+
+    calls = get_offline_llm().calls
+    for call in calls:
+        if not call.error:
+            ctx.timer.record(f"llm: {call.label[:40]}", call.seconds)
+
+    result = BenchmarkResult(
+        name=name,
+        unit=unit,
+        items=processed,
+        seconds=round(seconds, 3),
+        items_per_sec=round(processed / seconds, 3) if seconds else 0.0,
+        peak_rss_mb=peak_rss_mb(),
+        bytes_written=dir_bytes(workdir) - bytes_before,
+        llm_calls=len(calls),
+        llm_errors=sum(call.error for call in calls),
+        stages=ctx.timer.summary(),
+    )
+    result_file.write_text(json.dumps(result.to_dict(), indent=2))
+
+
+def _print_results(results: list[BenchmarkResult]) -> None:
+    for result in results:
+        click.echo(f"\n{result.name}")
+        click.echo(
+            f"  {result.items} {result.unit} in {result.seconds:.2f}s = {result.items_per_sec:.2f} {result.unit}/sec"
+        )
+        click.echo(
+            f"  peak RSS {result.peak_rss_mb:.1f} MB · {result.bytes_written / 1024:.1f} KB written · "
+            f"{result.llm_calls} LLM calls ({result.llm_errors} failed)"
+        )
+        for stage, stats in result.stages.items():
+            latency = f"p50 {stats['p50_ms']:>8.1f} ms  p95 {stats['p95_ms']:>8.1f} ms"
+            click.echo(f"  {stage:52} n={stats['count']:<5} {latency}")
+
+
+def main():
+    cli()
@@ -33,14 +33,31 @@ from .config import MCPServerConfig
 from .config import ToolConfig
 from .config import ToolkitConfig
 from .config import ToolPermissions
+from .core import CacheStats
 from .core import CCSDKSession
 from .core import ClaudeSession
+from .core import ClientPool
+from .core import LaneConfig
+from .core import LaneMetrics
+from .core import LLMGovernor
+from .core import PoolStats
+from .core import Priority
+from .core import ResponseCache
 from .core import SDKNotAvailableError
 from .core import SessionError
 from .core import SessionOptions
 from .core import SessionResponse
+from .core import UsageStats
+from .core import cache_key_excludes
 from .core import check_claude_cli
+from .core import get_client_pool
+from .core import get_governor
+from .core import get_response_cache
+from .core import query_claude
 from .core import query_with_retry
+from .core import run_pooled
+from .core import set_response_cache
+from .core import track_usage
 from .logger import LogEvent
 from .logger import LogFormat
 from .logger import LogLevel
@@ -64,6 +81,26 @@ __all__ = [
     "SDKNotAvailableError",
     "check_claude_cli",
     "query_with_retry",
+    "query_claude",
+    "UsageStats",
+    "track_usage",
+    "cache_key_excludes",
+    # Response cache
+    "ResponseCache",
+    "CacheStats",
+    "get_response_cache",
+    "set_response_cache",
+    # Client pool
+    "ClientPool",
+    "PoolStats",
+    "get_client_pool",
+    "run_pooled",
+    # Concurrency governor
+    "LLMGovernor",
+    "LaneConfig",
+    "LaneMetrics",
+    "Priority",
+    "get_governor",
     # Config
     "AgentConfig",
     "AgentDefinition",
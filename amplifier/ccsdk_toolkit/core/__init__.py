@@ -10,8 +10,30 @@ Basic Usage:
     ...     response = await session.query("Hello!")
 """
 
+from .cache import CacheStats
+from .cache import ResponseCache
+from .cache import get_response_cache
+from .cache import set_response_cache
+from .client import UsageStats
+from .client import cache_key_excludes
+from .client import query_claude
+from .client import track_usage
+from .governor import LaneConfig
+from .governor import LaneMetrics
+from .governor import LLMGovernor
+from .governor import Priority
+from .governor import get_governor
 from .models import SessionOptions
 from .models import SessionResponse
+from .offline import OfflineClaudeClient
+from .offline import OfflineLLM
+from .offline import OfflineLLMConfig
+from .offline import get_offline_llm
+from .offline import offline_enabled
+from .pool import ClientPool
+from .pool import PoolStats
+from .pool import get_client_pool
+from .pool import run_pooled
 from .session import ClaudeSession
 from .session import ClaudeSession as CCSDKSession  # Alias for requested naming
 from .session import SDKNotAvailableError
@@ -28,4 +50,26 @@ __all__ = [
     "SessionOptions",
     "check_claude_cli",
     "query_with_retry",
+    "query_claude",
+    "UsageStats",
+    "track_usage",
+    "cache_key_excludes",
+    "ResponseCache",
+    "CacheStats",
+    "get_response_cache",
+    "set_response_cache",
+    "ClientPool",
+    "PoolStats",
+    "get_client_pool",
+    "run_pooled",
+    "LLMGovernor",
+    "LaneConfig",
+    "LaneMetrics",
+    "Priority",
+    "get_governor",
+    "OfflineClaudeClient",
+    "OfflineLLM",
+    "OfflineLLMConfig",
+    "get_offline_llm",
+    "offline_enabled",
 ]
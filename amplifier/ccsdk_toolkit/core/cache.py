@@ -0,0 +1,238 @@
+"""Content-addressed cache for Claude responses.
+
+Responses are stored in SQLite keyed by a hash of everything that determines
+the answer (model, system prompt, max turns, conversation context, prompt).
+A crash/resume, a re-sync or a re-run with unchanged prompts is answered from
+disk instead of paying for another model call.
+
+Configuration:
+    AMPLIFIER_LLM_CACHE=off       Bypass the cache for the whole process
+    AMPLIFIER_LLM_CACHE_PATH=...  Database location (default: <data dir>/cache/llm_responses.db)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from amplifier.utils.sqlite_utils import connect
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every cached response when the key layout changes
+CACHE_VERSION = 1
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 50_000
+# Evict at most once per this many writes
+EVICT_EVERY = 100
+
+_DISABLED_VALUES = {"0", "off", "false", "no", "disabled"}
+
+
+def cache_key(
+    prompt: str,
+    system_prompt: str | None = None,
+    max_turns: int | None = None,
+    model: str | None = None,
+    context: str = "",
+) -> str:
+    """Stable hash of everything that determines a response.
+
+    Args:
+        prompt: The user prompt
+        system_prompt: System prompt the client was configured with
+        max_turns: Turn limit the client was configured with
+        model: Model name, None for the CLI default
+        context: Digest of earlier turns in the same conversation, if any
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps([CACHE_VERSION, model or "", system_prompt or "", max_turns, context, prompt])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for one cache instance plus on-disk totals."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    entries: int = 0
+    lifetime_hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL and LRU size eviction.
+
+    Safe to share between asyncio tasks and threads of one process, and
+    between processes through SQLite's own locking.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: Entries older than this are treated as misses and evicted
+            max_entries: Least recently used entries beyond this count are evicted
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn = connect(self.path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                metadata TEXT NOT NULL DEFAULT '{}',
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+            CREATE INDEX IF NOT EXISTS idx_responses_created ON responses(created_at);
+            """
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> tuple[str, dict[str, Any]] | None:
+        """Return (response, metadata) for a key, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, metadata, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row["created_at"] > self.ttl_seconds:
+                self._stats.misses += 1
+                return None
+
+            self._conn.execute("UPDATE responses SET accessed_at = ?, hits = hits + 1 WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._stats.hits += 1
+            return row["response"], json.loads(row["metadata"])
+
+    def put(self, key: str, response: str, metadata: dict[str, Any] | None = None) -> None:
+        """Store a response, replacing any previous entry for the key."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO responses (key, response, metadata, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    response = excluded.response, metadata = excluded.metadata,
+                    created_at = excluded.created_at, accessed_at = excluded.accessed_at
+                """,
+                (key, response, json.dumps(metadata or {}, default=str), now, now),
+            )
+            self._stats.writes += 1
+            if self._stats.writes % EVICT_EVERY == 1:
+                self._evict(now)
+            self._conn.commit()
+
+    def discard(self, key: str) -> None:
+        """Remove one entry, e.g. after the caller found the response unusable."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def evict(self) -> int:
+        """Drop expired entries and trim to ``max_entries``. Returns the number removed."""
+        with self._lock:
+            removed = self._evict(time.time())
+            self._conn.commit()
+            return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self) -> CacheStats:
+        """Counters for this process plus entry and hit totals from disk."""
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM responses").fetchone()
+        return CacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            writes=self._stats.writes,
+            evictions=self._stats.evictions,
+            entries=row[0],
+            lifetime_hits=row[1],
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self, now: float) -> int:
+        removed = self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,)).rowcount
+        excess = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+        if excess > 0:
+            removed += self._conn.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            ).rowcount
+        if removed:
+            logger.debug(f"Evicted {removed} cached responses")
+        self._stats.evictions += removed
+        return removed
+
+
+_default_cache: ResponseCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    """False when the cache is bypassed with AMPLIFIER_LLM_CACHE=off."""
+    return os.getenv("AMPLIFIER_LLM_CACHE", "on").strip().lower() not in _DISABLED_VALUES
+
+
+def default_cache_path() -> Path:
+    env_path = os.getenv("AMPLIFIER_LLM_CACHE_PATH")
+    if env_path:
+        return Path(env_path)
+
+    from amplifier.config.paths import paths
+
+    return paths.data_dir / "cache" / "llm_responses.db"
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Process-wide response cache, or None when bypassed."""
+    global _default_cache
+    if not cache_enabled():
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache(default_cache_path())
+        return _default_cache
+
+
+def set_response_cache(cache: ResponseCache | None) -> None:
+    """Replace the process-wide cache, None reopens the default database on next use."""
+    global _default_cache
+    with _default_cache_lock:
+        _default_cache = cache
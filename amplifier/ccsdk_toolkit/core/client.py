@@ -0,0 +1,217 @@
+"""One-shot Claude queries shared by the toolkit and the extraction pipelines."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import asynccontextmanager
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from ..defensive.streaming_json import ItemCallback
+from ..defensive.streaming_json import StreamingJSONParser
+from .cache import cache_key
+from .cache import get_response_cache
+from .governor import Priority
+from .governor import estimate_tokens
+from .governor import get_governor
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class UsageStats:
+    """Claude calls made inside a ``track_usage()`` block."""
+
+    calls: int = 0
+    cached: int = 0
+    prompt_tokens: int = 0  # Estimated, system prompt included
+    cost_usd: float = 0.0
+
+    def record(self, prompt_tokens: int, metadata: dict[str, Any], cached: bool = False) -> None:
+        if cached:
+            self.cached += 1
+            return
+        self.calls += 1
+        self.prompt_tokens += prompt_tokens
+        self.cost_usd += metadata.get("total_cost_usd") or 0.0
+
+
+_current_usage: ContextVar[UsageStats | None] = ContextVar("claude_usage", default=None)
+
+
+@contextmanager
+def track_usage() -> Iterator[UsageStats]:
+    """Count the Claude calls made in this block, including tasks it starts.
+
+    Usage:
+        >>> with track_usage() as usage:
+        ...     await extract(article)
+        >>> usage.calls, usage.cost_usd
+    """
+    usage = UsageStats()
+    token = _current_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _current_usage.reset(token)
+
+
+_cache_key_excludes: ContextVar[str] = ContextVar("claude_cache_key_excludes", default="")
+
+
+@contextmanager
+def cache_key_excludes(text: str) -> Iterator[None]:
+    """Key responses to prompts sent in this block, including by tasks it starts, as if ``text`` were not in them.
+
+    For context repeated from a neighbouring request, such as the overlap
+    between document chunks, which should not turn a cached answer into a miss.
+    """
+    token = _cache_key_excludes.set(text)
+    try:
+        yield
+    finally:
+        _cache_key_excludes.reset(token)
+
+
+def record_usage(prompt_tokens: int, metadata: dict[str, Any], cached: bool = False) -> None:
+    """Add one call to the innermost active ``track_usage()`` block, if any."""
+    usage = _current_usage.get()
+    if usage is not None:
+        usage.record(prompt_tokens, metadata, cached)
+
+
+async def collect_response(client: Any, on_text: Callable[[str], None] | None = None) -> tuple[str, dict[str, Any]]:
+    """Drain ``client.receive_response()`` into (text, metadata).
+
+    Args:
+        client: Connected ClaudeSDKClient that has been sent a query
+        on_text: Called with every text block as it arrives
+
+    Returns:
+        Concatenated text and ResultMessage metadata (session_id, cost, duration)
+    """
+    chunks: list[str] = []
+    metadata: dict[str, Any] = {}
+
+    async for message in client.receive_response():
+        content = getattr(message, "content", None)
+        if isinstance(content, list):
+            for block in content:
+                text = getattr(block, "text", "")
+                if text:
+                    chunks.append(text)
+                    if on_text:
+                        on_text(text)
+
+        if message.__class__.__name__ == "ResultMessage":
+            for field in ("session_id", "total_cost_usd", "duration_ms"):
+                if hasattr(message, field):
+                    metadata[field] = getattr(message, field)
+
+    return "".join(chunks), metadata
+
+
+@asynccontextmanager
+async def _admitted(model: str | None, priority: int, tokens: int, timeout: float | None) -> AsyncIterator[None]:
+    """A governor slot, with the request's deadline starting once the slot is granted."""
+    async with get_governor().slot(model, priority, tokens), asyncio.timeout(timeout):
+        yield
+
+
+async def query_claude(
+    prompt: str,
+    *,
+    system_prompt: str,
+    max_turns: int = 1,
+    model: str | None = None,
+    use_cache: bool = True,
+    validate: Callable[[str], Any] | None = None,
+    priority: int = Priority.EXTRACTION,
+    on_item: ItemCallback | None = None,
+    timeout: float | None = None,
+) -> str:
+    """Send a single prompt to Claude and return the response text.
+
+    Runs on a warm client when a ``ClientPool`` is active, otherwise on a
+    fresh client that is closed afterwards, and always inside a slot from the
+    process-wide governor. Identical requests are answered from the response
+    cache. Only non-empty responses that pass ``validate`` are cached, so a
+    malformed answer is retried on the next run instead of being replayed
+    forever. Rejected responses are still returned for the caller's own
+    error handling.
+
+    Args:
+        prompt: The prompt to send
+        system_prompt: System prompt for the client
+        max_turns: Maximum conversation turns
+        model: Model name, None for the CLI default
+        use_cache: Set False to bypass the cache for this call
+        validate: Called with the response text, raise to keep it out of the cache
+        priority: Governor priority class, lower is served first
+        on_item: Called with (key, element) for each array element of the JSON
+            response as soon as it is complete, see ``StreamingJSONParser``
+        timeout: Seconds the request may take once the governor admits it, None for no limit;
+            time spent queued for a slot does not count
+
+    Returns:
+        Response text (may be empty if the SDK returned nothing)
+
+    Raises:
+        ImportError: claude_code_sdk is not installed
+        TimeoutError: The request ran longer than ``timeout``
+    """
+    cache = get_response_cache() if use_cache else None
+    excluded = _cache_key_excludes.get()
+    key = cache_key(prompt.replace(excluded, "", 1) if excluded else prompt, system_prompt, max_turns, model)
+    tokens = estimate_tokens(system_prompt, prompt)
+    parser = StreamingJSONParser(on_item) if on_item else None
+
+    def on_text(text: str) -> None:
+        if parser:
+            parser.feed(text)
+
+    if cache:
+        cached = cache.get(key)
+        if cached is not None:
+            record_usage(tokens, cached[1], cached=True)
+            on_text(cached[0])
+            return cached[0]
+
+    from .pool import get_client_pool
+
+    pool = get_client_pool()
+    if pool:
+        # The slot is taken once a client is leased, never the other way round
+        response, metadata = await pool.query(
+            prompt,
+            system_prompt=system_prompt,
+            max_turns=max_turns,
+            model=model,
+            on_text=on_text,
+            admit=lambda: _admitted(model, priority, tokens, timeout),
+        )
+    else:
+        async with _admitted(model, priority, tokens, timeout):
+            from claude_code_sdk import ClaudeCodeOptions
+
+            from .offline import get_client_class
+
+            options = ClaudeCodeOptions(system_prompt=system_prompt, max_turns=max_turns, model=model)
+            async with get_client_class()(options=options) as client:
+                await client.query(prompt)
+                response, metadata = await collect_response(client, on_text)
+
+    record_usage(tokens, metadata)
+    if cache and response.strip():
+        try:
+            if validate:
+                validate(response)
+        except Exception as e:
+            logger.debug(f"Not caching rejected response: {e}")
+        else:
+            cache.put(key, response, metadata)
+    return response
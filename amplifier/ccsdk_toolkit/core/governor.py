@@ -0,0 +1,269 @@
+"""Process-wide concurrency governor and rate limiter for Claude calls.
+
+Every LLM call in the process takes a slot from one governor before it runs:
+
+- Each model has its own lane: an AIMD concurrency limit, a priority queue
+  of waiters, and token buckets for requests and estimated tokens per minute
+- The concurrency limit grows by one per window of successful calls and is
+  halved on timeouts and errors (at most once per cooldown)
+- Waiters are served by priority class, classification ahead of bulk work
+- Retry helpers ask the governor for their delay, so independent retry loops
+  back off together while a lane is congested
+
+Configuration (defaults for every model):
+    AMPLIFIER_LLM_MAX_CONCURRENCY      Upper bound for the adaptive limit (default: 8)
+    AMPLIFIER_LLM_REQUESTS_PER_MINUTE  Request rate limit (default: unlimited)
+    AMPLIFIER_LLM_TOKENS_PER_MINUTE    Estimated token rate limit (default: unlimited)
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from enum import IntEnum
+
+logger = logging.getLogger(__name__)
+
+# Latency samples kept per lane for percentiles
+LATENCY_WINDOW = 500
+
+
+class Priority(IntEnum):
+    """Priority classes, lower values are served first."""
+
+    CLASSIFICATION = 0
+    INTERACTIVE = 1
+    EXTRACTION = 2
+    BULK = 3
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return sum(len(text) for text in texts) // 4
+
+
+def _env_float(name: str) -> float | None:
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+@dataclass
+class LaneConfig:
+    """Limits for one model lane.
+
+    Attributes:
+        initial_concurrency: Starting concurrency limit
+        min_concurrency: The limit never drops below this
+        max_concurrency: The limit never grows above this
+        requests_per_minute: Request rate limit, None for unlimited
+        tokens_per_minute: Estimated token rate limit, None for unlimited
+        decrease_factor: Multiplier applied to the limit on failure
+        cooldown: Seconds after a decrease during which failures don't decrease again
+    """
+
+    initial_concurrency: int = 4
+    min_concurrency: int = 1
+    max_concurrency: int = field(default_factory=lambda: int(os.getenv("AMPLIFIER_LLM_MAX_CONCURRENCY", "8")))
+    requests_per_minute: float | None = field(default_factory=lambda: _env_float("AMPLIFIER_LLM_REQUESTS_PER_MINUTE"))
+    tokens_per_minute: float | None = field(default_factory=lambda: _env_float("AMPLIFIER_LLM_TOKENS_PER_MINUTE"))
+    decrease_factor: float = 0.5
+    cooldown: float = 5.0
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of polling.
+
+    ``reserve`` always takes the tokens and returns how long the caller must
+    wait for them, so concurrent callers queue up in reservation order.
+    """
+
+    def __init__(self, per_minute: float | None, burst: float | None = None):
+        self.rate = per_minute / 60 if per_minute else None
+        self.capacity = burst if burst is not None else (per_minute or 0) / 6  # ten seconds of budget
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float) -> float:
+        """Take ``amount`` tokens, returning the seconds to wait before using them."""
+        if self.rate is None:
+            return 0.0
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        # A single request larger than the burst still goes through, it just waits longer
+        self.tokens -= amount
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+@dataclass
+class LaneMetrics:
+    """Snapshot of one model lane."""
+
+    model: str
+    limit: float
+    in_flight: int
+    queued: int
+    completed: int
+    failed: int
+    p50_ms: float
+    p95_ms: float
+
+
+class _Lane:
+    def __init__(self, model: str, config: LaneConfig):
+        self.model = model
+        self.config = config
+        self.limit = float(config.initial_concurrency)
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.last_decrease = 0.0
+        self.waiters: list[tuple[int, int, asyncio.Future]] = []
+        self.requests = TokenBucket(config.requests_per_minute)
+        self.tokens = TokenBucket(config.tokens_per_minute)
+        self.latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, future in self.waiters if not future.done())
+
+    def on_success(self, latency: float) -> None:
+        self.completed += 1
+        self.latencies.append(latency)
+        # Additive increase: +1 after a full window of successes at the current limit
+        self.limit = min(self.config.max_concurrency, self.limit + 1 / self.limit)
+
+    def on_failure(self, latency: float) -> None:
+        self.failed += 1
+        self.latencies.append(latency)
+        now = time.monotonic()
+        if now - self.last_decrease >= self.config.cooldown:
+            self.last_decrease = now
+            self.limit = max(self.config.min_concurrency, self.limit * self.config.decrease_factor)
+            logger.debug(f"LLM lane {self.model}: concurrency limit lowered to {self.limit:.1f}")
+
+    def cooldown_remaining(self) -> float:
+        return max(0.0, self.last_decrease + self.config.cooldown - time.monotonic())
+
+    def wake(self) -> None:
+        while self.waiters and self.in_flight < int(self.limit):
+            _, _, future = heapq.heappop(self.waiters)
+            if future.done():  # Cancelled while waiting
+                continue
+            self.in_flight += 1
+            future.set_result(None)
+
+    def percentile(self, q: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+
+class LLMGovernor:
+    """Admission control for every Claude call in the process."""
+
+    def __init__(self, default_config: LaneConfig | None = None):
+        self.default_config = default_config
+        self._configs: dict[str, LaneConfig] = {}
+        self._lanes: dict[str, _Lane] = {}
+        self._seq = itertools.count()
+
+    def configure(self, model: str | None, config: LaneConfig) -> None:
+        """Set limits for one model (None is the CLI default model)."""
+        key = model or "default"
+        self._configs[key] = config
+        self._lanes.pop(key, None)
+
+    @asynccontextmanager
+    async def slot(
+        self, model: str | None = None, priority: int = Priority.EXTRACTION, estimated_tokens: int = 0
+    ) -> AsyncIterator[None]:
+        """Wait for a concurrency slot and rate budget, then run the body.
+
+        The body's outcome drives the lane's concurrency limit: success raises
+        it, any exception (including cancellation by a caller's timeout)
+        lowers it.
+        """
+        lane = self._lane(model)
+        await self._acquire(lane, priority)
+        try:
+            wait = max(lane.requests.reserve(1), lane.tokens.reserve(estimated_tokens))
+            if wait:
+                await asyncio.sleep(wait)
+
+            started = time.perf_counter()
+            try:
+                yield
+            except BaseException:
+                lane.on_failure(time.perf_counter() - started)
+                raise
+            lane.on_success(time.perf_counter() - started)
+        finally:
+            lane.in_flight -= 1
+            lane.wake()
+
+    def retry_delay(self, attempt: int, base_delay: float = 1.0, model: str | None = None) -> float:
+        """Delay before retry ``attempt`` (0-based): exponential backoff with full jitter.
+
+        Never shorter than the lane's remaining cooldown, so retries don't
+        pile onto a model that just started failing.
+        """
+        delay = random.uniform(base_delay, base_delay * 2 ** (attempt + 1))
+        return max(delay, self._lane(model).cooldown_remaining())
+
+    def metrics(self) -> list[LaneMetrics]:
+        """Live per-model snapshot: limit, in-flight calls, queue depth and latency percentiles."""
+        return [
+            LaneMetrics(
+                model=lane.model,
+                limit=round(lane.limit, 2),
+                in_flight=lane.in_flight,
+                queued=lane.queued,
+                completed=lane.completed,
+                failed=lane.failed,
+                p50_ms=lane.percentile(0.5),
+                p95_ms=lane.percentile(0.95),
+            )
+            for lane in self._lanes.values()
+        ]
+
+    def _lane(self, model: str | None) -> _Lane:
+        key = model or "default"
+        lane = self._lanes.get(key)
+        if lane is None:
+            config = self._configs.get(key) or self.default_config or LaneConfig()
+            lane = self._lanes[key] = _Lane(key, config)
+        return lane
+
+    async def _acquire(self, lane: _Lane, priority: int) -> None:
+        if lane.in_flight < int(lane.limit) and not lane.queued:
+            lane.in_flight += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(lane.waiters, (priority, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted a slot just as we were cancelled, hand it on
+                lane.in_flight -= 1
+                lane.wake()
+            raise
+
+
+_governor = LLMGovernor()
+
+
+def get_governor() -> LLMGovernor:
+    """The process-wide governor."""
+    return _governor
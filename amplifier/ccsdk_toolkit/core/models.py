@@ -6,6 +6,8 @@ from typing import Any
 from pydantic import BaseModel
 from pydantic import Field
 
+from .governor import Priority
+
 
 class SessionOptions(BaseModel):
     """Configuration options for Claude sessions.
@@ -17,6 +19,9 @@ class SessionOptions(BaseModel):
         retry_delay: Initial retry delay in seconds (default: 1.0)
         stream_output: Enable real-time streaming output (default: False)
         progress_callback: Optional callback for progress updates
+        model: Model to use (default: the Claude CLI default)
+        use_cache: Answer repeated prompts from the response cache (default: True)
+        priority: Governor priority class, lower is served first (default: interactive)
     """
 
     system_prompt: str = Field(default="You are a helpful assistant")
@@ -29,6 +34,9 @@ class SessionOptions(BaseModel):
         description="Optional callback for progress updates",
         exclude=True,  # Exclude from serialization since callables can't be serialized
     )
+    model: str | None = Field(default=None, description="Model to use, None for the CLI default")
+    use_cache: bool = Field(default=True, description="Answer repeated prompts from the response cache")
+    priority: int = Field(default=Priority.INTERACTIVE, description="Governor priority class, lower is served first")
 
     class Config:
         json_schema_extra = {
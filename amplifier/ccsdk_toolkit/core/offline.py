@@ -0,0 +1,432 @@
+"""
+Offline stand-in for the Claude CLI client.
+
+With ``AMPLIFIER_LLM_BACKEND=offline`` every client the toolkit opens
+(``query_claude``, ``ClaudeSession``, ``ClientPool``) is an
+``OfflineClaudeClient``: no CLI process and no network, deterministic answers,
+and latency, streaming rate, errors and cost drawn from configurable
+distributions. This makes concurrency, caching and I/O behaviour of the
+pipelines measurable and testable without live calls.
+
+Answers are templated from the prompt: the last JSON example in the prompt is
+instantiated with generated values (lists get several elements, ``a|b|c``
+picks one option, ``0.0-1.0`` ranges get a number, ``true/false`` is true),
+a category list answers with one category, and anything else gets markdown
+prose. Fixtures override the template for prompts matching a regex.
+
+Environment:
+    AMPLIFIER_LLM_BACKEND=offline             Use the stand-in
+    AMPLIFIER_OFFLINE_LATENCY=lognormal:1,0.5 Seconds to first token: fixed:S, uniform:A,B or lognormal:MEDIAN,SIGMA
+    AMPLIFIER_OFFLINE_TOKENS_PER_SECOND=150   Streaming rate after the first token
+    AMPLIFIER_OFFLINE_CONNECT_SECONDS=0.3     Client start-up time (CLI process launch)
+    AMPLIFIER_OFFLINE_ERROR_RATE=0            Probability a response fails mid-stream
+    AMPLIFIER_OFFLINE_ITEMS=6                 Elements per generated JSON list
+    AMPLIFIER_OFFLINE_TEXT_TOKENS=400         Length of prose answers
+    AMPLIFIER_OFFLINE_SEED=0                  Seed for latencies, errors and content
+    AMPLIFIER_OFFLINE_FIXTURES=fixtures.jsonl Lines of {"match": regex, "response": text}
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+import re
+import time
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+from ..defensive.streaming_json import parse_first_json
+from .governor import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+BACKEND_ENV = "AMPLIFIER_LLM_BACKEND"
+
+_WORDS = [
+    "adaptive",
+    "agent",
+    "async",
+    "batch",
+    "boundary",
+    "cache",
+    "cluster",
+    "concurrency",
+    "contract",
+    "context",
+    "cost",
+    "dataflow",
+    "dependency",
+    "embedding",
+    "event",
+    "feedback",
+    "gateway",
+    "graph",
+    "index",
+    "isolation",
+    "journal",
+    "kernel",
+    "latency",
+    "ledger",
+    "lineage",
+    "memory",
+    "module",
+    "pipeline",
+    "planner",
+    "pool",
+    "priority",
+    "prompt",
+    "queue",
+    "quota",
+    "replay",
+    "resilience",
+    "retry",
+    "schema",
+    "session",
+    "shard",
+    "signal",
+    "snapshot",
+    "stage",
+    "storage",
+    "stream",
+    "synthesis",
+    "telemetry",
+    "throughput",
+    "token",
+    "topology",
+    "trace",
+    "vector",
+    "workflow",
+]
+
+_CHUNK_TOKENS = 16
+_RANGE = re.compile(r"(?<=:)(\s*)(-?\d+(?:\.\d+)?)\s*-\s*(-?\d+(?:\.\d+)?)")
+_BOOLEAN_CHOICE = re.compile(r"(?<=:)(\s*)(true|false)\s*[/|]\s*(?:true|false)")
+_CATEGORY_LINE = re.compile(r"^\s*-\s*([a-z][a-z0-9_]*)\s*:", re.MULTILINE)
+_OPENER = re.compile(r"^[ \t]*[\[{]", re.MULTILINE)
+
+
+class OfflineLLMError(RuntimeError):
+    """Failure injected by the offline stand-in."""
+
+
+def offline_enabled() -> bool:
+    """True when AMPLIFIER_LLM_BACKEND selects the offline stand-in."""
+    return os.getenv(BACKEND_ENV, "").strip().lower() == "offline"
+
+
+def get_client_class() -> type:
+    """Client class to open: ``OfflineClaudeClient`` or ``claude_code_sdk.ClaudeSDKClient``.
+
+    Raises:
+        ImportError: claude_code_sdk is not installed and the offline backend is not selected
+    """
+    if offline_enabled():
+        return OfflineClaudeClient
+    from claude_code_sdk import ClaudeSDKClient
+
+    return ClaudeSDKClient
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Parse ``fixed:S``, ``uniform:A,B`` or ``lognormal:MEDIAN,SIGMA`` into a sampler."""
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",") if v.strip()]
+    kind = kind.strip().lower()
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "lognormal" and len(values) == 2:
+        mu = math.log(values[0]) if values[0] > 0 else 0.0
+        return lambda rng: rng.lognormvariate(mu, values[1]) if values[0] > 0 else 0.0
+    raise ValueError(f"Invalid latency distribution '{spec}', expected fixed:S, uniform:A,B or lognormal:MEDIAN,SIGMA")
+
+
+@dataclass
+class OfflineLLMConfig:
+    """Behaviour of the offline stand-in, see the module docstring for the environment variables."""
+
+    latency: str = "lognormal:1.0,0.5"
+    tokens_per_second: float = 150.0
+    connect_seconds: float = 0.3
+    error_rate: float = 0.0
+    items_per_list: int = 6
+    text_tokens: int = 400
+    seed: int = 0
+    fixtures: Path | None = None
+    input_cost_per_mtok: float = 3.0
+    output_cost_per_mtok: float = 15.0
+
+    @classmethod
+    def from_env(cls) -> "OfflineLLMConfig":
+        config = cls()
+        env = {
+            "AMPLIFIER_OFFLINE_LATENCY": ("latency", str),
+            "AMPLIFIER_OFFLINE_TOKENS_PER_SECOND": ("tokens_per_second", float),
+            "AMPLIFIER_OFFLINE_CONNECT_SECONDS": ("connect_seconds", float),
+            "AMPLIFIER_OFFLINE_ERROR_RATE": ("error_rate", float),
+            "AMPLIFIER_OFFLINE_ITEMS": ("items_per_list", int),
+            "AMPLIFIER_OFFLINE_TEXT_TOKENS": ("text_tokens", int),
+            "AMPLIFIER_OFFLINE_SEED": ("seed", int),
+            "AMPLIFIER_OFFLINE_FIXTURES": ("fixtures", Path),
+        }
+        for name, (attr, convert) in env.items():
+            value = os.getenv(name)
+            if value:
+                setattr(config, attr, convert(value))
+        return config
+
+
+@dataclass
+class OfflineCall:
+    """One answered prompt."""
+
+    label: str  # First line of the system prompt, identifies the pipeline stage
+    seconds: float
+    prompt_tokens: int
+    output_tokens: int
+    error: bool = False
+
+
+@dataclass
+class OfflineLLM:
+    """Shared state of all offline clients: configuration, random source and call log."""
+
+    config: OfflineLLMConfig = field(default_factory=OfflineLLMConfig.from_env)
+    calls: list[OfflineCall] = field(default_factory=list)
+    connects: int = 0
+
+    def __post_init__(self):
+        self._rng = random.Random(self.config.seed)
+        self._latency = parse_latency(self.config.latency)
+        self._fixtures: list[tuple[re.Pattern, str]] = []
+        if self.config.fixtures:
+            for line in self.config.fixtures.read_text().splitlines():
+                if line.strip():
+                    entry = json.loads(line)
+                    self._fixtures.append((re.compile(entry["match"], re.DOTALL), entry["response"]))
+
+    def add_fixture(self, pattern: str, response: str) -> None:
+        """Answer prompts matching ``pattern`` with ``response`` (checked before templating)."""
+        self._fixtures.append((re.compile(pattern, re.DOTALL), response))
+
+    def first_token_delay(self) -> float:
+        return max(0.0, self._latency(self._rng))
+
+    def should_fail(self) -> bool:
+        return self._rng.random() < self.config.error_rate
+
+    def respond(self, prompt: str) -> str:
+        """Deterministic answer for a prompt."""
+        for pattern, response in self._fixtures:
+            if pattern.search(prompt):
+                return response
+
+        rng = random.Random(f"{self.config.seed}:{hashlib.sha256(prompt.encode()).hexdigest()}")
+        template = find_json_template(prompt)
+        if template is not None:
+            return json.dumps(_instantiate(template, rng, self.config.items_per_list), indent=2)
+
+        categories = _CATEGORY_LINE.findall(prompt)
+        if categories and "categor" in prompt.lower():
+            return rng.choice(categories)
+
+        return _prose(rng, self.config.text_tokens)
+
+    def cost(self, prompt_tokens: int, output_tokens: int) -> float:
+        config = self.config
+        return (prompt_tokens * config.input_cost_per_mtok + output_tokens * config.output_cost_per_mtok) / 1e6
+
+
+_offline_llm: OfflineLLM | None = None
+
+
+def get_offline_llm() -> OfflineLLM:
+    """Process-wide offline stand-in, configured from the environment on first use."""
+    global _offline_llm
+    if _offline_llm is None:
+        _offline_llm = OfflineLLM()
+    return _offline_llm
+
+
+def set_offline_llm(llm: OfflineLLM | None) -> None:
+    """Replace the process-wide stand-in (None re-reads the environment on next use)."""
+    global _offline_llm
+    _offline_llm = llm
+
+
+def find_json_template(prompt: str) -> Any | None:
+    """The last top-level JSON example in a prompt, placeholders made valid, or None."""
+    template = None
+    covered_until = -1
+    for match in _OPENER.finditer(prompt):
+        start = match.end() - 1
+        if start < covered_until:
+            continue
+        span = _example_span(prompt, start)
+        if span is None:
+            continue
+        text = _RANGE.sub(lambda m: f"{m.group(1)}{(float(m.group(2)) + float(m.group(3))) / 2}", span)
+        text = _BOOLEAN_CHOICE.sub(r"\1\2", text)
+        try:
+            value = parse_first_json(text)
+        except ValueError:
+            continue
+        if isinstance(value, dict | list) and value:
+            template = value
+            covered_until = start + len(span)
+    return template
+
+
+def _example_span(text: str, start: int) -> str | None:
+    """Bracketed text from ``start`` to its matching close, without // comments and ... elisions."""
+    out: list[str] = []
+    depth = 0
+    in_string = False
+    escape = False
+    i = start
+    while i < len(text):
+        ch = text[i]
+        if in_string:
+            out.append(ch)
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+            out.append(ch)
+        elif text.startswith("//", i):
+            newline = text.find("\n", i)
+            i = len(text) if newline < 0 else newline
+            continue
+        elif text.startswith("...", i):
+            i += 3
+            continue
+        else:
+            out.append(ch)
+            if ch in "{[":
+                depth += 1
+            elif ch in "}]":
+                depth -= 1
+                if depth == 0:
+                    return "".join(out)
+        i += 1
+    return None
+
+
+def _instantiate(template: Any, rng: random.Random, items: int, index: int = 0) -> Any:
+    if isinstance(template, dict):
+        return {key: _instantiate(value, rng, items, index) for key, value in template.items()}
+    if isinstance(template, list):
+        if not template:
+            return []
+        count = rng.randint(max(1, items // 2), max(1, items))
+        return [_instantiate(template[i % len(template)], rng, items, i) for i in range(count)]
+    if isinstance(template, bool) or template is None:
+        return template
+    if isinstance(template, float) and 0.0 <= template <= 1.0:
+        return round(rng.uniform(0.3, 1.0), 2)
+    if isinstance(template, int | float):
+        return template
+    if isinstance(template, str):
+        options = template.split("|")
+        if len(options) > 1 and all(option and " " not in option for option in options):
+            return rng.choice(options)
+        return f"{template} {rng.choice(_WORDS)} {rng.choice(_WORDS)} {index + 1}"
+    return template
+
+
+def _prose(rng: random.Random, tokens: int) -> str:
+    words = max(1, int(tokens * 0.75))
+    paragraphs = [f"# {rng.choice(_WORDS).title()} {rng.choice(_WORDS)}"]
+    while words > 0:
+        length = min(words, rng.randint(40, 90))
+        paragraphs.append(" ".join(rng.choice(_WORDS) for _ in range(length)).capitalize() + ".")
+        words -= length
+    return "\n\n".join(paragraphs)
+
+
+@dataclass
+class TextBlock:
+    text: str
+
+
+@dataclass
+class AssistantMessage:
+    content: list[TextBlock]
+
+
+@dataclass
+class ResultMessage:
+    session_id: str
+    total_cost_usd: float
+    duration_ms: int
+    usage: dict[str, int]
+    is_error: bool = False
+    num_turns: int = 1
+
+
+class OfflineClaudeClient:
+    """Drop-in for ``ClaudeSDKClient``: ``async with``, ``query()``, ``receive_response()``."""
+
+    def __init__(self, options: Any = None):
+        self.options = options
+        self.llm = get_offline_llm()
+        self.session_id = hashlib.sha256(f"{id(self)}:{time.time()}".encode()).hexdigest()[:16]
+        self._prompt: str | None = None
+
+    async def __aenter__(self) -> "OfflineClaudeClient":
+        self.llm.connects += 1
+        if self.llm.config.connect_seconds:
+            await asyncio.sleep(self.llm.config.connect_seconds)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._prompt = None
+
+    async def query(self, prompt: str) -> None:
+        self._prompt = prompt
+
+    async def receive_response(self) -> AsyncIterator[Any]:
+        prompt, self._prompt = self._prompt or "", None
+        system_prompt = getattr(self.options, "system_prompt", None) or ""
+        label = system_prompt.strip().splitlines()[0][:60] if system_prompt.strip() else "(no system prompt)"
+        prompt_tokens = estimate_tokens(system_prompt, prompt)
+        started = time.perf_counter()
+
+        if prompt.strip() == "/clear":
+            yield ResultMessage(self.session_id, 0.0, 0, {"input_tokens": 0, "output_tokens": 0})
+            return
+
+        await asyncio.sleep(self.llm.first_token_delay())
+        text = self.llm.respond(prompt)
+        output_tokens = estimate_tokens(text)
+        if self.llm.should_fail():
+            self.llm.calls.append(OfflineCall(label, time.perf_counter() - started, prompt_tokens, 0, error=True))
+            raise OfflineLLMError("Offline LLM injected failure")
+
+        chunk_chars = _CHUNK_TOKENS * 4
+        delay = _CHUNK_TOKENS / self.llm.config.tokens_per_second if self.llm.config.tokens_per_second > 0 else 0.0
+        for i in range(0, len(text), chunk_chars):
+            if i and delay:
+                await asyncio.sleep(delay)
+            yield AssistantMessage([TextBlock(text[i : i + chunk_chars])])
+
+        seconds = time.perf_counter() - started
+        self.llm.calls.append(OfflineCall(label, seconds, prompt_tokens, output_tokens))
+        yield ResultMessage(
+            session_id=self.session_id,
+            total_cost_usd=self.llm.cost(prompt_tokens, output_tokens),
+            duration_ms=int(seconds * 1000),
+            usage={"input_tokens": prompt_tokens, "output_tokens": output_tokens},
+        )
@@ -0,0 +1,326 @@
+"""Pool of warm Claude CLI clients.
+
+Every ``ClaudeSDKClient`` launches a ``claude`` CLI subprocess. Opening one per
+extraction call means one process start-up per call. A ``ClientPool``
+keeps connected clients keyed by (system_prompt, max_turns, model) and hands
+them out again after each request.
+
+Each pooled client is owned by a dedicated task: the SDK enters an anyio task
+group on connect, which must be exited from the same task, so requests are
+passed to the owner task through a queue instead of sharing the client object.
+
+Usage:
+    >>> async with ClientPool(max_size=8):
+    ...     # query_claude() and ClaudeSession reuse warm clients in this block
+    ...     await run_pipeline()
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from contextlib import asynccontextmanager
+from contextlib import nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_POOL_SIZE = 8
+# Recycle a client after this many leases to bound any state the CLI accumulates
+DEFAULT_MAX_USES = 25
+DEFAULT_MAX_IDLE_SECONDS = 300.0
+# Sent between leases so one request never sees another's conversation
+RESET_COMMAND = "/clear"
+RESET_TIMEOUT = 10.0
+
+PoolKey = tuple[str, int, str | None]
+
+_current_pool: ContextVar["ClientPool | None"] = ContextVar("claude_client_pool", default=None)
+
+
+class ClientClosedError(ConnectionError):
+    """Raised for requests sent to a pooled client whose CLI process has exited."""
+
+
+@dataclass
+class PoolStats:
+    """Counters for a pool's lifetime."""
+
+    requests: int = 0
+    created: int = 0
+    reused: int = 0
+    retired: int = 0
+    failed: int = 0
+    connect_seconds: float = 0.0
+
+    @property
+    def avg_connect_ms(self) -> float:
+        """Average time to start one client."""
+        return self.connect_seconds * 1000 / self.created if self.created else 0.0
+
+    @property
+    def connect_ms_per_request(self) -> float:
+        """Client start-up time divided over all requests served by the pool."""
+        return self.connect_seconds * 1000 / self.requests if self.requests else 0.0
+
+
+class PooledClient:
+    """A connected CLI client served by its own owner task."""
+
+    def __init__(self, key: PoolKey, stats: PoolStats, reset_command: str | None, reset_timeout: float):
+        self.key = key
+        self.uses = 0
+        self.healthy = True
+        self.reset_failed = False
+        self.last_used = time.monotonic()
+        self._stats = stats
+        self._reset_command = reset_command
+        self._reset_timeout = reset_timeout
+        self._jobs: asyncio.Queue = asyncio.Queue()
+        self._connected: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(), name=f"claude-client-{id(self):x}")
+
+    async def query(self, prompt: str, on_text: Callable[[str], None] | None = None) -> tuple[str, dict[str, Any]]:
+        """Send one prompt and return (text, metadata) like ``collect_response``."""
+        await asyncio.shield(self._connected)
+        future = asyncio.get_running_loop().create_future()
+        self._jobs.put_nowait((prompt, on_text, future, None))
+        self._stats.requests += 1
+        try:
+            return await future
+        except BaseException:
+            # Failed or abandoned mid-response, the CLI state is unknown
+            self.healthy = False
+            raise
+
+    def reset(self) -> None:
+        """Queue a conversation reset, the next request waits behind it."""
+        if self._reset_command:
+            self._jobs.put_nowait((self._reset_command, None, None, self._reset_timeout))
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Disconnect gracefully when idle, cancel the owner task otherwise."""
+        if self.healthy and not self._task.done():
+            self._jobs.put_nowait(None)
+            try:
+                await asyncio.wait_for(asyncio.shield(self._task), timeout)
+                return
+            except TimeoutError:
+                pass
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        from claude_code_sdk import ClaudeCodeOptions
+
+        from .client import collect_response
+        from .offline import get_client_class
+
+        system_prompt, max_turns, model = self.key
+        options = ClaudeCodeOptions(system_prompt=system_prompt, max_turns=max_turns, model=model)
+        started = time.perf_counter()
+        try:
+            async with get_client_class()(options=options) as client:
+                self._stats.connect_seconds += time.perf_counter() - started
+                self._connected.set_result(None)
+
+                while (job := await self._jobs.get()) is not None:
+                    prompt, on_text, future, timeout = job
+                    try:
+                        async with asyncio.timeout(timeout):
+                            await client.query(prompt)
+                            result = await collect_response(client, on_text)
+                    except Exception as e:
+                        if future is None:
+                            self.reset_failed = True
+                        elif not future.done():
+                            future.set_exception(e)
+                        logger.debug(f"Retiring Claude client after error: {e!r}")
+                        return
+                    if future is not None and not future.done():
+                        future.set_result(result)
+        except Exception as e:
+            if not self._connected.done():
+                self._connected.set_exception(e)
+            logger.debug(f"Claude client exited: {e}")
+        finally:
+            self.healthy = False
+            if not self._connected.done():
+                self._connected.set_exception(ClientClosedError("Claude client closed before connecting"))
+            while not self._jobs.empty():
+                job = self._jobs.get_nowait()
+                if job is not None and job[2] is not None and not job[2].done():
+                    job[2].set_exception(ClientClosedError("Claude client closed"))
+
+
+class ClientPool:
+    """Bounded pool of warm Claude clients, active for the duration of ``async with``.
+
+    A lease holds a client exclusively; it is reset and returned to the pool
+    afterwards, or retired after an error, cancellation, ``max_uses`` leases
+    or ``max_idle_seconds`` without use. At most ``max_size`` clients are
+    alive and leased at any time.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        max_uses: int = DEFAULT_MAX_USES,
+        max_idle_seconds: float = DEFAULT_MAX_IDLE_SECONDS,
+        reset_command: str | None = RESET_COMMAND,
+        reset_timeout: float = RESET_TIMEOUT,
+    ):
+        """Configure the pool.
+
+        Args:
+            max_size: Maximum live clients, defaults to AMPLIFIER_CLAUDE_POOL_SIZE or 8
+            max_uses: Leases before a client is recycled
+            max_idle_seconds: Idle clients older than this are recycled
+            reset_command: Prompt that clears the conversation between leases
+            reset_timeout: Seconds to wait for the reset before recycling instead
+        """
+        self.max_size = max_size or int(os.getenv("AMPLIFIER_CLAUDE_POOL_SIZE", DEFAULT_POOL_SIZE))
+        self.max_uses = max_uses
+        self.max_idle_seconds = max_idle_seconds
+        self.reset_command = reset_command
+        self.reset_timeout = reset_timeout
+        self.stats = PoolStats()
+        self._slots = asyncio.Semaphore(self.max_size)
+        self._idle: dict[PoolKey, list[PooledClient]] = {}
+        self._live: set[PooledClient] = set()
+        self._closing: set[asyncio.Task] = set()
+        self._closed = False
+        self._token = None
+
+    async def __aenter__(self) -> "ClientPool":
+        self._token = _current_pool.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._token is not None:
+            _current_pool.reset(self._token)
+            self._token = None
+        await self.close()
+
+    @asynccontextmanager
+    async def lease(
+        self, system_prompt: str, max_turns: int = 1, model: str | None = None
+    ) -> AsyncIterator[PooledClient]:
+        """Hold a client for several related queries, e.g. a multi-turn session."""
+        key = (system_prompt, max_turns, model)
+        async with self._slots:
+            client = self._take_idle(key)
+            if client is None:
+                client = await self._spawn(key)
+            else:
+                self.stats.reused += 1
+
+            try:
+                yield client
+            finally:
+                client.uses += 1
+                self._release(client)
+
+    async def query(
+        self,
+        prompt: str,
+        *,
+        system_prompt: str,
+        max_turns: int = 1,
+        model: str | None = None,
+        on_text: Callable[[str], None] | None = None,
+        admit: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
+    ) -> tuple[str, dict[str, Any]]:
+        """Send one prompt on a pooled client, retrying once if the client had died while idle.
+
+        ``admit`` is entered around the request once a client is leased, e.g. a
+        governor slot. Leases always come first, as in ``ClaudeSession``, so a
+        caller holding a slot never waits for a lease held by one waiting for a slot.
+        """
+        for attempt in range(2):
+            async with self.lease(system_prompt, max_turns, model) as client, (admit or nullcontext)():
+                try:
+                    return await client.query(prompt, on_text)
+                except ClientClosedError:
+                    if attempt:
+                        raise
+        raise AssertionError("unreachable")
+
+    async def close(self) -> None:
+        """Disconnect every client."""
+        self._closed = True
+        clients = list(self._live)
+        self._live.clear()
+        self._idle.clear()
+        await asyncio.gather(*(client.close() for client in clients), *self._closing, return_exceptions=True)
+        if self.stats.created:
+            logger.debug(
+                f"Claude client pool: {self.stats.requests} requests on {self.stats.created} clients, "
+                f"{self.stats.avg_connect_ms:.0f}ms start-up per client, "
+                f"{self.stats.connect_ms_per_request:.0f}ms per request"
+            )
+
+    def _take_idle(self, key: PoolKey) -> PooledClient | None:
+        idle = self._idle.get(key, [])
+        now = time.monotonic()
+        while idle:
+            client = idle.pop()
+            if client.healthy and now - client.last_used <= self.max_idle_seconds:
+                return client
+            self._retire(client)
+        return None
+
+    async def _spawn(self, key: PoolKey) -> PooledClient:
+        # A slot is held, so when the pool is full at least one live client is idle
+        while len(self._live) >= self.max_size:
+            oldest = min((client for clients in self._idle.values() for client in clients), key=lambda c: c.last_used)
+            self._idle[oldest.key].remove(oldest)
+            self._retire(oldest)
+
+        client = PooledClient(key, self.stats, self.reset_command, self.reset_timeout)
+        self._live.add(client)
+        self.stats.created += 1
+        return client
+
+    def _release(self, client: PooledClient) -> None:
+        if client.healthy and not self._closed and client.uses < self.max_uses:
+            client.reset()
+            client.last_used = time.monotonic()
+            self._idle.setdefault(client.key, []).append(client)
+        else:
+            self._retire(client)
+
+    def _retire(self, client: PooledClient) -> None:
+        if client.reset_failed and self.reset_command:
+            # Without a working reset, reuse would leak conversations between requests
+            logger.warning(f"Claude CLI did not answer {self.reset_command!r}, pooled clients will not be reused")
+            self.reset_command = None
+            self.max_uses = 1
+        if not client.healthy:
+            self.stats.failed += 1
+        self.stats.retired += 1
+        self._live.discard(client)
+        # Closing waits for the CLI to exit, don't hold up the caller for it
+        task = asyncio.ensure_future(client.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+
+def get_client_pool() -> ClientPool | None:
+    """The pool activated by the innermost ``async with ClientPool()``, if any."""
+    return _current_pool.get()
+
+
+async def run_pooled(awaitable: Awaitable[T], **pool_options: Any) -> T:
+    """Await ``awaitable`` with a ``ClientPool`` active, e.g. ``asyncio.run(run_pooled(main()))``."""
+    async with ClientPool(**pool_options):
+        return await awaitable
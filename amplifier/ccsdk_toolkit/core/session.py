@@ -1,13 +1,27 @@
 """Core Claude session implementation with robust error handling."""
 
 import asyncio
+import hashlib
 import os
 import shutil
+from contextlib import AsyncExitStack
 from pathlib import Path
 from typing import Any
 
+from ..defensive.streaming_json import ItemCallback
+from ..defensive.streaming_json import StreamingJSONParser
+from .cache import cache_key
+from .cache import get_response_cache
+from .client import collect_response
+from .client import record_usage
+from .governor import estimate_tokens
+from .governor import get_governor
 from .models import SessionOptions
 from .models import SessionResponse
+from .offline import get_client_class
+from .offline import offline_enabled
+from .pool import PooledClient
+from .pool import get_client_pool
 
 
 class SessionError(Exception):
@@ -23,8 +37,16 @@ class ClaudeSession:
 
     This provides a robust wrapper around the claude_code_sdk with:
     - Prerequisite checking for the claude CLI
-    - Automatic retry with exponential backoff
+    - Automatic retry with jittered exponential backoff, coordinated by the governor
     - Graceful degradation when SDK unavailable
+    - Response caching, the CLI client is only started on the first cache miss
+    - Warm clients from the active ``ClientPool``, leased for the session's lifetime
+
+    Cache keys include a digest of the conversation so far, so a cached
+    answer is only reused for the same conversation state. Turns are answered
+    from the cache only until the first one that has to go to Claude. That
+    turn carries a transcript of the cached turns before it, so the live
+    client knows the whole conversation. Every later turn is sent live.
     """
 
     def __init__(self, options: SessionOptions | None = None):
@@ -35,10 +57,18 @@ class ClaudeSession:
         """
         self.options = options or SessionOptions()
         self.client = None
+        self._sdk_options = None
+        self._lease: AsyncExitStack | None = None
+        self._context = ""
+        # Turns answered from the cache that no live client has seen yet
+        self._replayed: list[tuple[str, str]] = []
+        self._live = False
         self._check_prerequisites()
 
     def _check_prerequisites(self):
         """Check if claude CLI is installed and accessible."""
+        if offline_enabled():
+            return
         # Check if claude CLI is available
         claude_path = shutil.which("claude")
         if not claude_path:
@@ -62,19 +92,16 @@ class ClaudeSession:
                 )
 
     async def __aenter__(self):
-        """Enter async context and initialize SDK client."""
+        """Enter async context and prepare SDK client options."""
         try:
             # Import SDK only when actually using it
             from claude_code_sdk import ClaudeCodeOptions
-            from claude_code_sdk import ClaudeSDKClient
 
-            self.client = ClaudeSDKClient(
-                options=ClaudeCodeOptions(
-                    system_prompt=self.options.system_prompt,
-                    max_turns=self.options.max_turns,
-                )
+            self._sdk_options = ClaudeCodeOptions(
+                system_prompt=self.options.system_prompt,
+                max_turns=self.options.max_turns,
+                model=self.options.model,
             )
-            await self.client.__aenter__()
             return self
 
         except ImportError:
@@ -84,69 +111,114 @@ class ClaudeSession:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit async context and cleanup."""
-        if self.client:
+        await self._disconnect(exc_type, exc_val, exc_tb)
+        self._sdk_options = None
+
+    async def _connect(self):
+        """Lease a pooled client or start one on first use."""
+        if self.client is None:
+            pool = get_client_pool()
+            if pool:
+                self._lease = AsyncExitStack()
+                self.client = await self._lease.enter_async_context(
+                    pool.lease(self.options.system_prompt, self.options.max_turns, self.options.model)
+                )
+            else:
+                client = get_client_class()(options=self._sdk_options)
+                await client.__aenter__()
+                self.client = client
+        return self.client
+
+    async def _disconnect(self, exc_type=None, exc_val=None, exc_tb=None):
+        """Return a leased client to the pool or close our own."""
+        if self._lease:
+            await self._lease.aclose()
+            self._lease = None
+        elif self.client is not None and not isinstance(self.client, PooledClient):
             await self.client.__aexit__(exc_type, exc_val, exc_tb)
+        self.client = None
 
-    async def query(self, prompt: str, stream: bool | None = None) -> SessionResponse:
+    async def _send(self, prompt: str, on_text) -> tuple[str, dict[str, Any]]:
+        tokens = estimate_tokens(self.options.system_prompt, prompt)
+        # The lease is kept for the whole session, so it is taken before the slot, as query_claude does
+        client = await self._connect()
+        async with get_governor().slot(self.options.model, self.options.priority, tokens):
+            if isinstance(client, PooledClient):
+                response = await client.query(prompt, on_text)
+            else:
+                await client.query(prompt)
+                response = await collect_response(client, on_text)
+        record_usage(tokens, response[1])
+        return response
+
+    async def query(
+        self, prompt: str, stream: bool | None = None, on_item: ItemCallback | None = None
+    ) -> SessionResponse:
         """Send a query to Claude with automatic retry.
 
         Args:
             prompt: The prompt to send to Claude
             stream: Override the session's stream_output setting
+            on_item: Called with (key, element) for each array element of a JSON
+                response as soon as it is complete; a retried attempt starts over
 
         Returns:
             SessionResponse with the result or error
         """
-        if not self.client:
+        if self._sdk_options is None:
             return SessionResponse(error="Session not initialized. Use 'async with' context.")
 
-        retry_delay = self.options.retry_delay
+        should_stream = stream if stream is not None else self.options.stream_output
+        parser = StreamingJSONParser(on_item) if on_item else None
+
+        def on_text(text: str) -> None:
+            if parser:
+                parser.feed(text)
+
+            # Stream output if enabled
+            if should_stream:
+                print(text, end="", flush=True)
+
+            # Call progress callback if provided
+            if self.options.progress_callback:
+                self.options.progress_callback(text)
+
+        cache = get_response_cache() if self.options.use_cache else None
+        key = cache_key(prompt, self.options.system_prompt, self.options.max_turns, self.options.model, self._context)
+        # Once a turn went live the client's history is the conversation, cached answers could contradict it
+        if cache and not self._live:
+            cached = cache.get(key)
+            if cached is not None:
+                response_text, metadata = cached
+                record_usage(0, metadata, cached=True)
+                on_text(response_text)
+                if should_stream:
+                    print()
+                self._replayed.append((prompt, response_text))
+                self._advance(key, response_text)
+                return SessionResponse(content=response_text, metadata={**metadata, "cached": True})
+
+        live_prompt = self._with_replayed_turns(prompt)
         last_error = None
 
         for attempt in range(self.options.retry_attempts):
+            if on_item:
+                parser = StreamingJSONParser(on_item)
             try:
-                # Execute query directly
-                assert self.client is not None  # Type guard for pyright
-                await self.client.query(prompt)
-
                 # Collect response with streaming support
-                response_text = ""
-                metadata: dict[str, Any] = {"attempt": attempt + 1}
-
-                async for message in self.client.receive_response():
-                    if hasattr(message, "content"):
-                        content = getattr(message, "content", [])
-                        if isinstance(content, list):
-                            for block in content:
-                                if hasattr(block, "text"):
-                                    text = getattr(block, "text", "")
-                                    if text:
-                                        response_text += text
-
-                                        # Stream output if enabled
-                                        should_stream = stream if stream is not None else self.options.stream_output
-                                        if should_stream:
-                                            print(text, end="", flush=True)
-
-                                        # Call progress callback if provided
-                                        if self.options.progress_callback:
-                                            self.options.progress_callback(text)
-
-                    # Collect metadata from ResultMessage if available
-                    if hasattr(message, "__class__") and message.__class__.__name__ == "ResultMessage":
-                        if hasattr(message, "session_id"):
-                            metadata["session_id"] = getattr(message, "session_id", None)
-                        if hasattr(message, "total_cost_usd"):
-                            metadata["total_cost_usd"] = getattr(message, "total_cost_usd", 0.0)
-                        if hasattr(message, "duration_ms"):
-                            metadata["duration_ms"] = getattr(message, "duration_ms", 0)
+                response_text, metadata = await self._send(live_prompt, on_text)
+                metadata["attempt"] = attempt + 1
 
                 # Add newline after streaming if enabled
-                should_stream = stream if stream is not None else self.options.stream_output
                 if should_stream and response_text:
                     print()  # Final newline after streaming
 
                 if response_text:
+                    if cache:
+                        cache.put(key, response_text, metadata)
+                    self._live = True
+                    self._replayed = []
+                    self._advance(key, response_text)
                     return SessionResponse(content=response_text, metadata=metadata)
 
                 # Empty response, will retry
@@ -155,11 +227,24 @@ class ClaudeSession:
                 last_error = str(e)
             except Exception as e:
                 last_error = str(e)
+                if isinstance(self.client, PooledClient) and not self.client.healthy:
+                    # Retry on a fresh client from the pool
+                    await self._disconnect()
 
             # Wait before retry (except on last attempt)
             if attempt < self.options.retry_attempts - 1:
-                await asyncio.sleep(retry_delay)
-                retry_delay *= 2  # Exponential backoff
+                await asyncio.sleep(get_governor().retry_delay(attempt, self.options.retry_delay, self.options.model))
 
         # All retries exhausted
         return SessionResponse(error=f"Failed after {self.options.retry_attempts} attempts: {last_error}")
+
+    def _advance(self, key: str, response_text: str) -> None:
+        """Key later turns on the conversation so far, the same way for cached and live answers."""
+        self._context = hashlib.sha256(f"{key}{response_text}".encode()).hexdigest()
+
+    def _with_replayed_turns(self, prompt: str) -> str:
+        """The prompt to send live, prefixed with the cached turns the client has not seen."""
+        if not self._replayed:
+            return prompt
+        turns = "\n\n".join(f"User:\n{sent}\n\nAssistant:\n{answer}" for sent, answer in self._replayed)
+        return f"Earlier turns of this conversation:\n\n{turns}\n\nContinue the conversation.\n\nUser:\n{prompt}"
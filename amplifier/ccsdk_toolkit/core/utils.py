@@ -8,6 +8,9 @@ from pathlib import Path
 from typing import Any
 from typing import TypeVar
 
+from .governor import get_governor
+from .offline import offline_enabled
+
 T = TypeVar("T")
 
 
@@ -24,6 +27,9 @@ def check_claude_cli() -> tuple[bool, str]:
         ... else:
         ...     print(f"Claude CLI not available: {info}")
     """
+    if offline_enabled():
+        return True, "offline stand-in (AMPLIFIER_LLM_BACKEND=offline)"
+
     # Check if claude CLI is available in PATH
     claude_path = shutil.which("claude")
     if claude_path:
@@ -67,6 +73,9 @@ async def query_with_retry(
 ) -> Any:
     """Execute an async function with exponential backoff retry.
 
+    Delays are jittered and never shorter than the governor's cooldown after
+    a failure, so concurrent retry loops don't hammer a congested model.
+
     Args:
         func: Async function to execute
         *args: Positional arguments for the function
@@ -86,7 +95,6 @@ async def query_with_retry(
         ...     return "success"
         >>> result = await query_with_retry(flaky_operation, max_attempts=5)
     """
-    delay = initial_delay
     last_error = None
 
     for attempt in range(max_attempts):
@@ -100,8 +108,7 @@ async def query_with_retry(
 
         # Wait before retry (except on last attempt)
         if attempt < max_attempts - 1:
-            await asyncio.sleep(delay)
-            delay *= 2  # Exponential backoff
+            await asyncio.sleep(get_governor().retry_delay(attempt, initial_delay))
 
     # All retries exhausted
     if last_error:
@@ -12,10 +12,14 @@ from .llm_parsing import parse_llm_json
 from .prompt_isolation import isolate_prompt
 from .pydantic_extraction import extract_agent_output
 from .retry_patterns import retry_with_feedback
+from .streaming_json import StreamingJSONParser
+from .streaming_json import parse_first_json
 
 __all__ = [
     # LLM response handling
     "parse_llm_json",
+    "parse_first_json",
+    "StreamingJSONParser",
     "isolate_prompt",
     "retry_with_feedback",
     "extract_agent_output",
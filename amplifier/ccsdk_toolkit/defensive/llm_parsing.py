@@ -9,6 +9,8 @@ import logging
 import re
 from typing import Union
 
+from .streaming_json import parse_first_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +24,7 @@ def parse_llm_json(
     - Plain JSON
     - Markdown-wrapped JSON (```json blocks)
     - JSON with text preambles
+    - Trailing commas
     - Common formatting issues
 
     Returns default value on failure (doesn't raise exceptions).
@@ -67,7 +70,17 @@ def parse_llm_json(
                     logger.debug(f"Failed to parse markdown-extracted JSON: {e}")
                 continue
 
-    # Try 3: Find JSON-like structures in text
+    # Try 3: One pass that skips preambles and fences and drops trailing commas
+    try:
+        result = parse_first_json(response)
+        if verbose:
+            logger.debug("Successfully parsed JSON with the one-pass parser")
+        return result
+    except ValueError as e:
+        if verbose:
+            logger.debug(f"One-pass JSON parsing failed: {e}")
+
+    # Try 4: Find JSON-like structures in text
     # Look for {...} or [...] patterns
     json_patterns = [
         r"(\{[^{}]*\{[^{}]*\}[^{}]*\})",  # Nested objects
@@ -91,7 +104,7 @@ def parse_llm_json(
                     logger.debug(f"Failed to parse JSON structure: {e}")
                 continue
 
-    # Try 4: Extract after common preambles
+    # Try 5: Extract after common preambles
     # Remove common AI response prefixes
     preamble_patterns = [
         r"^.*?(?:here\'s|here is|below is|following is).*?:\s*",
@@ -112,7 +125,7 @@ def parse_llm_json(
                     logger.debug(f"Failed after preamble removal: {e}")
                 continue
 
-    # Try 5: Fix common JSON formatting issues
+    # Try 6: Fix common JSON formatting issues
     # This is a last resort for slightly malformed JSON
     fixes = [
         (r",\s*}", "}"),  # Remove trailing commas before }
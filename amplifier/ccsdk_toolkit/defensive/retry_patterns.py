@@ -6,10 +6,11 @@ Implements intelligent retry mechanisms that learn from failures.
 
 import asyncio
 import logging
-import random
 from collections.abc import Callable
 from typing import Any
 
+from ..core.governor import get_governor
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,12 +42,10 @@ async def retry_with_feedback(
 
     for attempt in range(max_retries + 1):
         try:
-            # Add delay with exponential backoff and jitter (except first attempt)
+            # Add delay with exponential backoff and jitter (except first attempt),
+            # stretched by the governor while the model is backing off
             if attempt > 0:
-                delay = base_delay * (2 ** (attempt - 1))
-                # Add jitter to prevent thundering herd
-                jitter = random.uniform(0, delay * 0.1)
-                await asyncio.sleep(delay + jitter)
+                await asyncio.sleep(get_governor().retry_delay(attempt - 1, base_delay))
 
                 if provide_feedback and last_error:
                     # Enhance prompt with error feedback
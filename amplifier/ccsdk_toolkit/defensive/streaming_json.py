@@ -0,0 +1,239 @@
+"""
+Incremental JSON parsing of streamed LLM responses.
+
+Finds the JSON value in a response while it streams in and hands out each
+element of its arrays as soon as the element is complete, so callers can start
+persisting concepts or relationships before the call finishes. One pass over
+the text skips preambles and markdown fences and drops trailing commas; the
+chunks are kept in a list instead of being concatenated.
+"""
+
+import json
+import re
+from collections.abc import Callable
+from typing import Any
+
+_WHITESPACE = " \t\r\n"
+_STRING_RUN = re.compile(r'[^"\\]+')
+_FENCED_BLOCK = re.compile(r"```(?:json)?[ \t]*\n(.*?)```", re.DOTALL | re.IGNORECASE)
+
+# Characters that may follow an opening bracket, used to tell a JSON value from "[see below]" in a preamble
+_OBJECT_FOLLOW = set('"}')
+_ARRAY_FOLLOW = set('{["-0123456789tfn]')
+
+_MISSING = object()
+
+ItemCallback = Callable[[str | None, Any], None]
+
+
+class StreamingJSONParser:
+    """Tolerant incremental parser for the first JSON object or array in LLM output.
+
+    Elements are reported for the top-level array (key ``None``) and for arrays
+    that are direct values of a top-level object (key is the object key, e.g.
+    ``"concepts"``). While streaming, the first complete value wins; use
+    ``parse_first_json`` on a finished response to prefer a fenced value.
+
+    Usage:
+        >>> parser = StreamingJSONParser(on_item=lambda key, item: store.add(key, item))
+        >>> for chunk in stream:
+        ...     parser.feed(chunk)
+        >>> data = parser.result()
+    """
+
+    def __init__(self, on_item: ItemCallback | None = None):
+        """Initialize the parser.
+
+        Args:
+            on_item: Called with (key, element) for every completed array element
+        """
+        self.on_item = on_item
+        self._chunks: list[str] = []
+        self._value: Any = _MISSING
+        self._reset()
+
+    @property
+    def done(self) -> bool:
+        """True once a complete JSON value has been parsed."""
+        return self._value is not _MISSING
+
+    def feed(self, chunk: str) -> list[tuple[str | None, Any]]:
+        """Consume the next chunk of the response.
+
+        Returns:
+            (key, element) pairs completed by this chunk
+        """
+        self._chunks.append(chunk)
+        items: list[tuple[str | None, Any]] = []
+        i, n = 0, len(chunk)
+
+        while i < n and self._value is _MISSING:
+            if self._in_string:
+                if not self._escape:
+                    match = _STRING_RUN.match(chunk, i)
+                    if match:
+                        self._write(match.group())
+                        i = match.end()
+                        continue
+                ch = chunk[i]
+                i += 1
+                self._write(ch)
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._end_string()
+                continue
+
+            ch = chunk[i]
+            i += 1
+            if ch in _WHITESPACE:
+                # Kept inside the value, "[1 2]" must not become "[12]"
+                if self._stack:
+                    self._write(ch)
+                continue
+            if not self._stack and not self._seek(ch):
+                continue
+            self._structural(ch, items)
+
+        return items
+
+    def result(self) -> Any:
+        """The parsed value.
+
+        Raises:
+            ValueError: No complete JSON object or array was found
+        """
+        if self._value is _MISSING:
+            raise ValueError("No complete JSON object or array in response")
+        return self._value
+
+    def text(self) -> str:
+        """Everything fed so far."""
+        return "".join(self._chunks)
+
+    def _reset(self) -> None:
+        self._out: list[str] = []
+        self._stack: list[str] = []
+        self._candidate: str | None = None
+        self._in_string = False
+        self._escape = False
+        self._pending_comma = False
+        self._element: list[str] | None = None
+        self._string: list[str] | None = None
+        self._string_value: str | None = None
+        self._key: str | None = None
+        self._valid = True
+
+    def _seek(self, ch: str) -> bool:
+        """Look for the start of the value, True once ``ch`` belongs to it."""
+        if self._candidate:
+            follow = _OBJECT_FOLLOW if self._candidate == "{" else _ARRAY_FOLLOW
+            opener, self._candidate = self._candidate, None
+            if ch in follow:
+                self._write(opener)
+                self._stack.append(opener)
+                return True
+        if ch in "{[":
+            self._candidate = ch
+        return False
+
+    def _structural(self, ch: str, items: list[tuple[str | None, Any]]) -> None:
+        stack = self._stack
+        if ch == ",":
+            if self._at_tracked_array():
+                self._finish_element(items)
+            self._pending_comma = True
+            return
+
+        if ch in "}]":
+            # A comma directly before a closing bracket is dropped
+            self._pending_comma = False
+            if ch == "]" and self._at_tracked_array():
+                self._finish_element(items)
+            if stack.pop() != ("{" if ch == "}" else "["):
+                self._valid = False
+            self._write(ch)
+            if not stack:
+                self._close()
+            return
+
+        if self._pending_comma:
+            self._write(",")
+            self._pending_comma = False
+        if self._element is None and self._at_tracked_array():
+            self._element = []
+
+        self._write(ch)
+        if ch in "{[":
+            stack.append(ch)
+        elif ch == '"':
+            self._in_string = True
+            if stack == ["{"]:
+                self._string = ['"']
+        elif ch == ":" and stack == ["{"]:
+            self._key = self._string_value
+
+    def _write(self, text: str) -> None:
+        self._out.append(text)
+        if self._element is not None:
+            self._element.append(text)
+        if self._string is not None:
+            self._string.append(text)
+
+    def _end_string(self) -> None:
+        self._in_string = False
+        if self._string is not None:
+            self._string_value = json.loads("".join(self._string), strict=False)
+            self._string = None
+
+    def _at_tracked_array(self) -> bool:
+        return self._stack == ["["] or self._stack == ["{", "["]
+
+    def _finish_element(self, items: list[tuple[str | None, Any]]) -> None:
+        if self._element is None:
+            return
+        text, self._element = "".join(self._element), None
+        if not self._valid:
+            return
+        try:
+            item = json.loads(text, strict=False)
+        except json.JSONDecodeError:
+            # Not JSON after all (a bracket in prose), stop reporting elements of this value
+            self._valid = False
+            return
+        key = self._key if self._stack[0] == "{" else None
+        items.append((key, item))
+        if self.on_item:
+            self.on_item(key, item)
+
+    def _close(self) -> None:
+        if self._valid:
+            try:
+                self._value = json.loads("".join(self._out), strict=False)
+                return
+            except json.JSONDecodeError:
+                pass
+        # Keep looking, the real value may follow
+        self._reset()
+
+
+def parse_first_json(response: str) -> Any:
+    """Parse the first JSON object or array in an LLM response.
+
+    A value in a markdown fence wins over brackets in the prose before it,
+    e.g. the "[1]" in "As noted in [1], here it is:" followed by a fenced object.
+
+    Raises:
+        ValueError: No complete JSON object or array was found
+    """
+    for match in _FENCED_BLOCK.finditer(response):
+        parser = StreamingJSONParser()
+        parser.feed(match.group(1))
+        if parser.done:
+            return parser.result()
+
+    parser = StreamingJSONParser()
+    parser.feed(response)
+    return parser.result()
@@ -10,6 +10,7 @@ Synthesizes insights from AI context documentation using a 4-stage pipeline:
 """
 
 import asyncio
+import os
 import sys
 import uuid
 from datetime import UTC
@@ -26,11 +27,9 @@ import click
 from rich.console import Console
 from rich.panel import Panel
 
-from amplifier.ccsdk_toolkit.defensive import read_json_with_retry
 from amplifier.ccsdk_toolkit.defensive import write_json_with_retry
 
-from .models import CrossCuttingTheme
-from .models import FileSummary
+from .journal import SynthesisJournal
 from .models import SynthesisState
 from .stages import ExpanderStage
 from .stages import ReaderStage
@@ -54,6 +53,12 @@ except ImportError:
 @click.option("--json-output", is_flag=True, help="Output results as JSON")
 @click.option("--verbose", is_flag=True, help="Enable verbose output")
 @click.option("--notify", is_flag=True, help="Enable desktop notifications on completion")
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=lambda: int(os.getenv("AMPLIFIER_LLM_MAX_CONCURRENCY", "8")),
+    help="Files summarized and themes expanded at once (default: AMPLIFIER_LLM_MAX_CONCURRENCY or 8)",
+)
 def main(
     directory: Path,
     pattern: str,
@@ -64,6 +69,7 @@ def main(
     json_output: bool,
     verbose: bool,
     notify: bool,
+    concurrency: int,
 ):
     """
     Synthesize ideas from AI context documentation.
@@ -93,6 +99,7 @@ def main(
             json_output=json_output,
             verbose=verbose,
             notify=notify,
+            concurrency=concurrency,
         )
     )
 
@@ -107,6 +114,7 @@ async def run_synthesis(
     json_output: bool,
     verbose: bool,
     notify: bool,
+    concurrency: int = 8,
 ):
     """Main synthesis pipeline."""
     console = Console()
@@ -123,8 +131,8 @@ async def run_synthesis(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Load or create session state
-    state_file = output_dir / "synthesis_state.json"
-    state = load_or_create_state(state_file, resume_id)
+    journal = SynthesisJournal(output_dir / "synthesis_state.json")
+    state = load_or_create_state(journal, resume_id)
 
     if resume_id:
         console.print(f"[cyan]Resuming session: {state.session_id}[/cyan]")
@@ -134,9 +142,9 @@ async def run_synthesis(
 
     # Initialize stages
     reader = ReaderStage(console)
-    summarizer = SummarizerStage(state_file, console)
-    synthesizer = SynthesizerStage(state_file, console)
-    expander = ExpanderStage(state_file, console)
+    summarizer = SummarizerStage(journal, console, concurrency=concurrency)
+    synthesizer = SynthesizerStage(journal, console)
+    expander = ExpanderStage(journal, console, concurrency=concurrency)
 
     try:
         # Stage 1: Read files
@@ -146,13 +154,16 @@ async def run_synthesis(
         # Count total files first
         total_files = reader.count_files(directory, pattern, recursive)
         state.total_files = total_files
+        journal.snapshot(state)  # Folds in what a resumed run journaled
 
-        # Determine skip count for resume
-        skip_count = len(state.summaries) if resume_id else 0
+        # Files finish out of order, so resume skips by path rather than by count
+        summarized = {s.file_path for s in state.summaries}
 
         # Read files
         source_files = list(
-            reader.read_files(directory=directory, pattern=pattern, recursive=recursive, limit=limit, skip=skip_count)
+            reader.read_files(
+                directory=directory, pattern=pattern, recursive=recursive, limit=limit, exclude=summarized
+            )
         )
 
         console.print(f"[green]✓ Loaded {len(source_files)} files[/green]")
@@ -176,7 +187,7 @@ async def run_synthesis(
         # Stage 4: Expand ideas
         console.print("\n[bold cyan]Stage 4: Expanding Ideas[/bold cyan]")
         logger.stage_start("Expander")
-        expanded = await expander.expand_ideas(themes, state.summaries, source_files, state)
+        expanded = await expander.expand_ideas(themes, state.summaries, state)
         console.print(f"[green]✓ Expanded {len(expanded)} ideas[/green]")
         logger.stage_complete("Expander", f"Expanded {len(expanded)} ideas")
 
@@ -219,46 +230,11 @@ async def run_synthesis(
         sys.exit(1)
 
 
-def load_or_create_state(state_file: Path, resume_id: str | None) -> SynthesisState:
+def load_or_create_state(journal: SynthesisJournal, resume_id: str | None) -> SynthesisState:
     """Load existing state or create new one."""
-    if resume_id and state_file.exists():
-        state_data = read_json_with_retry(state_file)
-        if state_data and state_data.get("session_id") == resume_id:
-            # Reconstruct state from saved data
-            state = SynthesisState(
-                session_id=state_data["session_id"],
-                total_files=state_data.get("total_files", 0),
-                processed_files=state_data.get("processed_files", 0),
-                current_stage=state_data.get("current_stage", "reader"),
-                metadata=state_data.get("metadata", {}),
-            )
-
-            # Restore summaries
-            for s in state_data.get("summaries", []):
-                state.summaries.append(
-                    FileSummary(
-                        file_path=Path(s["file_path"]),
-                        key_points=s["key_points"],
-                        main_ideas=s["main_ideas"],
-                        important_quotes=s["important_quotes"],
-                        metadata=s.get("metadata", {}),
-                        timestamp=datetime.fromisoformat(s["timestamp"]),
-                    )
-                )
-
-            # Restore themes
-            for t in state_data.get("themes", []):
-                state.themes.append(
-                    CrossCuttingTheme(
-                        theme=t["theme"],
-                        description=t["description"],
-                        supporting_points=t["supporting_points"],
-                        source_files=[Path(f) for f in t["source_files"]],
-                        confidence=t["confidence"],
-                        metadata=t.get("metadata", {}),
-                    )
-                )
-
+    if resume_id:
+        state = journal.load(resume_id)
+        if state:
             return state
 
     # Create new state
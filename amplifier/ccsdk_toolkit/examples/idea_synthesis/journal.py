@@ -0,0 +1,207 @@
+"""Append-only persistence for synthesis state.
+
+Each finished summary, theme set and expanded idea is appended to a JSONL
+journal as it completes, so saving progress costs one line instead of
+re-serializing the whole state. Every ``snapshot_every`` entries (and at the
+end of each stage) the full state is written to the snapshot file and the
+journal is truncated. Loading reads the snapshot and replays the journal;
+replay is idempotent, so a crash between writing a snapshot and truncating
+the journal loses nothing.
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from amplifier.ccsdk_toolkit.defensive import read_json_with_retry
+from amplifier.ccsdk_toolkit.defensive import write_json_with_retry
+
+from .models import CrossCuttingTheme
+from .models import ExpandedIdea
+from .models import FileSummary
+from .models import SynthesisState
+
+logger = logging.getLogger(__name__)
+
+
+def summary_to_dict(summary: FileSummary) -> dict[str, Any]:
+    return {
+        "file_path": str(summary.file_path),
+        "key_points": summary.key_points,
+        "main_ideas": summary.main_ideas,
+        "important_quotes": summary.important_quotes,
+        "metadata": summary.metadata,
+        "timestamp": summary.timestamp.isoformat(),
+    }
+
+
+def summary_from_dict(data: dict[str, Any]) -> FileSummary:
+    return FileSummary(
+        file_path=Path(data["file_path"]),
+        key_points=data["key_points"],
+        main_ideas=data["main_ideas"],
+        important_quotes=data["important_quotes"],
+        metadata=data.get("metadata", {}),
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+    )
+
+
+def theme_to_dict(theme: CrossCuttingTheme) -> dict[str, Any]:
+    return {
+        "theme": theme.theme,
+        "description": theme.description,
+        "supporting_points": theme.supporting_points,
+        "source_files": [str(f) for f in theme.source_files],
+        "confidence": theme.confidence,
+        "metadata": theme.metadata,
+    }
+
+
+def theme_from_dict(data: dict[str, Any]) -> CrossCuttingTheme:
+    return CrossCuttingTheme(
+        theme=data["theme"],
+        description=data["description"],
+        supporting_points=data["supporting_points"],
+        source_files=[Path(f) for f in data["source_files"]],
+        confidence=data["confidence"],
+        metadata=data.get("metadata", {}),
+    )
+
+
+def idea_to_dict(idea: ExpandedIdea) -> dict[str, Any]:
+    return {
+        "title": idea.title,
+        "synthesis": idea.synthesis,
+        "themes": [t.theme for t in idea.themes],
+        "supporting_quotes": [[str(q[0]), q[1]] for q in idea.supporting_quotes],
+        "action_items": idea.action_items,
+        "metadata": idea.metadata,
+        "timestamp": idea.timestamp.isoformat(),
+    }
+
+
+def idea_from_dict(data: dict[str, Any], themes: dict[str, CrossCuttingTheme]) -> ExpandedIdea:
+    return ExpandedIdea(
+        title=data["title"],
+        synthesis=data["synthesis"],
+        themes=[themes[name] for name in data.get("themes", []) if name in themes],
+        supporting_quotes=[(Path(path), quote) for path, quote in data.get("supporting_quotes", [])],
+        action_items=data["action_items"],
+        metadata=data.get("metadata", {}),
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+    )
+
+
+class SynthesisJournal:
+    """Snapshot plus append-only journal of a synthesis session's results."""
+
+    def __init__(self, state_file: Path, snapshot_every: int = 200):
+        """Initialize the journal.
+
+        Args:
+            state_file: Snapshot path; the journal lives next to it with a .journal.jsonl suffix
+            snapshot_every: Journal entries between snapshots
+        """
+        self.state_file = state_file
+        self.journal_file = state_file.with_suffix(".journal.jsonl")
+        self.snapshot_every = snapshot_every
+        self._entries = 0
+
+    def load(self, session_id: str) -> SynthesisState | None:
+        """Rebuild a session's state from the snapshot and journal, None if neither belongs to it."""
+        data = read_json_with_retry(self.state_file) if self.state_file.exists() else None
+        if data and data.get("session_id") != session_id:
+            return None
+        state = SynthesisState(session_id=session_id)
+        summaries: dict[str, FileSummary] = {}
+        themes: list[CrossCuttingTheme] = []
+        ideas: dict[str, dict[str, Any]] = {}
+
+        if data:
+            state.total_files = data.get("total_files", 0)
+            state.current_stage = data.get("current_stage", "reader")
+            state.metadata = data.get("metadata", {})
+            for s in data.get("summaries", []):
+                summaries[s["file_path"]] = summary_from_dict(s)
+            themes = [theme_from_dict(t) for t in data.get("themes", [])]
+            for e in data.get("expanded_ideas", []):
+                ideas[",".join(e.get("themes", []))] = e
+
+        replayed = False
+        for entry in self._read_entries():
+            if entry.get("session_id") != session_id:
+                continue
+            replayed = True
+            kind = entry["kind"]
+            if kind == "summary":
+                summaries[entry["data"]["file_path"]] = summary_from_dict(entry["data"])
+            elif kind == "themes":
+                themes = [theme_from_dict(t) for t in entry["data"]]
+            elif kind == "expanded":
+                ideas[",".join(entry["data"].get("themes", []))] = entry["data"]
+            elif kind == "stage":
+                state.current_stage = entry["data"]
+        if not data and not replayed:
+            return None
+
+        themes_by_name = {t.theme: t for t in themes}
+        state.summaries = list(summaries.values())
+        state.processed_files = len(state.summaries)
+        state.themes = themes
+        state.expanded_ideas = [idea_from_dict(e, themes_by_name) for e in ideas.values()]
+        self._entries = 0
+        return state
+
+    def record_summary(self, state: SynthesisState, summary: FileSummary) -> None:
+        self._append(state, "summary", summary_to_dict(summary))
+
+    def record_themes(self, state: SynthesisState) -> None:
+        self._append(state, "themes", [theme_to_dict(t) for t in state.themes])
+
+    def record_idea(self, state: SynthesisState, idea: ExpandedIdea) -> None:
+        self._append(state, "expanded", idea_to_dict(idea))
+
+    def record_stage(self, state: SynthesisState) -> None:
+        self._append(state, "stage", state.current_stage)
+
+    def snapshot(self, state: SynthesisState) -> None:
+        """Write the full state and start an empty journal."""
+        state.last_updated = datetime.now(state.last_updated.tzinfo)
+        write_json_with_retry(
+            {
+                "session_id": state.session_id,
+                "total_files": state.total_files,
+                "processed_files": state.processed_files,
+                "current_stage": state.current_stage,
+                "last_updated": state.last_updated.isoformat(),
+                "metadata": state.metadata,
+                "summaries": [summary_to_dict(s) for s in state.summaries],
+                "themes": [theme_to_dict(t) for t in state.themes],
+                "expanded_ideas": [idea_to_dict(e) for e in state.expanded_ideas],
+            },
+            self.state_file,
+        )
+        self.journal_file.unlink(missing_ok=True)
+        self._entries = 0
+
+    def _append(self, state: SynthesisState, kind: str, data: Any) -> None:
+        entry = {"session_id": state.session_id, "kind": kind, "data": data}
+        with open(self.journal_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        self._entries += 1
+        if self._entries >= self.snapshot_every:
+            self.snapshot(state)
+
+    def _read_entries(self) -> list[dict[str, Any]]:
+        if not self.journal_file.exists():
+            return []
+        entries = []
+        for line in self.journal_file.read_text(encoding="utf-8").splitlines():
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A line cut short by a crash mid-write
+                logger.warning(f"Skipping unreadable journal line in {self.journal_file}")
+        return entries
@@ -1,5 +1,6 @@
 """Expander stage - expands themes with deeper context and synthesis."""
 
+import asyncio
 from pathlib import Path
 
 from rich.console import Console
@@ -7,12 +8,10 @@ from rich.progress import Progress
 from rich.progress import SpinnerColumn
 from rich.progress import TextColumn
 
-from amplifier.ccsdk_toolkit.defensive import write_json_with_retry
-
+from ..journal import SynthesisJournal
 from ..models import CrossCuttingTheme
 from ..models import ExpandedIdea
 from ..models import FileSummary
-from ..models import SourceFile
 from ..models import SynthesisState
 from ..utils import query_claude_with_timeout
 
@@ -20,21 +19,22 @@ from ..utils import query_claude_with_timeout
 class ExpanderStage:
     """Expands themes into comprehensive synthesis."""
 
-    def __init__(self, state_file: Path, console: Console | None = None):
+    def __init__(self, journal: SynthesisJournal, console: Console | None = None, concurrency: int = 8):
         """Initialize the expander stage.
 
         Args:
-            state_file: Path to save state
+            journal: Where expanded ideas are recorded
             console: Rich console for output
+            concurrency: Maximum themes expanded at once
         """
-        self.state_file = state_file
+        self.journal = journal
         self.console = console or Console()
+        self.concurrency = max(1, concurrency)
 
     async def expand_ideas(
         self,
         themes: list[CrossCuttingTheme],
         summaries: list[FileSummary],
-        source_files: list[SourceFile],
         state: SynthesisState,
     ) -> list[ExpandedIdea]:
         """Expand themes into comprehensive ideas with context.
@@ -42,52 +42,63 @@ class ExpanderStage:
         Args:
             themes: List of cross-cutting themes
             summaries: List of file summaries
-            source_files: Original source files
             state: Current synthesis state
 
         Returns:
             List of expanded ideas
         """
-        # Skip if already processed
-        if state.expanded_ideas:
+        # Skip themes expanded by an earlier run of this session
+        expanded_themes = {t.theme for idea in state.expanded_ideas for t in idea.themes}
+        pending = [theme for theme in themes if theme.theme not in expanded_themes]
+        if not pending:
             self.console.print("[yellow]Ideas already expanded, skipping...[/yellow]")
             return state.expanded_ideas
 
+        summaries_by_path = {s.file_path: s for s in summaries}
+        slots = asyncio.Semaphore(self.concurrency)
+        expanded_ideas = []
+
         with Progress(
             SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=self.console
         ) as progress:
-            task = progress.add_task(f"Expanding {len(themes)} themes...", total=len(themes))
-
-            expanded_ideas = []
+            task = progress.add_task(f"Expanding {len(pending)} themes...", total=len(pending))
 
-            for theme in themes:
+            async def expand(theme: CrossCuttingTheme) -> None:
                 try:
-                    expanded = await self._expand_theme(theme, summaries, source_files)
-                    expanded_ideas.append(expanded)
-
-                    # Save immediately
-                    state.expanded_ideas.append(expanded)
-                    state.current_stage = "expander"
-                    self._save_state(state)
-
-                    progress.update(task, advance=1, description=f"Expanded: {theme.theme[:30]}...")
-
+                    async with slots:
+                        expanded = await self._expand_theme(theme, summaries_by_path)
                 except Exception as e:
                     self.console.print(f"[red]Error expanding theme '{theme.theme}': {e}[/red]")
                     progress.update(task, advance=1)
-                    continue
+                    return
 
-            return expanded_ideas
+                # Record immediately
+                expanded_ideas.append(expanded)
+                state.expanded_ideas.append(expanded)
+                state.current_stage = "expander"
+                self.journal.record_idea(state, expanded)
 
-    async def _expand_theme(
-        self, theme: CrossCuttingTheme, summaries: list[FileSummary], source_files: list[SourceFile]
-    ) -> ExpandedIdea:
+                progress.update(task, advance=1, description=f"Expanded: {theme.theme[:30]}...")
+
+            await asyncio.gather(*(expand(theme) for theme in pending))
+
+        # Present ideas in theme order, whatever order they finished in
+        theme_order = {theme.theme: index for index, theme in enumerate(themes)}
+
+        def position(idea: ExpandedIdea) -> int:
+            return theme_order.get(idea.themes[0].theme, len(themes)) if idea.themes else len(themes)
+
+        state.expanded_ideas.sort(key=position)
+        expanded_ideas.sort(key=position)
+        self.journal.snapshot(state)
+        return expanded_ideas
+
+    async def _expand_theme(self, theme: CrossCuttingTheme, summaries: dict[Path, FileSummary]) -> ExpandedIdea:
         """Expand a single theme with full context.
 
         Args:
             theme: Theme to expand
-            summaries: All file summaries
-            source_files: Original source files
+            summaries: All file summaries by file path
 
         Returns:
             Expanded idea
@@ -95,14 +106,10 @@ class ExpanderStage:
         # Gather relevant quotes from source files
         relevant_quotes = []
         for source_path in theme.source_files:
-            # Find the source file
-            source = next((s for s in source_files if s.path == source_path), None)
-            if source:
-                # Find summary for this file
-                summary = next((s for s in summaries if s.file_path == source_path), None)
-                if summary and summary.important_quotes:
-                    for quote in summary.important_quotes[:2]:  # Limit quotes per file
-                        relevant_quotes.append((source_path, quote))
+            summary = summaries.get(source_path)
+            if summary and summary.important_quotes:
+                for quote in summary.important_quotes[:2]:  # Limit quotes per file
+                    relevant_quotes.append((source_path, quote))
 
         system_prompt = """You are an expert at synthesizing ideas and creating actionable insights.
 Your task is to expand themes into comprehensive, actionable syntheses."""
@@ -154,50 +161,3 @@ Return JSON:
             action_items=action_items,
             metadata={"confidence": theme.confidence},
         )
-
-    def _save_state(self, state: SynthesisState) -> None:
-        """Save current state to disk."""
-        state_dict = {
-            "session_id": state.session_id,
-            "total_files": state.total_files,
-            "processed_files": state.processed_files,
-            "current_stage": state.current_stage,
-            "last_updated": state.last_updated.isoformat(),
-            "metadata": state.metadata,
-            "summaries": [
-                {
-                    "file_path": str(s.file_path),
-                    "key_points": s.key_points,
-                    "main_ideas": s.main_ideas,
-                    "important_quotes": s.important_quotes,
-                    "metadata": s.metadata,
-                    "timestamp": s.timestamp.isoformat(),
-                }
-                for s in state.summaries
-            ],
-            "themes": [
-                {
-                    "theme": t.theme,
-                    "description": t.description,
-                    "supporting_points": t.supporting_points,
-                    "source_files": [str(f) for f in t.source_files],
-                    "confidence": t.confidence,
-                    "metadata": t.metadata,
-                }
-                for t in state.themes
-            ],
-            "expanded_ideas": [
-                {
-                    "title": e.title,
-                    "synthesis": e.synthesis,
-                    "themes": [t.theme for t in e.themes],
-                    "supporting_quotes": [[str(q[0]), q[1]] for q in e.supporting_quotes],
-                    "action_items": e.action_items,
-                    "metadata": e.metadata,
-                    "timestamp": e.timestamp.isoformat(),
-                }
-                for e in state.expanded_ideas
-            ],
-        }
-
-        write_json_with_retry(state_dict, self.state_file)
@@ -23,7 +23,13 @@ class ReaderStage:
         self.console = console or Console()
 
     def read_files(
-        self, directory: Path, pattern: str = "*.md", recursive: bool = True, limit: int | None = None, skip: int = 0
+        self,
+        directory: Path,
+        pattern: str = "*.md",
+        recursive: bool = True,
+        limit: int | None = None,
+        skip: int = 0,
+        exclude: set[Path] | None = None,
     ) -> Generator[SourceFile, None, None]:
         """Read markdown files from directory.
 
@@ -32,7 +38,8 @@ class ReaderStage:
             pattern: Glob pattern for files
             recursive: Whether to search recursively
             limit: Maximum files to read
-            skip: Number of files to skip (for resume)
+            skip: Number of files to skip
+            exclude: Files not to read, such as those already summarized (for resume)
 
         Yields:
             SourceFile objects
@@ -43,7 +50,9 @@ class ReaderStage:
         else:
             files = sorted(directory.glob(pattern))
 
-        # Apply skip and limit
+        # Apply exclude, skip and limit
+        if exclude:
+            files = [f for f in files if f not in exclude]
         if skip > 0:
             files = files[skip:]
         if limit:
@@ -1,6 +1,6 @@
 """Summarizer stage - creates summaries of each file using AI."""
 
-from pathlib import Path
+import asyncio
 
 from rich.console import Console
 from rich.progress import BarColumn
@@ -9,8 +9,7 @@ from rich.progress import SpinnerColumn
 from rich.progress import TaskProgressColumn
 from rich.progress import TextColumn
 
-from amplifier.ccsdk_toolkit.defensive import write_json_with_retry
-
+from ..journal import SynthesisJournal
 from ..models import FileSummary
 from ..models import SourceFile
 from ..models import SynthesisState
@@ -20,18 +19,23 @@ from ..utils import query_claude_with_timeout
 class SummarizerStage:
     """Summarizes markdown files using Claude."""
 
-    def __init__(self, state_file: Path, console: Console | None = None):
+    def __init__(self, journal: SynthesisJournal, console: Console | None = None, concurrency: int = 8):
         """Initialize the summarizer stage.
 
         Args:
-            state_file: Path to save state
+            journal: Where finished summaries are recorded
             console: Rich console for output
+            concurrency: Maximum files summarized at once
         """
-        self.state_file = state_file
+        self.journal = journal
         self.console = console or Console()
+        self.concurrency = max(1, concurrency)
 
     async def summarize_files(self, files: list[SourceFile], state: SynthesisState) -> list[FileSummary]:
-        """Summarize a list of files.
+        """Summarize a list of files, up to ``concurrency`` at a time.
+
+        Summaries are recorded in the journal as each one finishes, so their
+        order follows completion, not input order.
 
         Args:
             files: List of source files to summarize
@@ -44,6 +48,8 @@ class SummarizerStage:
 
         # Check which files are already processed
         processed_paths = {s.file_path for s in state.summaries}
+        pending = [file for file in files if file.path not in processed_paths]
+        slots = asyncio.Semaphore(self.concurrency)
 
         with Progress(
             SpinnerColumn(),
@@ -53,30 +59,29 @@ class SummarizerStage:
             console=self.console,
         ) as progress:
             task = progress.add_task(f"Summarizing {len(files)} files...", total=len(files))
+            progress.update(task, advance=len(files) - len(pending))
 
-            for file in files:
-                # Skip if already processed
-                if file.path in processed_paths:
-                    progress.update(task, advance=1)
-                    continue
-
+            async def summarize(file: SourceFile) -> None:
                 try:
-                    summary = await self._summarize_single(file)
-                    summaries.append(summary)
-
-                    # Add to state and save immediately
-                    state.summaries.append(summary)
-                    state.processed_files += 1
-                    state.current_stage = "summarizer"
-                    self._save_state(state)
-
-                    progress.update(task, advance=1, description=f"Summarized {file.path.name}")
-
+                    async with slots:
+                        summary = await self._summarize_single(file)
                 except Exception as e:
                     self.console.print(f"[red]Error summarizing {file.path}: {e}[/red]")
                     progress.update(task, advance=1)
-                    continue
+                    return
+
+                # Add to state and record immediately
+                summaries.append(summary)
+                state.summaries.append(summary)
+                state.processed_files += 1
+                state.current_stage = "summarizer"
+                self.journal.record_summary(state, summary)
+
+                progress.update(task, advance=1, description=f"Summarized {file.path.name}")
 
+            await asyncio.gather(*(summarize(file) for file in pending))
+
+        self.journal.snapshot(state)
         return summaries
 
     async def _summarize_single(self, file: SourceFile) -> FileSummary:
@@ -132,50 +137,3 @@ Focus on:
             important_quotes=important_quotes,
             metadata=file.metadata,
         )
-
-    def _save_state(self, state: SynthesisState) -> None:
-        """Save current state to disk."""
-        state_dict = {
-            "session_id": state.session_id,
-            "total_files": state.total_files,
-            "processed_files": state.processed_files,
-            "current_stage": state.current_stage,
-            "last_updated": state.last_updated.isoformat(),
-            "metadata": state.metadata,
-            "summaries": [
-                {
-                    "file_path": str(s.file_path),
-                    "key_points": s.key_points,
-                    "main_ideas": s.main_ideas,
-                    "important_quotes": s.important_quotes,
-                    "metadata": s.metadata,
-                    "timestamp": s.timestamp.isoformat(),
-                }
-                for s in state.summaries
-            ],
-            "themes": [
-                {
-                    "theme": t.theme,
-                    "description": t.description,
-                    "supporting_points": t.supporting_points,
-                    "source_files": [str(f) for f in t.source_files],
-                    "confidence": t.confidence,
-                    "metadata": t.metadata,
-                }
-                for t in state.themes
-            ],
-            "expanded_ideas": [
-                {
-                    "title": e.title,
-                    "synthesis": e.synthesis,
-                    "themes": [t.theme for t in e.themes],
-                    "supporting_quotes": [[str(q[0]), q[1]] for q in e.supporting_quotes],
-                    "action_items": e.action_items,
-                    "metadata": e.metadata,
-                    "timestamp": e.timestamp.isoformat(),
-                }
-                for e in state.expanded_ideas
-            ],
-        }
-
-        write_json_with_retry(state_dict, self.state_file)
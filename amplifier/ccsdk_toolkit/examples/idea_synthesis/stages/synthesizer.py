@@ -1,14 +1,11 @@
 """Synthesizer stage - finds cross-cutting themes across summaries."""
 
-from pathlib import Path
-
 from rich.console import Console
 from rich.progress import Progress
 from rich.progress import SpinnerColumn
 from rich.progress import TextColumn
 
-from amplifier.ccsdk_toolkit.defensive import write_json_with_retry
-
+from ..journal import SynthesisJournal
 from ..models import CrossCuttingTheme
 from ..models import FileSummary
 from ..models import SynthesisState
@@ -18,14 +15,14 @@ from ..utils import query_claude_with_timeout
 class SynthesizerStage:
     """Synthesizes themes across document summaries."""
 
-    def __init__(self, state_file: Path, console: Console | None = None):
+    def __init__(self, journal: SynthesisJournal, console: Console | None = None):
         """Initialize the synthesizer stage.
 
         Args:
-            state_file: Path to save state
+            journal: Where the themes are recorded
             console: Rich console for output
         """
-        self.state_file = state_file
+        self.journal = journal
         self.console = console or Console()
 
     async def synthesize_themes(self, summaries: list[FileSummary], state: SynthesisState) -> list[CrossCuttingTheme]:
@@ -54,7 +51,8 @@ class SynthesizerStage:
                 # Save themes to state
                 state.themes = themes
                 state.current_stage = "synthesizer"
-                self._save_state(state)
+                self.journal.record_themes(state)
+                self.journal.snapshot(state)
 
                 progress.update(task, advance=1, description=f"Found {len(themes)} themes")
 
@@ -120,6 +118,10 @@ Focus on themes that:
 
         response = await query_claude_with_timeout(prompt=prompt, system_prompt=system_prompt, parse_json=True)
 
+        paths_by_name = {}
+        for summary in summaries:
+            paths_by_name.setdefault(summary.file_path.name, summary.file_path)
+
         themes = []
         # Ensure response is a list
         theme_list = response if isinstance(response, list) else []
@@ -127,12 +129,8 @@ Focus on themes that:
             if not isinstance(theme_data, dict):
                 continue
             # Map file names back to paths
-            source_paths = []
-            for file_name in theme_data.get("source_files", []):
-                for summary in summaries:
-                    if summary.file_path.name == file_name:
-                        source_paths.append(summary.file_path)
-                        break
+            file_names = theme_data.get("source_files", [])
+            source_paths = [paths_by_name[name] for name in file_names if name in paths_by_name]
 
             themes.append(
                 CrossCuttingTheme(
@@ -145,50 +143,3 @@ Focus on themes that:
             )
 
         return themes
-
-    def _save_state(self, state: SynthesisState) -> None:
-        """Save current state to disk."""
-        state_dict = {
-            "session_id": state.session_id,
-            "total_files": state.total_files,
-            "processed_files": state.processed_files,
-            "current_stage": state.current_stage,
-            "last_updated": state.last_updated.isoformat(),
-            "metadata": state.metadata,
-            "summaries": [
-                {
-                    "file_path": str(s.file_path),
-                    "key_points": s.key_points,
-                    "main_ideas": s.main_ideas,
-                    "important_quotes": s.important_quotes,
-                    "metadata": s.metadata,
-                    "timestamp": s.timestamp.isoformat(),
-                }
-                for s in state.summaries
-            ],
-            "themes": [
-                {
-                    "theme": t.theme,
-                    "description": t.description,
-                    "supporting_points": t.supporting_points,
-                    "source_files": [str(f) for f in t.source_files],
-                    "confidence": t.confidence,
-                    "metadata": t.metadata,
-                }
-                for t in state.themes
-            ],
-            "expanded_ideas": [
-                {
-                    "title": e.title,
-                    "synthesis": e.synthesis,
-                    "themes": [t.theme for t in e.themes],
-                    "supporting_quotes": [[str(q[0]), q[1]] for q in e.supporting_quotes],
-                    "action_items": e.action_items,
-                    "metadata": e.metadata,
-                    "timestamp": e.timestamp.isoformat(),
-                }
-                for e in state.expanded_ideas
-            ],
-        }
-
-        write_json_with_retry(state_dict, self.state_file)
@@ -47,7 +47,8 @@ class GraphBuilder:
         logger.info(f"Loaded {len(extractions)} extractions")
         return extractions
 
-    def normalize_concept(self, name: str) -> str:
+    @staticmethod
+    def normalize_concept(name: str) -> str:
         """Simple normalization: lowercase, strip punctuation at ends."""
         name = name.strip().lower()
         # Remove trailing punctuation but keep internal punctuation
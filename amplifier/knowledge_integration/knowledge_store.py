@@ -7,6 +7,8 @@ Simple, direct implementation with no unnecessary abstractions.
 import json
 import logging
 from collections import defaultdict
+from collections.abc import Iterator
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -14,15 +16,48 @@ from amplifier.knowledge_integration.entity_resolver import EntityResolver
 from amplifier.knowledge_integration.models import Relationship
 from amplifier.knowledge_integration.models import UnifiedExtraction
 from amplifier.knowledge_integration.models import UnifiedKnowledgeNode
+from amplifier.utils import sqlite_utils
 
 logger = logging.getLogger(__name__)
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS nodes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL UNIQUE,
+    type TEXT NOT NULL,
+    definition TEXT NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_nodes_type ON nodes(type);
+CREATE TABLE IF NOT EXISTS node_sources (
+    node_id TEXT NOT NULL,
+    source TEXT NOT NULL,
+    PRIMARY KEY (node_id, source)
+);
+CREATE INDEX IF NOT EXISTS idx_node_sources_source ON node_sources(source);
+CREATE TABLE IF NOT EXISTS relationships (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    subject TEXT NOT NULL,
+    predicate TEXT NOT NULL,
+    object TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    source TEXT,
+    UNIQUE (subject, predicate, object)
+);
+CREATE INDEX IF NOT EXISTS idx_relationships_object ON relationships(object);
+CREATE TABLE IF NOT EXISTS processed_sources (source TEXT PRIMARY KEY);
+"""
+
 
 class UnifiedKnowledgeStore:
     """
     Store for unified knowledge graph with concepts and relationships.
 
-    Handles incremental updates and maintains indices for fast retrieval.
+    Handles incremental updates and keeps the graph in an embedded SQLite
+    database (WAL mode), so lookups by name, type, source or relationship
+    endpoint are indexed queries and readers can run while a sync writes.
     """
 
     def __init__(self, storage_path: Path | None = None, use_entity_resolution: bool = True):
@@ -30,11 +65,13 @@ class UnifiedKnowledgeStore:
         Initialize the unified knowledge store.
 
         Args:
-            storage_path: Path to JSON storage file
+            storage_path: Path to the SQLite database (a legacy JSON file with the
+                same stem is imported once on first open)
             use_entity_resolution: Whether to use entity resolution for deduplication
         """
-        self.storage_path = storage_path or Path(".data/knowledge/graph.json")
-        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        storage_path = storage_path or Path(".data/knowledge/graph.db")
+        self.storage_path = storage_path.with_suffix(".db")
+        self.legacy_path = storage_path.with_suffix(".json")
         self.use_entity_resolution = use_entity_resolution
 
         # Initialize entity resolver
@@ -45,30 +82,49 @@ class UnifiedKnowledgeStore:
             self.entity_resolver = None
 
         # Core storage
-        self.nodes: dict[str, UnifiedKnowledgeNode] = {}
-        self.relationships: list[Relationship] = []
-        self.relationship_signatures: set[str] = set()  # For deduplication
+        self._conn = sqlite_utils.connect(self.storage_path)
+        self._conn.executescript(_SCHEMA)
+
+        # Dict-like views kept for compatibility, every lookup is an indexed query
+        self.nodes: Mapping[str, UnifiedKnowledgeNode] = sqlite_utils.QueryMapping(
+            self._get_node,
+            lambda: self._iter_column("SELECT id FROM nodes ORDER BY seq"),
+            lambda: self._count("SELECT COUNT(*) FROM nodes"),
+            lambda: ((node.id, node) for node in self._fetch_nodes("1", ())),
+        )
+        self.name_to_id: Mapping[str, str] = sqlite_utils.QueryMapping(
+            self._get_node_id,
+            lambda: self._iter_column("SELECT name FROM nodes ORDER BY seq"),
+            lambda: self._count("SELECT COUNT(*) FROM nodes"),
+        )
+
+        # Loaded on first access, dropped whenever a relationship is written
+        self._relationships: list[Relationship] | None = None
 
-        # Indices for fast lookup
-        self.name_to_id: dict[str, str] = {}
-        self.type_index: dict[str, list[str]] = defaultdict(list)
-        self.source_index: dict[str, list[str]] = defaultdict(list)
+        # Import existing JSON data
+        self.load()
 
-        # Track processed sources
-        self.processed_sources: set[str] = set()
+    @property
+    def relationships(self) -> list[Relationship]:
+        """All relationships in insertion order."""
+        if self._relationships is None:
+            self._relationships = self._fetch_relationships("1", ())
+        return self._relationships
 
-        # ID counter
-        self.next_id = 1
+    @property
+    def processed_sources(self) -> set[str]:
+        return set(self._iter_column("SELECT source FROM processed_sources"))
 
-        # Load existing data
-        if self.storage_path.exists():
-            self.load()
+    @property
+    def next_id(self) -> int:
+        return sqlite_utils.get_meta(self._conn, "next_id", 1)
 
     def add_extraction(self, extraction: UnifiedExtraction) -> dict[str, Any]:
         """
         Add a unified extraction to the store.
 
         Processes both concepts and relationships, creating nodes as needed.
+        Everything is written in a single transaction.
 
         Args:
             extraction: UnifiedExtraction containing concepts and relationships
@@ -79,77 +135,70 @@ class UnifiedKnowledgeStore:
         added_nodes = []
         added_relationships = []
 
-        # Process concepts
-        for concept_data in extraction.concepts:
-            node_id = self._add_or_update_node(
-                name=concept_data.get("name", ""),
-                node_type=concept_data.get("category", "concept"),
-                definition=concept_data.get("description", ""),
-                source=extraction.source,
-                metadata=concept_data,
-            )
-            added_nodes.append(node_id)
-
-        # Process relationships
-        for rel in extraction.relationships:
-            # Resolve entity names for subject and object
-            if self.entity_resolver:
-                subject_match = self.entity_resolver.resolve(rel.subject)
-                object_match = self.entity_resolver.resolve(rel.object)
-                resolved_subject = subject_match.canonical
-                resolved_object = object_match.canonical
-
-                # Create normalized relationship with resolved names
-                normalized_rel = Relationship(
-                    subject=resolved_subject,
-                    predicate=rel.predicate,
-                    object=resolved_object,
-                    confidence=rel.confidence,
-                    source=rel.source or extraction.source,
-                )
-            else:
-                resolved_subject = rel.subject
-                resolved_object = rel.object
-                normalized_rel = rel
-
-            # Create signature for deduplication
-            rel_signature = f"{resolved_subject}|{normalized_rel.predicate}|{resolved_object}"
-
-            # Skip if relationship already exists
-            if rel_signature in self.relationship_signatures:
-                continue
-
-            # Ensure nodes exist for subject and object
-            if resolved_subject not in self.name_to_id:
-                self._add_or_update_node(
-                    name=rel.subject,  # Use original name, will be resolved inside
-                    node_type="entity",
-                    definition=f"Entity from relationship: {rel}",
+        with self._conn:
+            # Process concepts
+            for concept_data in extraction.concepts:
+                node_id = self._add_or_update_node(
+                    name=concept_data.get("name", ""),
+                    node_type=concept_data.get("category", "concept"),
+                    definition=concept_data.get("description", ""),
                     source=extraction.source,
+                    metadata=concept_data,
                 )
+                added_nodes.append(node_id)
+
+            # Process relationships
+            for rel in extraction.relationships:
+                # Resolve entity names for subject and object
+                if self.entity_resolver:
+                    subject_match = self.entity_resolver.resolve(rel.subject)
+                    object_match = self.entity_resolver.resolve(rel.object)
+                    resolved_subject = subject_match.canonical
+                    resolved_object = object_match.canonical
+
+                    # Create normalized relationship with resolved names
+                    normalized_rel = Relationship(
+                        subject=resolved_subject,
+                        predicate=rel.predicate,
+                        object=resolved_object,
+                        confidence=rel.confidence,
+                        source=rel.source or extraction.source,
+                    )
+                else:
+                    resolved_subject = rel.subject
+                    resolved_object = rel.object
+                    normalized_rel = rel
+
+                # Skip if relationship already exists
+                if self._relationship_exists(normalized_rel):
+                    continue
+
+                # Ensure nodes exist for subject and object
+                if self._get_node_id(resolved_subject) is None:
+                    self._add_or_update_node(
+                        name=rel.subject,  # Use original name, will be resolved inside
+                        node_type="entity",
+                        definition=f"Entity from relationship: {rel}",
+                        source=extraction.source,
+                    )
+
+                if self._get_node_id(resolved_object) is None:
+                    self._add_or_update_node(
+                        name=rel.object,  # Use original name, will be resolved inside
+                        node_type="entity",
+                        definition=f"Entity from relationship: {rel}",
+                        source=extraction.source,
+                    )
+
+                # Store relationship (nodes pick it up through the subject/object indexes)
+                self._insert_relationship(normalized_rel)
+                added_relationships.append(str(normalized_rel))
+
+            # Only mark source as processed if we actually extracted something
+            if added_nodes or added_relationships:
+                self._conn.execute("INSERT OR IGNORE INTO processed_sources (source) VALUES (?)", (extraction.source,))
 
-            if resolved_object not in self.name_to_id:
-                self._add_or_update_node(
-                    name=rel.object,  # Use original name, will be resolved inside
-                    node_type="entity",
-                    definition=f"Entity from relationship: {rel}",
-                    source=extraction.source,
-                )
-
-            # Add relationship to nodes (using resolved names)
-            if resolved_subject in self.name_to_id:
-                self.nodes[self.name_to_id[resolved_subject]].add_relationship(normalized_rel)
-            if resolved_object in self.name_to_id:
-                self.nodes[self.name_to_id[resolved_object]].add_relationship(normalized_rel)
-
-            # Store relationship and signature
-            self.relationships.append(normalized_rel)
-            self.relationship_signatures.add(rel_signature)
-            added_relationships.append(str(normalized_rel))
-
-        # Only mark source as processed if we actually extracted something
         if added_nodes or added_relationships:
-            self.processed_sources.add(extraction.source)
             # Save immediately (incremental saving)
             self.save()
 
@@ -157,7 +206,7 @@ class UnifiedKnowledgeStore:
             "nodes_added": len(added_nodes),
             "relationships_added": len(added_relationships),
             "total_nodes": len(self.nodes),
-            "total_relationships": len(self.relationships),
+            "total_relationships": self._count("SELECT COUNT(*) FROM relationships"),
         }
 
     def _add_or_update_node(
@@ -197,44 +246,128 @@ class UnifiedKnowledgeStore:
             resolved_name = name
 
         # Check if node already exists (using resolved name)
-        if resolved_name in self.name_to_id:
-            node_id = self.name_to_id[resolved_name]
-            node = self.nodes[node_id]
+        row = self._conn.execute("SELECT id, metadata FROM nodes WHERE name = ?", (resolved_name,)).fetchone()
+        if row:
+            node_id = row["id"]
 
             # Update existing node
-            if source not in node.sources:
-                node.sources.append(source)
+            self._conn.execute("INSERT OR IGNORE INTO node_sources (node_id, source) VALUES (?, ?)", (node_id, source))
 
             # Merge metadata
             if metadata:
-                node.metadata.update(metadata)
+                merged = json.loads(row["metadata"])
+                merged.update(metadata)
+                self._conn.execute("UPDATE nodes SET metadata = ? WHERE id = ?", (json.dumps(merged), node_id))
 
             return node_id
 
         # Create new node
-        node_id = f"node_{self.next_id}"
-        self.next_id += 1
-
-        node = UnifiedKnowledgeNode(
-            id=node_id,
-            name=resolved_name,
-            type=node_type,
-            definition=definition,
-            sources=[source],
-            metadata=metadata or {},
+        next_id = self.next_id
+        sqlite_utils.set_meta(self._conn, "next_id", next_id + 1)
+        node_id = f"node_{next_id}"
+
+        self._insert_node(
+            UnifiedKnowledgeNode(
+                id=node_id,
+                name=resolved_name,
+                type=node_type,
+                definition=definition,
+                sources=[source],
+                metadata=metadata or {},
+            )
         )
 
-        # Store node and update indices
-        self.nodes[node_id] = node
-        self.name_to_id[resolved_name] = node_id
-        self.type_index[node_type].append(node_id)
-        self.source_index[source].append(node_id)
-
         return node_id
 
+    def _insert_node(self, node: UnifiedKnowledgeNode) -> None:
+        self._conn.execute(
+            "INSERT INTO nodes (id, name, type, definition, metadata) VALUES (?, ?, ?, ?, ?)",
+            (node.id, node.name, node.type, node.definition, json.dumps(node.metadata)),
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO node_sources (node_id, source) VALUES (?, ?)",
+            [(node.id, source) for source in node.sources],
+        )
+
+    def _insert_relationship(self, rel: Relationship) -> None:
+        self._relationships = None
+        self._conn.execute(
+            "INSERT OR IGNORE INTO relationships (subject, predicate, object, confidence, source) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (rel.subject, rel.predicate, rel.object, rel.confidence, rel.source),
+        )
+
+    def _relationship_exists(self, rel: Relationship) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM relationships WHERE subject = ? AND predicate = ? AND object = ?",
+            (rel.subject, rel.predicate, rel.object),
+        ).fetchone()
+        return row is not None
+
+    def _get_node_id(self, name: str) -> str | None:
+        row = self._conn.execute("SELECT id FROM nodes WHERE name = ?", (name,)).fetchone()
+        return row["id"] if row else None
+
+    def _get_node(self, node_id: str) -> UnifiedKnowledgeNode | None:
+        nodes = self._fetch_nodes("id = ?", (node_id,))
+        return nodes[0] if nodes else None
+
+    def _fetch_nodes(self, where: str, params: tuple[Any, ...]) -> list[UnifiedKnowledgeNode]:
+        """Load nodes matching a WHERE clause on the nodes table, with sources and relationships."""
+        rows = self._conn.execute(f"SELECT * FROM nodes WHERE {where} ORDER BY seq", params).fetchall()
+        if not rows:
+            return []
+
+        subquery = f"SELECT id FROM nodes WHERE {where}"
+        sources: dict[str, list[str]] = defaultdict(list)
+        for row in self._conn.execute(
+            f"SELECT node_id, source FROM node_sources WHERE node_id IN ({subquery}) ORDER BY rowid", params
+        ):
+            sources[row["node_id"]].append(row["source"])
+
+        nodes = {
+            row["name"]: UnifiedKnowledgeNode(
+                id=row["id"],
+                name=row["name"],
+                type=row["type"],
+                definition=row["definition"],
+                sources=sources.get(row["id"], []),
+                metadata=json.loads(row["metadata"]),
+            )
+            for row in rows
+        }
+
+        names = f"SELECT name FROM nodes WHERE {where}"
+        for rel in self._fetch_relationships(f"subject IN ({names}) OR object IN ({names})", params + params):
+            if rel.subject in nodes:
+                nodes[rel.subject].add_relationship(rel)
+            if rel.object in nodes and rel.object != rel.subject:
+                nodes[rel.object].add_relationship(rel)
+
+        return list(nodes.values())
+
+    def _fetch_relationships(self, where: str, params: tuple[Any, ...]) -> list[Relationship]:
+        return [
+            Relationship(
+                subject=row["subject"],
+                predicate=row["predicate"],
+                object=row["object"],
+                confidence=row["confidence"],
+                source=row["source"],
+            )
+            for row in self._conn.execute(f"SELECT * FROM relationships WHERE {where} ORDER BY seq", params)
+        ]
+
+    def _iter_column(self, sql: str, params: tuple[Any, ...] = ()) -> Iterator[str]:
+        return (row[0] for row in self._conn.execute(sql, params).fetchall())
+
+    def _count(self, sql: str, params: tuple[Any, ...] = ()) -> int:
+        return self._conn.execute(sql, params).fetchone()[0]
+
     def is_source_processed(self, source: str) -> bool:
         """Check if a source has already been processed."""
-        return source in self.processed_sources
+        row = self._conn.execute("SELECT 1 FROM processed_sources WHERE source = ?", (source,)).fetchone()
+        return row is not None
 
     def get_node_by_name(self, name: str) -> UnifiedKnowledgeNode | None:
         """Get a node by its name."""
@@ -245,13 +378,16 @@ class UnifiedKnowledgeStore:
         else:
             resolved_name = name
 
-        node_id = self.name_to_id.get(resolved_name)
-        return self.nodes.get(node_id) if node_id else None
+        nodes = self._fetch_nodes("name = ?", (resolved_name,))
+        return nodes[0] if nodes else None
 
     def get_nodes_by_type(self, node_type: str) -> list[UnifiedKnowledgeNode]:
         """Get all nodes of a specific type."""
-        node_ids = self.type_index.get(node_type, [])
-        return [self.nodes[node_id] for node_id in node_ids]
+        return self._fetch_nodes("type = ?", (node_type,))
+
+    def get_nodes_by_source(self, source: str) -> list[UnifiedKnowledgeNode]:
+        """Get all nodes extracted from a source."""
+        return self._fetch_nodes("id IN (SELECT node_id FROM node_sources WHERE source = ?)", (source,))
 
     def get_relationships_for_node(self, name: str) -> list[Relationship]:
         """Get all relationships involving a node."""
@@ -262,35 +398,8 @@ class UnifiedKnowledgeStore:
         return node.relationships_as_subject + node.relationships_as_object
 
     def save(self) -> None:
-        """Save the knowledge store to JSON."""
-        data = {
-            "nodes": [
-                {
-                    "id": node.id,
-                    "name": node.name,
-                    "type": node.type,
-                    "definition": node.definition,
-                    "sources": node.sources,
-                    "metadata": node.metadata,
-                }
-                for node in self.nodes.values()
-            ],
-            "relationships": [
-                {
-                    "subject": rel.subject,
-                    "predicate": rel.predicate,
-                    "object": rel.object,
-                    "confidence": rel.confidence,
-                    "source": rel.source,
-                }
-                for rel in self.relationships
-            ],
-            "processed_sources": list(self.processed_sources),
-            "next_id": self.next_id,
-        }
-
-        with open(self.storage_path, "w") as f:
-            json.dump(data, f, indent=2)
+        """Commit pending writes and persist the entity resolver cache."""
+        self._conn.commit()
 
         # Save entity resolver cache if available
         if self.entity_resolver:
@@ -298,82 +407,69 @@ class UnifiedKnowledgeStore:
 
         logger.info(f"Saved knowledge store to {self.storage_path}")
 
-    def load(self) -> None:
-        """Load the knowledge store from JSON."""
-        with open(self.storage_path) as f:
-            data = json.load(f)
-
-        # Clear existing data
-        self.nodes.clear()
-        self.relationships.clear()
-        self.relationship_signatures.clear()
-        self.name_to_id.clear()
-        self.type_index.clear()
-        self.source_index.clear()
-        self.processed_sources.clear()
-
-        # Load nodes
-        for node_data in data.get("nodes", []):
-            node = UnifiedKnowledgeNode(
-                id=node_data["id"],
-                name=node_data["name"],
-                type=node_data["type"],
-                definition=node_data["definition"],
-                sources=node_data.get("sources", []),
-                metadata=node_data.get("metadata", {}),
-            )
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
 
-            self.nodes[node.id] = node
-            self.name_to_id[node.name] = node.id
-            self.type_index[node.type].append(node.id)
-
-            for source in node.sources:
-                self.source_index[source].append(node.id)
-
-        # Load relationships
-        for rel_data in data.get("relationships", []):
-            rel = Relationship(
-                subject=rel_data["subject"],
-                predicate=rel_data["predicate"],
-                object=rel_data["object"],
-                confidence=rel_data.get("confidence", 1.0),
-                source=rel_data.get("source"),
-            )
+    def load(self) -> None:
+        """Import a legacy JSON store into the database (once, while the database is empty)."""
+        if not self.legacy_path.exists() or self.next_id != 1:
+            return
 
-            self.relationships.append(rel)
+        with open(self.legacy_path) as f:
+            data = json.load(f)
 
-            # Rebuild relationship signature for deduplication
-            rel_signature = f"{rel.subject}|{rel.predicate}|{rel.object}"
-            self.relationship_signatures.add(rel_signature)
+        with self._conn:
+            # Load nodes
+            for node_data in data.get("nodes", []):
+                self._insert_node(
+                    UnifiedKnowledgeNode(
+                        id=node_data["id"],
+                        name=node_data["name"],
+                        type=node_data["type"],
+                        definition=node_data["definition"],
+                        sources=node_data.get("sources", []),
+                        metadata=node_data.get("metadata", {}),
+                    )
+                )
 
-            # Add to nodes
-            if rel.subject in self.name_to_id:
-                self.nodes[self.name_to_id[rel.subject]].add_relationship(rel)
-            if rel.object in self.name_to_id:
-                self.nodes[self.name_to_id[rel.object]].add_relationship(rel)
+            # Load relationships
+            for rel_data in data.get("relationships", []):
+                self._insert_relationship(
+                    Relationship(
+                        subject=rel_data["subject"],
+                        predicate=rel_data["predicate"],
+                        object=rel_data["object"],
+                        confidence=rel_data.get("confidence", 1.0),
+                        source=rel_data.get("source"),
+                    )
+                )
 
-        # Load other data
-        self.processed_sources = set(data.get("processed_sources", []))
-        self.next_id = data.get("next_id", len(self.nodes) + 1)
+            # Load other data
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO processed_sources (source) VALUES (?)",
+                [(source,) for source in data.get("processed_sources", [])],
+            )
+            sqlite_utils.set_meta(self._conn, "next_id", data.get("next_id", len(data.get("nodes", [])) + 1))
 
-        logger.info(f"Loaded {len(self.nodes)} nodes and {len(self.relationships)} relationships")
+        logger.info(f"Imported {len(self.nodes)} nodes from {self.legacy_path} into {self.storage_path}")
 
     def get_statistics(self) -> dict[str, Any]:
         """Get statistics about the knowledge store."""
-        type_counts = {node_type: len(node_ids) for node_type, node_ids in self.type_index.items()}
+        type_counts = dict(self._conn.execute("SELECT type, COUNT(*) FROM nodes GROUP BY type").fetchall())
+        total_nodes = sum(type_counts.values())
+
+        # A relationship counts once for its subject node and once for its object node
+        endpoint_count = self._count(
+            "SELECT (SELECT COUNT(*) FROM relationships r JOIN nodes n ON n.name = r.subject)"
+            " + (SELECT COUNT(*) FROM relationships r JOIN nodes n ON n.name = r.object"
+            " WHERE r.object != r.subject)"
+        )
 
         return {
-            "total_nodes": len(self.nodes),
-            "total_relationships": len(self.relationships),
-            "total_sources": len(self.processed_sources),
+            "total_nodes": total_nodes,
+            "total_relationships": self._count("SELECT COUNT(*) FROM relationships"),
+            "total_sources": self._count("SELECT COUNT(*) FROM processed_sources"),
             "nodes_by_type": type_counts,
-            "average_relationships_per_node": (
-                sum(
-                    len(node.relationships_as_subject) + len(node.relationships_as_object)
-                    for node in self.nodes.values()
-                )
-                / len(self.nodes)
-                if self.nodes
-                else 0
-            ),
+            "average_relationships_per_node": endpoint_count / total_nodes if total_nodes else 0,
         }
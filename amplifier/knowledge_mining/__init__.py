@@ -7,6 +7,7 @@ from .knowledge_assistant import KnowledgeAssistant
 from .knowledge_extractor import KnowledgeExtractor
 from .knowledge_store import KnowledgeStore
 from .pattern_finder import PatternFinder
+from .pattern_finder import create_pattern_finder
 
 __all__ = [
     "InsightGenerator",
@@ -14,6 +15,7 @@ __all__ = [
     "KnowledgeExtractor",
     "KnowledgeStore",
     "PatternFinder",
+    "create_pattern_finder",
 ]
 
 __version__ = "1.0.0"
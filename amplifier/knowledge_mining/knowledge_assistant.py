@@ -17,7 +17,7 @@ from .insight_generator import InsightGenerator
 from .knowledge_extractor import KnowledgeExtractor
 from .knowledge_store import KnowledgeStore
 from .pattern_finder import Pattern
-from .pattern_finder import PatternFinder
+from .pattern_finder import create_pattern_finder
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +34,8 @@ class KnowledgeAssistant:
 
         # Initialize components
         self.extractor = KnowledgeExtractor()
-        self.store = KnowledgeStore(paths.data_dir / "knowledge" / "store.json")
-        self.pattern_finder = PatternFinder()
+        self.store = KnowledgeStore(paths.data_dir / "knowledge" / "store.db")
+        self.pattern_finder = create_pattern_finder()
         self.insight_generator = InsightGenerator(self.store)
 
         # Load existing extractions into pattern finder
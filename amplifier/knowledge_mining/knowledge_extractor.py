@@ -5,7 +5,6 @@ Simple, direct implementation that actually extracts semantic knowledge.
 """
 
 import asyncio
-import json
 import logging
 import subprocess
 import time
@@ -13,17 +12,18 @@ from dataclasses import dataclass
 from dataclasses import field
 from typing import Any
 
+from amplifier.ccsdk_toolkit.core.client import query_claude
+from amplifier.ccsdk_toolkit.core.governor import Priority
+from amplifier.ccsdk_toolkit.defensive.streaming_json import parse_first_json
+
 from .config import get_config
 
 try:
-    from claude_code_sdk import ClaudeCodeOptions
-    from claude_code_sdk import ClaudeSDKClient
+    import claude_code_sdk  # noqa: F401
 
     CLAUDE_SDK_AVAILABLE = True
 except ImportError:
     CLAUDE_SDK_AVAILABLE = False
-    ClaudeCodeOptions = None
-    ClaudeSDKClient = None
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +127,12 @@ class KnowledgeExtractor:
         config = get_config()
         # Use configured chars for fast classification
         sample_text = text[: config.knowledge_mining_classification_chars]
+        valid_types = config.get_valid_document_types()
+
+        def check_document_type(response: str) -> None:
+            # Only valid categories are worth caching
+            if response.strip().lower() not in valid_types:
+                raise ValueError(f"Invalid classification '{response.strip()}'")
 
         classification_prompt = f"""Classify this document into ONE of these categories:
 - article: formal article, research paper, or technical documentation
@@ -152,40 +158,27 @@ Respond with ONLY the category name, nothing else."""
 
         try:
             # Check if SDK is available (should never happen since we check in __init__)
-            if not CLAUDE_SDK_AVAILABLE or ClaudeSDKClient is None or ClaudeCodeOptions is None:
+            if not CLAUDE_SDK_AVAILABLE:
                 raise RuntimeError("FATAL: Claude Code SDK not available for classification")
 
-            # Use 10-minute timeout for SDK operations (600 seconds)
-            async with asyncio.timeout(600):
-                # Use configured model for fast classification with minimal turns
-                async with ClaudeSDKClient(
-                    options=ClaudeCodeOptions(
-                        system_prompt="You are a document classifier. Respond with only the category name.",
-                        max_turns=1,
-                        model=config.knowledge_mining_model,  # Fast, efficient model for classification
-                    )
-                ) as client:
-                    await client.query(classification_prompt)
-
-                    # Collect response
-                    response = ""
-                    async for message in client.receive_response():
-                        if hasattr(message, "content"):
-                            content = getattr(message, "content", [])
-                            if isinstance(content, list):
-                                for block in content:
-                                    if hasattr(block, "text"):
-                                        response += getattr(block, "text", "")
-
-                    # Clean and validate response
-                    doc_type = response.strip().lower()
-                    valid_types = config.get_valid_document_types()
-
-                    if doc_type in valid_types:
-                        logger.debug(f"Document classified as: {doc_type}")
-                        return doc_type
-                    logger.warning(f"Invalid classification '{doc_type}', defaulting to 'general'")
-                    return "general"
+            # Use configured model for fast classification with minimal turns
+            response = await query_claude(
+                classification_prompt,
+                system_prompt="You are a document classifier. Respond with only the category name.",
+                model=config.knowledge_mining_model,  # Fast, efficient model for classification
+                validate=check_document_type,
+                priority=Priority.CLASSIFICATION,  # Routing decision, ahead of bulk extraction
+                timeout=600,  # 10 minutes once admitted, queueing for a slot does not count
+            )
+
+            # Clean and validate response
+            doc_type = response.strip().lower()
+
+            if doc_type in valid_types:
+                logger.debug(f"Document classified as: {doc_type}")
+                return doc_type
+            logger.warning(f"Invalid classification '{doc_type}', defaulting to 'general'")
+            return "general"
 
         except TimeoutError:
             logger.error("Claude Code SDK timed out after 600 seconds for classification")
@@ -229,37 +222,20 @@ Respond with ONLY the category name, nothing else."""
             prompt = self._build_extraction_prompt(text, title, document_type)
 
             # Check if SDK is available
-            if not CLAUDE_SDK_AVAILABLE or ClaudeSDKClient is None or ClaudeCodeOptions is None:
+            if not CLAUDE_SDK_AVAILABLE:
                 logger.error("Claude Code SDK not available - cannot extract knowledge")
                 raise RuntimeError("Claude Code SDK is required for knowledge extraction")
 
             # Use Claude Code SDK to extract knowledge
-            logger.info("Initializing Claude Code SDK client...")
-
-            response = ""  # Initialize response before the async with block
-
-            # Use 10-minute timeout for SDK operations (600 seconds)
-            async with asyncio.timeout(600):
-                async with ClaudeSDKClient(
-                    options=ClaudeCodeOptions(
-                        system_prompt="You are a knowledge extraction expert. Extract structured knowledge from articles. Return ONLY valid JSON with no other text.",
-                        max_turns=1,
-                        model=config.knowledge_mining_extraction_model,  # More powerful model for extraction
-                    )
-                ) as client:
-                    # Send query
-                    logger.info("Sending query to Claude Code SDK...")
-                    await client.query(prompt)
-
-                    # Collect response - trust the SDK to work
-                    logger.info("Waiting for Claude Code SDK response...")
-                    async for message in client.receive_response():
-                        if hasattr(message, "content"):
-                            content = getattr(message, "content", [])
-                            if isinstance(content, list):
-                                for block in content:
-                                    if hasattr(block, "text"):
-                                        response += getattr(block, "text", "")
+            logger.info("Sending query to Claude Code SDK...")
+
+            response = await query_claude(
+                prompt,
+                system_prompt="You are a knowledge extraction expert. Extract structured knowledge from articles. Return ONLY valid JSON with no other text.",
+                model=config.knowledge_mining_extraction_model,  # More powerful model for extraction
+                validate=parse_first_json,
+                timeout=600,  # 10 minutes once admitted
+            )
 
             elapsed = time.time() - start_time
             logger.info(f"Received response in {elapsed:.1f} seconds ({len(response)} characters)")
@@ -269,22 +245,9 @@ Respond with ONLY the category name, nothing else."""
                 logger.info("Empty response received - likely interrupted")
                 raise RuntimeError("Extraction interrupted - no response received")
 
-            # Parse JSON response
-            # Strip markdown code block formatting if present
-            cleaned_response = response.strip()
-            if cleaned_response.startswith("```json"):
-                cleaned_response = cleaned_response[7:]  # Remove ```json
-            elif cleaned_response.startswith("```"):
-                cleaned_response = cleaned_response[3:]  # Remove ```
-
-            if cleaned_response.endswith("```"):
-                cleaned_response = cleaned_response[:-3]  # Remove trailing ```
-
-            # Strip any remaining whitespace
-            cleaned_response = cleaned_response.strip()
-
+            # Parse JSON response (fences, preambles and trailing commas are tolerated)
             try:
-                data = json.loads(cleaned_response)
+                data = parse_first_json(response)
 
                 # Convert to our data structures
                 concepts = [
@@ -328,13 +291,10 @@ Respond with ONLY the category name, nothing else."""
                     metadata={"extraction_method": "llm", "text_length": len(text), "extraction_time": elapsed},
                 )
 
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 logger.error(f"Failed to parse LLM response as JSON: {e}")
                 logger.error("Original response: %s", response[:500] if response else "(empty)")
-                logger.error("Cleaned response: %s", cleaned_response[:500] if cleaned_response else "(empty)")
-                raise ValueError(
-                    f"LLM did not return valid JSON.\nOriginal length: {len(response)}\nCleaned length: {len(cleaned_response)}\nError: {e}"
-                ) from e
+                raise ValueError(f"LLM did not return valid JSON.\nOriginal length: {len(response)}\nError: {e}") from e
 
         except TimeoutError:
             # Handles both asyncio.TimeoutError and builtin TimeoutError (asyncio.TimeoutError is a subclass in Python 3.11+)
@@ -6,18 +6,46 @@ Simple graph-based storage optimized for AI queries.
 
 import json
 from collections import defaultdict
-from dataclasses import asdict
+from collections.abc import Iterator
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from amplifier.config.paths import paths
+from amplifier.utils import sqlite_utils
 
 from .knowledge_extractor import Concept
 from .knowledge_extractor import Extraction
 from .pattern_finder import Pattern
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS nodes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    type TEXT NOT NULL,
+    concept_name TEXT UNIQUE,
+    content TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_nodes_type ON nodes(type);
+CREATE TABLE IF NOT EXISTS node_sources (
+    node_id TEXT NOT NULL,
+    source TEXT NOT NULL,
+    PRIMARY KEY (node_id, source)
+);
+CREATE INDEX IF NOT EXISTS idx_node_sources_source ON node_sources(source);
+CREATE TABLE IF NOT EXISTS connections (
+    from_id TEXT NOT NULL,
+    to_id TEXT NOT NULL,
+    PRIMARY KEY (from_id, to_id)
+);
+CREATE TABLE IF NOT EXISTS processed_sources (source TEXT PRIMARY KEY);
+"""
+
 
 @dataclass
 class KnowledgeNode:
@@ -33,109 +61,133 @@ class KnowledgeNode:
 
 
 class KnowledgeStore:
-    """Store and index extracted knowledge for fast retrieval"""
+    """Store and index extracted knowledge for fast retrieval.
+
+    Backed by an embedded SQLite database (WAL mode) so startup cost does not
+    depend on corpus size and CLI readers can query while a sync is writing.
+    A legacy ``store.json`` next to the database is imported once on first open.
+    """
 
     def __init__(self, storage_path: Path | None = None):
-        self.storage_path = storage_path or (paths.data_dir / "knowledge" / "store.json")
-        self.nodes: dict[str, KnowledgeNode] = {}
-        self.index: dict[str, list[str]] = defaultdict(list)  # type -> node_ids
-        self.concept_index: dict[str, str] = {}  # concept_name -> node_id
-        self.source_index: dict[str, list[str]] = defaultdict(list)  # source -> node_ids
-        self.processed_sources: set[str] = set()  # Track which sources have been processed
-        self.next_id = 1
+        storage_path = storage_path or (paths.data_dir / "knowledge" / "store.db")
+        self.storage_path = storage_path.with_suffix(".db")
+        self._conn = sqlite_utils.connect(self.storage_path)
+        self._conn.executescript(_SCHEMA)
+
+        # Dict-like views kept for compatibility, every lookup is an indexed query
+        self.nodes: Mapping[str, KnowledgeNode] = sqlite_utils.QueryMapping(
+            self._get_node,
+            self._iter_node_ids,
+            lambda: self._count("SELECT COUNT(*) FROM nodes"),
+            lambda: ((node.id, node) for node in self._fetch_nodes("1")),
+        )
+        self.concept_index: Mapping[str, str] = sqlite_utils.QueryMapping(
+            self._get_concept_id,
+            lambda: self._iter_column("SELECT concept_name FROM nodes WHERE concept_name IS NOT NULL ORDER BY seq"),
+            lambda: self._count("SELECT COUNT(*) FROM nodes WHERE concept_name IS NOT NULL"),
+        )
+
+        self.legacy_path = storage_path.with_suffix(".json")
+        self.load()
+
+    @property
+    def next_id(self) -> int:
+        return sqlite_utils.get_meta(self._conn, "next_id", 1)
 
-        if self.storage_path.exists():
-            self.load()
+    @property
+    def processed_sources(self) -> set[str]:
+        return set(self._iter_column("SELECT source FROM processed_sources"))
+
+    def _allocate_id(self, prefix: str) -> str:
+        next_id = self.next_id
+        sqlite_utils.set_meta(self._conn, "next_id", next_id + 1)
+        return f"{prefix}_{next_id}"
 
     def is_source_processed(self, source: str) -> bool:
         """Check if a source has already been processed"""
-        return source in self.processed_sources
+        row = self._conn.execute("SELECT 1 FROM processed_sources WHERE source = ?", (source,)).fetchone()
+        return row is not None
 
     def add_extraction(self, extraction: Extraction) -> list[str]:
         """Add an extraction to the store, return node IDs created"""
         created_nodes = []
 
-        # Store concepts
-        for concept in extraction.concepts:
-            node_id = self._add_concept(concept, extraction.source)
-            created_nodes.append(node_id)
-
-        # Store insights
-        for insight in extraction.key_insights:
-            node_id = self._add_insight(insight, extraction.source)
-            created_nodes.append(node_id)
+        with self._conn:
+            # Store concepts
+            for concept in extraction.concepts:
+                node_id = self._add_concept(concept, extraction.source)
+                created_nodes.append(node_id)
 
-        # Store code patterns
-        for pattern in extraction.code_patterns:
-            node_id = self._add_code_pattern(pattern, extraction.source)
-            created_nodes.append(node_id)
+            # Store insights
+            for insight in extraction.key_insights:
+                node_id = self._add_insight(insight, extraction.source)
+                created_nodes.append(node_id)
 
-        # Create relationships
-        for rel in extraction.relationships:
-            # Convert Relationship object to dict for compatibility
-            rel_dict = {"from": rel.source, "to": rel.target, "type": rel.relationship_type}
-            self._add_relationship(rel_dict)
+            # Store code patterns
+            for pattern in extraction.code_patterns:
+                node_id = self._add_code_pattern(pattern, extraction.source)
+                created_nodes.append(node_id)
 
-        # Mark source as processed
-        if extraction.source:
-            self.processed_sources.add(extraction.source)
+            # Create relationships
+            for rel in extraction.relationships:
+                # Convert Relationship object to dict for compatibility
+                rel_dict = {"from": rel.source, "to": rel.target, "type": rel.relationship_type}
+                self._add_relationship(rel_dict)
 
-        # Update indices
-        self._rebuild_indices()
+            # Mark source as processed
+            if extraction.source:
+                self._conn.execute("INSERT OR IGNORE INTO processed_sources (source) VALUES (?)", (extraction.source,))
 
         return created_nodes
 
     def add_pattern(self, pattern: Pattern) -> str:
         """Add a discovered pattern to the store"""
-        node_id = f"pattern_{self.next_id}"
-        self.next_id += 1
-
-        node = KnowledgeNode(
-            id=node_id,
-            type="pattern",
-            content={
-                "pattern_type": pattern.pattern_type,
-                "description": pattern.description,
-                "strength": pattern.strength,
-                "concepts": pattern.concepts_involved,
-            },
-            sources=[occ["source"] for occ in pattern.occurrences],
-            created_at=datetime.now().isoformat(),
-            connections=[],
-            metadata={"occurrences": len(pattern.occurrences)},
-        )
-
-        self.nodes[node_id] = node
+        with self._conn:
+            node_id = self._allocate_id("pattern")
+
+            node = KnowledgeNode(
+                id=node_id,
+                type="pattern",
+                content={
+                    "pattern_type": pattern.pattern_type,
+                    "description": pattern.description,
+                    "strength": pattern.strength,
+                    "concepts": pattern.concepts_involved,
+                },
+                sources=[occ["source"] for occ in pattern.occurrences],
+                created_at=datetime.now().isoformat(),
+                connections=[],
+                metadata={"occurrences": len(pattern.occurrences)},
+            )
+            self._insert_node(node)
 
-        # Connect to involved concepts
-        for concept_name in pattern.concepts_involved:
-            if concept_name in self.concept_index:
-                concept_id = self.concept_index[concept_name]
-                node.connections.append(concept_id)
-                if concept_id in self.nodes:
-                    self.nodes[concept_id].connections.append(node_id)
+            # Connect to involved concepts
+            for concept_name in pattern.concepts_involved:
+                concept_id = self._get_concept_id(concept_name)
+                if concept_id:
+                    self._connect(node_id, concept_id)
+                    self._connect(concept_id, node_id)
 
-        self._rebuild_indices()
         return node_id
 
     def _add_concept(self, concept: Concept, source: str) -> str:
         """Add or update a concept node"""
         # Check if concept already exists
-        if concept.name in self.concept_index:
-            node_id = self.concept_index[concept.name]
-            node = self.nodes[node_id]
+        row = self._conn.execute("SELECT id, content FROM nodes WHERE concept_name = ?", (concept.name,)).fetchone()
+        if row:
+            node_id = row["id"]
             # Update existing concept
-            if source not in node.sources:
-                node.sources.append(source)
+            self._conn.execute("INSERT OR IGNORE INTO node_sources (node_id, source) VALUES (?, ?)", (node_id, source))
             # Merge descriptions if different
-            existing_desc = node.content.get("description", "")
+            content = json.loads(row["content"])
+            existing_desc = content.get("description", "")
             if concept.description not in existing_desc:
-                node.content["description"] = f"{existing_desc} | {concept.description}"
+                content["description"] = f"{existing_desc} | {concept.description}"
+                self._conn.execute("UPDATE nodes SET content = ? WHERE id = ?", (json.dumps(content), node_id))
             return node_id
 
         # Create new concept node
-        node_id = f"concept_{self.next_id}"
-        self.next_id += 1
+        node_id = self._allocate_id("concept")
 
         node = KnowledgeNode(
             id=node_id,
@@ -152,14 +204,12 @@ class KnowledgeStore:
             metadata={"category": concept.category, "importance": concept.importance},
         )
 
-        self.nodes[node_id] = node
-        self.concept_index[concept.name] = node_id
+        self._insert_node(node, concept_name=concept.name)
         return node_id
 
     def _add_insight(self, insight: str, source: str) -> str:
         """Add an insight node"""
-        node_id = f"insight_{self.next_id}"
-        self.next_id += 1
+        node_id = self._allocate_id("insight")
 
         node = KnowledgeNode(
             id=node_id,
@@ -171,13 +221,12 @@ class KnowledgeStore:
             metadata={"length": len(insight)},
         )
 
-        self.nodes[node_id] = node
+        self._insert_node(node)
         return node_id
 
     def _add_code_pattern(self, pattern: dict[str, str], source: str) -> str:
         """Add a code pattern node"""
-        node_id = f"code_{self.next_id}"
-        self.next_id += 1
+        node_id = self._allocate_id("code")
 
         node = KnowledgeNode(
             id=node_id,
@@ -189,36 +238,85 @@ class KnowledgeStore:
             metadata={"language": pattern.get("language", "unknown")},
         )
 
-        self.nodes[node_id] = node
+        self._insert_node(node)
         return node_id
 
     def _add_relationship(self, rel: dict[str, str]):
         """Add a relationship between concepts"""
-        from_name = rel["from"]
-        to_name = rel["to"]
-
-        if from_name in self.concept_index and to_name in self.concept_index:
-            from_id = self.concept_index[from_name]
-            to_id = self.concept_index[to_name]
+        from_id = self._get_concept_id(rel["from"])
+        to_id = self._get_concept_id(rel["to"])
 
+        if from_id and to_id:
             # Add bidirectional connections
-            if to_id not in self.nodes[from_id].connections:
-                self.nodes[from_id].connections.append(to_id)
-            if from_id not in self.nodes[to_id].connections:
-                self.nodes[to_id].connections.append(from_id)
+            self._connect(from_id, to_id)
+            self._connect(to_id, from_id)
+
+    def _insert_node(self, node: KnowledgeNode, concept_name: str | None = None) -> None:
+        """Insert a node row together with its sources and connections"""
+        self._conn.execute(
+            "INSERT INTO nodes (id, type, concept_name, content, created_at, metadata) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                node.id,
+                node.type,
+                concept_name,
+                json.dumps(node.content),
+                node.created_at,
+                json.dumps(node.metadata),
+            ),
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO node_sources (node_id, source) VALUES (?, ?)",
+            [(node.id, source) for source in node.sources],
+        )
+        for conn_id in node.connections:
+            self._connect(node.id, conn_id)
+
+    def _connect(self, from_id: str, to_id: str) -> None:
+        self._conn.execute("INSERT OR IGNORE INTO connections (from_id, to_id) VALUES (?, ?)", (from_id, to_id))
+
+    def _get_concept_id(self, name: str) -> str | None:
+        row = self._conn.execute("SELECT id FROM nodes WHERE concept_name = ?", (name,)).fetchone()
+        return row["id"] if row else None
+
+    def _get_node(self, node_id: str) -> KnowledgeNode | None:
+        nodes = self._fetch_nodes("id = ?", (node_id,))
+        return nodes[0] if nodes else None
+
+    def _fetch_nodes(self, where: str, params: tuple[Any, ...] = ()) -> list[KnowledgeNode]:
+        """Load full nodes matching a WHERE clause on the nodes table, in insertion order"""
+        subquery = f"SELECT id FROM nodes WHERE {where}"
+        sources: dict[str, list[str]] = defaultdict(list)
+        for row in self._conn.execute(
+            f"SELECT node_id, source FROM node_sources WHERE node_id IN ({subquery}) ORDER BY rowid", params
+        ):
+            sources[row["node_id"]].append(row["source"])
+        connections: dict[str, list[str]] = defaultdict(list)
+        for row in self._conn.execute(
+            f"SELECT from_id, to_id FROM connections WHERE from_id IN ({subquery}) ORDER BY rowid", params
+        ):
+            connections[row["from_id"]].append(row["to_id"])
+
+        return [
+            KnowledgeNode(
+                id=row["id"],
+                type=row["type"],
+                content=json.loads(row["content"]),
+                sources=sources.get(row["id"], []),
+                created_at=row["created_at"],
+                connections=connections.get(row["id"], []),
+                metadata=json.loads(row["metadata"]),
+            )
+            for row in self._conn.execute(f"SELECT * FROM nodes WHERE {where} ORDER BY seq", params)
+        ]
 
-    def _rebuild_indices(self):
-        """Rebuild all indices from nodes"""
-        self.index.clear()
-        self.source_index.clear()
+    def _iter_node_ids(self) -> Iterator[str]:
+        return self._iter_column("SELECT id FROM nodes ORDER BY seq")
 
-        for node_id, node in self.nodes.items():
-            # Type index
-            self.index[node.type].append(node_id)
+    def _iter_column(self, sql: str, params: tuple[Any, ...] = ()) -> Iterator[str]:
+        return (row[0] for row in self._conn.execute(sql, params).fetchall())
 
-            # Source index
-            for source in node.sources:
-                self.source_index[source].append(node_id)
+    def _count(self, sql: str, params: tuple[Any, ...] = ()) -> int:
+        return self._conn.execute(sql, params).fetchone()[0]
 
     def query(self, query_type: str = "", concept: str = "", source: str = "") -> list[KnowledgeNode]:
         """Query the knowledge store"""
@@ -226,43 +324,46 @@ class KnowledgeStore:
 
         if query_type:
             # Get all nodes of a specific type
-            node_ids = self.index.get(query_type, [])
-            results.extend([self.nodes[nid] for nid in node_ids])
+            results.extend(self._fetch_nodes("type = ?", (query_type,)))
 
-        if concept and concept in self.concept_index:
+        if concept:
             # Get concept and related nodes
-            concept_id = self.concept_index[concept]
-            concept_node = self.nodes[concept_id]
-            results.append(concept_node)
+            concept_nodes = self._fetch_nodes("concept_name = ?", (concept,))
+            if concept_nodes:
+                results.append(concept_nodes[0])
 
-            # Add connected nodes
-            for conn_id in concept_node.connections:
-                if conn_id in self.nodes:
-                    results.append(self.nodes[conn_id])
+                # Add connected nodes
+                results.extend(
+                    self._fetch_nodes("id IN (SELECT to_id FROM connections WHERE from_id = ?)", (concept_nodes[0].id,))
+                )
 
         if source:
             # Get all nodes from a source
-            node_ids = self.source_index.get(source, [])
-            results.extend([self.nodes[nid] for nid in node_ids if nid not in [r.id for r in results]])
+            seen = {r.id for r in results}
+            from_source = self._fetch_nodes("id IN (SELECT node_id FROM node_sources WHERE source = ?)", (source,))
+            results.extend(node for node in from_source if node.id not in seen)
 
         return results
 
     def get_concept_graph(self, start_concept: str, max_depth: int = 2) -> dict[str, Any]:
         """Get concept graph starting from a concept"""
-        if start_concept not in self.concept_index:
+        start_id = self._get_concept_id(start_concept)
+        if not start_id:
             return {}
 
         graph = {"nodes": [], "edges": []}
         visited = set()
-        to_explore = [(self.concept_index[start_concept], 0)]
+        to_explore = [(start_id, 0)]
 
         while to_explore:
             node_id, depth = to_explore.pop(0)
             if node_id in visited or depth > max_depth:
                 continue
 
+            node = self._get_node(node_id)
+            if node is None:
+                continue
             visited.add(node_id)
-            node = self.nodes[node_id]
 
             # Add node to graph
             graph["nodes"].append(
@@ -285,56 +386,57 @@ class KnowledgeStore:
 
     def get_statistics(self) -> dict[str, Any]:
         """Get statistics about the knowledge store"""
+        type_counts = dict(self._conn.execute("SELECT type, COUNT(*) FROM nodes GROUP BY type").fetchall())
         stats: dict[str, Any] = {
-            "total_nodes": len(self.nodes),
-            "concepts": len(self.concept_index),
-            "insights": len(self.index.get("insight", [])),
-            "code_patterns": len(self.index.get("code", [])),
-            "patterns": len(self.index.get("pattern", [])),
-            "sources": len(self.source_index),
-            "total_connections": sum(len(n.connections) for n in self.nodes.values()),
+            "total_nodes": sum(type_counts.values()),
+            "concepts": self._count("SELECT COUNT(*) FROM nodes WHERE concept_name IS NOT NULL"),
+            "insights": type_counts.get("insight", 0),
+            "code_patterns": type_counts.get("code", 0),
+            "patterns": type_counts.get("pattern", 0),
+            "sources": self._count("SELECT COUNT(DISTINCT source) FROM node_sources"),
+            "total_connections": self._count("SELECT COUNT(*) FROM connections"),
         }
 
         # Category breakdown
-        categories: dict[str, int] = {}
-        for node_id in self.index.get("concept", []):
-            node = self.nodes[node_id]
-            category = node.metadata.get("category", "unknown")
-            if category not in categories:
-                categories[category] = 0
-            categories[category] += 1
-        stats["categories"] = categories
+        rows = self._conn.execute(
+            "SELECT COALESCE(json_extract(metadata, '$.category'), 'unknown'), COUNT(*) "
+            "FROM nodes WHERE type = 'concept' GROUP BY 1"
+        ).fetchall()
+        stats["categories"] = dict(rows)
 
         return stats
 
     def save(self):
-        """Save the knowledge store to disk"""
-        data = {
-            "nodes": {nid: asdict(node) for nid, node in self.nodes.items()},
-            "concept_index": self.concept_index,
-            "processed_sources": list(self.processed_sources),
-            "next_id": self.next_id,
-        }
-        self.storage_path.write_text(json.dumps(data, indent=2))
+        """Flush pending writes to disk (every mutation already runs in its own transaction)"""
+        self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection"""
+        self._conn.close()
 
     def load(self):
-        """Load the knowledge store from disk"""
-        if not self.storage_path.exists():
+        """Import a legacy JSON store into the database (once, while the database is empty)"""
+        if not self.legacy_path.exists() or self.next_id != 1:
             return
 
-        data = json.loads(self.storage_path.read_text())
-        self.nodes = {nid: KnowledgeNode(**node_data) for nid, node_data in data["nodes"].items()}
-        self.concept_index = data["concept_index"]
-        self.processed_sources = set(data.get("processed_sources", []))
-        self.next_id = data["next_id"]
-        self._rebuild_indices()
+        data = json.loads(self.legacy_path.read_text())
+        concept_names = {node_id: name for name, node_id in data.get("concept_index", {}).items()}
+
+        with self._conn:
+            for node_id, node_data in data["nodes"].items():
+                self._insert_node(KnowledgeNode(**node_data), concept_name=concept_names.get(node_id))
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO processed_sources (source) VALUES (?)",
+                [(source,) for source in data.get("processed_sources", [])],
+            )
+            sqlite_utils.set_meta(self._conn, "next_id", data["next_id"])
 
 
 if __name__ == "__main__":
     # Test the knowledge store
     from knowledge_extractor import KnowledgeExtractor
 
-    store = KnowledgeStore(Path("test_store.json"))
+    store = KnowledgeStore(Path("test_store.db"))
     extractor = KnowledgeExtractor()
 
     # Add sample extraction
@@ -9,6 +9,9 @@ from typing import Any
 
 from .knowledge_extractor import Extraction
 
+# Words that mark a concept name as a technique (heuristic)
+TECHNIQUE_WORDS = ["method", "technique", "approach", "pattern", "strategy"]
+
 
 @dataclass
 class Pattern:
@@ -153,8 +156,8 @@ class PatternFinder:
             # Check if both are likely techniques (heuristic) with minimum co-occurrence
             if (
                 count >= 2
-                and any(word in c1 for word in ["method", "technique", "approach", "pattern", "strategy"])
-                and any(word in c2 for word in ["method", "technique", "approach", "pattern", "strategy"])
+                and any(word in c1 for word in TECHNIQUE_WORDS)
+                and any(word in c2 for word in TECHNIQUE_WORDS)
             ):
                 technique_pairs[(c1, c2)].append(count)
 
@@ -237,6 +240,31 @@ class PatternFinder:
         }
 
 
+def create_pattern_finder(backend: str = "auto") -> PatternFinder:
+    """Create a pattern finder for the requested backend.
+
+    Args:
+        backend: "sparse" (numpy/scipy matrices), "python" (dicts of sets),
+            or "auto" to use sparse when numpy and scipy are installed
+
+    Returns:
+        PatternFinder instance
+    """
+    if backend not in ("auto", "sparse", "python"):
+        raise ValueError(f"Unknown pattern finder backend: {backend}")
+
+    if backend != "python":
+        try:
+            from .sparse_pattern_finder import SparsePatternFinder
+
+            return SparsePatternFinder()
+        except ImportError:
+            if backend == "sparse":
+                raise
+
+    return PatternFinder()
+
+
 if __name__ == "__main__":
     # Test with sample extractions
     from knowledge_extractor import KnowledgeExtractor
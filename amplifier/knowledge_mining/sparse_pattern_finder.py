@@ -0,0 +1,330 @@
+"""
+Sparse Pattern Finder - Vectorized PatternFinder backend built on SciPy sparse matrices.
+
+Concepts and sources are interned to integer ids as extractions arrive, and
+only flat id arrays are kept. Pattern discovery builds a concept x source
+incidence matrix and a concept x concept co-occurrence matrix once, then
+answers every pattern query with matrix operations instead of walking
+dicts of sets in Python.
+
+Requires numpy and scipy. Use ``create_pattern_finder()`` to fall back to
+the pure Python ``PatternFinder`` when they are not installed.
+"""
+
+from array import array
+from typing import Any
+
+import numpy as np
+from scipy import sparse
+
+from .knowledge_extractor import Extraction
+from .pattern_finder import TECHNIQUE_WORDS
+from .pattern_finder import ConceptCluster
+from .pattern_finder import Pattern
+from .pattern_finder import PatternFinder
+
+
+class SparsePatternFinder(PatternFinder):
+    """PatternFinder that computes patterns with sparse matrix operations.
+
+    Produces the same patterns as ``PatternFinder``, with occurrences in the
+    same (insertion) order; lists the base class builds from sets come out in
+    first-appearance or id order. The dict attributes of the
+    base class (``concept_graph``, ``concept_sources``, ``co_occurrences``)
+    stay empty; all state lives in interned id arrays.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._concept_ids: dict[str, int] = {}
+        self._concept_names: list[str] = []
+        self._source_ids: dict[str, int] = {}
+        self._source_names: list[str] = []
+
+        # Incidence entries (concept, source), one per concept mention
+        self._mention_concepts = array("q")
+        self._mention_sources = array("q")
+        # Relationship edges (concept, concept), one per relationship
+        self._edge_from = array("q")
+        self._edge_to = array("q")
+
+        # First-appearance order, mirrors dict insertion order of the base class
+        self._mentioned: set[int] = set()
+        self._mention_order = array("q")
+        self._in_graph: set[int] = set()
+        self._graph_order = array("q")
+
+        self._matrices: tuple[sparse.csr_matrix, sparse.csr_matrix, sparse.csr_matrix] | None = None
+        self._mention_index: tuple[np.ndarray, np.ndarray] | None = None
+
+    def add_extraction(self, extraction: Extraction):
+        """Add an extraction to the pattern finder"""
+        source_id = self._intern_source(extraction.source)
+
+        for concept in extraction.concepts:
+            concept_id = self._intern_concept(concept.name)
+            self._mention_concepts.append(concept_id)
+            self._mention_sources.append(source_id)
+            if concept_id not in self._mentioned:
+                self._mentioned.add(concept_id)
+                self._mention_order.append(concept_id)
+
+        for rel in extraction.relationships:
+            from_id = self._intern_concept(rel.source)
+            to_id = self._intern_concept(rel.target)
+            self._edge_from.append(from_id)
+            self._edge_to.append(to_id)
+            for concept_id in (from_id, to_id):
+                if concept_id not in self._in_graph:
+                    self._in_graph.add(concept_id)
+                    self._graph_order.append(concept_id)
+
+        self._matrices = None
+        self._mention_index = None
+
+    def _intern_concept(self, name: str) -> int:
+        concept_id = self._concept_ids.get(name)
+        if concept_id is None:
+            concept_id = self._concept_ids[name] = len(self._concept_names)
+            self._concept_names.append(name)
+        return concept_id
+
+    def _intern_source(self, source: str) -> int:
+        source_id = self._source_ids.get(source)
+        if source_id is None:
+            source_id = self._source_ids[source] = len(self._source_names)
+            self._source_names.append(source)
+        return source_id
+
+    def _build_matrices(self) -> tuple[sparse.csr_matrix, sparse.csr_matrix, sparse.csr_matrix]:
+        """Build (incidence, co-occurrence, adjacency) matrices, cached until the next extraction.
+
+        - incidence[c, s]: how many times concept c was extracted from source s
+        - cooccurrence[a, b] (a <= b): how many relationships link a and b
+        - adjacency: symmetric 0/1 neighbour matrix of the concept graph
+        """
+        if self._matrices is not None:
+            return self._matrices
+
+        n_concepts = len(self._concept_names)
+        n_sources = len(self._source_names)
+
+        mention_concepts = np.frombuffer(self._mention_concepts, dtype=np.int64)
+        mention_sources = np.frombuffer(self._mention_sources, dtype=np.int64)
+        incidence = sparse.csr_matrix(
+            (np.ones(len(mention_concepts), dtype=np.int64), (mention_concepts, mention_sources)),
+            shape=(n_concepts, n_sources),
+        )
+
+        edge_from = np.frombuffer(self._edge_from, dtype=np.int64)
+        edge_to = np.frombuffer(self._edge_to, dtype=np.int64)
+        low = np.minimum(edge_from, edge_to)
+        high = np.maximum(edge_from, edge_to)
+        cooccurrence = sparse.csr_matrix(
+            (np.ones(len(low), dtype=np.int64), (low, high)),
+            shape=(n_concepts, n_concepts),
+        )
+
+        adjacency = (cooccurrence + cooccurrence.T).tocsr()
+        adjacency.data[:] = 1
+
+        self._matrices = (incidence, cooccurrence, adjacency)
+        return self._matrices
+
+    def _concept_sources(self, concept_id: int) -> np.ndarray:
+        """Source ids of every mention of a concept, in the order they were added (like ``concept_sources``)"""
+        if self._mention_index is None:
+            mention_concepts = np.frombuffer(self._mention_concepts, dtype=np.int64)
+            # A stable sort groups mentions by concept and keeps insertion order within each group
+            by_concept = np.argsort(mention_concepts, kind="stable")
+            starts = np.concatenate(([0], np.cumsum(np.bincount(mention_concepts, minlength=len(self._concept_names)))))
+            self._mention_index = (by_concept, starts)
+        by_concept, starts = self._mention_index
+        mentions = by_concept[starts[concept_id] : starts[concept_id + 1]]
+        return np.frombuffer(self._mention_sources, dtype=np.int64)[mentions]
+
+    def _unique_in_order(self, ids: np.ndarray) -> np.ndarray:
+        """Distinct ids in order of first appearance"""
+        _, first = np.unique(ids, return_index=True)
+        return ids[np.sort(first)]
+
+    def _name_mask(self, words: list[str], lower: bool = False) -> np.ndarray:
+        """Boolean mask over concept ids whose name contains any of the words"""
+        names = (n.lower() for n in self._concept_names) if lower else iter(self._concept_names)
+        return np.fromiter(
+            (any(word in name for word in words) for name in names), dtype=bool, count=len(self._concept_names)
+        )
+
+    def _row(self, matrix: sparse.csr_matrix, row: int) -> tuple[np.ndarray, np.ndarray]:
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        return matrix.indices[start:end], matrix.data[start:end]
+
+    def _find_recurring_concepts(self, min_occurrences: int) -> list[Pattern]:
+        """Find concepts that appear across multiple sources"""
+        incidence, _, _ = self._build_matrices()
+        total_mentions = np.asarray(incidence.sum(axis=1)).ravel()
+
+        order = np.frombuffer(self._mention_order, dtype=np.int64)
+        patterns = []
+        for concept_id in order[total_mentions[order] >= min_occurrences]:
+            concept = self._concept_names[concept_id]
+            unique_sources = [self._source_names[s] for s in self._unique_in_order(self._concept_sources(concept_id))]
+            patterns.append(
+                Pattern(
+                    pattern_type="recurring_concept",
+                    description=f"'{concept}' appears across {len(unique_sources)} sources",
+                    occurrences=[{"source": s, "context": concept} for s in unique_sources],
+                    strength=min(1.0, len(unique_sources) / 10),  # Normalize to 0-1
+                    concepts_involved=[concept],
+                )
+            )
+
+        return patterns
+
+    def _find_concept_clusters(self) -> list[ConceptCluster]:
+        """Find clusters of frequently co-occurring concepts
+
+        Same greedy neighbourhood clustering as the base class: in graph order,
+        every unclaimed concept with 2+ neighbours claims its closed neighbourhood.
+        Degrees and neighbourhoods come straight from the CSR adjacency.
+        """
+        _, _, adjacency = self._build_matrices()
+        degrees = np.diff(adjacency.indptr)
+
+        order = np.frombuffer(self._graph_order, dtype=np.int64)
+        processed = np.zeros(len(self._concept_names), dtype=bool)
+        clusters = []
+
+        for concept_id in order[degrees[order] >= 2]:
+            if processed[concept_id]:
+                continue
+
+            neighbours, _ = self._row(adjacency, concept_id)
+            cluster_ids = np.union1d(neighbours, [concept_id])
+            if len(cluster_ids) < 3:
+                continue
+
+            shared_contexts = [self._source_names[s] for s in self._concept_sources(concept_id)]
+            clusters.append(
+                ConceptCluster(
+                    core_concept=self._concept_names[concept_id],
+                    related_concepts=[self._concept_names[c] for c in cluster_ids if c != concept_id],
+                    shared_contexts=shared_contexts,
+                    frequency=len(shared_contexts),
+                )
+            )
+            processed[cluster_ids] = True
+
+        return clusters
+
+    def _find_technique_combinations(self) -> list[Pattern]:
+        """Find techniques that are frequently used together
+
+        Pairs are reported in the order they first co-occurred, like the base class.
+        """
+        if not len(self._edge_from):
+            return []
+        n_concepts = len(self._concept_names)
+        edge_from = np.frombuffer(self._edge_from, dtype=np.int64)
+        edge_to = np.frombuffer(self._edge_to, dtype=np.int64)
+        keys = np.minimum(edge_from, edge_to) * n_concepts + np.maximum(edge_from, edge_to)
+        pair_keys, first_seen, counts = np.unique(keys, return_index=True, return_counts=True)
+        is_technique = self._name_mask(TECHNIQUE_WORDS)
+        rows, cols = pair_keys // n_concepts, pair_keys % n_concepts
+
+        selected = (counts >= 2) & is_technique[rows] & is_technique[cols]
+        in_order = np.flatnonzero(selected)[np.argsort(first_seen[selected])]
+
+        patterns = []
+        for row, col, count in zip(rows[in_order], cols[in_order], counts[in_order], strict=True):
+            count = int(count)
+            tech1, tech2 = sorted([self._concept_names[row], self._concept_names[col]])
+            patterns.append(
+                Pattern(
+                    pattern_type="technique_combination",
+                    description=f"'{tech1}' frequently combined with '{tech2}'",
+                    occurrences=[
+                        {"source": "multiple", "context": f"co-occurred {count} times"},
+                    ],
+                    strength=min(1.0, count / 5),
+                    concepts_involved=[tech1, tech2],
+                )
+            )
+
+        return patterns
+
+    def _find_principle_applications(self) -> list[Pattern]:
+        """Find principles and their applications"""
+        _, _, adjacency = self._build_matrices()
+        is_principle = self._name_mask(["principle"], lower=True)
+
+        # Number of non-principle neighbours for every concept in one mat-vec
+        application_counts = adjacency @ (~is_principle).astype(np.int64)
+
+        order = np.frombuffer(self._graph_order, dtype=np.int64)
+        candidates = order[is_principle[order] & (application_counts[order] >= 2)]
+
+        patterns = []
+        for concept_id in candidates:
+            neighbours, _ = self._row(adjacency, concept_id)
+            principle = self._concept_names[concept_id]
+            applications = [self._concept_names[c] for c in neighbours[~is_principle[neighbours]]]
+            sources = [self._source_names[s] for s in self._concept_sources(concept_id)[:3]]
+            patterns.append(
+                Pattern(
+                    pattern_type="principle_application",
+                    description=f"Principle '{principle}' applied to: {', '.join(applications[:3])}",
+                    occurrences=[{"source": s, "context": principle} for s in sources],
+                    strength=min(1.0, len(applications) / 5),
+                    concepts_involved=[principle] + applications,
+                )
+            )
+
+        return patterns
+
+    def find_related_concepts(self, concept: str, max_depth: int = 2) -> set[str]:
+        """Find concepts related to a given concept up to max_depth"""
+        start = self._concept_ids.get(concept)
+        if start is None or start not in self._in_graph:
+            return set()
+
+        _, _, adjacency = self._build_matrices()
+        visited = np.zeros(len(self._concept_names), dtype=bool)
+        visited[start] = True
+        frontier = np.array([start])
+
+        # Expand one breadth-first layer per step by slicing adjacency rows
+        for _ in range(max_depth):
+            neighbours = np.unique(adjacency[frontier].indices)
+            frontier = neighbours[~visited[neighbours]]
+            if not len(frontier):
+                break
+            visited[frontier] = True
+
+        visited[start] = False
+        return {self._concept_names[c] for c in np.flatnonzero(visited)}
+
+    def get_concept_context(self, concept: str) -> dict[str, Any]:
+        """Get full context for a concept"""
+        concept_id = self._concept_ids.get(concept)
+        if concept_id is None:
+            return super().get_concept_context(concept)
+
+        _, cooccurrence, adjacency = self._build_matrices()
+        source_ids = self._concept_sources(concept_id)
+        neighbours, _ = self._row(adjacency, concept_id)
+
+        co_occurrences = {}
+        column = cooccurrence.getcol(concept_id).tocoo()
+        row_ids, row_counts = self._row(cooccurrence, concept_id)
+        for other_id, count in [*zip(row_ids, row_counts, strict=True), *zip(column.row, column.data, strict=True)]:
+            pair = tuple(sorted([concept, self._concept_names[other_id]]))
+            co_occurrences[str(pair)] = int(count)
+
+        return {
+            "concept": concept,
+            "sources": [self._source_names[s] for s in self._unique_in_order(source_ids)],
+            "related_concepts": [self._concept_names[c] for c in neighbours],
+            "occurrence_count": len(source_ids),
+            "co_occurrences": co_occurrences,
+        }
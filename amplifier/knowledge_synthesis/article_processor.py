@@ -9,10 +9,11 @@ import asyncio
 import json
 import logging
 import os
-import sys
 import time
+from collections.abc import Callable
 from dataclasses import asdict
 from dataclasses import dataclass
+from dataclasses import field
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -20,15 +21,23 @@ from typing import Any
 
 from amplifier.config.paths import paths
 from amplifier.content_loader import ContentItem
-from amplifier.utils.logging_utils import ExtractionLogger
+from amplifier.knowledge_synthesis.batch_progress import BatchProgress
+from amplifier.utils import sqlite_utils
 from amplifier.utils.notifications import send_notification
 from amplifier.utils.token_utils import truncate_to_tokens
 
 if TYPE_CHECKING:
+    from amplifier.ccsdk_toolkit.core.client import UsageStats
     from amplifier.knowledge_integration import UnifiedKnowledgeExtractor
+    from amplifier.knowledge_synthesis.chunked_extraction import Chunk
 
 logger = logging.getLogger(__name__)
 
+PROCESSOR_NAMES = ["concepts", "relationships", "insights", "patterns"]
+
+# Articles that may start ahead of the oldest uncommitted one, per unit of concurrency
+REORDER_WINDOW = 4
+
 
 # ============================================================================
 # DATA MODELS
@@ -46,6 +55,37 @@ class ProcessorResult:
     extracted_count: int = 0
 
 
+@dataclass
+class StrategyStats:
+    """Cost and quality counters for one extraction strategy."""
+
+    articles: int = 0
+    llm_calls: int = 0
+    cached_calls: int = 0
+    prompt_tokens: int = 0  # Estimated
+    cost_usd: float = 0.0
+    extraction_seconds: float = 0.0
+    extracted_items: int = 0
+    empty_sections: int = 0
+    failed_sections: int = 0
+    fallbacks: int = 0  # Hybrid: sections re-run with a focused extractor
+
+    def to_dict(self) -> dict[str, Any]:
+        """Counters plus per-article averages for comparing strategies."""
+        per_article = max(self.articles, 1)
+        return {
+            **asdict(self),
+            "calls_per_article": round(self.llm_calls / per_article, 2),
+            "tokens_per_article": round(self.prompt_tokens / per_article),
+            "cost_per_article_usd": round(self.cost_usd / per_article, 4),
+            "seconds_per_article": round(self.extraction_seconds / per_article, 1),
+            "items_per_article": round(self.extracted_items / per_article, 1),
+            "items_per_1k_tokens": round(self.extracted_items * 1000 / self.prompt_tokens, 2)
+            if self.prompt_tokens
+            else 0.0,
+        }
+
+
 @dataclass
 class ArticleProcessingStatus:
     """Complete processing status for a single article."""
@@ -80,22 +120,79 @@ class ArticleProcessingStatus:
         )
 
 
+@dataclass
+class _ArticleRun:
+    """One article in flight: processor results land here as they finish."""
+
+    article: ContentItem
+    position: int
+    status: ArticleProcessingStatus
+    data: dict[str, Any] = field(default_factory=dict)
+    finished: set[str] = field(default_factory=set)
+
+
 # ============================================================================
 # STATUS STORAGE
 # ============================================================================
 
 
+_STATUS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS statuses (
+    article_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    last_processed TEXT NOT NULL,
+    is_complete INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    needs_retry INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_statuses_state ON statuses(state);
+CREATE INDEX IF NOT EXISTS idx_statuses_retry ON statuses(needs_retry, last_processed);
+CREATE TABLE IF NOT EXISTS processor_results (
+    article_id TEXT NOT NULL REFERENCES statuses(article_id) ON DELETE CASCADE,
+    processor_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error_message TEXT,
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    extracted_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (article_id, processor_name)
+);
+CREATE INDEX IF NOT EXISTS idx_processor_results_status ON processor_results(processor_name, status);
+"""
+
+
+def _classify_status(status: ArticleProcessingStatus) -> tuple[str, bool]:
+    """Report category of a status: (complete|partial|failed, needs_retry)."""
+    if status.is_complete:
+        return "complete", False
+    results = status.processor_results.values()
+    if not any(r.status in ["success", "empty"] for r in results):
+        return "failed", True
+    # Only retry partials if some processors failed
+    return "partial", any(r.status == "failed" for r in results)
+
+
 class ProcessingStatusStore:
-    """Simple JSON-based status storage with incremental saves."""
+    """SQLite-backed status storage with incremental saves.
+
+    One database replaces the former one-JSON-file-per-article layout, so the
+    processing report is a handful of indexed aggregate queries instead of
+    parsing every status on each call. Legacy ``*.json`` status files in the
+    status directory are imported once on first open.
+    """
 
     def __init__(self, status_dir: Path | None = None):
         """Initialize status store.
 
         Args:
-            status_dir: Directory for status files (default: data_dir/processing_status)
+            status_dir: Directory for the status database (default: data_dir/processing_status)
         """
         self.status_dir = status_dir or paths.data_dir / "processing_status"
-        self.status_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.status_dir / "status.db"
+        self._conn = sqlite_utils.connect(self.db_path)
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_STATUS_SCHEMA)
+        self._import_legacy_files()
 
     def save_status(self, status: ArticleProcessingStatus) -> None:
         """Save status for a single article.
@@ -103,12 +200,37 @@ class ProcessingStatusStore:
         Args:
             status: Processing status to save
         """
-        # Use article_id as filename (sanitized)
-        safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in status.article_id)
-        status_file = self.status_dir / f"{safe_id}.json"
-
-        # Save atomically
-        status_file.write_text(json.dumps(status.to_dict(), indent=2))
+        state, needs_retry = _classify_status(status)
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO statuses (article_id, title, last_processed, is_complete, state, needs_retry)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(article_id) DO UPDATE SET
+                    title = excluded.title, last_processed = excluded.last_processed,
+                    is_complete = excluded.is_complete, state = excluded.state, needs_retry = excluded.needs_retry
+                """,
+                (
+                    status.article_id,
+                    status.title,
+                    status.last_processed.isoformat(),
+                    status.is_complete,
+                    state,
+                    needs_retry,
+                ),
+            )
+            self._conn.execute("DELETE FROM processor_results WHERE article_id = ?", (status.article_id,))
+            self._conn.executemany(
+                """
+                INSERT INTO processor_results
+                    (article_id, processor_name, status, error_message, retry_count, extracted_count)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (status.article_id, name, r.status, r.error_message, r.retry_count, r.extracted_count)
+                    for name, r in status.processor_results.items()
+                ],
+            )
 
     def load_status(self, article_id: str) -> ArticleProcessingStatus | None:
         """Load status for a single article.
@@ -119,18 +241,8 @@ class ProcessingStatusStore:
         Returns:
             Processing status or None if not found
         """
-        safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in article_id)
-        status_file = self.status_dir / f"{safe_id}.json"
-
-        if not status_file.exists():
-            return None
-
-        try:
-            data = json.loads(status_file.read_text())
-            return ArticleProcessingStatus.from_dict(data)
-        except Exception as e:
-            logger.warning(f"Failed to load status for {article_id}: {e}")
-            return None
+        statuses = self._fetch("WHERE s.article_id = ?", (article_id,))
+        return statuses[0] if statuses else None
 
     def get_all_statuses(self) -> list[ArticleProcessingStatus]:
         """Get all processing statuses.
@@ -138,15 +250,109 @@ class ProcessingStatusStore:
         Returns:
             List of all processing statuses
         """
-        statuses = []
-        for status_file in self.status_dir.glob("*.json"):
+        return self._fetch()
+
+    def get_incomplete(self) -> list[ArticleProcessingStatus]:
+        """Statuses of articles with at least one processor not succeeded."""
+        return self._fetch("WHERE s.state != 'complete'")
+
+    def get_by_state(self, state: str, limit: int | None = None) -> list[ArticleProcessingStatus]:
+        """Statuses in one report category: complete, partial or failed."""
+        return self._fetch("WHERE s.state = ?", (state,), limit=limit)
+
+    def get_failed(self, processor_name: str | None = None) -> list[ArticleProcessingStatus]:
+        """Statuses with a failed processor, optionally a specific one."""
+        where = "WHERE s.article_id IN (SELECT article_id FROM processor_results WHERE status = 'failed'"
+        params: tuple[Any, ...] = ()
+        if processor_name:
+            where += " AND processor_name = ?"
+            params = (processor_name,)
+        return self._fetch(where + ")", params)
+
+    def get_needs_retry(self, limit: int | None = None) -> list[ArticleProcessingStatus]:
+        """Failed articles and partials with failed processors, oldest first."""
+        return self._fetch("WHERE s.needs_retry = 1", limit=limit)
+
+    def summary(self) -> dict[str, int]:
+        """Article counts by report category."""
+        counts = dict(self._conn.execute("SELECT state, COUNT(*) FROM statuses GROUP BY state").fetchall())
+        needs_retry = self._conn.execute("SELECT COUNT(*) FROM statuses WHERE needs_retry = 1").fetchone()[0]
+        return {
+            "total_articles": sum(counts.values()),
+            "complete": counts.get("complete", 0),
+            "partial": counts.get("partial", 0),
+            "failed": counts.get("failed", 0),
+            "needs_retry": needs_retry,
+        }
+
+    def processor_stats(self) -> dict[str, dict[str, int]]:
+        """Count of each processor result status, per processor."""
+        stats: dict[str, dict[str, int]] = {}
+        for name, status, count in self._conn.execute(
+            "SELECT processor_name, status, COUNT(*) FROM processor_results GROUP BY processor_name, status"
+        ):
+            stats.setdefault(name, {})[status] = count
+        return stats
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def _fetch(
+        self, where: str = "", params: tuple[Any, ...] = (), limit: int | None = None
+    ) -> list[ArticleProcessingStatus]:
+        selection = f"FROM statuses s {where} ORDER BY s.last_processed"
+        if limit is not None:
+            selection += f" LIMIT {int(limit)}"
+        rows = self._conn.execute(f"SELECT * {selection}", params).fetchall()
+        if not rows:
+            return []
+
+        results: dict[str, dict[str, ProcessorResult]] = {row["article_id"]: {} for row in rows}
+        result_rows = self._conn.execute(
+            f"SELECT * FROM processor_results WHERE article_id IN (SELECT s.article_id {selection})", params
+        )
+        for r in result_rows:
+            results[r["article_id"]][r["processor_name"]] = ProcessorResult(
+                processor_name=r["processor_name"],
+                status=r["status"],
+                error_message=r["error_message"],
+                retry_count=r["retry_count"],
+                extracted_count=r["extracted_count"],
+            )
+
+        return [
+            ArticleProcessingStatus(
+                article_id=row["article_id"],
+                title=row["title"],
+                last_processed=datetime.fromisoformat(row["last_processed"]),
+                processor_results=results[row["article_id"]],
+                is_complete=bool(row["is_complete"]),
+            )
+            for row in rows
+        ]
+
+    def _import_legacy_files(self) -> None:
+        """Import per-article JSON status files (once, tracked in the meta table)."""
+        if sqlite_utils.get_meta(self._conn, "legacy_imported", False):
+            return
+
+        imported = 0
+        for status_file in sorted(self.status_dir.glob("*.json")):
             try:
-                data = json.loads(status_file.read_text())
-                statuses.append(ArticleProcessingStatus.from_dict(data))
+                status = ArticleProcessingStatus.from_dict(json.loads(status_file.read_text()))
             except Exception as e:
-                logger.warning(f"Failed to load status from {status_file}: {e}")
+                logger.warning(f"Failed to import status from {status_file}: {e}")
+                continue
+            # A status saved since the database was created is newer than the file
+            if self.load_status(status.article_id) is None:
+                self.save_status(status)
+                imported += 1
 
-        return statuses
+        with self._conn:
+            sqlite_utils.set_meta(self._conn, "legacy_imported", True)
+        if imported:
+            logger.info(f"Imported {imported} processing status files into {self.db_path}")
 
 
 # ============================================================================
@@ -162,6 +368,9 @@ class ArticleProcessor:
         extractor: "UnifiedKnowledgeExtractor | None" = None,
         status_store: ProcessingStatusStore | None = None,
         use_focused_extractors: bool = True,
+        chunked: bool = False,
+        max_chunk_tokens: int | None = None,
+        strategy: str = "focused",
     ):
         """Initialize resilient miner.
 
@@ -169,19 +378,30 @@ class ArticleProcessor:
             extractor: Unified knowledge extractor (old method)
             status_store: Processing status store
             use_focused_extractors: Whether to use focused extractors (new method)
+            chunked: Extract long articles chunk by chunk and merge, instead of truncating them
+            max_chunk_tokens: Token budget per chunk in chunked mode
+            strategy: Focused extraction strategy - "focused", "combined" or "hybrid"
         """
         self.extractor = extractor
         self.status_store = status_store or ProcessingStatusStore()
-        self.extraction_logger = ExtractionLogger()
         self.use_focused_extractors = use_focused_extractors
         self.focused_extractor = None
+        self.chunked_extractor = None
 
         if use_focused_extractors:
             try:
                 from amplifier.knowledge_synthesis.focused_extractors import FocusedKnowledgeExtractor
 
-                self.focused_extractor = FocusedKnowledgeExtractor()
-                logger.info("Using focused extractors for knowledge mining")
+                self.focused_extractor = FocusedKnowledgeExtractor(strategy)
+                logger.info(f"Using focused extractors for knowledge mining ({self.focused_extractor.strategy.value})")
+
+                if chunked:
+                    from amplifier.knowledge_synthesis.chunked_extraction import DEFAULT_CHUNK_TOKENS
+                    from amplifier.knowledge_synthesis.chunked_extraction import ChunkedExtractor
+
+                    self.chunked_extractor = ChunkedExtractor(
+                        self.focused_extractor, max_chunk_tokens=max_chunk_tokens or DEFAULT_CHUNK_TOKENS
+                    )
             except ImportError:
                 logger.warning("Focused extractors not available, falling back to unified extractor")
                 self.use_focused_extractors = False
@@ -197,6 +417,7 @@ class ArticleProcessor:
             "total_insights": 0,
             "total_patterns": 0,
         }
+        self.strategy_stats: dict[str, StrategyStats] = {}
 
     async def _classify_document(self, text: str, title: str = "") -> str:
         """Classify document type using Claude Code SDK.
@@ -261,56 +482,103 @@ class ArticleProcessor:
         Returns:
             Processing status with results from all processors
         """
-        # Start article processing with clean logging
-        self.extraction_logger.start_article(current, total, article.title, article.content_id)
-
-        # Truncate content to token limit
-        truncated_content, original_tokens, final_tokens = truncate_to_tokens(article.content)
-        self.extraction_logger.log_truncation(original_tokens, final_tokens)
+        statuses = await self.process_articles([article], positions=[current], total=total)
+        return statuses[0]
 
-        # Classify document type using Claude Code SDK (fast model)
-        import threading
-
-        # Set up for animated classification progress
-        classification_done = threading.Event()
-        document_type = "general"  # Default fallback
-
-        def show_classification_progress():
-            """Show animated progress for classification"""
-            spinner = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-            spinner_idx = 0
-            start_time = time.time()
-
-            while not classification_done.is_set():
-                elapsed = time.time() - start_time
-                message = f"├─ {spinner[spinner_idx]} Classifying document type ({elapsed:.1f}s)"
-                sys.stdout.write("\r" + message)
-                sys.stdout.flush()
-                spinner_idx = (spinner_idx + 1) % len(spinner)
-                time.sleep(0.1)
-
-            # Clear the line when done
-            sys.stdout.write("\r" + " " * 80 + "\r")
-            sys.stdout.flush()
-
-        # Start progress indicator
-        progress_thread = threading.Thread(target=show_classification_progress, daemon=True)
-        progress_thread.start()
-
-        # Perform classification
-        try:
-            document_type = await self._classify_document(truncated_content, article.title)
-        finally:
-            # Stop progress indicator
-            classification_done.set()
-            progress_thread.join(timeout=0.5)
+    async def process_articles(
+        self,
+        articles: list[ContentItem],
+        concurrency: int = 1,
+        positions: list[int] | None = None,
+        total: int | None = None,
+        on_complete: Callable[[ContentItem, ArticleProcessingStatus], None] | None = None,
+    ) -> list[ArticleProcessingStatus]:
+        """Process articles with up to ``concurrency`` of them in flight.
+
+        Statuses and extraction data are committed in input order, whatever
+        order the articles finish in. Finished articles wait in memory for the
+        ones before them, so no article starts more than ``REORDER_WINDOW``
+        times ``concurrency`` places ahead of the oldest uncommitted one. An article whose extraction or commit
+        raises is marked failed and the batch carries on. On cancellation,
+        articles already in flight are committed with the processors they
+        finished and the rest marked failed, so the next run retries only what
+        is missing; articles that never started are left untouched.
 
-        # Show final result
-        sys.stdout.write(f"├─ Document type: {document_type}\n")
-        sys.stdout.flush()
-        logger.debug(f"Document classified as: {document_type}")
+        Args:
+            articles: Articles to process
+            concurrency: Maximum articles in flight, each runs its extractors in parallel
+            positions: Display position of each article (default: 1..n)
+            total: Display total (default: number of articles)
+            on_complete: Called with each article and its status as it is committed
 
-        # Load existing status or create new
+        Returns:
+            Statuses of the committed articles, in input order
+        """
+        total = total or len(articles)
+        positions = positions or list(range(1, len(articles) + 1))
+        slots = asyncio.Semaphore(max(1, concurrency))
+        window = max(1, concurrency) * REORDER_WINDOW
+        committed_more = asyncio.Condition()
+        runs: list[_ArticleRun | None] = [None] * len(articles)
+        ready = [False] * len(articles)
+        committed: list[ArticleProcessingStatus] = []
+        next_commit = 0
+
+        async with BatchProgress(total, interleaved=concurrency > 1) as progress:
+
+            def commit(index: int, cancelled: bool = False) -> None:
+                run = runs[index]
+                assert run is not None
+                try:
+                    self._commit_run(run, progress, cancelled)
+                except Exception as e:
+                    self._commit_failed(run, progress, e)
+                committed.append(run.status)
+                if on_complete:
+                    try:
+                        on_complete(run.article, run.status)
+                    except Exception as e:
+                        logger.error(f"Completion callback failed for {run.article.content_id}: {e}")
+
+            def commit_ready() -> None:
+                nonlocal next_commit
+                while next_commit < len(articles) and ready[next_commit]:
+                    next_commit += 1
+                    commit(next_commit - 1)
+
+            async def worker(index: int, article: ContentItem) -> None:
+                async with committed_more:
+                    await committed_more.wait_for(lambda: index < next_commit + window)
+                async with slots:
+                    run = runs[index] = self._start_run(article, positions[index])
+                    progress.start(article.content_id, run.position, article.title)
+                    try:
+                        await self._extract_article(run, progress)
+                    except Exception as e:
+                        logger.error(f"Extraction failed for {article.content_id}: {e}")
+                        self._mark_unfinished(run, str(e))
+                ready[index] = True
+                commit_ready()
+                async with committed_more:
+                    committed_more.notify_all()
+
+            tasks = [asyncio.create_task(worker(index, article)) for index, article in enumerate(articles)]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                # Persist every article that started, finished or not, still in input order
+                for index in range(next_commit, len(articles)):
+                    if runs[index] is not None:
+                        commit(index, cancelled=not ready[index])
+                raise
+
+        return committed
+
+    def _start_run(self, article: ContentItem, position: int) -> "_ArticleRun":
+        """Load the article's status, or create a new one."""
         status = self.status_store.load_status(article.content_id)
         if status is None:
             status = ArticleProcessingStatus(
@@ -320,354 +588,214 @@ class ArticleProcessor:
                 processor_results={},
                 is_complete=False,
             )
+        return _ArticleRun(article=article, position=position, status=status)
 
-        # Process extraction based on mode
-        extraction_data = {}
-        concept_count = 0
-        relation_count = 0
-
-        try:
-            if self.use_focused_extractors and self.focused_extractor:
-                # Use focused extractors for better quality
-                import threading
-
-                # Track extraction start time
-                extraction_start = time.time()
-
-                # Thread safety for output
-                output_lock = threading.Lock()
-
-                # Create a simple progress indicator thread
-                stop_progress = threading.Event()
-                completed_extractors = []
-                extractor_results = {}  # Store results with timing and counts
-
-                def show_progress():
-                    """Show a simple animated progress indicator with extractor status"""
-                    spinner = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-                    spinner_idx = 0
-                    last_update = time.time()
-                    prev_len = 0  # Track previous message length
-
-                    # Initial message
-                    with output_lock:
-                        message = "├─ Running 4 extractors in parallel (concepts, relationships, insights, patterns)..."
-                        sys.stdout.write(message)
-                        sys.stdout.flush()
-                        prev_len = len(message)
-
-                    while not stop_progress.is_set():
-                        current_time = time.time()
-                        elapsed = current_time - extraction_start
-
-                        # Update spinner every 0.3 seconds
-                        if current_time - last_update >= 0.3:
-                            with output_lock:
-                                # Only update if we're still running
-                                if len(completed_extractors) < 4:
-                                    message = f"├─ {spinner[spinner_idx]} Running 4 extractors in parallel (concepts, relationships, insights, patterns)... ({elapsed:.0f}s)"
-
-                                    # Clear the line first
-                                    clear_len = max(prev_len, len(message))
-                                    sys.stdout.write("\r" + " " * clear_len + "\r")
-
-                                    # Now write the new message
-                                    sys.stdout.write(message)
-                                    sys.stdout.flush()
-
-                                    prev_len = len(message)
-                                    spinner_idx = (spinner_idx + 1) % len(spinner)
-                                    last_update = current_time
-
-                        stop_progress.wait(0.1)  # Check every 100ms
-
-                    # Clear the progress line when done
-                    with output_lock:
-                        sys.stdout.write("\r" + " " * prev_len + "\r")
-                        sys.stdout.flush()
-
-                # Start progress indicator in background
-                progress_thread = threading.Thread(target=show_progress, daemon=True)
-                progress_thread.start()
-
-                # Run focused extractors (they run in parallel internally)
-                # We'll wrap this to track individual completions
-                async def extract_with_tracking():
-                    """Wrapper to track which extractors complete"""
-                    if not self.focused_extractor:
-                        # Fallback to regular extract_all if focused_extractor is None
-                        return {}
-
-                    # Start all extractors in parallel
-                    tasks = {
-                        "concepts": asyncio.create_task(
-                            self.focused_extractor.concept_extractor.extract(
-                                truncated_content, article.title, document_type
-                            )
-                        ),
-                        "relationships": asyncio.create_task(
-                            self.focused_extractor.relationship_extractor.extract(
-                                truncated_content, article.title, document_type
-                            )
-                        ),
-                        "insights": asyncio.create_task(
-                            self.focused_extractor.insight_extractor.extract(
-                                truncated_content, article.title, document_type
-                            )
-                        ),
-                        "patterns": asyncio.create_task(
-                            self.focused_extractor.pattern_extractor.extract(
-                                truncated_content, article.title, document_type
-                            )
-                        ),
-                    }
-
-                    # Import here to avoid circular dependencies
-                    from amplifier.knowledge_synthesis.focused_extractors import FocusedExtractionResult
-
-                    results = {}
-
-                    # Create a mapping of tasks to names for tracking
-                    task_to_name = {task: name for name, task in tasks.items()}
-
-                    # Use asyncio.as_completed to track completions as they happen
-                    for coro in asyncio.as_completed(tasks.values()):
-                        try:
-                            result = await coro
-                            # Find which task completed
-                            for task in tasks.values():
-                                if task.done() and task in task_to_name:
-                                    name = task_to_name[task]
-                                    if name not in completed_extractors:
-                                        results[name] = result
-                                        completed_extractors.append(name)
-
-                                        # Store result details
-                                        extractor_results[name] = {
-                                            "count": len(result.data) if result.data else 0,
-                                            "time": time.time() - extraction_start,
-                                            "success": True,
-                                        }
-
-                                        # Log individual completion with output lock
-                                        with output_lock:
-                                            elapsed = time.time() - extraction_start
-                                            count = len(result.data) if result.data else 0
-                                            # Clear current line and show completion
-                                            sys.stdout.write("\r" + " " * 120 + "\r")  # Clear line
-                                            sys.stdout.write(f"├─ ✓ {name} completed ({count} found, {elapsed:.1f}s)\n")
-                                            sys.stdout.flush()
-
-                                        del task_to_name[task]  # Remove from mapping
-                                        break
-                        except Exception as e:
-                            # Find which task failed
-                            for task in tasks.values():
-                                if task.done() and task in task_to_name:
-                                    name = task_to_name[task]
-                                    if name not in completed_extractors:
-                                        logger.error(f"Extraction {name} failed: {e}")
-                                        results[name] = FocusedExtractionResult(
-                                            extraction_type=name, data=[], extraction_time=0.0, error=str(e)
-                                        )
-                                        completed_extractors.append(name)
-
-                                        # Store failure details
-                                        extractor_results[name] = {
-                                            "count": 0,
-                                            "time": time.time() - extraction_start,
-                                            "success": False,
-                                            "error": str(e),
-                                        }
-
-                                        # Log failure with output lock
-                                        with output_lock:
-                                            elapsed = time.time() - extraction_start
-                                            # Clear current line and show failure
-                                            sys.stdout.write("\r" + " " * 120 + "\r")  # Clear line
-                                            sys.stdout.write(f"├─ ✗ {name} failed ({elapsed:.1f}s)\n")
-                                            # Show error details indented
-                                            error_str = str(e)
-                                            # Truncate very long error messages
-                                            if len(error_str) > 100:
-                                                error_str = error_str[:97] + "..."
-                                            sys.stdout.write(f"│  └─ {error_str}\n")
-                                            sys.stdout.flush()
-
-                                        del task_to_name[task]  # Remove from mapping
-                                        break
-
-                    return results
-
-                extraction_results = await extract_with_tracking()
-
-                # Stop the progress indicator
-                stop_progress.set()
-                progress_thread.join(timeout=0.5)  # Wait briefly for thread to clean up
-
-                # Don't show inner completion - let extraction_logger handle it
-
-                # Process results and update status (without redundant output)
-                # Process concepts
-                concept_result = extraction_results.get("concepts")
-                if concept_result and not concept_result.error:
-                    concepts = concept_result.data
-                    concept_count = len(concepts)
-                    extraction_data["concepts"] = concepts
-                    status.processor_results["concepts"] = ProcessorResult(
-                        processor_name="concepts",
-                        status="success" if concepts else "empty",
-                        extracted_count=concept_count,
-                    )
-                else:
-                    status.processor_results["concepts"] = ProcessorResult(
-                        processor_name="concepts",
-                        status="failed",
-                        error_message=concept_result.error if concept_result else "Unknown error",
-                    )
-
-                # Process relationships
-                relationship_result = extraction_results.get("relationships")
-                if relationship_result and not relationship_result.error:
-                    relationships = relationship_result.data
-                    relation_count = len(relationships)
-                    extraction_data["relationships"] = relationships
-                    status.processor_results["relationships"] = ProcessorResult(
-                        processor_name="relationships",
-                        status="success" if relationships else "empty",
-                        extracted_count=relation_count,
-                    )
-                else:
-                    status.processor_results["relationships"] = ProcessorResult(
-                        processor_name="relationships",
-                        status="failed",
-                        error_message=relationship_result.error if relationship_result else "Unknown error",
-                    )
+    async def _extract_article(self, run: "_ArticleRun", progress: BatchProgress) -> None:
+        """Classify and extract one article, recording each processor's result on the run as it finishes."""
+        article = run.article
+        article_id = article.content_id
 
-                # Process insights
-                insight_result = extraction_results.get("insights")
-                if insight_result and not insight_result.error:
-                    insights = insight_result.data
-                    insight_count = len(insights)
-                    extraction_data["insights"] = insights
-                    status.processor_results["insights"] = ProcessorResult(
-                        processor_name="insights",
-                        status="success" if insights else "empty",
-                        extracted_count=insight_count,
-                    )
-                else:
-                    status.processor_results["insights"] = ProcessorResult(
-                        processor_name="insights",
-                        status="failed",
-                        error_message=insight_result.error if insight_result else "Unknown error",
-                    )
-
-                # Process patterns
-                pattern_result = extraction_results.get("patterns")
-                if pattern_result and not pattern_result.error:
-                    patterns = pattern_result.data
-                    pattern_count = len(patterns)
-                    extraction_data["patterns"] = patterns
-                    status.processor_results["patterns"] = ProcessorResult(
-                        processor_name="patterns",
-                        status="success" if patterns else "empty",
-                        extracted_count=pattern_count,
-                    )
-                else:
-                    status.processor_results["patterns"] = ProcessorResult(
-                        processor_name="patterns",
-                        status="failed",
-                        error_message=pattern_result.error if pattern_result else "Unknown error",
-                    )
+        # Truncate content to token limit (classification only needs the truncated text in chunked mode)
+        truncated_content, original_tokens, final_tokens = truncate_to_tokens(article.content)
+        chunks = None
+        if self.chunked_extractor:
+            chunks = self.chunked_extractor.chunk(article.content)
+            if len(chunks) > 1:
+                progress.log(article_id, f"Chunking: {original_tokens:,} tokens → {len(chunks)} chunks")
+        elif original_tokens > final_tokens:
+            progress.log(article_id, f"Truncating: {original_tokens:,} → {final_tokens:,} tokens")
 
-                # Check if all processors succeeded
-                status.is_complete = all(r.status in ["success", "empty"] for r in status.processor_results.values())
+        # Classify document type using Claude Code SDK (fast model)
+        progress.stage(article_id, "Classifying document type")
+        document_type = await self._classify_document(truncated_content, article.title)
+        progress.log(article_id, f"Document type: {document_type}")
+        logger.debug(f"Document classified as: {document_type}")
 
+        try:
+            if self.use_focused_extractors and self.focused_extractor:
+                await self._run_focused_extractors(run, progress, truncated_content, chunks, document_type)
             elif self.extractor:
-                # Use unified extractor (old behavior)
-                self.extraction_logger.start_phase("Unified Extraction")
-                phase_start = time.time()
-
-                async with asyncio.timeout(120):  # 120 seconds per DISCOVERIES.md
-                    extraction = await self.extractor.extract_from_text(
-                        text=truncated_content,
-                        title=article.title,
-                        source=article.content_id,
-                        document_type=document_type,
-                    )
+                await self._run_unified_extractor(run, progress, truncated_content, document_type)
+            else:
+                raise RuntimeError("No extractor available")
+        except Exception as e:
+            logger.debug(f"Extraction failed: {e}")
+            # Mark processors as failed if extraction failed
+            self._mark_unfinished(run, str(e))
 
-                phase_elapsed = time.time() - phase_start
+    async def _run_focused_extractors(
+        self,
+        run: "_ArticleRun",
+        progress: BatchProgress,
+        text: str,
+        chunks: "list[Chunk] | None",
+        document_type: str,
+    ) -> None:
+        from amplifier.ccsdk_toolkit.core.client import track_usage
+        from amplifier.knowledge_synthesis.focused_extractors import FocusedExtractionResult
+
+        assert self.focused_extractor is not None
+        article_id = run.article.content_id
+        extraction_start = time.time()
+
+        results: dict[str, FocusedExtractionResult] = {}
+        streamed = 0
+
+        def show_stage() -> None:
+            progress.stage(
+                article_id, f"Running extractors ({len(results)}/{len(PROCESSOR_NAMES)} done, {streamed} items found)"
+            )
 
-                # Process concepts
-                concepts = extraction.concepts
-                concept_count = len(concepts) if concepts else 0
-                extraction_data["concepts"] = concepts
+        def on_item(key: str | None, item: Any) -> None:
+            # Items arrive while the responses stream, long before an extractor finishes
+            nonlocal streamed
+            streamed += 1
+            show_stage()
 
-                # Process SPO relationships
-                relationships = extraction.relationships
-                relation_count = len(relationships) if relationships else 0
-                extraction_data["relationships"] = [
-                    {"subject": r.subject, "predicate": r.predicate, "object": r.object, "confidence": r.confidence}
-                    for r in relationships
-                ]
+        # Start all extractors in parallel
+        with track_usage() as usage:
+            if self.chunked_extractor and chunks:
+                tasks = self.chunked_extractor.start(chunks, run.article.title, document_type, on_item=on_item)
+            else:
+                tasks = self.focused_extractor.start(text, run.article.title, document_type, on_item=on_item)
+        task_to_name = {task: name for name, task in tasks.items()}
+        pending = set(tasks.values())
 
-                # Log unified extraction completion with breakdown
-                self.extraction_logger.complete_phase(
-                    "Unified Extraction", {"concepts": concepts, "relationships": relationships}, phase_elapsed
-                )
+        try:
+            # Report each extractor as it completes
+            while pending:
+                show_stage()
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = task_to_name[task]
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.error(f"Extraction {name} failed: {e}")
+                        result = FocusedExtractionResult(
+                            extraction_type=name, data=[], extraction_time=0.0, error=str(e)
+                        )
+                    results[name] = result
+                    self._record_result(run, result)
+
+                    elapsed = time.time() - extraction_start
+                    if result.error:
+                        # Truncate very long error messages
+                        error_str = result.error if len(result.error) <= 100 else result.error[:97] + "..."
+                        progress.log(article_id, f"✗ {name} failed ({elapsed:.1f}s): {error_str}")
+                    else:
+                        progress.log(article_id, f"✓ {name} completed ({len(result.data)} found, {elapsed:.1f}s)")
+        finally:
+            for task in pending:
+                task.cancel()
+
+        self._record_strategy(usage, results, time.time() - extraction_start)
+
+    async def _run_unified_extractor(
+        self, run: "_ArticleRun", progress: BatchProgress, text: str, document_type: str
+    ) -> None:
+        assert self.extractor is not None
+        article_id = run.article.content_id
+        progress.stage(article_id, "Unified extraction")
+        phase_start = time.time()
+
+        async with asyncio.timeout(120):  # 120 seconds per DISCOVERIES.md
+            extraction = await self.extractor.extract_from_text(
+                text=text,
+                title=run.article.title,
+                source=article_id,
+                document_type=document_type,
+            )
 
-                # Store other extracted data
-                extraction_data["insights"] = extraction.key_insights
-                extraction_data["patterns"] = extraction.code_patterns
+        concepts = extraction.concepts or []
+        relationships = extraction.relationships or []
+        progress.log(
+            article_id,
+            f"Unified Extraction: Done ({len(concepts)} concepts, {len(relationships)} relations, "
+            f"{time.time() - phase_start:.1f}s)",
+        )
 
-                # Update status for all processors
-                status.processor_results["concepts"] = ProcessorResult(
-                    processor_name="concepts", status="success" if concepts else "empty", extracted_count=concept_count
-                )
-                status.processor_results["relationships"] = ProcessorResult(
-                    processor_name="relationships",
-                    status="success" if relationships else "empty",
-                    extracted_count=relation_count,
-                )
-                status.processor_results["insights"] = ProcessorResult(
-                    processor_name="insights",
-                    status="success" if extraction.key_insights else "empty",
-                    extracted_count=len(extraction.key_insights) if extraction.key_insights else 0,
-                )
-                status.processor_results["patterns"] = ProcessorResult(
-                    processor_name="patterns",
-                    status="success" if extraction.code_patterns else "empty",
-                    extracted_count=len(extraction.code_patterns) if extraction.code_patterns else 0,
+        sections = {
+            "concepts": concepts,
+            "relationships": [
+                {"subject": r.subject, "predicate": r.predicate, "object": r.object, "confidence": r.confidence}
+                for r in relationships
+            ],
+            "insights": extraction.key_insights or [],
+            "patterns": extraction.code_patterns or [],
+        }
+        for name, data in sections.items():
+            run.data[name] = data
+            run.status.processor_results[name] = ProcessorResult(
+                processor_name=name, status="success" if data else "empty", extracted_count=len(data)
+            )
+            run.finished.add(name)
+
+    def _record_result(self, run: "_ArticleRun", result: Any) -> None:
+        """Store one focused extractor's result on the run."""
+        name = result.extraction_type
+        if result.error:
+            run.status.processor_results[name] = ProcessorResult(
+                processor_name=name, status="failed", error_message=result.error
+            )
+        else:
+            run.data[name] = result.data
+            run.status.processor_results[name] = ProcessorResult(
+                processor_name=name, status="success" if result.data else "empty", extracted_count=len(result.data)
+            )
+        run.finished.add(name)
+
+    def _mark_unfinished(self, run: "_ArticleRun", error: str) -> None:
+        """Mark processors that produced no result in this run as failed."""
+        for processor_name in PROCESSOR_NAMES:
+            if processor_name not in run.finished:
+                run.status.processor_results[processor_name] = ProcessorResult(
+                    processor_name=processor_name, status="failed", error_message=error
                 )
 
-                status.is_complete = True
-            else:
-                raise RuntimeError("No extractor available")
+    def _commit_run(self, run: "_ArticleRun", progress: BatchProgress, cancelled: bool = False) -> None:
+        """Save an article's extracted data and status, then report it."""
+        status = run.status
+        if cancelled:
+            self._mark_unfinished(run, "Cancelled before completion")
 
-        except Exception as e:
-            logger.debug(f"Extraction failed: {e}")
-            # Mark processors as failed if extraction failed
-            for processor_name in ["concepts", "relationships", "insights", "patterns"]:
-                if processor_name not in status.processor_results:
-                    status.processor_results[processor_name] = ProcessorResult(
-                        processor_name=processor_name, status="failed", error_message=str(e)
-                    )
+        # Save extracted data first, a saved status claims the data exists
+        if run.data:
+            self._save_extraction_data(run.article.content_id, run.data)
 
-        # Save status after processing
+        # Check if all processors succeeded
+        status.is_complete = all(
+            name in status.processor_results and status.processor_results[name].status in ["success", "empty"]
+            for name in PROCESSOR_NAMES
+        )
         status.last_processed = datetime.now()
         self.status_store.save_status(status)
 
-        # Save extracted data if we have any
-        if extraction_data:
-            self._save_extraction_data(article.content_id, extraction_data)
-
         # Update statistics
         self._update_stats(status)
 
         # Log completion with status for partial failure reporting
-        self.extraction_logger.complete_article(status)
+        failed_processors = [name for name, result in status.processor_results.items() if result.status == "failed"]
+        progress.finish(run.article.content_id, failed_processors, cancelled)
+
+    def _commit_failed(self, run: "_ArticleRun", progress: BatchProgress, error: Exception) -> None:
+        """Record an article whose results could not be saved as failed, so the next run retries it."""
+        article_id = run.article.content_id
+        logger.error(f"Failed to save results for {article_id}: {error}")
+        status = run.status
+        for processor_name in PROCESSOR_NAMES:
+            status.processor_results[processor_name] = ProcessorResult(
+                processor_name=processor_name, status="failed", error_message=f"Saving results failed: {error}"
+            )
+        status.is_complete = False
+        status.last_processed = datetime.now()
+        try:
+            self.status_store.save_status(status)
+        except Exception as e:
+            logger.error(f"Failed to save status for {article_id}: {e}")
 
-        return status
+        self._update_stats(status)
+        progress.finish(article_id, list(PROCESSOR_NAMES))
 
     def _save_extraction_data(self, article_id: str, data: dict[str, Any]) -> None:
         """Save extracted data in both formats for compatibility.
@@ -719,6 +847,32 @@ class ArticleProcessor:
         jsonl_data.update(nested_data)
         return jsonl_data
 
+    def _record_strategy(self, usage: "UsageStats", results: dict[str, Any], elapsed: float) -> None:
+        """Add one article's extraction cost and yield to its strategy's counters.
+
+        Args:
+            usage: Claude calls made during the extraction
+            results: Extraction results by type
+            elapsed: Wall-clock extraction time in seconds
+        """
+        if not self.focused_extractor:
+            return
+        stats = self.strategy_stats.setdefault(self.focused_extractor.strategy.value, StrategyStats())
+        stats.articles += 1
+        stats.llm_calls += usage.calls
+        stats.cached_calls += usage.cached
+        stats.prompt_tokens += usage.prompt_tokens
+        stats.cost_usd += usage.cost_usd
+        stats.extraction_seconds += elapsed
+        for result in results.values():
+            stats.fallbacks += result.fallback
+            if result.error:
+                stats.failed_sections += 1
+            elif not result.data:
+                stats.empty_sections += 1
+            else:
+                stats.extracted_items += len(result.data)
+
     def _update_stats(self, status: ArticleProcessingStatus) -> None:
         """Update mining statistics based on processing status.
 
@@ -755,59 +909,29 @@ class ArticleProcessor:
         Returns:
             Report with statistics and details
         """
-        all_statuses = self.status_store.get_all_statuses()
-
-        # Categorize articles
-        complete = []
-        partial = []
-        failed = []
-        needs_retry = []
-
-        for status in all_statuses:
-            if status.is_complete:
-                complete.append(status)
-            else:
-                # Count successful processors
-                success_count = sum(1 for r in status.processor_results.values() if r.status in ["success", "empty"])
-
-                if success_count == 0:
-                    failed.append(status)
-                    needs_retry.append(status)
-                else:
-                    partial.append(status)
-                    # Only retry if some processors failed
-                    if any(r.status == "failed" for r in status.processor_results.values()):
-                        needs_retry.append(status)
-
-        # Calculate processor-level stats
-        processor_stats = {
-            "concepts": {"success": 0, "failed": 0, "empty": 0},
-            "relationships": {"success": 0, "failed": 0, "empty": 0},
-            "insights": {"success": 0, "failed": 0, "empty": 0},
-            "patterns": {"success": 0, "failed": 0, "empty": 0},
-        }
-
-        for status in all_statuses:
-            for processor_name, result in status.processor_results.items():
-                if processor_name in processor_stats and result.status in processor_stats[processor_name]:
-                    processor_stats[processor_name][result.status] += 1
+        store = self.status_store
+        failed = store.get_by_state("failed", limit=10)  # First 10
+        needs_retry = store.get_needs_retry(limit=10)  # First 10
+
+        # Keep the four processors listed even before any article ran
+        processor_stats = {name: {"success": 0, "failed": 0, "empty": 0} for name in PROCESSOR_NAMES}
+        for processor_name, counts in store.processor_stats().items():
+            if processor_name in processor_stats:
+                processor_stats[processor_name].update(
+                    {k: v for k, v in counts.items() if k in processor_stats[processor_name]}
+                )
 
         return {
-            "summary": {
-                "total_articles": len(all_statuses),
-                "complete": len(complete),
-                "partial": len(partial),
-                "failed": len(failed),
-                "needs_retry": len(needs_retry),
-            },
+            "summary": store.summary(),
             "extraction_stats": self.stats,
+            "strategy_stats": {name: stats.to_dict() for name, stats in self.strategy_stats.items()},
             "processor_stats": processor_stats,
-            "failed_articles": [{"id": s.article_id, "title": s.title} for s in failed[:10]],  # First 10
-            "needs_retry": [{"id": s.article_id, "title": s.title} for s in needs_retry[:10]],  # First 10
+            "failed_articles": [{"id": s.article_id, "title": s.title} for s in failed],
+            "needs_retry": [{"id": s.article_id, "title": s.title} for s in needs_retry],
         }
 
     async def process_batch_with_retry(
-        self, articles: list[ContentItem], retry_failed: bool = True, notify: bool = False
+        self, articles: list[ContentItem], retry_failed: bool = True, notify: bool = False, concurrency: int = 1
     ) -> dict[str, Any]:
         """Process a batch of articles with optional retry for failed items.
 
@@ -815,6 +939,7 @@ class ArticleProcessor:
             articles: List of articles to process
             retry_failed: Whether to retry failed processors
             notify: Whether to send notifications
+            concurrency: Maximum articles processed at once
 
         Returns:
             Processing report
@@ -823,6 +948,8 @@ class ArticleProcessor:
         logger.info(f"Processing batch of {total} articles")
 
         try:
+            to_process = []
+            positions = []
             for idx, article in enumerate(articles, 1):
                 # Check if already processed
                 existing_status = self.status_store.load_status(article.content_id)
@@ -832,9 +959,12 @@ class ArticleProcessor:
                     continue
 
                 # Process or reprocess
-                await self.process_article_with_logging(article, idx, total)
+                to_process.append(article)
+                positions.append(idx)
+
+            await self.process_articles(to_process, concurrency, positions=positions, total=total)
 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             if notify:
                 report = self.get_processing_report()
                 summary = report.get("summary", {})
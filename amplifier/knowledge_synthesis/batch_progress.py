@@ -0,0 +1,151 @@
+"""
+Batch Progress
+
+Purpose: Show progress for articles processed one at a time or concurrently
+Contract: One asyncio task redraws a single status line; every event is printed above it
+
+Replaces the per-article spinner threads: with several articles in flight,
+independent threads rewriting the same terminal line garble the output. Here a
+single renderer owns the status line, and permanent lines (extractor results,
+article summaries) are printed through it. The status line is only drawn on a
+terminal, so redirected output stays a clean log.
+"""
+
+import asyncio
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TextIO
+
+SPINNER = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+
+
+@dataclass
+class _Article:
+    position: int
+    title: str
+    stage: str = "starting"
+    started: float = field(default_factory=time.time)
+
+
+class BatchProgress:
+    """Progress display shared by every article of a batch.
+
+    Use as ``async with BatchProgress(total) as progress``. With ``interleaved``
+    set, lines of concurrent articles are prefixed with the article's position
+    instead of being grouped under a per-article header.
+    """
+
+    def __init__(self, total: int, interleaved: bool = False, stream: TextIO | None = None, interval: float = 0.1):
+        """Initialize the display.
+
+        Args:
+            total: Number of articles in the batch
+            interleaved: Several articles print at the same time
+            stream: Output stream (default: stdout)
+            interval: Seconds between status line redraws
+        """
+        self.total = total
+        self.interleaved = interleaved
+        self.stream = stream or sys.stdout
+        self.interval = interval
+        self.done = 0
+        self._articles: dict[str, _Article] = {}
+        self._live = self.stream.isatty()
+        self._line_len = 0
+        self._spinner_idx = 0
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "BatchProgress":
+        if self._live:
+            self._task = asyncio.create_task(self._render())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._clear()
+        self.stream.flush()
+
+    def start(self, article_id: str, position: int, title: str) -> None:
+        """Register an article as in flight."""
+        self._articles[article_id] = _Article(position, title)
+        if not self.interleaved:
+            display_title = title[:60] + "..." if len(title) > 60 else title
+            self._write(f"\n[{position}/{self.total}] {display_title} ({article_id})")
+
+    def stage(self, article_id: str, stage: str) -> None:
+        """Update what an in-flight article is doing, shown on the status line."""
+        if article_id in self._articles:
+            self._articles[article_id].stage = stage
+
+    def log(self, article_id: str, message: str) -> None:
+        """Print a permanent line for an article."""
+        article = self._articles.get(article_id)
+        if self.interleaved and article:
+            self._write(f"[{article.position}/{self.total}] {message}")
+        else:
+            self._write(f"├─ {message}")
+
+    def finish(self, article_id: str, failed_processors: list[str], cancelled: bool = False) -> None:
+        """Print an article's summary and remove it from the status line."""
+        article = self._articles.pop(article_id, None)
+        self.done += 1
+        elapsed = f"{time.time() - article.started:.1f}s" if article else ""
+
+        if cancelled:
+            outcome = "⚠ Cancelled: partial results saved"
+        elif failed_processors:
+            outcome = f"⚠ Partial: {', '.join(failed_processors)} failed"
+        else:
+            outcome = "✓ Complete: all processors succeeded"
+
+        if self.interleaved and article:
+            title = article.title[:50] + "..." if len(article.title) > 50 else article.title
+            self._write(f"[{article.position}/{self.total}] └─ {title} ({elapsed}) {outcome}")
+        else:
+            self._write(f"  └─ Complete ({elapsed} total)")
+            self._write(f"     {outcome}")
+
+    def _write(self, line: str) -> None:
+        self._clear()
+        self.stream.write(line + "\n")
+        self._draw()
+
+    def _clear(self) -> None:
+        if self._line_len:
+            self.stream.write("\r" + " " * self._line_len + "\r")
+            self._line_len = 0
+
+    def _draw(self) -> None:
+        if not self._live or not self._articles:
+            self.stream.flush()
+            return
+        now = time.time()
+        spinner = SPINNER[self._spinner_idx % len(SPINNER)]
+        if self.interleaved:
+            active = " · ".join(
+                f"[{a.position}] {a.stage} {now - a.started:.0f}s"
+                for a in sorted(self._articles.values(), key=lambda a: a.position)
+            )
+            line = f"{spinner} {self.done}/{self.total} done · {len(self._articles)} in flight: {active}"
+        else:
+            article = next(iter(self._articles.values()))
+            line = f"├─ {spinner} {article.stage} ({now - article.started:.1f}s)"
+
+        width = shutil.get_terminal_size().columns - 1
+        line = line[:width]
+        self.stream.write(line)
+        self.stream.flush()
+        self._line_len = len(line)
+
+    async def _render(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self._spinner_idx += 1
+            self._clear()
+            self._draw()
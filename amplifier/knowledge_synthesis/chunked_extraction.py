@@ -0,0 +1,298 @@
+"""
+Chunked Extraction
+
+Purpose: Map-reduce focused extraction over long documents instead of truncating them
+Contract: Split on markdown sections, extract every chunk concurrently, merge and dedupe per document
+
+Chunks are built from whole markdown sections, and each chunk after the first
+repeats the tail of the previous one so statements that straddle a boundary are
+seen whole. Oversized sections fall back to paragraph and then raw token splits.
+
+Re-extraction of an edited document only pays for the chunks around the edit.
+A chunk ends after a section whose content marks it as an anchor (or when the
+next section would not fit), so cuts do not depend on anything before them and
+an edit moves at most the cuts next to it. Chunk prompts are content-addressed
+in the Claude response cache with the repeated overlap left out of the key, so
+every unchanged chunk is answered from disk.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+import tiktoken
+
+from amplifier.ccsdk_toolkit.core.client import cache_key_excludes
+from amplifier.ccsdk_toolkit.defensive.streaming_json import ItemCallback
+from amplifier.knowledge.graph_builder import GraphBuilder
+
+from .focused_extractors import EXTRACTION_TYPES
+from .focused_extractors import ExtractionStrategy
+from .focused_extractors import FocusedExtractionResult
+from .focused_extractors import FocusedKnowledgeExtractor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_TOKENS = 12_000
+DEFAULT_OVERLAP_TOKENS = 400
+
+HEADING_PATTERN = re.compile(r"^#{1,6}\s")
+FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+
+
+@dataclass
+class Chunk:
+    """One slice of a document sent to the extractors"""
+
+    index: int
+    text: str
+    tokens: int
+    overlap: str = ""  # Tail of the previous chunk that ``text`` starts with
+
+    @property
+    def body(self) -> str:
+        """The chunk's own text, without the overlap"""
+        return self.text[len(self.overlap) :]
+
+
+@cache
+def _encoding() -> tiktoken.Encoding:
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _count(text: str) -> int:
+    return len(_encoding().encode(text))
+
+
+def split_sections(text: str) -> list[str]:
+    """Split markdown into sections that each start at a heading (fenced code is never split)"""
+    sections: list[str] = []
+    current: list[str] = []
+    in_fence = False
+
+    for line in text.splitlines(keepends=True):
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        elif not in_fence and HEADING_PATTERN.match(line) and current:
+            sections.append("".join(current))
+            current = []
+        current.append(line)
+
+    if current:
+        sections.append("".join(current))
+    return sections
+
+
+def _split_oversized(section: str, max_tokens: int) -> list[str]:
+    """Split a section larger than the budget on paragraphs, then on raw token windows"""
+    pieces = []
+    # Split after blank lines, keeping them so the pieces still add up to the section
+    for paragraph in re.split(r"(?<=\n\n)(?!\n)", section):
+        if _count(paragraph) <= max_tokens:
+            pieces.append(paragraph)
+            continue
+        tokens = _encoding().encode(paragraph)
+        pieces.extend(_encoding().decode(tokens[i : i + max_tokens]) for i in range(0, len(tokens), max_tokens))
+    return pieces
+
+
+def _is_anchor(piece: str, piece_tokens: int, target_tokens: int) -> bool:
+    """Whether a chunk may end after this piece, decided by the piece's content alone
+
+    About one anchor per ``target_tokens`` tokens of text.
+    """
+    digest = int.from_bytes(hashlib.blake2b(piece.encode(), digest_size=8).digest(), "big")
+    return digest < piece_tokens / target_tokens * 2**64
+
+
+def chunk_markdown(
+    text: str, max_tokens: int = DEFAULT_CHUNK_TOKENS, overlap_tokens: int = DEFAULT_OVERLAP_TOKENS
+) -> list[Chunk]:
+    """Split markdown at section anchors into chunks of at most ``max_tokens`` tokens
+
+    Chunks average about half the body budget, so most of them end at an
+    anchor rather than where the budget ran out: only those cuts stay put when
+    earlier text changes length.
+
+    Args:
+        text: Document text
+        max_tokens: Token budget per chunk, including the overlap
+        overlap_tokens: Tokens from the end of the previous chunk repeated at the start of the next
+
+    Returns:
+        Chunks in document order; a document within budget is a single chunk
+    """
+    total = _count(text)
+    if total <= max_tokens:
+        return [Chunk(index=0, text=text, tokens=total)]
+
+    body_budget = max(1, max_tokens - overlap_tokens)
+    target_tokens = max(1, body_budget // 2)
+    bodies: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+
+    for section in split_sections(text):
+        pieces = [section] if _count(section) <= body_budget else _split_oversized(section, body_budget)
+        for piece in pieces:
+            piece_tokens = _count(piece)
+            if current and current_tokens + piece_tokens > body_budget:
+                bodies.append("".join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += piece_tokens
+            if _is_anchor(piece, piece_tokens, target_tokens):
+                bodies.append("".join(current))
+                current, current_tokens = [], 0
+
+    if current:
+        bodies.append("".join(current))
+
+    chunks = []
+    for index, body in enumerate(bodies):
+        overlap = ""
+        if index and overlap_tokens:
+            previous = _encoding().encode(bodies[index - 1])
+            overlap = _encoding().decode(previous[-overlap_tokens:])
+        chunks.append(Chunk(index=index, text=overlap + body, tokens=_count(overlap + body), overlap=overlap))
+    return chunks
+
+
+# Same normalization as the graph, so merged items line up with graph nodes
+normalize_name = GraphBuilder.normalize_concept
+
+
+def _item_key(extraction_type: str, item: Any) -> Any:
+    if not isinstance(item, dict):
+        return normalize_name(str(item))
+    if extraction_type == "relationships":
+        return (
+            normalize_name(str(item.get("subject", ""))),
+            normalize_name(str(item.get("predicate", ""))),
+            normalize_name(str(item.get("object", ""))),
+        )
+    if extraction_type == "patterns":
+        return normalize_name(str(item.get("name") or item.get("code", "")))
+    return normalize_name(str(item.get("name", "")))
+
+
+def _score(item: Any) -> float:
+    if not isinstance(item, dict):
+        return 0.0
+    try:
+        return float(item.get("importance", item.get("confidence", 0.0)))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def merge_items(extraction_type: str, chunk_items: list[list[Any]]) -> list[Any]:
+    """Merge items from all chunks, keeping the highest-scored copy of each duplicate
+
+    Order follows first appearance in the document.
+    """
+    merged: dict[Any, Any] = {}
+    for items in chunk_items:
+        for item in items:
+            key = _item_key(extraction_type, item)
+            if not key or key == ("", "", ""):
+                continue
+            if key not in merged or _score(item) > _score(merged[key]):
+                # Re-inserting would move the key, assignment keeps first-appearance order
+                merged[key] = item
+    return list(merged.values())
+
+
+class ChunkedExtractor:
+    """Runs the focused extractors over document chunks and merges the results"""
+
+    def __init__(
+        self,
+        focused_extractor: FocusedKnowledgeExtractor | None = None,
+        max_chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+        overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+    ):
+        """Initialize the chunked extractor
+
+        Args:
+            focused_extractor: Extractors to run per chunk, its strategy applies to every chunk
+            max_chunk_tokens: Token budget per chunk
+            overlap_tokens: Tokens repeated between neighbouring chunks
+        """
+        self.focused_extractor = focused_extractor or FocusedKnowledgeExtractor()
+        self.max_chunk_tokens = max_chunk_tokens
+        self.overlap_tokens = overlap_tokens
+
+    def chunk(self, text: str) -> list[Chunk]:
+        """Split a document with this extractor's budget"""
+        return chunk_markdown(text, self.max_chunk_tokens, self.overlap_tokens)
+
+    def start(
+        self,
+        chunks: list[Chunk],
+        title: str = "",
+        document_type: str = "general",
+        strategy: ExtractionStrategy | str | None = None,
+        on_item: ItemCallback | None = None,
+    ) -> dict[str, asyncio.Task]:
+        """Start extraction of every chunk, one merging task per type
+
+        ``on_item`` sees every chunk's items as they stream in, before duplicates are merged.
+
+        Returns dict with keys: concepts, relationships, insights, patterns
+        """
+        per_chunk = []
+        for chunk in chunks:
+            # Tasks keep the context they were started in, so every call for this chunk keys on its body
+            with cache_key_excludes(chunk.overlap):
+                per_chunk.append(self.focused_extractor.start(chunk.text, title, document_type, strategy, on_item))
+        return {
+            name: asyncio.create_task(self._merge(name, [tasks[name] for tasks in per_chunk]))
+            for name in EXTRACTION_TYPES
+        }
+
+    async def extract_all(
+        self,
+        text: str,
+        title: str = "",
+        document_type: str = "general",
+        strategy: ExtractionStrategy | str | None = None,
+    ) -> dict[str, FocusedExtractionResult]:
+        """Chunk a document and run all four extractors over it
+
+        Returns dict with keys: concepts, relationships, insights, patterns
+        """
+        tasks = self.start(self.chunk(text), title, document_type, strategy)
+        results = await asyncio.gather(*tasks.values())
+        return dict(zip(tasks, results, strict=True))
+
+    async def _merge(self, extraction_type: str, chunk_tasks: list[asyncio.Task]) -> FocusedExtractionResult:
+        # Any failed chunk fails the whole result, so the article is retried;
+        # the successful chunks are then answered from the response cache
+        start_time = time.time()
+        results: list[FocusedExtractionResult] = await asyncio.gather(*chunk_tasks)
+
+        errors = [r.error for r in results if r.error]
+        elapsed = time.time() - start_time
+        fallback = any(r.fallback for r in results)
+        if errors:
+            return FocusedExtractionResult(
+                extraction_type=extraction_type,
+                data=[],
+                extraction_time=elapsed,
+                error=f"{len(errors)} of {len(results)} chunks failed: {errors[0]}",
+                fallback=fallback,
+            )
+
+        data = merge_items(extraction_type, [r.data for r in results])
+        logger.debug(
+            f"Merged {extraction_type} from {len(results)} chunks: "
+            f"{sum(len(r.data) for r in results)} extracted, {len(data)} after dedupe"
+        )
+        return FocusedExtractionResult(
+            extraction_type=extraction_type, data=data, extraction_time=elapsed, fallback=fallback
+        )
@@ -7,14 +7,20 @@ import asyncio
 import json
 import logging
 import os
-from typing import Any
+from collections import Counter
+from datetime import datetime
 
 import click
 
+from amplifier.ccsdk_toolkit.core.cache import get_response_cache
+from amplifier.ccsdk_toolkit.core.governor import get_governor
+from amplifier.ccsdk_toolkit.core.pool import get_client_pool
+from amplifier.ccsdk_toolkit.core.pool import run_pooled
 from amplifier.config.paths import paths
 from amplifier.knowledge_integration import UnifiedKnowledgeExtractor
 from amplifier.utils.notifications import send_notification
 
+from .event_rollups import EventRollups
 from .events import EventEmitter
 from .store import KnowledgeStore
 
@@ -53,7 +59,35 @@ def cli():
     default=False,
     help="Send desktop notifications on completion",
 )
-def sync(max_items: int | None, resilient: bool, skip_partial_failures: bool, notify: bool):
+@click.option(
+    "--chunked",
+    is_flag=True,
+    default=False,
+    help="Extract long articles section by section and merge, instead of truncating them",
+)
+@click.option(
+    "--strategy",
+    type=click.Choice(["focused", "combined", "hybrid"]),
+    default="focused",
+    help="focused: one prompt per knowledge type; combined: one prompt for all four; "
+    "hybrid: combined, re-running focused extractors for empty types (default: focused)",
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Articles processed at once with --resilient; LLM calls stay bounded by "
+    "AMPLIFIER_LLM_MAX_CONCURRENCY (default: 4)",
+)
+def sync(
+    max_items: int | None,
+    resilient: bool,
+    skip_partial_failures: bool,
+    notify: bool,
+    chunked: bool,
+    strategy: str,
+    concurrency: int,
+):
     """
     Sync and extract knowledge from content files.
 
@@ -65,15 +99,28 @@ def sync(max_items: int | None, resilient: bool, skip_partial_failures: bool, no
 
     By default, retries articles with partial failures. Use --skip-partial-failures
     to process only new articles.
+
+    With --chunked, articles longer than one chunk are split on markdown sections
+    and every chunk is extracted; unchanged chunks are answered from the response cache.
+
+    --strategy combined sends each article once instead of four times; the summary
+    reports calls, tokens, cost and items per article for each strategy used.
+
+    --concurrency sets how many articles are in flight at once. Results are saved
+    in article order, and Ctrl+C keeps the finished extractors of in-flight articles.
     """
     # By default, retry partial failures unless skip flag is set
     retry_partial_mode = not skip_partial_failures
 
     try:
         if resilient:
-            asyncio.run(_sync_content_resilient(max_items, retry_partial_mode, notify))
+            asyncio.run(
+                run_pooled(
+                    _sync_content_resilient(max_items, retry_partial_mode, notify, chunked, strategy, concurrency)
+                )
+            )
         else:
-            asyncio.run(_sync_content(max_items, notify))
+            asyncio.run(run_pooled(_sync_content(max_items, notify)))
     except KeyboardInterrupt:
         if notify:
             send_notification(
@@ -92,6 +139,28 @@ def sync(max_items: int | None, resilient: bool, skip_partial_failures: bool, no
         raise
 
 
+def _log_llm_stats() -> None:
+    """Log response cache, client pool and governor statistics for this run."""
+    cache = get_response_cache()
+    if cache:
+        stats = cache.stats()
+        logger.info(f"LLM cache: {stats.hits} hits, {stats.misses} misses ({stats.hit_rate:.0%} hit rate)")
+
+    pool = get_client_pool()
+    if pool and pool.stats.requests:
+        stats = pool.stats
+        logger.info(
+            f"Claude clients: {stats.requests} requests on {stats.created} clients, "
+            f"start-up {stats.avg_connect_ms:.0f}ms per client, {stats.connect_ms_per_request:.0f}ms per request"
+        )
+
+    for lane in get_governor().metrics():
+        logger.info(
+            f"LLM lane {lane.model}: {lane.completed} ok, {lane.failed} failed, limit {lane.limit}, "
+            f"latency p50 {lane.p50_ms / 1000:.1f}s p95 {lane.p95_ms / 1000:.1f}s"
+        )
+
+
 async def _sync_content(max_items: int | None, notify: bool = False):
     """Sync and extract knowledge from content files."""
     # Import the new content loader
@@ -244,12 +313,15 @@ async def _sync_content(max_items: int | None, notify: bool = False):
     # Show error summary
     error_summary = store.get_error_summary()
     logger.info(f"Extraction quality: {error_summary}")
+    _log_llm_stats()
 
     emitter.emit(
         "sync_finished",
         stage="sync",
         data={"processed": processed, "skipped": skipped, "total": len(content_items)},
     )
+    with EventRollups() as rollups:
+        rollups.catch_up(emitter)
 
     # Send completion notification
     if notify:
@@ -260,14 +332,21 @@ async def _sync_content(max_items: int | None, notify: bool = False):
         )
 
 
-async def _sync_content_resilient(max_items: int | None, retry_partial: bool = False, notify: bool = False):
+async def _sync_content_resilient(
+    max_items: int | None,
+    retry_partial: bool = False,
+    notify: bool = False,
+    chunked: bool = False,
+    strategy: str = "focused",
+    concurrency: int = 1,
+):
     """Sync content with resilient partial failure handling."""
     from amplifier.content_loader import ContentLoader
 
     from .article_processor import ArticleProcessor
 
     # Initialize components
-    miner = ArticleProcessor()
+    miner = ArticleProcessor(chunked=chunked, strategy=strategy)
     loader = ContentLoader()
     emitter = EventEmitter()
 
@@ -317,9 +396,11 @@ async def _sync_content_resilient(max_items: int | None, retry_partial: bool = F
 
     emitter.emit("sync_started", stage="sync", data={"total": len(content_items), "max": max_items})
 
+    batch = []
+    positions = []
     for idx, item in enumerate(content_items):
         # Check max items limit
-        if max_items and processed >= max_items:
+        if max_items and processed + len(batch) >= max_items:
             break
 
         # Check if already processed
@@ -341,53 +422,52 @@ async def _sync_content_resilient(max_items: int | None, retry_partial: bool = F
                     partial += 1
                     continue
 
-        # Process article with resilient handling
-        try:
-            # Process with resilient miner (directly pass ContentItem)
-            status = await miner.process_article_with_logging(item, current=idx + 1, total=len(content_items))
+        batch.append(item)
+        positions.append(idx + 1)
 
-            # Update counters based on status
-            if status.is_complete:
-                processed += 1
+    def on_complete(item, status) -> None:
+        nonlocal processed, partial, failed
+
+        # Update counters based on status
+        if status.is_complete:
+            processed += 1
+        else:
+            # Check if we got partial results
+            successful_processors = [
+                name for name, result in status.processor_results.items() if result.status in ["success", "empty"]
+            ]
+            if successful_processors:
+                partial += 1
             else:
-                # Check if we got partial results
-                successful_processors = [
-                    name for name, result in status.processor_results.items() if result.status in ["success", "empty"]
-                ]
-                if successful_processors:
-                    partial += 1
-                else:
-                    failed += 1
+                failed += 1
 
-            # Emit appropriate event
-            emitter.emit(
-                "extraction_completed",
-                stage="extract",
-                source_id=item.content_id,
-                data={
-                    "title": item.title,
-                    "complete": status.is_complete,
-                    "processors": {name: result.status for name, result in status.processor_results.items()},
-                },
-            )
+        # Emit appropriate event
+        emitter.emit(
+            "extraction_completed",
+            stage="extract",
+            source_id=item.content_id,
+            data={
+                "title": item.title,
+                "complete": status.is_complete,
+                "processors": {name: result.status for name, result in status.processor_results.items()},
+            },
+        )
 
-        except KeyboardInterrupt:
-            logger.info("\n⚠ Interrupted - saving progress...")
-            if notify:
-                send_notification(
-                    title="Amplifier",
-                    message=f"Sync interrupted. Processed {processed}, partial {partial}, failed {failed}",
-                    cwd=os.getcwd(),
-                )
-            break
-        except Exception as e:
-            logger.error(f"  ✗ Unexpected error: {e}")
-            failed += 1
-            emitter.emit(
-                "extraction_failed",
-                stage="extract",
-                source_id=item.content_id,
-                data={"title": item.title, "error": str(e)},
+    # Process with resilient miner, several articles at once
+    interrupted = False
+    try:
+        await miner.process_articles(
+            batch, concurrency, positions=positions, total=len(content_items), on_complete=on_complete
+        )
+    except asyncio.CancelledError:
+        # Ctrl+C: articles in flight were saved with their finished processors, report what we have
+        interrupted = True
+        logger.info("\n⚠ Interrupted - progress saved")
+        if notify:
+            send_notification(
+                title="Amplifier",
+                message=f"Sync interrupted. Processed {processed}, partial {partial}, failed {failed}",
+                cwd=os.getcwd(),
             )
 
     # Generate and display comprehensive report
@@ -417,12 +497,29 @@ async def _sync_content_resilient(max_items: int | None, retry_partial: bool = F
             logger.info(f"  Total Insights: {extraction_stats.get('total_insights', 0)}")
             logger.info(f"  Total Patterns: {extraction_stats.get('total_patterns', 0)}")
 
+        # Show cost and yield per extraction strategy
+        for name, stats in report_data.get("strategy_stats", {}).items():
+            logger.info(f"\nExtraction Strategy '{name}' ({stats['articles']} articles):")
+            logger.info(
+                f"  Per article: {stats['calls_per_article']} calls, {stats['tokens_per_article']:,} prompt tokens, "
+                f"${stats['cost_per_article_usd']:.4f}, {stats['seconds_per_article']}s"
+            )
+            logger.info(
+                f"  Yield: {stats['items_per_article']} items per article, "
+                f"{stats['items_per_1k_tokens']} per 1k prompt tokens"
+            )
+            logger.info(
+                f"  Sections: {stats['empty_sections']} empty, {stats['failed_sections']} failed, "
+                f"{stats['fallbacks']} hybrid fallbacks, {stats['cached_calls']} cached calls"
+            )
+
     # Basic stats
     logger.info("\nOverall Statistics:")
     logger.info(f"  Complete: {processed} articles (all processors succeeded)")
     logger.info(f"  Partial: {partial} articles (some processors failed)")
     logger.info(f"  Failed: {failed} articles (all processors failed)")
     logger.info(f"  Total processed: {processed + partial + failed}")
+    _log_llm_stats()
 
     # Emit completion event
     emitter.emit(
@@ -433,8 +530,11 @@ async def _sync_content_resilient(max_items: int | None, retry_partial: bool = F
             "partial": partial,
             "failed": failed,
             "total": len(content_items),
+            "interrupted": interrupted,
         },
     )
+    with EventRollups() as rollups:
+        rollups.catch_up(emitter)
 
     # Suggest next actions if there were failures
     if partial > 0 or failed > 0:
@@ -505,7 +605,10 @@ def events(n: int, event_filter: str | None, follow: bool) -> None:
         try:
             while True:
                 _time.sleep(1)
-                new_size = path.stat().st_size
+                new_size = path.stat().st_size if path.exists() else 0
+                if new_size < last_size:
+                    # Log was rotated, continue from the start of the new active file
+                    last_size = 0
                 if new_size > last_size:
                     # Read newly appended lines
                     with open(path, encoding="utf-8") as f:
@@ -539,94 +642,51 @@ def events(n: int, event_filter: str | None, follow: bool) -> None:
     default="last",
     help="Summarize last run (default) or all events",
 )
-def events_summary(scope: str) -> None:
-    """Summarize pipeline events."""
+@click.option("--since", type=click.DateTime(), default=None, help="Only events at or after this time (implies all)")
+@click.option("--until", type=click.DateTime(), default=None, help="Only events before this time (implies all)")
+def events_summary(scope: str, since: datetime | None, until: datetime | None) -> None:
+    """Summarize pipeline events from the pre-aggregated rollups."""
     path = paths.data_dir / "knowledge" / "events.jsonl"
-    if not path.exists():
+    emitter = EventEmitter(path)
+    if not emitter.segments():
         logger.info(f"No events found at {path}")
         return
 
-    # Load events
-    rows: list[dict[str, Any]] = []
-    with open(path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                rows.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-
-    if not rows:
-        logger.info("No events to summarize")
-        return
+    # Fold any events appended since the last summary into the rollups
+    with EventRollups() as rollups:
+        rollups.catch_up(emitter)
 
-    # Determine window
-    start_idx = 0
-    end_idx = len(rows) - 1
-    if scope.lower() == "last":
-        # Find last sync_finished, then back to the preceding sync_started
-        last_finish = None
-        for i in range(len(rows) - 1, -1, -1):
-            if rows[i].get("event") == "sync_finished":
-                last_finish = i
-                break
-        if last_finish is None:
-            # No completed runs; take from last sync_started if any
-            for i in range(len(rows) - 1, -1, -1):
-                if rows[i].get("event") == "sync_started":
-                    start_idx = i
-                    break
-            end_idx = len(rows) - 1
+        ranged = since is not None or until is not None
+        if scope.lower() == "last" and not ranged:
+            summary = rollups.last_run()
         else:
-            end_idx = last_finish
-            start_idx = 0
-            for i in range(last_finish, -1, -1):
-                if rows[i].get("event") == "sync_started":
-                    start_idx = i
-                    break
-
-    window = rows[start_idx : end_idx + 1]
-    if not window:
+            summary = rollups.summarize(
+                since=since.timestamp() if since else None,
+                until=until.timestamp() if until else None,
+            )
+
+    if summary is None or not summary.by_type:
         logger.info("No events in selected window")
         return
 
-    # Aggregate
-    from collections import Counter
-
-    by_type: Counter[str] = Counter(ev.get("event", "") for ev in window)
-    skipped_reasons: Counter[str] = Counter(
-        (ev.get("data", {}) or {}).get("reason", "") for ev in window if ev.get("event") == "content_skipped"
-    )
+    by_type = Counter(summary.by_type)
     success = by_type.get("extraction_succeeded", 0)
     failures = by_type.get("extraction_failed", 0)
     started = by_type.get("extraction_started", 0)
-
-    # Duration
-    started_ts = next((ev.get("timestamp") for ev in window if ev.get("event") == "sync_started"), None)
-    finished_ts = next((ev.get("timestamp") for ev in reversed(window) if ev.get("event") == "sync_finished"), None)
-    duration_s = (float(finished_ts) - float(started_ts)) if started_ts and finished_ts else None
-
-    # Processed/skipped totals from summary if present
-    processed = None
-    skipped = None
-    total = None
-    for ev in reversed(window):
-        if ev.get("event") == "sync_finished":
-            data = ev.get("data", {}) or {}
-            processed = data.get("processed")
-            skipped = data.get("skipped")
-            total = data.get("total")
-            break
+    run_data = summary.run_summary or {}
 
     # Print
     print("\n=== Event Summary ===")
-    print(f"Scope: {'last run' if scope.lower() == 'last' else 'all events'}")
-    if duration_s is not None:
-        print(f"Duration: {duration_s:.1f}s")
-    if processed is not None:
-        print(f"Processed: {processed}  Skipped: {skipped}  Total: {total}")
+    if ranged:
+        print(f"Scope: {since or 'beginning'} to {until or 'now'}")
+    else:
+        print(f"Scope: {'last run' if scope.lower() == 'last' else 'all events'}")
+    if summary.duration_s is not None:
+        print(f"Duration: {summary.duration_s:.1f}s")
+    if run_data.get("processed") is not None:
+        print(
+            f"Processed: {run_data.get('processed')}  Skipped: {run_data.get('skipped')}  Total: {run_data.get('total')}"
+        )
     print(f"Starts: {started}  Success: {success}  Failures: {failures}")
     rate = (success / started * 100.0) if started else 0.0
     print(f"Success rate: {rate:.1f}%")
@@ -635,7 +695,13 @@ def events_summary(scope: str) -> None:
     for k, v in by_type.most_common():
         print(f"  {k}: {v}")
 
-    top_skip = [(k, c) for k, c in skipped_reasons.items() if k]
+    print("\nBy Stage:")
+    for stage, stats in summary.by_stage.items():
+        failure_rate = stats["failures"] / stats["count"] * 100.0 if stats["count"] else 0.0
+        avg = f"  avg {stats['avg_duration']:.1f}s" if stats["avg_duration"] else ""
+        print(f"  {stage}: {stats['count']} events  {failure_rate:.1f}% failed{avg}")
+
+    top_skip = [(k, c) for k, c in summary.skipped_reasons.items() if k]
     if top_skip:
         print("\nTop Skipped Reasons:")
         for k, v in sorted(top_skip, key=lambda x: x[1], reverse=True)[:5]:
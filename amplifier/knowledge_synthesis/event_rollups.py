@@ -0,0 +1,395 @@
+"""
+Pre-aggregated rollups of pipeline events.
+
+Tails the JSONL event log from a persisted offset and folds every new event
+into SQLite aggregates: counts and durations per hourly bucket, event type
+and stage, skip reasons, and one row per sync run. Summaries then read the
+aggregates instead of re-parsing the raw log, so they stay instant over
+months of history and can be restricted to a time range.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+from amplifier.config.paths import paths
+from amplifier.utils import sqlite_utils
+
+from .events import EventEmitter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROLLUP_PATH = paths.data_dir / "knowledge" / "events_rollup.db"
+BUCKET_SECONDS = 3600
+
+# Events that close an extraction opened by `extraction_started`
+EXTRACTION_END_EVENTS = {"extraction_succeeded", "extraction_completed", "extraction_failed"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS event_buckets (
+    bucket INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    duration_total REAL NOT NULL DEFAULT 0,
+    duration_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, event, stage)
+);
+CREATE TABLE IF NOT EXISTS skip_buckets (
+    bucket INTEGER NOT NULL,
+    reason TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, reason)
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL,
+    finished_at REAL,
+    summary TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_finished ON runs(finished_at);
+CREATE TABLE IF NOT EXISTS run_counts (
+    run_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (run_id, kind, key)
+);
+CREATE TABLE IF NOT EXISTS run_stages (
+    run_id INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    failures INTEGER NOT NULL DEFAULT 0,
+    duration_total REAL NOT NULL DEFAULT 0,
+    duration_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (run_id, stage)
+);
+CREATE TABLE IF NOT EXISTS open_extractions (source_id TEXT PRIMARY KEY, started_at REAL NOT NULL);
+"""
+
+
+@dataclass
+class EventSummary:
+    """Aggregated view of a run or a time range."""
+
+    by_type: dict[str, int] = field(default_factory=dict)
+    skipped_reasons: dict[str, int] = field(default_factory=dict)
+    # stage -> {"count", "failures", "avg_duration"}
+    by_stage: dict[str, dict[str, float]] = field(default_factory=dict)
+    started_at: float | None = None
+    finished_at: float | None = None
+    run_summary: dict[str, Any] | None = None
+
+    @property
+    def duration_s(self) -> float | None:
+        if self.started_at and self.finished_at:
+            return self.finished_at - self.started_at
+        return None
+
+
+class EventRollups:
+    """Incrementally maintained aggregates over the pipeline event log."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or DEFAULT_ROLLUP_PATH
+        self._conn = sqlite_utils.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> EventRollups:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def catch_up(self, emitter: EventEmitter) -> int:
+        """
+        Fold events appended since the last call into the rollups.
+
+        The read position (segment fingerprint + byte offset) is persisted, so
+        each call only reads new bytes. Segments rotated away since the last
+        call are finished first. Runs in one write transaction, so concurrent
+        callers never count an event twice.
+
+        Returns:
+            Number of events ingested
+        """
+        emitter.flush()
+        ingested = 0
+
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            fingerprint = sqlite_utils.get_meta(self._conn, "fingerprint")
+            offset = sqlite_utils.get_meta(self._conn, "offset", 0)
+
+            # Newest first: active log, then rotated segments
+            segments = emitter.segments()
+            fingerprints = [_fingerprint(segment) for segment in segments]
+            if fingerprint in fingerprints:
+                start = fingerprints.index(fingerprint)
+            else:
+                # First run, or our segment was rotated out entirely: everything kept is new
+                start = len(segments) - 1
+
+            # Walk from our segment towards the active log, oldest to newest
+            for index in range(start, -1, -1):
+                segment_fingerprint = fingerprints[index]
+                if segment_fingerprint is None:
+                    continue  # Empty (freshly rotated) active log
+                end = offset if segment_fingerprint == fingerprint else 0
+                for line, line_end in _read_from(segments[index], end):
+                    ingested += self._ingest_line(line)
+                    end = line_end
+                fingerprint, offset = segment_fingerprint, end
+
+            sqlite_utils.set_meta(self._conn, "fingerprint", fingerprint)
+            sqlite_utils.set_meta(self._conn, "offset", offset)
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+        if ingested:
+            logger.debug(f"Rolled up {ingested} new events into {self.path}")
+        return ingested
+
+    def _ingest_line(self, line: bytes) -> int:
+        try:
+            obj = json.loads(line)
+            timestamp = float(obj.get("timestamp", 0.0))
+        except (json.JSONDecodeError, AttributeError, TypeError, ValueError):
+            return 0
+
+        event = str(obj.get("event", ""))
+        stage = obj.get("stage") or ""
+        source_id = obj.get("source_id")
+        data = obj.get("data") or {}
+        bucket = _bucket(timestamp)
+
+        # Extraction durations: pair each end event with its start
+        duration = None
+        if event == "extraction_started" and source_id:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO open_extractions (source_id, started_at) VALUES (?, ?)", (source_id, timestamp)
+            )
+        elif event in EXTRACTION_END_EVENTS and source_id:
+            row = self._conn.execute(
+                "SELECT started_at FROM open_extractions WHERE source_id = ?", (source_id,)
+            ).fetchone()
+            if row:
+                duration = timestamp - row["started_at"]
+                self._conn.execute("DELETE FROM open_extractions WHERE source_id = ?", (source_id,))
+
+        self._conn.execute(
+            "INSERT INTO event_buckets (bucket, event, stage, count, duration_total, duration_count) "
+            "VALUES (?, ?, ?, 1, ?, ?) ON CONFLICT(bucket, event, stage) DO UPDATE SET "
+            "count = count + 1, duration_total = duration_total + excluded.duration_total, "
+            "duration_count = duration_count + excluded.duration_count",
+            (bucket, event, stage, duration or 0.0, 0 if duration is None else 1),
+        )
+
+        reason = data.get("reason") if isinstance(data, dict) and event == "content_skipped" else None
+        if reason:
+            self._conn.execute(
+                "INSERT INTO skip_buckets (bucket, reason, count) VALUES (?, ?, 1) "
+                "ON CONFLICT(bucket, reason) DO UPDATE SET count = count + 1",
+                (bucket, reason),
+            )
+
+        # Per-run aggregates
+        run_id: int | None = sqlite_utils.get_meta(self._conn, "current_run")
+        if event == "sync_started":
+            run_id = self._start_run(timestamp)
+        elif run_id is None:
+            # Events outside a started run (e.g. an early sync_finished) form their own run
+            run_id = self._start_run(None)
+
+        self._count_for_run(run_id, "event", event)
+        if reason:
+            self._count_for_run(run_id, "skip_reason", reason)
+        self._conn.execute(
+            "INSERT INTO run_stages (run_id, stage, count, failures, duration_total, duration_count) "
+            "VALUES (?, ?, 1, ?, ?, ?) ON CONFLICT(run_id, stage) DO UPDATE SET "
+            "count = count + 1, failures = failures + excluded.failures, "
+            "duration_total = duration_total + excluded.duration_total, "
+            "duration_count = duration_count + excluded.duration_count",
+            (run_id, stage, int(event.endswith("_failed")), duration or 0.0, 0 if duration is None else 1),
+        )
+
+        if event == "sync_finished":
+            self._conn.execute(
+                "UPDATE runs SET finished_at = ?, summary = ? WHERE id = ?", (timestamp, json.dumps(data), run_id)
+            )
+            sqlite_utils.set_meta(self._conn, "current_run", None)
+
+        return 1
+
+    def _start_run(self, started_at: float | None) -> int:
+        run_id = self._conn.execute("INSERT INTO runs (started_at) VALUES (?)", (started_at,)).lastrowid
+        if run_id is None:
+            raise RuntimeError("SQLite did not report the id of the new run")
+        sqlite_utils.set_meta(self._conn, "current_run", run_id)
+        return run_id
+
+    def _count_for_run(self, run_id: int, kind: str, key: str) -> None:
+        self._conn.execute(
+            "INSERT INTO run_counts (run_id, kind, key, count) VALUES (?, ?, ?, 1) "
+            "ON CONFLICT(run_id, kind, key) DO UPDATE SET count = count + 1",
+            (run_id, kind, key),
+        )
+
+    def last_run(self) -> EventSummary | None:
+        """Summary of the last finished sync run, or of the run in progress if none finished."""
+        row = self._conn.execute(
+            "SELECT * FROM runs WHERE finished_at IS NOT NULL ORDER BY finished_at DESC, id DESC LIMIT 1"
+        ).fetchone()
+        if row is None:
+            row = self._conn.execute("SELECT * FROM runs ORDER BY id DESC LIMIT 1").fetchone()
+        if row is None:
+            return None
+
+        counts: dict[str, dict[str, int]] = {"event": {}, "skip_reason": {}}
+        for count_row in self._conn.execute("SELECT kind, key, count FROM run_counts WHERE run_id = ?", (row["id"],)):
+            counts[count_row["kind"]][count_row["key"]] = count_row["count"]
+
+        by_stage = _stage_rows(
+            self._conn.execute(
+                "SELECT stage, count, failures, duration_total, duration_count FROM run_stages "
+                "WHERE run_id = ? ORDER BY stage",
+                (row["id"],),
+            )
+        )
+        return EventSummary(
+            by_type=counts["event"],
+            skipped_reasons=counts["skip_reason"],
+            by_stage=by_stage,
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+            run_summary=json.loads(row["summary"]) if row["summary"] else None,
+        )
+
+    def summarize(self, since: float | None = None, until: float | None = None) -> EventSummary:
+        """
+        Summary over all events in [since, until), at hourly bucket granularity.
+
+        The range is widened to whole buckets: the bucket holding ``since`` and
+        the bucket holding ``until`` are both included.
+
+        Args:
+            since: Start timestamp (inclusive), None for the beginning of history
+            until: End timestamp (exclusive), None for now
+        """
+        where, params = _range_clause(since, until)
+        by_type = dict(
+            self._conn.execute(f"SELECT event, SUM(count) FROM event_buckets WHERE {where} GROUP BY event", params)
+        )
+        skipped = dict(
+            self._conn.execute(f"SELECT reason, SUM(count) FROM skip_buckets WHERE {where} GROUP BY reason", params)
+        )
+
+        run_where = "1"
+        run_params: list[float] = []
+        if since is not None:
+            run_where += " AND started_at >= ?"
+            run_params.append(since)
+        if until is not None:
+            run_where += " AND finished_at < ?"
+            run_params.append(until)
+        span = self._conn.execute(
+            f"SELECT MIN(started_at), MAX(finished_at) FROM runs WHERE {run_where}", run_params
+        ).fetchone()
+        last_finished = self._conn.execute(
+            f"SELECT summary FROM runs WHERE finished_at IS NOT NULL AND {run_where} ORDER BY finished_at DESC LIMIT 1",
+            run_params,
+        ).fetchone()
+
+        return EventSummary(
+            by_type=by_type,
+            skipped_reasons=skipped,
+            by_stage=self._stage_stats(where, params),
+            started_at=span[0],
+            finished_at=span[1],
+            run_summary=json.loads(last_finished["summary"]) if last_finished and last_finished["summary"] else None,
+        )
+
+    def _stage_stats(self, where: str, params: tuple[Any, ...]) -> dict[str, dict[str, float]]:
+        return _stage_rows(
+            self._conn.execute(
+                "SELECT stage, SUM(count) AS count, "
+                "SUM(CASE WHEN event GLOB '*_failed' THEN count ELSE 0 END) AS failures, "
+                "SUM(duration_total) AS duration_total, SUM(duration_count) AS duration_count "
+                f"FROM event_buckets WHERE {where} GROUP BY stage ORDER BY stage",
+                params,
+            )
+        )
+
+
+def _stage_rows(rows: Iterator[Any]) -> dict[str, dict[str, float]]:
+    """Per-stage count, failures and average extraction duration."""
+    return {
+        row["stage"] or "-": {
+            "count": row["count"],
+            "failures": row["failures"],
+            "avg_duration": row["duration_total"] / row["duration_count"] if row["duration_count"] else 0.0,
+        }
+        for row in rows
+    }
+
+
+def _bucket(timestamp: float) -> int:
+    return int(timestamp // BUCKET_SECONDS) * BUCKET_SECONDS
+
+
+def _bucket_end(timestamp: float) -> int:
+    """First bucket boundary at or after a timestamp."""
+    return -int(-timestamp // BUCKET_SECONDS) * BUCKET_SECONDS
+
+
+def _range_clause(since: float | None, until: float | None) -> tuple[str, tuple[Any, ...]]:
+    clauses = ["1"]
+    params: list[Any] = []
+    if since is not None:
+        clauses.append("bucket >= ?")
+        params.append(_bucket(since))
+    if until is not None:
+        clauses.append("bucket < ?")
+        params.append(_bucket_end(until))
+    return " AND ".join(clauses), tuple(params)
+
+
+def _fingerprint(path: Path) -> str | None:
+    """Identify a log segment by its first line, which survives rotation and compression."""
+    try:
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rb") as f:
+            first = f.readline()
+    except (OSError, EOFError):
+        return None
+    return hashlib.sha1(first).hexdigest() if first else None
+
+
+def _read_from(path: Path, offset: int) -> Iterator[tuple[bytes, int]]:
+    """Yield (complete line, offset after it) starting at a byte offset of the uncompressed stream."""
+    opener = gzip.open if path.suffix == ".gz" else open
+    try:
+        with opener(path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Partially written line, pick it up on the next call
+                    return
+                offset += len(line)
+                yield line, offset
+    except (OSError, EOFError) as e:
+        logger.warning(f"Could not read events from {path}: {e}")
@@ -3,13 +3,22 @@ Lightweight event emitter for the knowledge synthesis pipeline.
 
 Writes newline-delimited JSON events to a fixed path for easy tailing/replay.
 Follows incremental processing principles: append-only, resilient, minimal.
+Writes are batched by a background flusher, old segments are rotated and
+gzip-compressed, and tails are read backwards from the end of the log.
 """
 
 from __future__ import annotations
 
+import atexit
+import gzip
+import itertools
 import json
 import logging
+import os
+import shutil
+import threading
 import time
+from collections.abc import Iterator
 from dataclasses import asdict
 from dataclasses import dataclass
 from pathlib import Path
@@ -20,6 +29,8 @@ from amplifier.config.paths import paths
 logger = logging.getLogger(__name__)
 
 DEFAULT_EVENTS_PATH = paths.data_dir / "knowledge" / "events.jsonl"
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024  # Rotate the active log at 50 MB
+DEFAULT_BACKUPS = 20
 
 
 @dataclass
@@ -34,11 +45,48 @@ class Event:
 
 
 class EventEmitter:
-    """Append-only JSONL event emitter."""
+    """
+    Append-only JSONL event emitter.
 
-    def __init__(self, path: Path | None = None) -> None:
+    Events are buffered in memory and appended in batches: by a background
+    flusher thread every `flush_interval` seconds, inline as soon as
+    `max_buffer` events are pending, and once more on interpreter exit. Once the active log
+    grows past `max_bytes` it is rotated into gzip-compressed segments
+    (`events.1.jsonl.gz` is the newest), keeping at most `backups` of them.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        flush_interval: float = 1.0,
+        max_buffer: int = 100,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+    ) -> None:
+        """
+        Initialize the emitter.
+
+        Args:
+            path: Active JSONL log (default: {data_dir}/knowledge/events.jsonl)
+            flush_interval: Seconds between background flushes, 0 writes every event immediately
+            max_buffer: Pending events that trigger an immediate flush
+            max_bytes: Size of the active log that triggers rotation
+            backups: Number of gzip-compressed rotated segments to keep
+        """
         self.path = path or DEFAULT_EVENTS_PATH
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+        self._buffer: list[str] = []
+        self._buffer_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self._closed = False
 
     def emit(
         self,
@@ -49,6 +97,67 @@ class EventEmitter:
         data: dict[str, Any] | None = None,
     ) -> None:
         rec = Event(timestamp=time.time(), event=event, source_id=source_id, stage=stage, data=data)
+        line = json.dumps(asdict(rec), ensure_ascii=False) + "\n"
+
+        if self.flush_interval <= 0 or self._closed:
+            with self._write_lock:
+                self._write(line)
+            return
+
+        with self._buffer_lock:
+            self._buffer.append(line)
+            pending = len(self._buffer)
+
+        if pending >= self.max_buffer:
+            # Size-based flush happens inline, which also bounds the buffer
+            self.flush()
+        elif self._flusher is None:
+            # Only an emitter holding buffered events needs the exit hook; readers never get one
+            atexit.register(self.close)
+            self._flusher = threading.Thread(target=self._flush_loop, name="event-flusher", daemon=True)
+            self._flusher.start()
+
+    def flush(self) -> None:
+        """Write all buffered events to disk."""
+        with self._buffer_lock:
+            lines, self._buffer = self._buffer, []
+        if lines:
+            with self._write_lock:
+                self._write("".join(lines))
+
+    def close(self) -> None:
+        """Stop the background flusher and write any remaining events."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5)
+            atexit.unregister(self.close)
+        self.flush()
+
+    def __enter__(self) -> EventEmitter:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _flush_loop(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except OSError as e:
+                logger.error(f"Failed to flush events to {self.path}: {e}")
+
+    def _write(self, text: str) -> None:
+        """Append text to the active log, rotating first if it would exceed max_bytes."""
+        try:
+            if self.path.stat().st_size + len(text) > self.max_bytes:
+                self._rotate()
+        except FileNotFoundError:
+            pass
 
         # Retry logic for WSL I/O errors
         max_retries = 3
@@ -57,7 +166,7 @@ class EventEmitter:
         for attempt in range(max_retries):
             try:
                 with open(self.path, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(asdict(rec), ensure_ascii=False) + "\n")
+                    f.write(text)
                     f.flush()  # Ensure write is committed
                 return  # Success
             except OSError as e:
@@ -74,28 +183,110 @@ class EventEmitter:
                 else:
                     raise  # Re-raise on last attempt or different error
 
+    def _segment_path(self, index: int) -> Path:
+        """Path of rotated segment `index` (1 = newest)."""
+        return self.path.with_name(f"{self.path.stem}.{index}{self.path.suffix}.gz")
+
+    def _rotate(self) -> None:
+        """Compress the active log into segment 1, shifting older segments up."""
+        if self.backups < 1:
+            self.path.unlink(missing_ok=True)
+            return
+
+        self._segment_path(self.backups).unlink(missing_ok=True)
+        for index in range(self.backups - 1, 0, -1):
+            segment = self._segment_path(index)
+            if segment.exists():
+                segment.replace(self._segment_path(index + 1))
+
+        # Move aside first so concurrent appends start a fresh active log
+        rotating = self.path.with_name(self.path.name + ".rotating")
+        self.path.replace(rotating)
+        with open(rotating, "rb") as src, gzip.open(self._segment_path(1), "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        rotating.unlink()
+        logger.info(f"Rotated {self.path} into {self._segment_path(1)}")
+
+    def segments(self) -> list[Path]:
+        """Existing log files, newest first (active log, then rotated segments)."""
+        candidates = [self.path] + [self._segment_path(i) for i in range(1, self.backups + 1)]
+        return [p for p in candidates if p.exists()]
+
+    def iter_events(self, *, reverse: bool = False, event_filter: str | None = None) -> Iterator[Event]:
+        """
+        Stream events across the active log and rotated segments.
+
+        Args:
+            reverse: Newest first, reading the active log backwards block by block
+            event_filter: Only yield events of this type
+
+        Yields:
+            Parsed events, skipping blank or malformed lines
+        """
+        self.flush()
+        segments = self.segments() if reverse else list(reversed(self.segments()))
+        for segment in segments:
+            for raw in _read_lines(segment, reverse=reverse):
+                ev = _parse_event(raw)
+                if ev is None or (event_filter and ev.event != event_filter):
+                    continue
+                yield ev
+
     def tail(self, n: int = 50, event_filter: str | None = None) -> list[Event]:
-        """Return the last N events, optionally filtered by event type."""
-        if not self.path.exists():
+        """Return the last N events (after filtering), oldest first."""
+        if n <= 0:
             return []
-        lines = self.path.read_text(encoding="utf-8").splitlines()
-        selected: list[Event] = []
-        for raw in lines[-n:]:
-            if not raw.strip():
-                continue
-            try:
-                obj = json.loads(raw)
-                if event_filter and obj.get("event") != event_filter:
-                    continue
-                selected.append(
-                    Event(
-                        timestamp=float(obj.get("timestamp", 0.0)),
-                        event=str(obj.get("event", "")),
-                        source_id=obj.get("source_id"),
-                        stage=obj.get("stage"),
-                        data=obj.get("data"),
-                    )
-                )
-            except json.JSONDecodeError:
-                continue
+        selected = list(itertools.islice(self.iter_events(reverse=True, event_filter=event_filter), n))
+        selected.reverse()
         return selected
+
+
+def _read_lines(path: Path, *, reverse: bool = False, block_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield raw lines of a plain or gzip-compressed log, optionally from the end.
+
+    Plain files are read backwards in fixed-size blocks, so finding the last
+    few events never scans the whole log. Rotated segments are size-bounded
+    and read whole.
+    """
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as f:
+            if not reverse:
+                yield from f
+                return
+            lines = f.read().split(b"\n")
+        yield from reversed(lines)
+        return
+
+    with open(path, "rb") as f:
+        if not reverse:
+            yield from f
+            return
+
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b""
+        while position > 0:
+            size = min(block_size, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + remainder).split(b"\n")
+            # The first piece may be a partial line, keep it for the next block
+            remainder = lines[0]
+            yield from reversed(lines[1:])
+        yield remainder
+
+
+def _parse_event(raw: bytes | str) -> Event | None:
+    if not raw.strip():
+        return None
+    try:
+        obj = json.loads(raw)
+        return Event(
+            timestamp=float(obj.get("timestamp", 0.0)),
+            event=str(obj.get("event", "")),
+            source_id=obj.get("source_id"),
+            stage=obj.get("stage"),
+            data=obj.get("data"),
+        )
+    except (json.JSONDecodeError, AttributeError, TypeError, ValueError):
+        return None
@@ -4,10 +4,10 @@ Extracts concepts, relationships, insights, and patterns in a single pass.
 """
 
 import asyncio
-import json
 import logging
 from typing import Any
 
+from amplifier.ccsdk_toolkit.defensive.streaming_json import parse_first_json
 from amplifier.utils.token_utils import truncate_to_tokens
 
 # Import TimeoutError from asyncio for proper exception handling
@@ -67,9 +67,10 @@ class KnowledgeSynthesizer:
                         source_id, error_type="empty_response", error_detail="Claude SDK returned empty response"
                     )
 
-                # Clean and parse response
-                cleaned = self._clean_response(response)
-                extraction = json.loads(cleaned)
+                # Parse response, tolerating fences, preambles and trailing commas
+                extraction = parse_first_json(response)
+                if not isinstance(extraction, dict):
+                    raise ValueError(f"Expected a JSON object, got {type(extraction).__name__}")
 
                 # Add metadata
                 extraction["source_id"] = source_id
@@ -85,7 +86,7 @@ class KnowledgeSynthesizer:
             error_msg = "Claude Code SDK timeout after 120s"
             logger.error(error_msg)
             return self._empty_extraction(source_id, error_type="timeout", error_detail=error_msg)
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             error_msg = f"Failed to parse JSON: {str(e)}"
             logger.error(error_msg)
             logger.debug(f"Response was: {response[:500] if response else 'empty'}")
@@ -153,7 +154,7 @@ Text to analyze:
         if not CLAUDE_SDK_AVAILABLE:
             return ""
 
-        response = ""
+        chunks: list[str] = []
 
         async with ClaudeSDKClient(  # type: ignore
             options=ClaudeCodeOptions(  # type: ignore
@@ -170,24 +171,9 @@ Text to analyze:
                     if isinstance(content, list):
                         for block in content:
                             if hasattr(block, "text"):
-                                response += getattr(block, "text", "")
+                                chunks.append(getattr(block, "text", ""))
 
-        return response
-
-    def _clean_response(self, response: str) -> str:
-        """Clean markdown formatting from response."""
-        cleaned = response.strip()
-
-        # Remove markdown code block formatting if present
-        if cleaned.startswith("```json"):
-            cleaned = cleaned[7:]  # Remove ```json
-        elif cleaned.startswith("```"):
-            cleaned = cleaned[3:]  # Remove ```
-
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3]  # Remove trailing ```
-
-        return cleaned.strip()
+        return "".join(chunks)
 
     def _empty_extraction(self, source_id: str, error_type: str = "unknown", error_detail: str = "") -> dict[str, Any]:
         """Return empty extraction structure with error details."""
@@ -7,24 +7,52 @@ Philosophy: "More focused asks are generally better than asking for more in sing
 """
 
 import asyncio
-import json
 import logging
 import time
 from dataclasses import dataclass
+from enum import Enum
 from typing import Any
 
+from amplifier.ccsdk_toolkit.core.client import query_claude
+from amplifier.ccsdk_toolkit.defensive.streaming_json import ItemCallback
+from amplifier.ccsdk_toolkit.defensive.streaming_json import parse_first_json
+
 try:
-    from claude_code_sdk import ClaudeCodeOptions
-    from claude_code_sdk import ClaudeSDKClient
+    import claude_code_sdk  # noqa: F401
 
     CLAUDE_SDK_AVAILABLE = True
 except ImportError:
     CLAUDE_SDK_AVAILABLE = False
-    ClaudeCodeOptions = None
-    ClaudeSDKClient = None
 
 logger = logging.getLogger(__name__)
 
+EXTRACTION_TYPES = ["concepts", "relationships", "insights", "patterns"]
+
+
+class ExtractionStrategy(str, Enum):
+    """How the four knowledge types are requested from Claude"""
+
+    FOCUSED = "focused"  # One focused prompt per type, best quality, 4x prompt tokens
+    COMBINED = "combined"  # One structured prompt returning all four types
+    HYBRID = "hybrid"  # Combined prompt, focused re-run for types that came back empty
+
+
+def _parse_json_response(response: str) -> dict[str, Any]:
+    """Parse a JSON object response, tolerating fences, preambles and trailing commas"""
+    data = parse_first_json(response)
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a JSON object, got {type(data).__name__}")
+    return data
+
+
+def _parse_combined_response(response: str) -> dict[str, Any]:
+    """Parse a combined response, every section must be present"""
+    data = _parse_json_response(response)
+    missing = [name for name in EXTRACTION_TYPES if not isinstance(data.get(name), list)]
+    if missing:
+        raise ValueError(f"Combined response missing sections: {', '.join(missing)}")
+    return data
+
 
 @dataclass
 class FocusedExtractionResult:
@@ -34,12 +62,15 @@ class FocusedExtractionResult:
     data: list[Any]
     extraction_time: float
     error: str | None = None
+    fallback: bool = False  # Hybrid strategy re-ran the focused extractor for this type
 
 
 class ConceptExtractor:
     """Focused extractor for concepts only"""
 
-    async def extract(self, text: str, title: str = "", document_type: str = "general") -> FocusedExtractionResult:
+    async def extract(
+        self, text: str, title: str = "", document_type: str = "general", on_item: ItemCallback | None = None
+    ) -> FocusedExtractionResult:
         """Extract ONLY concepts from text"""
         if not CLAUDE_SDK_AVAILABLE:
             return FocusedExtractionResult(
@@ -78,37 +109,15 @@ Look for:
 Return ONLY valid JSON, no other text."""
 
         try:
-            response = ""
-            async with asyncio.timeout(120):  # 2 minutes timeout
-                if ClaudeSDKClient is None or ClaudeCodeOptions is None:
-                    raise RuntimeError("Claude SDK not available")
-                async with ClaudeSDKClient(
-                    options=ClaudeCodeOptions(
-                        system_prompt="You are a concept extraction specialist. Extract ONLY concepts from text. Return ONLY valid JSON.",
-                        max_turns=1,
-                    )
-                ) as client:
-                    await client.query(prompt)
-
-                    async for message in client.receive_response():
-                        if hasattr(message, "content"):
-                            content = getattr(message, "content", [])
-                            if isinstance(content, list):
-                                for block in content:
-                                    if hasattr(block, "text"):
-                                        response += getattr(block, "text", "")
-
-            # Parse response
-            cleaned_response = response.strip()
-            if cleaned_response.startswith("```json"):
-                cleaned_response = cleaned_response[7:]
-            elif cleaned_response.startswith("```"):
-                cleaned_response = cleaned_response[3:]
-            if cleaned_response.endswith("```"):
-                cleaned_response = cleaned_response[:-3]
-            cleaned_response = cleaned_response.strip()
-
-            data = json.loads(cleaned_response)
+            response = await query_claude(
+                prompt,
+                system_prompt="You are a concept extraction specialist. Extract ONLY concepts from text. Return ONLY valid JSON.",
+                validate=_parse_json_response,
+                on_item=on_item,
+                timeout=120,  # 2 minutes once admitted
+            )
+
+            data = _parse_json_response(response)
             concepts = data.get("concepts", [])
 
             elapsed = time.time() - start_time
@@ -135,7 +144,9 @@ Return ONLY valid JSON, no other text."""
 class RelationshipExtractor:
     """Focused extractor for relationships only"""
 
-    async def extract(self, text: str, title: str = "", document_type: str = "general") -> FocusedExtractionResult:
+    async def extract(
+        self, text: str, title: str = "", document_type: str = "general", on_item: ItemCallback | None = None
+    ) -> FocusedExtractionResult:
         """Extract ONLY relationships from text"""
         if not CLAUDE_SDK_AVAILABLE:
             return FocusedExtractionResult(
@@ -178,37 +189,15 @@ Common predicates: depends_on, contains, uses, implements, extends, replaces, ca
 Return ONLY valid JSON, no other text."""
 
         try:
-            response = ""
-            async with asyncio.timeout(120):  # 2 minutes timeout
-                if ClaudeSDKClient is None or ClaudeCodeOptions is None:
-                    raise RuntimeError("Claude SDK not available")
-                async with ClaudeSDKClient(
-                    options=ClaudeCodeOptions(
-                        system_prompt="You are a relationship extraction specialist. Extract ONLY relationships from text. Return ONLY valid JSON.",
-                        max_turns=1,
-                    )
-                ) as client:
-                    await client.query(prompt)
-
-                    async for message in client.receive_response():
-                        if hasattr(message, "content"):
-                            content = getattr(message, "content", [])
-                            if isinstance(content, list):
-                                for block in content:
-                                    if hasattr(block, "text"):
-                                        response += getattr(block, "text", "")
-
-            # Parse response
-            cleaned_response = response.strip()
-            if cleaned_response.startswith("```json"):
-                cleaned_response = cleaned_response[7:]
-            elif cleaned_response.startswith("```"):
-                cleaned_response = cleaned_response[3:]
-            if cleaned_response.endswith("```"):
-                cleaned_response = cleaned_response[:-3]
-            cleaned_response = cleaned_response.strip()
-
-            data = json.loads(cleaned_response)
+            response = await query_claude(
+                prompt,
+                system_prompt="You are a relationship extraction specialist. Extract ONLY relationships from text. Return ONLY valid JSON.",
+                validate=_parse_json_response,
+                on_item=on_item,
+                timeout=120,  # 2 minutes once admitted
+            )
+
+            data = _parse_json_response(response)
             relationships = data.get("relationships", [])
 
             elapsed = time.time() - start_time
@@ -237,7 +226,9 @@ Return ONLY valid JSON, no other text."""
 class InsightExtractor:
     """Focused extractor for insights only"""
 
-    async def extract(self, text: str, title: str = "", document_type: str = "general") -> FocusedExtractionResult:
+    async def extract(
+        self, text: str, title: str = "", document_type: str = "general", on_item: ItemCallback | None = None
+    ) -> FocusedExtractionResult:
         """Extract ONLY insights from text"""
         if not CLAUDE_SDK_AVAILABLE:
             return FocusedExtractionResult(
@@ -280,37 +271,15 @@ Extract ALL meaningful insights - don't limit yourself.
 Return ONLY valid JSON, no other text."""
 
         try:
-            response = ""
-            async with asyncio.timeout(120):  # 2 minutes timeout
-                if ClaudeSDKClient is None or ClaudeCodeOptions is None:
-                    raise RuntimeError("Claude SDK not available")
-                async with ClaudeSDKClient(
-                    options=ClaudeCodeOptions(
-                        system_prompt="You are an insight extraction specialist. Extract ONLY actionable insights from text. Return ONLY valid JSON.",
-                        max_turns=1,
-                    )
-                ) as client:
-                    await client.query(prompt)
-
-                    async for message in client.receive_response():
-                        if hasattr(message, "content"):
-                            content = getattr(message, "content", [])
-                            if isinstance(content, list):
-                                for block in content:
-                                    if hasattr(block, "text"):
-                                        response += getattr(block, "text", "")
-
-            # Parse response
-            cleaned_response = response.strip()
-            if cleaned_response.startswith("```json"):
-                cleaned_response = cleaned_response[7:]
-            elif cleaned_response.startswith("```"):
-                cleaned_response = cleaned_response[3:]
-            if cleaned_response.endswith("```"):
-                cleaned_response = cleaned_response[:-3]
-            cleaned_response = cleaned_response.strip()
-
-            data = json.loads(cleaned_response)
+            response = await query_claude(
+                prompt,
+                system_prompt="You are an insight extraction specialist. Extract ONLY actionable insights from text. Return ONLY valid JSON.",
+                validate=_parse_json_response,
+                on_item=on_item,
+                timeout=120,  # 2 minutes once admitted
+            )
+
+            data = _parse_json_response(response)
             insights = data.get("insights", [])
 
             elapsed = time.time() - start_time
@@ -337,7 +306,9 @@ Return ONLY valid JSON, no other text."""
 class PatternExtractor:
     """Focused extractor for code patterns only"""
 
-    async def extract(self, text: str, title: str = "", document_type: str = "general") -> FocusedExtractionResult:
+    async def extract(
+        self, text: str, title: str = "", document_type: str = "general", on_item: ItemCallback | None = None
+    ) -> FocusedExtractionResult:
         """Extract ONLY code patterns from text"""
         if not CLAUDE_SDK_AVAILABLE:
             return FocusedExtractionResult(
@@ -380,37 +351,15 @@ Look for:
 Return ONLY valid JSON, no other text."""
 
         try:
-            response = ""
-            async with asyncio.timeout(120):  # 2 minutes timeout
-                if ClaudeSDKClient is None or ClaudeCodeOptions is None:
-                    raise RuntimeError("Claude SDK not available")
-                async with ClaudeSDKClient(
-                    options=ClaudeCodeOptions(
-                        system_prompt="You are a code pattern extraction specialist. Extract ONLY code patterns from text. Return ONLY valid JSON.",
-                        max_turns=1,
-                    )
-                ) as client:
-                    await client.query(prompt)
-
-                    async for message in client.receive_response():
-                        if hasattr(message, "content"):
-                            content = getattr(message, "content", [])
-                            if isinstance(content, list):
-                                for block in content:
-                                    if hasattr(block, "text"):
-                                        response += getattr(block, "text", "")
-
-            # Parse response
-            cleaned_response = response.strip()
-            if cleaned_response.startswith("```json"):
-                cleaned_response = cleaned_response[7:]
-            elif cleaned_response.startswith("```"):
-                cleaned_response = cleaned_response[3:]
-            if cleaned_response.endswith("```"):
-                cleaned_response = cleaned_response[:-3]
-            cleaned_response = cleaned_response.strip()
-
-            data = json.loads(cleaned_response)
+            response = await query_claude(
+                prompt,
+                system_prompt="You are a code pattern extraction specialist. Extract ONLY code patterns from text. Return ONLY valid JSON.",
+                validate=_parse_json_response,
+                on_item=on_item,
+                timeout=120,  # 2 minutes once admitted
+            )
+
+            data = _parse_json_response(response)
             patterns = data.get("patterns", [])
 
             elapsed = time.time() - start_time
@@ -434,32 +383,187 @@ Return ONLY valid JSON, no other text."""
             )
 
 
+class CombinedExtractor:
+    """Single-pass extractor returning all four knowledge types from one prompt"""
+
+    async def extract(
+        self, text: str, title: str = "", document_type: str = "general", on_item: ItemCallback | None = None
+    ) -> dict[str, FocusedExtractionResult]:
+        """Extract concepts, relationships, insights and patterns in one call
+
+        Returns dict with keys: concepts, relationships, insights, patterns
+        """
+        if not CLAUDE_SDK_AVAILABLE:
+            return self._failed(0.0, "Claude SDK not available")
+
+        start_time = time.time()
+        prompt = f"""Analyze this text and extract its knowledge in four separate sections.
+
+Title: {title}
+
+Content:
+{text}
+
+Extract knowledge in this JSON format:
+{{
+  "concepts": [
+    {{
+      "name": "concept name",
+      "description": "one sentence description",
+      "category": "pattern|technique|principle|tool|concept",
+      "importance": 0.0-1.0
+    }}
+  ],
+  "relationships": [
+    {{
+      "subject": "entity1",
+      "predicate": "relationship_type",
+      "object": "entity2",
+      "confidence": 0.0-1.0,
+      "context": "brief context or explanation"
+    }}
+  ],
+  "insights": [
+    "actionable insight, best practice, warning, lesson learned or recommendation"
+  ],
+  "patterns": [
+    {{
+      "name": "pattern name",
+      "code": "code snippet or pseudo-code",
+      "language": "python|javascript|etc",
+      "purpose": "what problem it solves",
+      "context": "when to use this pattern"
+    }}
+  ]
+}}
+
+Work through the sections one at a time and be as thorough in each as if it were the only one:
+- concepts: technical concepts, design patterns, principles, tools, frameworks, algorithms
+- relationships: dependencies, causal links, hierarchies, interactions, comparisons
+  (common predicates: depends_on, contains, uses, implements, extends, replaces, causes, enables, prevents, similar_to)
+- insights: complete, actionable statements - best practices, pitfalls, performance tips, trade-offs
+- patterns: code examples, configuration examples, command sequences, API usage, error handling
+
+Use an empty list for a section with nothing to extract.
+
+Return ONLY valid JSON, no other text."""
+
+        try:
+            response = await query_claude(
+                prompt,
+                system_prompt="You are a knowledge extraction specialist. Extract concepts, relationships, insights and code patterns from text. Return ONLY valid JSON.",
+                validate=_parse_combined_response,
+                on_item=on_item,
+                timeout=180,  # One call does the work of four
+            )
+
+            data = _parse_combined_response(response)
+            elapsed = time.time() - start_time
+            logger.debug(
+                f"Combined extraction completed in {elapsed:.1f}s: "
+                + ", ".join(f"{len(data[name])} {name}" for name in EXTRACTION_TYPES)
+            )
+            return {
+                name: FocusedExtractionResult(extraction_type=name, data=data[name], extraction_time=elapsed)
+                for name in EXTRACTION_TYPES
+            }
+
+        except TimeoutError:
+            elapsed = time.time() - start_time
+            error_msg = f"Combined extraction timed out after {elapsed:.1f} seconds - SDK may be unavailable or content too complex"
+            logger.error(error_msg)
+            return self._failed(elapsed, error_msg)
+        except Exception as e:
+            elapsed = time.time() - start_time
+            error_msg = f"Combined extraction failed: {str(e) or 'Unknown error occurred'}"
+            logger.error(f"Combined extraction failed after {elapsed:.1f}s: {e}")
+            return self._failed(elapsed, error_msg)
+
+    def _failed(self, elapsed: float, error: str) -> dict[str, FocusedExtractionResult]:
+        return {
+            name: FocusedExtractionResult(extraction_type=name, data=[], extraction_time=elapsed, error=error)
+            for name in EXTRACTION_TYPES
+        }
+
+
 class FocusedKnowledgeExtractor:
     """Orchestrates focused extractions for better quality results"""
 
-    def __init__(self):
-        """Initialize all focused extractors"""
+    def __init__(self, strategy: ExtractionStrategy | str = ExtractionStrategy.FOCUSED):
+        """Initialize all focused extractors
+
+        Args:
+            strategy: Default extraction strategy for start() and extract_all()
+        """
         self.concept_extractor = ConceptExtractor()
         self.relationship_extractor = RelationshipExtractor()
         self.insight_extractor = InsightExtractor()
         self.pattern_extractor = PatternExtractor()
+        self.combined_extractor = CombinedExtractor()
+        self.strategy = ExtractionStrategy(strategy)
+
+    @property
+    def extractors(self) -> dict[str, Any]:
+        """Focused extractor per extraction type"""
+        return {
+            "concepts": self.concept_extractor,
+            "relationships": self.relationship_extractor,
+            "insights": self.insight_extractor,
+            "patterns": self.pattern_extractor,
+        }
+
+    def start(
+        self,
+        text: str,
+        title: str = "",
+        document_type: str = "general",
+        strategy: ExtractionStrategy | str | None = None,
+        on_item: ItemCallback | None = None,
+    ) -> dict[str, asyncio.Task]:
+        """Start extraction as one task per type, so callers can report each as it completes
+
+        Must be called from a running event loop.
+
+        Args:
+            on_item: Called with (type, item) for each extracted item while the responses stream in;
+                a call that fails or is re-run may report items that are not in the final result
+
+        Returns dict with keys: concepts, relationships, insights, patterns
+        """
+        strategy = ExtractionStrategy(strategy or self.strategy)
+        if strategy == ExtractionStrategy.FOCUSED:
+            return {
+                name: asyncio.create_task(extractor.extract(text, title, document_type, on_item))
+                for name, extractor in self.extractors.items()
+            }
+
+        combined = asyncio.create_task(self.combined_extractor.extract(text, title, document_type, on_item))
+
+        async def section(name: str) -> FocusedExtractionResult:
+            result = (await asyncio.shield(combined))[name]
+            if strategy == ExtractionStrategy.HYBRID and (result.error or not result.data):
+                logger.debug(f"Combined extraction returned no {name}, re-running focused extractor")
+                rerun = await self.extractors[name].extract(text, title, document_type, on_item)
+                rerun.extraction_time += result.extraction_time
+                rerun.fallback = True
+                return rerun
+            return result
+
+        return {name: asyncio.create_task(section(name)) for name in EXTRACTION_TYPES}
 
     async def extract_all(
-        self, text: str, title: str = "", document_type: str = "general"
+        self,
+        text: str,
+        title: str = "",
+        document_type: str = "general",
+        strategy: ExtractionStrategy | str | None = None,
     ) -> dict[str, FocusedExtractionResult]:
-        """Run all focused extractors in parallel
+        """Run all extractors in parallel with the given strategy (default: this extractor's)
 
         Returns dict with keys: concepts, relationships, insights, patterns
         """
-        # Run all extractors in parallel for efficiency
-        tasks = [
-            self.concept_extractor.extract(text, title, document_type),
-            self.relationship_extractor.extract(text, title, document_type),
-            self.insight_extractor.extract(text, title, document_type),
-            self.pattern_extractor.extract(text, title, document_type),
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = self.start(text, title, document_type, strategy)
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
 
         # Process results
         extraction_results = {}
@@ -467,7 +571,7 @@ class FocusedKnowledgeExtractor:
             if isinstance(result, Exception):
                 logger.error(f"Extraction {i} failed: {result}")
                 # Create empty result for failed extraction
-                extraction_type = ["concepts", "relationships", "insights", "patterns"][i]
+                extraction_type = EXTRACTION_TYPES[i]
                 extraction_results[extraction_type] = FocusedExtractionResult(
                     extraction_type=extraction_type, data=[], extraction_time=0.0, error=str(result)
                 )
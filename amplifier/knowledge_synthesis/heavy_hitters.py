@@ -0,0 +1,97 @@
+"""
+Heavy Hitters - Bounded-memory frequency counting for unbounded streams.
+Implements the SpaceSaving algorithm behind a Counter-like interface.
+"""
+
+import heapq
+from collections.abc import Hashable
+from collections.abc import Iterable
+
+
+class SpaceSaving:
+    """
+    Approximate counter that tracks at most `capacity` items.
+
+    When full, a new item replaces the item with the smallest count and
+    inherits that count as its error bound. Any item whose true frequency
+    exceeds N / capacity (N = total count added) is guaranteed to be tracked,
+    and tracked counts overestimate the true count by at most `error(item)`.
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        """
+        Initialize the sketch.
+
+        Args:
+            capacity: Maximum number of distinct items kept in memory
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: dict[Hashable, int] = {}
+        self._errors: dict[Hashable, int] = {}
+        # Lazy min-heap of (count, seq, item); stale entries are skipped on pop
+        self._heap: list[tuple[int, int, Hashable]] = []
+        self._seq = 0
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        """Add `count` occurrences of `item`."""
+        self.total += count
+
+        if item in self._counts:
+            self._counts[item] += count
+        elif len(self._counts) < self.capacity:
+            self._counts[item] = count
+            self._errors[item] = 0
+        else:
+            evicted, min_count = self._pop_min()
+            del self._counts[evicted]
+            del self._errors[evicted]
+            self._counts[item] = min_count + count
+            self._errors[item] = min_count
+
+        self._push(item)
+
+    def update(self, items: Iterable[Hashable]) -> None:
+        """Add one occurrence of every item in `items`."""
+        for item in items:
+            self.add(item)
+
+    def get(self, item: Hashable, default: int = 0) -> int:
+        """Estimated count of `item` (an overestimate by at most `error(item)`)."""
+        return self._counts.get(item, default)
+
+    def error(self, item: Hashable) -> int:
+        """Maximum overestimation of `item`'s count."""
+        return self._errors.get(item, 0)
+
+    def most_common(self, n: int | None = None) -> list[tuple[Hashable, int]]:
+        """Tracked items ordered by estimated count, like `Counter.most_common`."""
+        if n is None:
+            return sorted(self._counts.items(), key=lambda kv: kv[1], reverse=True)
+        return heapq.nlargest(n, self._counts.items(), key=lambda kv: kv[1])
+
+    def __getitem__(self, item: Hashable) -> int:
+        return self.get(item)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._counts
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _push(self, item: Hashable) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (self._counts[item], self._seq, item))
+        # Stale entries accumulate on every increment, compact occasionally
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, i, key) for i, (key, count) in enumerate(self._counts.items())]
+            heapq.heapify(self._heap)
+            self._seq = len(self._heap)
+
+    def _pop_min(self) -> tuple[Hashable, int]:
+        while True:
+            count, _, item = heapq.heappop(self._heap)
+            if self._counts.get(item) == count:
+                return item, count
@@ -1,37 +1,75 @@
 """
 Stream Reader - Processes JSONL as a temporal knowledge stream.
 Maintains sliding windows and tracks concept emergence over time.
+
+All statistics are maintained incrementally: window counters are updated on
+append and eviction, and global frequencies live in bounded SpaceSaving
+sketches, so memory stays constant however long the stream is.
 """
 
+import itertools
 import json
 from collections import Counter
 from collections import deque
+from collections.abc import Hashable
 from collections.abc import Iterator
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
 from amplifier.config.paths import paths
 
+from .heavy_hitters import SpaceSaving
+
+# Number of most recent articles compared against the stream for emergence
+RECENT_ARTICLES = 3
+
+
+class WindowCounter:
+    """Counter over the last `size` pushed batches, updated in O(batch) per push."""
+
+    def __init__(self, size: int):
+        self.batches: deque[Sequence[Hashable]] = deque(maxlen=size)
+        self.counts: Counter[Hashable] = Counter()
+
+    def push(self, keys: Sequence[Hashable]) -> None:
+        """Add a batch of keys, subtracting the batch that falls out of the window."""
+        if self.batches.maxlen and len(self.batches) == self.batches.maxlen:
+            for key in self.batches[0]:
+                self.counts[key] -= 1
+                if not self.counts[key]:
+                    del self.counts[key]
+
+        self.batches.append(keys)
+        self.counts.update(keys)
+
 
 class StreamReader:
     """Streams through knowledge extractions with sliding window tracking."""
 
-    def __init__(self, path: Path | None = None, window_size: int = 10):
+    def __init__(self, path: Path | None = None, window_size: int = 10, max_tracked: int = 10_000):
         """
         Initialize stream reader.
 
         Args:
             path: Path to extractions JSONL file
             window_size: Number of articles to keep in sliding window
+            max_tracked: Memory cap, maximum distinct concepts, relationships and
+                concept pairs each kept in the global frequency sketches
         """
         self.path = path or paths.data_dir / "knowledge" / "extractions.jsonl"
         self.window_size = window_size
         self.window = deque(maxlen=window_size)
 
-        # Track concept frequencies across the stream
-        self.concept_freq = Counter()
-        self.relationship_freq = Counter()
-        self.cooccurrence_matrix = Counter()  # (concept1, concept2) -> count
+        # Window statistics, maintained on append/evict
+        self.window_concepts = WindowCounter(window_size)
+        self.window_relationships = WindowCounter(window_size)
+        self.recent_concepts = WindowCounter(min(RECENT_ARTICLES, window_size))
+
+        # Track concept frequencies across the stream (bounded heavy hitters)
+        self.concept_freq = SpaceSaving(max_tracked)
+        self.relationship_freq = SpaceSaving(max_tracked)
+        self.cooccurrence_matrix = SpaceSaving(max_tracked)  # (concept1, concept2) -> count
 
     def stream_articles(self) -> Iterator[dict[str, Any]]:
         """
@@ -64,25 +102,10 @@ class StreamReader:
         if not self.window:
             return {"window_size": 0, "concepts": {}, "relationships": {}, "cooccurrences": {}}
 
-        # Collect concepts from window
-        window_concepts = Counter()
-        window_relationships = Counter()
-
-        for article in self.window:
-            for concept in article.get("concepts", []):
-                name = concept.get("name", "")
-                if name:
-                    window_concepts[name] += 1
-
-            for rel in article.get("relationships", []):
-                triple = (rel.get("subject"), rel.get("predicate"), rel.get("object"))
-                if all(triple):
-                    window_relationships[triple] += 1
-
         return {
             "window_size": len(self.window),
-            "concepts": dict(window_concepts.most_common(20)),
-            "relationships": dict(window_relationships.most_common(10)),
+            "concepts": dict(self.window_concepts.counts.most_common(20)),
+            "relationships": dict(self.window_relationships.counts.most_common(10)),
             "cooccurrences": dict(self.cooccurrence_matrix.most_common(10)),
             "temporal_order": [a.get("source_id") for a in self.window],
         }
@@ -100,17 +123,9 @@ class StreamReader:
         if not self.window:
             return []
 
-        # Count recent concepts
-        recent_concepts = Counter()
-        for article in list(self.window)[-3:]:  # Last 3 articles
-            for concept in article.get("concepts", []):
-                name = concept.get("name", "")
-                if name:
-                    recent_concepts[name] += 1
-
-        # Find concepts with increased frequency
+        # Find concepts with increased frequency in the last few articles
         emerging = []
-        for concept, recent_count in recent_concepts.items():
+        for concept, recent_count in self.recent_concepts.counts.items():
             overall_freq = self.concept_freq.get(concept, 0)
             if overall_freq > 0:
                 increase_ratio = recent_count / (overall_freq / max(len(self.window), 1))
@@ -123,23 +138,21 @@ class StreamReader:
         """Update sliding window and statistics."""
         self.window.append(article)
 
-        # Update concept frequencies
-        concepts_in_article = []
-        for concept in article.get("concepts", []):
-            name = concept.get("name", "")
-            if name:
-                self.concept_freq[name] += 1
-                concepts_in_article.append(name)
-
-        # Update co-occurrence matrix
-        for i, c1 in enumerate(concepts_in_article):
-            for c2 in concepts_in_article[i + 1 :]:
-                # Store in sorted order for consistency
-                pair = tuple(sorted([c1, c2]))
-                self.cooccurrence_matrix[pair] += 1
-
-        # Update relationship frequencies
-        for rel in article.get("relationships", []):
-            triple = (rel.get("subject"), rel.get("predicate"), rel.get("object"))
-            if all(triple):
-                self.relationship_freq[triple] += 1
+        concepts_in_article = [name for concept in article.get("concepts", []) if (name := concept.get("name", ""))]
+        triples = [
+            triple
+            for rel in article.get("relationships", [])
+            if all(triple := (rel.get("subject"), rel.get("predicate"), rel.get("object")))
+        ]
+
+        # Update window counters (evicted article is subtracted)
+        self.window_concepts.push(concepts_in_article)
+        self.window_relationships.push(triples)
+        self.recent_concepts.push(concepts_in_article)
+
+        # Update global frequencies
+        self.concept_freq.update(concepts_in_article)
+        self.relationship_freq.update(triples)
+
+        # Update co-occurrence matrix; sorting once keeps every pair in sorted order
+        self.cooccurrence_matrix.update(itertools.combinations(sorted(concepts_in_article), 2))
@@ -126,6 +126,29 @@ def append_line_with_retry(line: str, filepath: Path | str, max_retries: int = 3
             raise
 
 
+def load_manifest(manifest_path: Path) -> dict[str, dict]:
+    """Records of a previous incremental scan, empty if there is none or it is unreadable."""
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable manifest {manifest_path}: {e}")
+        return {}
+
+
+def save_manifest(manifest_path: Path, records: dict[str, dict]) -> None:
+    """Write a scan manifest through a temporary file, so an interrupted write never corrupts it."""
+    tmp_path = manifest_path.with_suffix(".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(records, f)
+        tmp_path.replace(manifest_path)
+    except OSError as e:
+        logger.warning(f"Could not save manifest {manifest_path}: {e}")
+
+
 # Convenience aliases for simpler imports
 write_json = write_json_with_retry
 read_json = read_json_with_retry
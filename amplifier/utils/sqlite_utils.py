@@ -0,0 +1,117 @@
+"""Small helpers for the embedded SQLite stores.
+
+All stores open their database through ``connect`` so they share the same
+settings: WAL journaling (readers never block on a writer), a busy timeout
+for concurrent CLI processes and ``sqlite3.Row`` rows.
+"""
+
+import json
+import sqlite3
+from collections.abc import Callable
+from collections.abc import ItemsView
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import ValuesView
+from pathlib import Path
+from typing import Any
+from typing import TypeVar
+
+V = TypeVar("V")
+
+
+def connect(db_path: Path | str, timeout: float = 30.0) -> sqlite3.Connection:
+    """Open a SQLite database configured for concurrent readers and one writer.
+
+    Args:
+        db_path: Database file, parent directories are created as needed
+        timeout: Seconds to wait for a lock held by another process
+
+    Returns:
+        Open connection with WAL mode enabled
+    """
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(db_path, timeout=timeout, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA busy_timeout={int(timeout * 1000)}")
+    return conn
+
+
+def get_meta(conn: sqlite3.Connection, key: str, default: Any = None) -> Any:
+    """Read a JSON value from the ``meta`` key/value table."""
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return json.loads(row[0]) if row else default
+
+
+def set_meta(conn: sqlite3.Connection, key: str, value: Any) -> None:
+    """Write a JSON value to the ``meta`` key/value table."""
+    conn.execute(
+        "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        (key, json.dumps(value)),
+    )
+
+
+class QueryMapping(Mapping[str, V]):
+    """Read-only mapping whose lookups are delegated to SQL queries.
+
+    Lets a store keep exposing dict-like attributes (``store.nodes[...]``)
+    without loading the whole table into memory. With ``fetch_all``,
+    ``values()`` and ``items()`` load every entry in one bulk query instead
+    of one lookup per key.
+    """
+
+    def __init__(
+        self,
+        getter: Callable[[str], V | None],
+        keys: Callable[[], Iterator[str]],
+        count: Callable[[], int],
+        fetch_all: Callable[[], Iterable[tuple[str, V]]] | None = None,
+    ):
+        self._getter = getter
+        self._keys = keys
+        self._count = count
+        self._fetch_all = fetch_all
+
+    def __getitem__(self, key: str) -> V:
+        value = self._getter(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return self._keys()
+
+    def __len__(self) -> int:
+        return self._count()
+
+    def values(self) -> ValuesView[V]:
+        if self._fetch_all is None:
+            return super().values()
+        return _BulkValues(self, self._fetch_all)
+
+    def items(self) -> ItemsView[str, V]:
+        if self._fetch_all is None:
+            return super().items()
+        return _BulkItems(self, self._fetch_all)
+
+
+class _BulkValues(ValuesView[V]):
+    def __init__(self, mapping: Mapping[str, V], fetch_all: Callable[[], Iterable[tuple[str, V]]]):
+        super().__init__(mapping)
+        self._fetch = fetch_all
+
+    def __iter__(self) -> Iterator[V]:
+        return (value for _, value in self._fetch())
+
+
+class _BulkItems(ItemsView[str, V]):
+    def __init__(self, mapping: Mapping[str, V], fetch_all: Callable[[], Iterable[tuple[str, V]]]):
+        super().__init__(mapping)
+        self._fetch = fetch_all
+
+    def __iter__(self) -> Iterator[tuple[str, V]]:
+        return iter(self._fetch())
@@ -4,6 +4,14 @@ from .clients import DalleClient
 from .clients import GptImageClient
 from .clients import ImageGeneratorProtocol
 from .clients import ImagenClient
+from .core import DEFAULT_API_CONCURRENCY
 from .core import ImageGenerator
 
-__all__ = ["ImageGenerator", "ImageGeneratorProtocol", "ImagenClient", "DalleClient", "GptImageClient"]
+__all__ = [
+    "ImageGenerator",
+    "ImageGeneratorProtocol",
+    "ImagenClient",
+    "DalleClient",
+    "GptImageClient",
+    "DEFAULT_API_CONCURRENCY",
+]
@@ -3,6 +3,7 @@
 import asyncio
 import base64
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Protocol
 
@@ -51,6 +52,14 @@ class ImageGeneratorProtocol(Protocol):
         """Check if the API is available and configured."""
         ...
 
+    def estimate_cost(self, params: dict | None = None) -> float:
+        """Expected cost of one generate() call with these params."""
+        ...
+
+    async def close(self) -> None:
+        """Release connections and threads; the client can still be used afterwards."""
+        ...
+
 
 class ImagenClient:
     """Client for Google's image generation via Gemini API."""
@@ -58,10 +67,17 @@ class ImagenClient:
     api_name = "imagen"
     COST_PER_IMAGE = 0.035  # ~$0.03-0.04 per image
 
-    def __init__(self):
+    def __init__(self, max_workers: int = 4):
+        """Initialize client.
+
+        Args:
+            max_workers: Threads for the blocking Gemini SDK calls, i.e. requests in flight at once
+        """
         self.api_key = os.getenv("GOOGLE_API_KEY")
         # Check if API key is actually present and not empty
         self.configured = bool(self.api_key and self.api_key.strip() and GENAI_AVAILABLE)
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
         self.client = None
         if self.configured and genai:
             try:
@@ -98,9 +114,8 @@ class ImagenClient:
         logger.info(f"Generating Google image with prompt: {prompt[:100]}...")
 
         try:
-            # Run the synchronous API call in a thread pool executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, self._generate_sync, prompt)
+            # Run the synchronous API call on the client's own threads to avoid blocking
+            response = await self._run_sync(self._generate_sync, prompt)
 
             # Get the first generated image
             if not response.generated_images:
@@ -158,14 +173,27 @@ class ImagenClient:
 
         try:
             # Try a simple API call to verify the key works
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.client.models.list)
+            await self._run_sync(self.client.models.list)
             logger.info("Google Imagen API is available and configured.")
             return True
         except Exception as e:
             logger.warning(f"Google API key configured but API check failed: {e}")
             return False
 
+    def estimate_cost(self, params: dict | None = None) -> float:
+        return self.COST_PER_IMAGE
+
+    async def close(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _run_sync(self, func, *args):
+        """Run a blocking SDK call on the client's bounded thread pool (not the loop's shared default)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="imagen")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
 
 class DalleClient:
     """Client for OpenAI DALL-E API."""
@@ -182,6 +210,7 @@ class DalleClient:
         self.api_key = os.getenv("OPENAI_API_KEY")
         self.configured = bool(self.api_key)
         self.client = None
+        self._session: aiohttp.ClientSession | None = None
         if self.configured:
             self.client = AsyncOpenAI(api_key=self.api_key)
 
@@ -239,7 +268,7 @@ class DalleClient:
             await self._download_image(image_url, output_path)
 
             # Calculate cost based on quality
-            cost = self.COST_PER_IMAGE.get(quality, self.COST_PER_IMAGE["standard"])
+            cost = self.estimate_cost(params)
 
             logger.info(f"Image saved to: {output_path}")
             logger.info(f"Estimated cost: ${cost:.3f}")
@@ -259,10 +288,11 @@ class DalleClient:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        async with (
-            aiohttp.ClientSession() as session,
-            session.get(url) as response,
-        ):
+        # One session (and connection pool) for all downloads of this client
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+
+        async with self._session.get(url) as response:
             response.raise_for_status()
             content = await response.read()
             output_path.write_bytes(content)
@@ -279,6 +309,15 @@ class DalleClient:
 
         return True
 
+    def estimate_cost(self, params: dict | None = None) -> float:
+        quality = (params or {}).get("quality", "standard")
+        return self.COST_PER_IMAGE.get(quality, self.COST_PER_IMAGE["standard"])
+
+    async def close(self) -> None:
+        if self._session:
+            await self._session.close()
+            self._session = None
+
 
 class GptImageClient:
     """Client for OpenAI GPT-Image-1 API."""
@@ -364,7 +403,7 @@ class GptImageClient:
             output_path.write_bytes(image_bytes)
 
             # Calculate cost based on quality
-            cost = self.COST_PER_IMAGE.get(quality if quality else "auto", self.COST_PER_IMAGE["auto"])
+            cost = self.estimate_cost(params)
 
             logger.info(f"Image saved to: {output_path}")
             logger.info(f"Estimated cost: ${cost:.3f}")
@@ -387,3 +426,12 @@ class GptImageClient:
             return False
 
         return True
+
+    def estimate_cost(self, params: dict | None = None) -> float:
+        quality_param = (params or {}).get("quality", "standard")
+        quality = {"standard": "medium", "hd": "high"}.get(quality_param, quality_param)
+        return self.COST_PER_IMAGE.get(quality if quality else "auto", self.COST_PER_IMAGE["auto"])
+
+    async def close(self) -> None:
+        # AsyncOpenAI keeps its own connection pool for the life of the client
+        pass
@@ -15,14 +15,29 @@ from .clients import ImagenClient
 logger = get_logger(__name__)
 
 
+# Images generated at once per API, within typical rate limits
+DEFAULT_API_CONCURRENCY = {"imagen": 2, "dalle": 4, "gptimage": 4}
+
+# Generation parameters for every image
+GENERATION_PARAMS = {"quality": "standard"}  # Use standard quality for cost efficiency
+
+
 class ImageGenerator:
-    """Orchestrates image generation across multiple APIs."""
+    """Orchestrates image generation across multiple APIs.
+
+    All prompts are generated concurrently, each API limited to its own
+    number of requests in flight, so total time follows the slowest API
+    rather than the number of prompts. A running budget (spent plus the
+    estimated cost of requests in flight) keeps new requests from starting
+    once they could push the total past ``cost_limit``.
+    """
 
     def __init__(
         self,
         apis: list[str],
         output_dir: Path,
         cost_limit: float | None = None,
+        api_concurrency: dict[str, int] | None = None,
     ):
         """Initialize image generator.
 
@@ -30,16 +45,20 @@ class ImageGenerator:
             apis: List of API names to use (imagen, dalle, gptimage)
             output_dir: Directory for output images
             cost_limit: Optional cost limit for generation
+            api_concurrency: Images generated at once per API (defaults: DEFAULT_API_CONCURRENCY)
         """
         self.output_dir = output_dir
         self.cost_limit = cost_limit
         self.total_cost = 0.0
+        self.api_concurrency = {**DEFAULT_API_CONCURRENCY, **(api_concurrency or {})}
+        self._reserved_cost = 0.0
+        self._budget_exhausted = False
 
         # Initialize requested clients
         self.clients = {}
         for api in apis:
             if api == "imagen":
-                self.clients[api] = ImagenClient()
+                self.clients[api] = ImagenClient(max_workers=self.api_concurrency["imagen"])
             elif api == "dalle":
                 self.clients[api] = DalleClient()
             elif api == "gptimage":
@@ -54,47 +73,62 @@ class ImageGenerator:
 
         Args:
             prompts: List of image prompts
-            save_callback: Optional callback after each image (for state saving)
+            save_callback: Optional callback after each prompt's images (for state saving)
 
         Returns:
-            List of image alternatives for each prompt
+            List of image alternatives for each prompt, in prompt order
         """
         logger.info(f"Generating images for {len(prompts)} prompts")
 
-        results = []
-        for i, prompt in enumerate(prompts):
-            try:
-                # Check cost limit
-                if self.cost_limit and self.total_cost >= self.cost_limit:
-                    logger.warning(f"Cost limit reached: ${self.total_cost:.2f}")
-                    break
-
-                # Generate alternatives
-                alternatives = await self._generate_alternatives(prompt, i)
-
-                if alternatives:
-                    results.append(alternatives)
-                    logger.info(
-                        f"Generated {len(alternatives.alternatives) + 1} images for prompt {i + 1}/{len(prompts)}"
-                    )
+        # Check each API once, not once per prompt
+        available = {}
+        for api_name, client in self.clients.items():
+            if await client.check_availability():
+                available[api_name] = client
+            else:
+                logger.warning(f"{api_name} API not configured, skipping")
+        if not available:
+            logger.error("No APIs available for generation")
+            return []
 
-                    # Save state after each expensive operation
-                    if save_callback:
-                        await save_callback(results, self.total_cost)
+        limits = {api_name: asyncio.Semaphore(self.api_concurrency.get(api_name, 1)) for api_name in available}
+        completed: dict[int, ImageAlternatives] = {}
 
+        async def generate_prompt(index: int, prompt: ImagePrompt) -> None:
+            try:
+                alternatives = await self._generate_alternatives(prompt, available, limits)
             except Exception as e:
-                logger.error(f"Failed to generate images for prompt {i + 1}: {e}")
-                continue
+                logger.error(f"Failed to generate images for prompt {index + 1}: {e}")
+                return
+
+            if alternatives:
+                completed[index] = alternatives
+                logger.info(
+                    f"Generated {len(alternatives.alternatives) + 1} images for prompt {index + 1}/{len(prompts)}"
+                )
+
+                # Save state after each expensive operation
+                if save_callback:
+                    await save_callback([completed[i] for i in sorted(completed)], self.total_cost)
+
+        try:
+            await asyncio.gather(*(generate_prompt(i, prompt) for i, prompt in enumerate(prompts)))
+        finally:
+            for client in self.clients.values():
+                await client.close()
 
         logger.info(f"Total generation cost: ${self.total_cost:.2f}")
-        return results
+        return [completed[i] for i in sorted(completed)]
 
-    async def _generate_alternatives(self, prompt: ImagePrompt, index: int) -> ImageAlternatives | None:
+    async def _generate_alternatives(
+        self, prompt: ImagePrompt, clients: dict, limits: dict[str, asyncio.Semaphore]
+    ) -> ImageAlternatives | None:
         """Generate images from multiple APIs for one prompt.
 
         Args:
             prompt: Image prompt
-            index: Prompt index
+            clients: Available API clients by name
+            limits: Per-API concurrency limits
 
         Returns:
             Image alternatives or None if failed
@@ -105,34 +139,25 @@ class ImageGenerator:
 
         # Generate from each API in parallel
         tasks = []
-        for api_name, client in self.clients.items():
-            if not await client.check_availability():
-                logger.warning(f"{api_name} API not configured, skipping")
-                continue
-
+        for api_name, client in clients.items():
             output_path = images_dir / f"{prompt.illustration_id}-{api_name}.png"
-            tasks.append(self._generate_single(client, api_name, prompt, output_path))
-
-        if not tasks:
-            logger.error("No APIs available for generation")
-            return None
+            tasks.append(self._generate_budgeted(client, api_name, prompt, output_path, limits[api_name]))
 
         # Run generations in parallel
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Filter successful results
+        # Filter successful results (None: skipped for budget)
         generated_images = []
         for result in results:
             if isinstance(result, GeneratedImage):
                 generated_images.append(result)
-                self.total_cost += result.cost_estimate
-            else:
+            elif result is not None:
                 logger.error(f"Generation failed: {result}")
 
         if not generated_images:
             return None
 
-        # Select primary image (first successful one for now)
+        # Select primary image (first successful one, in API order, for now)
         primary = generated_images[0]
         alternatives = generated_images[1:] if len(generated_images) > 1 else []
 
@@ -143,6 +168,35 @@ class ImageGenerator:
             selection_reason="First successfully generated image",
         )
 
+    async def _generate_budgeted(
+        self, client, api_name: str, prompt: ImagePrompt, output_path: Path, limit: asyncio.Semaphore
+    ) -> GeneratedImage | None:
+        """Generate one image once the API has a free slot and the budget allows it.
+
+        Returns:
+            Generated image, or None if the cost limit leaves no room for it
+        """
+        async with limit:
+            # Check and reserve with no await in between, so concurrent requests can't overspend
+            # (1e-9 of slack: float sums that land exactly on the limit still fit)
+            estimate = client.estimate_cost(GENERATION_PARAMS)
+            if self.cost_limit and self.total_cost + self._reserved_cost + estimate > self.cost_limit + 1e-9:
+                if not self._budget_exhausted:
+                    self._budget_exhausted = True
+                    logger.warning(
+                        f"Cost limit reached: ${self.total_cost:.2f} spent, "
+                        f"${self._reserved_cost:.2f} in flight, limit ${self.cost_limit:.2f}"
+                    )
+                return None
+
+            self._reserved_cost += estimate
+            try:
+                image = await self._generate_single(client, api_name, prompt, output_path)
+            finally:
+                self._reserved_cost -= estimate
+            self.total_cost += image.cost_estimate
+            return image
+
     async def _generate_single(self, client, api_name: str, prompt: ImagePrompt, output_path: Path) -> GeneratedImage:
         """Generate a single image from one API.
 
@@ -164,7 +218,7 @@ class ImageGenerator:
             url, cost = await client.generate(
                 prompt=prompt.full_prompt,
                 output_path=output_path,
-                params={"quality": "standard"},  # Use standard quality for cost efficiency
+                params=dict(GENERATION_PARAMS),
             )
 
             return GeneratedImage(
@@ -172,7 +226,7 @@ class ImageGenerator:
                 api=api_name,  # type: ignore[arg-type]
                 url=url,
                 local_path=output_path,
-                generation_params={"quality": "standard"},
+                generation_params=dict(GENERATION_PARAMS),
                 cost_estimate=cost,
             )
 
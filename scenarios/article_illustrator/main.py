@@ -61,6 +61,7 @@ class ArticleIllustratorPipeline:
         resume: bool = False,
         prompts_only: bool = False,
         cost_limit: float | None = None,
+        api_concurrency: int | None = None,
     ) -> bool:
         """Run the complete illustration pipeline.
 
@@ -72,6 +73,7 @@ class ArticleIllustratorPipeline:
             resume: Whether to resume from previous session
             prompts_only: Only generate prompts, skip images
             cost_limit: Maximum cost limit
+            api_concurrency: Images generated at once per API (None for per-API defaults)
 
         Returns:
             True if successful, False otherwise
@@ -146,7 +148,7 @@ class ArticleIllustratorPipeline:
 
             # Stage 3: Image Generation
             if not self.state.images_complete:
-                await self._generate_images(apis, cost_limit)
+                await self._generate_images(apis, cost_limit, api_concurrency)
 
             # Stage 4: Markdown Update
             if not self.state.markdown_complete:
@@ -195,7 +197,7 @@ class ArticleIllustratorPipeline:
         self.session_mgr.mark_complete(self.state, StageState.PROMPTS)
         logger.info(f"✓ Generated {len(self.state.prompts)} prompts")
 
-    async def _generate_images(self, apis: list[str], cost_limit: float | None) -> None:
+    async def _generate_images(self, apis: list[str], cost_limit: float | None, api_concurrency: int | None) -> None:
         """Stage 3: Generate images using specified APIs."""
         logger.info("\n=== Stage 3: Image Generation ===")
 
@@ -214,6 +216,7 @@ class ArticleIllustratorPipeline:
             apis=apis,
             output_dir=self.output_dir,
             cost_limit=cost_limit,
+            api_concurrency=dict.fromkeys(apis, api_concurrency) if api_concurrency else None,
         )
 
         self.state.images = await generator.generate_images(self.state.prompts, save_callback=save_callback)
@@ -309,6 +312,11 @@ class ArticleIllustratorPipeline:
     type=float,
     help="Maximum cost limit for generation",
 )
+@click.option(
+    "--api-concurrency",
+    type=int,
+    help="Images generated at once per API (default: 2 for imagen, 4 for dalle and gptimage)",
+)
 def illustrate(
     article_path: Path,
     output_dir: Path | None,
@@ -318,6 +326,7 @@ def illustrate(
     resume: bool,
     prompts_only: bool,
     cost_limit: float | None,
+    api_concurrency: int | None,
 ):
     """Generate illustrations for a markdown article.
 
@@ -350,6 +359,7 @@ def illustrate(
             resume=resume,
             prompts_only=prompts_only,
             cost_limit=cost_limit,
+            api_concurrency=api_concurrency,
         )
     )
 
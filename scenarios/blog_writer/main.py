@@ -24,18 +24,22 @@ from .user_feedback import UserFeedbackHandler
 
 logger = get_logger(__name__)
 
+SESSIONS_DIR = Path(".data/blog_post_writer")
+DEFAULT_STYLE_CACHE_DIR = SESSIONS_DIR / "style_cache"
+
 
 class BlogPostPipeline:
     """Orchestrates the blog post writing pipeline."""
 
-    def __init__(self, state_manager: StateManager):
+    def __init__(self, state_manager: StateManager, style_cache_dir: Path | None = DEFAULT_STYLE_CACHE_DIR):
         """Initialize pipeline with state management.
 
         Args:
             state_manager: State manager instance
+            style_cache_dir: Cache of style profiles by writings content (None to disable)
         """
         self.state = state_manager
-        self.style_extractor = StyleExtractor()
+        self.style_extractor = StyleExtractor(cache_dir=style_cache_dir)
         self.blog_writer = BlogWriter()
         self.source_reviewer = SourceReviewer()
         self.style_reviewer = StyleReviewer()
@@ -46,6 +50,7 @@ class BlogPostPipeline:
         self.brain_dump_path: Path | None = None
         self.writings_dir: Path | None = None
         self.output_path: Path | None = None
+        self.additional_instructions: str = ""
 
     async def run(
         self,
@@ -106,11 +111,8 @@ class BlogPostPipeline:
                     logger.warning("Max iterations reached")
                     break
 
-                # Source review
-                await self._review_sources()
-
-                # Style review
-                await self._review_style()
+                # Source and style review
+                await self._review_draft()
 
                 # Check if revision needed
                 needs_revision = self.state.state.source_review.get(
@@ -170,32 +172,39 @@ class BlogPostPipeline:
         self.state.update_draft(draft)
         self.state.update_stage("draft_written")
 
-    async def _review_sources(self) -> None:
+    async def _review_draft(self) -> None:
+        """Review the current draft for source accuracy and style at the same time.
+
+        Both reviews only read the draft, so they run concurrently; results are
+        recorded afterwards, source review first, whichever finishes first.
+        """
+        source_review, style_review = await asyncio.gather(self._review_sources(), self._review_style())
+
+        self.state.set_source_review(source_review)
+        self.state.add_iteration_history({"type": "source_review", "review": source_review})
+        self.state.set_style_review(style_review)
+        self.state.add_iteration_history({"type": "style_review", "review": style_review})
+
+    async def _review_sources(self) -> dict:
         """Review draft for source accuracy."""
         logger.info("\n🔍 Reviewing source accuracy...")
 
-        review = await self.source_reviewer.review_sources(
+        return await self.source_reviewer.review_sources(
             self.state.state.current_draft,
             self.brain_dump,
             additional_instructions=self.additional_instructions,
             user_feedback_history=self.state.state.user_feedback,
         )
 
-        self.state.set_source_review(review)
-        self.state.add_iteration_history({"type": "source_review", "review": review})
-
-    async def _review_style(self) -> None:
+    async def _review_style(self) -> dict:
         """Review draft for style consistency."""
         logger.info("\n🎨 Reviewing style consistency...")
 
-        review = await self.style_reviewer.review_style(
+        return await self.style_reviewer.review_style(
             self.state.state.current_draft,
             self.state.state.style_profile,
         )
 
-        self.state.set_style_review(review)
-        self.state.add_iteration_history({"type": "style_review", "review": review})
-
     async def _revise_draft(self) -> None:
         """Revise draft based on reviews."""
         logger.info("\n🔄 Revising draft based on reviews...")
@@ -347,6 +356,11 @@ class BlogPostPipeline:
     default=10,
     help="Maximum iterations (default: 10)",
 )
+@click.option(
+    "--no-style-cache",
+    is_flag=True,
+    help="Re-extract the writing style even if these writings were analyzed before",
+)
 @click.option(
     "--verbose",
     is_flag=True,
@@ -360,6 +374,7 @@ def main(
     resume: bool,
     reset: bool,
     max_iterations: int,
+    no_style_cache: bool,
     verbose: bool,
 ):
     """Blog Post Writer - Transform ideas into polished blog posts.
@@ -379,14 +394,12 @@ def main(
 
     # Determine session directory
     session_dir = None
-    if resume:
-        # Find most recent session for resume
-        base_dir = Path(".data/blog_post_writer")
-        if base_dir.exists():
-            sessions = sorted([d for d in base_dir.iterdir() if d.is_dir()], reverse=True)
-            if sessions:
-                session_dir = sessions[0]
-                logger.info(f"Resuming session: {session_dir.name}")
+    # Find most recent session for resume (the style cache lives alongside the sessions)
+    if resume and SESSIONS_DIR.exists():
+        sessions = sorted([d for d in SESSIONS_DIR.iterdir() if (d / "state.json").exists()], reverse=True)
+        if sessions:
+            session_dir = sessions[0]
+            logger.info(f"Resuming session: {session_dir.name}")
 
     # Create state manager (new session if not resuming)
     state_manager = StateManager(session_dir)
@@ -413,7 +426,7 @@ def main(
             instructions = state_manager.state.additional_instructions
 
     # Create and run pipeline
-    pipeline = BlogPostPipeline(state_manager)
+    pipeline = BlogPostPipeline(state_manager, style_cache_dir=None if no_style_cache else DEFAULT_STYLE_CACHE_DIR)
 
     logger.info("🚀 Starting Blog Post Writer Pipeline")
     logger.info(f"  Session: {state_manager.session_dir}")
@@ -6,5 +6,6 @@ Analyzes author's existing writings to extract style patterns.
 
 from .core import StyleExtractor
 from .core import StyleProfile
+from .core import writings_digest
 
-__all__ = ["StyleExtractor", "StyleProfile"]
+__all__ = ["StyleExtractor", "StyleProfile", "writings_digest"]
@@ -4,6 +4,8 @@ Style extraction core functionality.
 Analyzes writings to identify author's unique style patterns.
 """
 
+import hashlib
+import json
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +20,18 @@ from amplifier.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Bump when the prompt or the profile format changes, so cached profiles are re-extracted
+STYLE_CACHE_VERSION = 1
+
+
+def writings_digest(files: list[Path], root: Path) -> str:
+    """SHA-256 over the relative paths and contents of a set of writing samples."""
+    digest = hashlib.sha256(f"v{STYLE_CACHE_VERSION}".encode())
+    for file in files:
+        digest.update(file.relative_to(root).as_posix().encode() + b"\0")
+        digest.update(file.read_bytes() + b"\0")
+    return digest.hexdigest()
+
 
 class StyleProfile(BaseModel):
     """Author style profile extracted from writings."""
@@ -33,11 +47,20 @@ class StyleProfile(BaseModel):
 
 
 class StyleExtractor:
-    """Extracts author style from writing samples."""
+    """Extracts author style from writing samples.
+
+    With a cache directory, extracted profiles are stored by a digest of the
+    writings, so another session on unchanged writings skips the analysis.
+    """
 
-    def __init__(self):
-        """Initialize style extractor."""
+    def __init__(self, cache_dir: Path | None = None):
+        """Initialize style extractor.
+
+        Args:
+            cache_dir: Directory for cached style profiles (None to disable)
+        """
         self.profile: StyleProfile | None = None
+        self.cache_dir = cache_dir
 
     async def extract_style(self, writings_dir: Path) -> dict[str, Any]:
         """Extract style profile from writings directory.
@@ -48,12 +71,24 @@ class StyleExtractor:
         Returns:
             Style profile as dictionary
         """
-        # Find all markdown files
-        files = list(writings_dir.glob("**/*.md"))
+        # Find all markdown files (sorted, so the samples and the cache key don't depend on directory order)
+        files = sorted(writings_dir.glob("**/*.md"))
         if not files:
             logger.warning(f"No markdown files found in {writings_dir}")
             return self._default_profile()
 
+        cache_file = None
+        if self.cache_dir is not None:
+            try:
+                cache_file = self.cache_dir / f"{writings_digest(files, writings_dir)}.json"
+            except OSError as e:
+                logger.warning(f"Could not hash writings for the style cache: {e}")
+        cached = self._load_cached(cache_file) if cache_file else None
+        if cached is not None:
+            logger.info(f"Using cached style profile for {len(files)} unchanged writing samples")
+            self.profile = cached
+            return cached.model_dump()
+
         logger.info(f"Analyzing {len(files)} writing samples:")
         for f in files[:3]:  # Show first 3
             logger.info(f"  • {f.name}")
@@ -79,19 +114,41 @@ class StyleExtractor:
         # Extract style with AI
         combined_samples = "\n\n".join(samples)
         profile = await self._analyze_with_ai(combined_samples)
+        if profile is None:
+            return self._default_profile()
 
         # Store profile
         self.profile = profile
+        if cache_file:
+            self._save_cached(cache_file, profile)
         return profile.model_dump()
 
-    async def _analyze_with_ai(self, samples: str) -> StyleProfile:
+    def _load_cached(self, cache_file: Path) -> StyleProfile | None:
+        try:
+            return StyleProfile(**json.loads(cache_file.read_text()))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cached style profile {cache_file}: {e}")
+            return None
+
+    def _save_cached(self, cache_file: Path, profile: StyleProfile) -> None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            tmp_file.write_text(profile.model_dump_json(indent=2))
+            tmp_file.replace(cache_file)
+        except OSError as e:
+            logger.warning(f"Could not cache style profile: {e}")
+
+    async def _analyze_with_ai(self, samples: str) -> StyleProfile | None:
         """Analyze samples with AI to extract style.
 
         Args:
             samples: Combined writing samples
 
         Returns:
-            Extracted style profile
+            Extracted style profile, None if extraction failed
         """
         prompt = f"""Analyze these writing samples to extract the author's style:
 
@@ -133,7 +190,7 @@ common_phrases (list), writing_patterns (list), voice, examples (list)"""
 
                 if parsed is None:
                     logger.warning("Could not extract style after retries, using defaults")
-                    return StyleProfile(**self._default_profile())
+                    return None
 
                 # Handle both dict and list responses from LLM
                 # If LLM returns an array like [{...}], extract first element
@@ -143,10 +200,10 @@ common_phrases (list), writing_patterns (list), voice, examples (list)"""
                         logger.debug("Extracted style data from array response")
                     else:
                         logger.warning("LLM returned empty or invalid array, using defaults")
-                        return StyleProfile(**self._default_profile())
+                        return None
                 elif not isinstance(parsed, dict):
                     logger.warning(f"Unexpected response type: {type(parsed)}, using defaults")
-                    return StyleProfile(**self._default_profile())
+                    return None
 
                 # Log what we extracted
                 logger.info("Successfully extracted style profile:")
@@ -170,7 +227,7 @@ common_phrases (list), writing_patterns (list), voice, examples (list)"""
 
         except Exception as e:
             logger.error(f"Style extraction failed: {e}")
-            return StyleProfile(**self._default_profile())
+            return None
 
     def _default_profile(self) -> dict[str, Any]:
         """Return default style profile when extraction fails."""
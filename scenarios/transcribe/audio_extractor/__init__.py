@@ -4,6 +4,8 @@ Audio Extractor Module
 Extracts and compresses audio from video files for transcription.
 """
 
+from .core import AudioChunk
 from .core import AudioExtractor
+from .core import plan_chunks
 
-__all__ = ["AudioExtractor"]
+__all__ = ["AudioExtractor", "AudioChunk", "plan_chunks"]
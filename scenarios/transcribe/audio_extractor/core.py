@@ -4,13 +4,56 @@ Audio Extractor Core Implementation
 Extracts audio from video files and compresses for API limits.
 """
 
+import re
+import shutil
 import subprocess
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
 
 from amplifier.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_SILENCE_RE = re.compile(r"silence_(start|end): (-?[\d.]+)")
+
+
+@dataclass
+class AudioChunk:
+    """A piece of a longer recording, cut for separate transcription."""
+
+    path: Path
+    start: float  # Offset into the original recording, in seconds
+    duration: float
+
+
+def plan_chunks(duration: float, silences: list[tuple[float, float]], max_seconds: float) -> list[tuple[float, float]]:
+    """Choose cut points for a recording of ``duration`` seconds.
+
+    Each chunk is at most ``max_seconds`` long and ends in the middle of the
+    latest silence in its second half, so words are not cut; without one it
+    is cut at the limit.
+
+    Args:
+        duration: Length of the recording in seconds
+        silences: (start, end) of detected silences, in order
+        max_seconds: Longest allowed chunk
+
+    Returns:
+        (start, end) of each chunk, covering the whole recording
+    """
+    cut_points = [(start + end) / 2 for start, end in silences]
+    chunks = []
+    start = 0.0
+    while duration - start > max_seconds:
+        limit = start + max_seconds
+        candidates = [point for point in cut_points if start + max_seconds / 2 <= point <= limit]
+        end = candidates[-1] if candidates else limit
+        chunks.append((start, end))
+        start = end
+    chunks.append((start, duration))
+    return chunks
+
 
 class AudioExtractor:
     """Extract and compress audio from video files."""
@@ -97,18 +140,7 @@ class AudioExtractor:
 
         # Get duration for bitrate calculation
         try:
-            duration_cmd = [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_entries",
-                "format=duration",
-                "-of",
-                "default=noprint_wrappers=1:nokey=1",
-                str(audio_path),
-            ]
-            result = subprocess.run(duration_cmd, capture_output=True, text=True, check=True)
-            duration = float(result.stdout.strip())
+            duration = self.probe_duration(audio_path)
 
             # Calculate target bitrate (90% of max for safety)
             target_bitrate = int((max_size_bytes * 8 * 0.9) / duration / 1000)  # kbps
@@ -156,6 +188,127 @@ class AudioExtractor:
             # Return original and let caller handle
             return audio_path
 
+    def split_for_api(
+        self,
+        audio_path: Path,
+        max_size_mb: int = 25,
+        max_chunk_seconds: float = 600,
+        silence_db: int = -30,
+        min_silence: float = 0.5,
+    ) -> list[AudioChunk]:
+        """Split audio at silences into chunks that fit the API limit, without re-encoding.
+
+        Unlike compress_for_api, quality is untouched: chunks are stream copies
+        of the original, bounded by both size and duration so they can be
+        transcribed in parallel.
+
+        Args:
+            audio_path: Path to audio file
+            max_size_mb: Maximum chunk size in MB (25MB for OpenAI)
+            max_chunk_seconds: Maximum chunk duration
+            silence_db: Level below which audio counts as silence
+            min_silence: Shortest pause to cut at, in seconds
+
+        Returns:
+            Chunks in order; a single chunk of the original file if it is already within both limits
+
+        Raises:
+            ValueError: If probing or cutting fails
+        """
+        try:
+            duration = self.probe_duration(audio_path)
+        except (subprocess.CalledProcessError, ValueError) as e:
+            raise ValueError(f"Could not read audio duration: {e}")
+
+        # 90% of the size limit for safety, assuming a constant bitrate
+        bytes_per_second = audio_path.stat().st_size / duration if duration else 0
+        max_seconds = max_chunk_seconds
+        if bytes_per_second:
+            max_seconds = min(max_seconds, max_size_mb * 1024 * 1024 * 0.9 / bytes_per_second)
+
+        if duration <= max_seconds:
+            return [AudioChunk(path=audio_path, start=0.0, duration=duration)]
+
+        silences = self.detect_silences(audio_path, silence_db, min_silence)
+        plan = plan_chunks(duration, silences, max_seconds)
+        logger.info(f"Splitting {duration / 60:.1f} minutes of audio into {len(plan)} chunks")
+
+        # Every source's audio has the same name, so each split gets a directory of its own
+        chunk_dir = Path(tempfile.mkdtemp(prefix=f"{audio_path.stem}_chunks_", dir=self.temp_dir))
+        chunks = []
+        for index, (start, end) in enumerate(plan):
+            chunk_path = chunk_dir / f"chunk_{index:03d}{audio_path.suffix}"
+            cmd = [
+                "ffmpeg",
+                "-ss",
+                f"{start:.3f}",
+                "-t",
+                f"{end - start:.3f}",
+                "-i",
+                str(audio_path),
+                "-vn",
+                "-c",
+                "copy",  # No re-encoding
+                "-y",
+                str(chunk_path),
+            ]
+            try:
+                subprocess.run(cmd, capture_output=True, text=True, check=True)
+            except subprocess.CalledProcessError as e:
+                shutil.rmtree(chunk_dir, ignore_errors=True)
+                raise ValueError(f"Failed to cut audio chunk {index}: {e.stderr}")
+            chunks.append(AudioChunk(path=chunk_path, start=start, duration=end - start))
+        return chunks
+
+    def detect_silences(
+        self, audio_path: Path, silence_db: int = -30, min_silence: float = 0.5
+    ) -> list[tuple[float, float]]:
+        """Find pauses with ffmpeg's silencedetect filter.
+
+        Returns:
+            (start, end) of each silence in seconds, empty if detection fails
+        """
+        cmd = [
+            "ffmpeg",
+            "-i",
+            str(audio_path),
+            "-af",
+            f"silencedetect=noise={silence_db}dB:d={min_silence}",
+            "-f",
+            "null",
+            "-",
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"Silence detection failed, cutting at fixed lengths: {e.stderr}")
+            return []
+
+        silences = []
+        start = None
+        for kind, value in _SILENCE_RE.findall(result.stderr):
+            if kind == "start":
+                start = max(float(value), 0.0)
+            elif start is not None:
+                silences.append((start, float(value)))
+                start = None
+        return silences
+
+    def probe_duration(self, audio_path: Path) -> float:
+        """Duration of an audio file in seconds, via ffprobe."""
+        duration_cmd = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            str(audio_path),
+        ]
+        result = subprocess.run(duration_cmd, capture_output=True, text=True, check=True)
+        return float(result.stdout.strip())
+
     def _get_codec(self, format: str) -> str:
         """Get appropriate codec for audio format."""
         codec_map = {
@@ -181,6 +334,18 @@ class AudioExtractor:
             except OSError as e:
                 logger.warning(f"Could not remove {audio_path.name}: {e}")
 
+    def cleanup_chunks(self, chunks: list[AudioChunk], audio_path: Path) -> None:
+        """Remove the chunks split_for_api cut from an audio file, with their directory.
+
+        Args:
+            chunks: Chunks returned by split_for_api
+            audio_path: The audio file that was split, which is kept
+        """
+        cut = [chunk.path for chunk in chunks if chunk.path != audio_path]
+        if cut:
+            shutil.rmtree(cut[0].parent, ignore_errors=True)
+            logger.debug(f"Cleaned up: {cut[0].parent.name}")
+
     def cleanup_all(self) -> None:
         """Remove all temporary audio files."""
         if self.temp_dir.exists():
@@ -2,12 +2,19 @@
 
 import json
 import logging
+from dataclasses import asdict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from amplifier.utils.file_io import load_manifest
+from amplifier.utils.file_io import save_manifest
+
 logger = logging.getLogger(__name__)
 
+# Per-transcript records from earlier scans, keyed by folder name
+MANIFEST_NAME = ".index_manifest.json"
+
 
 @dataclass
 class TranscriptInfo:
@@ -34,8 +41,8 @@ def extract_title_from_markdown(md_path: Path) -> str | None:
     return None
 
 
-def extract_metadata_from_json(transcript_folder: Path) -> dict:
-    """Extract duration, date, source from transcript.json.
+def find_metadata_json(transcript_folder: Path) -> Path:
+    """Location of a transcript's transcript.json.
 
     Checks .data location first for new storage pattern, then falls back
     to content directory for backward compatibility.
@@ -46,7 +53,12 @@ def extract_metadata_from_json(transcript_folder: Path) -> dict:
     data_json_path = paths.data_dir / "transcripts" / transcript_folder.name / "transcript.json"
 
     # Try new location first
-    json_path = data_json_path if data_json_path.exists() else transcript_folder / "transcript.json"
+    return data_json_path if data_json_path.exists() else transcript_folder / "transcript.json"
+
+
+def extract_metadata_from_json(transcript_folder: Path, json_path: Path | None = None) -> dict:
+    """Extract duration, date, source from transcript.json (see find_metadata_json)."""
+    json_path = json_path or find_metadata_json(transcript_folder)
 
     if json_path.exists():
         try:
@@ -89,13 +101,23 @@ def format_duration(seconds: int | float) -> str:
 
 
 def scan_transcripts(transcripts_dir: Path) -> list[TranscriptInfo]:
-    """Scan all transcript folders and extract info from existing files."""
+    """Scan all transcript folders and extract info from existing files.
+
+    A folder whose transcript.md, transcript.json and insights.md are unchanged
+    since the last scan (same size and mtime) is taken from the manifest
+    instead of being parsed again.
+    """
     transcripts = []
 
     if not transcripts_dir.exists():
         logger.warning(f"Transcripts directory does not exist: {transcripts_dir}")
         return transcripts
 
+    manifest_path = transcripts_dir / MANIFEST_NAME
+    manifest = load_manifest(manifest_path)
+    records = {}
+    parsed = 0
+
     # Find all folders that contain transcript.md
     for folder in transcripts_dir.iterdir():
         if not folder.is_dir():
@@ -105,16 +127,23 @@ def scan_transcripts(transcripts_dir: Path) -> list[TranscriptInfo]:
         if not transcript_md.exists():
             continue
 
+        json_path = find_metadata_json(folder)
+        insights_md = folder / "insights.md"
+        signature = [file_signature(transcript_md), str(json_path), file_signature(json_path), insights_md.exists()]
+
+        cached = manifest.get(folder.name)
+        if cached and cached.get("signature") == signature:
+            records[folder.name] = cached
+            transcripts.append(TranscriptInfo(**cached["info"]))
+            continue
+
         # Extract title from markdown
         title = extract_title_from_markdown(transcript_md)
         if not title:
             title = folder.name  # Fallback to folder name
 
         # Extract metadata from JSON (checks .data and content locations)
-        metadata = extract_metadata_from_json(folder)
-
-        # Check if insights exist
-        has_insights = (folder / "insights.md").exists()
+        metadata = extract_metadata_from_json(folder, json_path)
 
         transcript_info = TranscriptInfo(
             folder_name=folder.name,
@@ -122,10 +151,16 @@ def scan_transcripts(transcripts_dir: Path) -> list[TranscriptInfo]:
             duration=metadata["duration"],
             source=metadata["source"],
             created_at=metadata["created_at"],
-            has_insights=has_insights,
+            has_insights=signature[-1],
         )
 
         transcripts.append(transcript_info)
+        records[folder.name] = {"signature": signature, "info": asdict(transcript_info)}
+        parsed += 1
+
+    if records != manifest:
+        save_manifest(manifest_path, records)
+    logger.debug(f"Index scan: {parsed} of {len(records)} transcripts parsed, the rest from the manifest")
 
     # Sort by creation date (newest first)
     transcripts.sort(key=lambda t: t.created_at, reverse=True)
@@ -133,6 +168,15 @@ def scan_transcripts(transcripts_dir: Path) -> list[TranscriptInfo]:
     return transcripts
 
 
+def file_signature(path: Path) -> list[int] | None:
+    """Size and mtime of a file, None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
 def generate_index_markdown(transcripts: list[TranscriptInfo]) -> str:
     """Generate markdown index content."""
     lines = []
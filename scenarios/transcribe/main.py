@@ -5,7 +5,12 @@ Transcription Pipeline - Main Orchestrator and CLI
 Coordinates video transcription with state management for resume capability.
 """
 
+import queue
 import sys
+import threading
+from collections.abc import Callable
+from dataclasses import asdict
+from dataclasses import dataclass
 from pathlib import Path
 
 import click
@@ -13,35 +18,89 @@ import click
 from amplifier.utils.logger import get_logger
 
 from .audio_extractor import AudioExtractor
+from .quote_extractor.core import Quote
+from .quote_extractor.core import timestamp_link
+from .result_cache import ResultCache
+from .result_cache import audio_fingerprint
 from .state import StateManager
 from .state import VideoProcessingResult
 from .storage import TranscriptStorage
+from .summary_generator import Summary
+from .video_loader import VideoInfo
 from .video_loader import VideoLoader
+from .whisper_transcriber import Transcript
 from .whisper_transcriber import WhisperTranscriber
 
 logger = get_logger(__name__)
 
+# Queue sentinel: no more videos for this stage
+_DONE = object()
+
+# Whisper prompt; the template (not the title) is part of the result cache key, so retitled media still hits
+PROMPT_TEMPLATE = "Transcription of: {title}"
+
+DEFAULT_CACHE_DIR = Path(".data/transcribe/cache")
+
+
+@dataclass
+class _VideoJob:
+    """A video on its way through the pipeline stages."""
+
+    source: str
+    video_info: VideoInfo
+    output_dir: Path
+    cost: float
+    audio_path: Path | None = None
+    transcript: Transcript | None = None
+    cache_key: str | None = None  # Result cache key of the transcript
+
 
 class TranscriptionPipeline:
     """Orchestrates the transcription pipeline."""
 
-    def __init__(self, state_manager: StateManager | None = None, enhance: bool = True, force_download: bool = False):
+    def __init__(
+        self,
+        state_manager: StateManager | None = None,
+        enhance: bool = True,
+        force_download: bool = False,
+        chunk_concurrency: int = 4,
+        compress: bool = False,
+        download_workers: int = 2,
+        transcribe_workers: int = 2,
+        enhance_workers: int = 2,
+        queue_size: int = 2,
+        cache_dir: Path | None = DEFAULT_CACHE_DIR,
+    ):
         """Initialize pipeline.
 
         Args:
             state_manager: State manager for persistence (creates new if None)
             enhance: Whether to enable AI enhancements (summaries/quotes)
             force_download: If True, skip cache and re-download audio
+            chunk_concurrency: Chunks of one recording transcribed at once
+            compress: Fit long audio into one request by lowering its bitrate instead of splitting it
+            download_workers: Videos downloaded or extracted at once
+            transcribe_workers: Videos transcribed at once (each sending up to chunk_concurrency requests)
+            enhance_workers: Videos summarized and quoted at once
+            queue_size: Videos waiting between two stages before the earlier stage pauses
+            cache_dir: Result cache of transcripts, summaries and quotes by audio content (None to disable)
         """
         self.state = state_manager or StateManager()
         self.enhance = enhance
         self.force_download = force_download
+        self.chunk_concurrency = chunk_concurrency
+        self.compress = compress
+        self.download_workers = download_workers
+        self.transcribe_workers = transcribe_workers
+        self.enhance_workers = enhance_workers
+        self.queue_size = queue_size
 
         # Initialize components
         self.video_loader = VideoLoader()
         self.audio_extractor = AudioExtractor(temp_dir=self.state.session_dir / "audio")
         self.transcriber = WhisperTranscriber()
         self.storage = TranscriptStorage()
+        self.cache = ResultCache(cache_dir) if cache_dir else None
 
         # Initialize AI enhancement components if enabled
         self.summary_generator = None
@@ -59,104 +118,188 @@ class TranscriptionPipeline:
                 self.enhance = False
 
     def process_video(self, source: str) -> bool:
-        """Process a single video/audio source.
+        """Process a single video/audio source through every stage.
 
         Args:
             source: URL or file path
 
         Returns:
-            True if successful, False otherwise
+            True if successful (or already processed), False otherwise
         """
-        try:
-            # Stage 1: Load video info
-            self.state.update_stage("loading", source)
-            video_info = self.video_loader.load(source)
-
-            # Check if already processed
-            if self.state.is_already_processed(video_info.id):
-                logger.info(f"⏭ Skipping (already processed): {video_info.title}")
-                return True
-
-            logger.info(f"Processing: {video_info.title}")
-            logger.info(f"  Duration: {video_info.duration / 60:.1f} minutes")
-
-            # Estimate cost
-            cost = self.transcriber.estimate_cost(video_info.duration)
-            logger.info(f"  Estimated cost: ${cost:.3f}")
-
-            # Determine output directory for this video
-            video_id = self.storage._sanitize_filename(video_info.id)
-            output_dir = self.storage.output_dir / video_id
-            output_dir.mkdir(parents=True, exist_ok=True)
+        failed_before = len(self.state.state.failed_videos)
+        job = self._run_step(self._prepare, source, source)
+        if job is not None:
+            job = self._run_step(self._transcribe, job, source)
+        if job is not None:
+            self._run_step(self._finish, job, source)
+        return len(self.state.state.failed_videos) == failed_before
 
-            # Stage 2: Extract/download audio
-            self.state.update_stage("extracting", video_info.id)
+    def _prepare(self, source: str) -> _VideoJob | None:
+        """Download stage: load video info and get its audio on disk.
 
-            if video_info.type == "url":
-                # Download audio directly to output directory (with caching)
-                audio_path = self.video_loader.download_audio(
-                    source, output_dir, output_filename="audio.mp3", use_cache=(not self.force_download)
-                )
-            else:
-                # Extract audio from local file
-                temp_audio = self.audio_extractor.extract(Path(source))
-                # Save to output directory
-                audio_path = self.storage.save_audio(temp_audio, output_dir)
-                # Clean up temp file
-                if temp_audio != audio_path:
-                    self.audio_extractor.cleanup(temp_audio)
-
-            # Stage 3: Compress if needed
-            audio_path = self.audio_extractor.compress_for_api(audio_path)
-
-            # Stage 4: Transcribe
-            self.state.update_stage("transcribing", video_info.id)
-            transcript = self.transcriber.transcribe(audio_path, prompt=f"Transcription of: {video_info.title}")
-
-            # Stage 5: Save outputs
-            self.state.update_stage("saving", video_info.id)
-            output_dir = self.storage.save(transcript, video_info, audio_path)
-
-            # Stage 6: AI Enhancement (if enabled)
-            if self.enhance and self.summary_generator and self.quote_extractor:
-                try:
-                    self.state.update_stage("enhancing", video_info.id)
-                    logger.info("Generating AI enhancements...")
-
-                    # Generate summary
-                    summary = self.summary_generator.generate(transcript.text, video_info.title)
-
-                    # Extract quotes
-                    video_url = source if "youtube" in source.lower() else None
-                    quotes = self.quote_extractor.extract(transcript, video_url, video_info.id)
-
-                    # Save combined insights document
-                    self.storage.save_insights(
-                        summary=summary,
-                        quotes=quotes,
-                        title=video_info.title,
-                        output_dir=output_dir,
-                    )
-
-                    logger.info("✓ AI enhancements complete")
-                except Exception as e:
-                    logger.warning(f"AI enhancement failed (transcript saved): {e}")
+        Returns:
+            The job for the later stages, None if the video was already processed
+        """
+        progress = self.state.get_progress(source) or {}
+        if progress:
+            video_info = VideoInfo(**progress["video"])
+        else:
+            video_info = self.video_loader.load(source)
 
-            # Record success
-            result = VideoProcessingResult(
-                video_id=video_info.id,
-                source=source,
-                status="success",
-                output_dir=str(output_dir),
-                duration_seconds=video_info.duration,
-                cost_estimate=cost,
+        # Check if already processed
+        if self.state.is_already_processed(video_info.id):
+            logger.info(f"⏭ Skipping (already processed): {video_info.title}")
+            return None
+
+        logger.info(f"Processing: {video_info.title}")
+        logger.info(f"  Duration: {video_info.duration / 60:.1f} minutes")
+
+        # Estimate cost
+        cost = self.transcriber.estimate_cost(video_info.duration)
+        logger.info(f"  Estimated cost: ${cost:.3f}")
+
+        # Determine output directory for this video
+        video_id = self.storage._sanitize_filename(video_info.id)
+        output_dir = self.storage.output_dir / video_id
+        output_dir.mkdir(parents=True, exist_ok=True)
+        job = _VideoJob(source=source, video_info=video_info, output_dir=output_dir, cost=cost)
+
+        # Resume mid-pipeline: reuse what earlier stages left behind
+        if progress.get("audio_path") and Path(progress["audio_path"]).exists():
+            job.audio_path = Path(progress["audio_path"])
+            if progress.get("stage") == "transcribed":
+                job.transcript = self.storage.load_transcript(video_info.id)
+            logger.info(f"  Resuming after {'transcription' if job.transcript else 'download'}: {video_info.title}")
+            return job
+
+        if video_info.type == "url":
+            # Download audio directly to output directory (with caching)
+            job.audio_path = self.video_loader.download_audio(
+                source, output_dir, output_filename="audio.mp3", use_cache=(not self.force_download)
             )
-            self.state.add_processed(result)
-
-            # Audio file is preserved in output directory (not cleaned up)
-
-            return True
+        else:
+            # Extract audio from local file
+            temp_audio = self.audio_extractor.extract(Path(source))
+            # Save to output directory
+            job.audio_path = self.storage.save_audio(temp_audio, output_dir)
+            # Clean up temp file
+            if temp_audio != job.audio_path:
+                self.audio_extractor.cleanup(temp_audio)
+
+        self.state.set_progress(
+            source, "downloaded", video={**asdict(video_info), "audio_path": None}, audio_path=str(job.audio_path)
+        )
+        return job
+
+    def _transcribe(self, job: _VideoJob) -> _VideoJob:
+        """Transcribe stage: split (or compress) if needed, transcribe, and save the transcript.
+
+        Audio transcribed before (same bytes, model and prompt template) reuses the cached transcript.
+        """
+        if job.transcript is not None:
+            return job
+
+        assert job.audio_path is not None
+        audio_path = job.audio_path
+        transcript = self.cache.get_transcript(self._cache_key(job)) if self.cache else None
+        if transcript:
+            logger.info(f"✓ Using cached transcript: {job.video_info.title}")
+            self.state.record_cache_hit("transcripts", cost_avoided=job.cost)
+        else:
+            audio_path, transcript = self._transcribe_audio(
+                job.audio_path, prompt=PROMPT_TEMPLATE.format(title=job.video_info.title)
+            )
+            if self.cache:
+                self.cache.put_transcript(self._cache_key(job), transcript)
+
+        job.transcript = transcript
+        job.output_dir = self.storage.save(transcript, job.video_info, audio_path)
+        self.state.set_progress(job.source, "transcribed")
+        return job
+
+    def _cache_key(self, job: _VideoJob) -> str:
+        """Result cache key of a job's transcript: audio content plus what shapes the transcription."""
+        assert self.cache is not None and job.audio_path is not None
+        if job.cache_key is None:
+            job.cache_key = self.cache.key(
+                audio_fingerprint(job.audio_path),
+                model=self.transcriber.model,
+                prompt=PROMPT_TEMPLATE,
+                compress=self.compress,
+            )
+        return job.cache_key
+
+    def _summarize(self, job: _VideoJob) -> Summary:
+        assert self.summary_generator is not None and job.transcript is not None
+        key = self.cache.key(self._cache_key(job), model=self.summary_generator.model) if self.cache else None
+        summary = self.cache.get_summary(key) if self.cache and key else None
+        if summary:
+            self.state.record_cache_hit("summaries")
+            return summary
+
+        summary = self.summary_generator.generate(job.transcript.text, job.video_info.title)
+        if self.cache and key:
+            self.cache.put_summary(key, summary)
+        return summary
+
+    def _extract_quotes(self, job: _VideoJob) -> list[Quote]:
+        assert self.quote_extractor is not None and job.transcript is not None
+        video_url = job.source if "youtube" in job.source.lower() else None
+        key = self.cache.key(self._cache_key(job), model=self.quote_extractor.model) if self.cache else None
+        quotes = self.cache.get_quotes(key) if self.cache and key else None
+        if quotes:
+            self.state.record_cache_hit("quote sets")
+            # Links point at this video, not the one the quotes were first extracted for
+            for quote in quotes:
+                quote.timestamp_link = timestamp_link(video_url, job.video_info.id, quote.timestamp)
+            return quotes
+
+        quotes = self.quote_extractor.extract(job.transcript, video_url, job.video_info.id)
+        if self.cache and key:
+            self.cache.put_quotes(key, quotes)
+        return quotes
+
+    def _finish(self, job: _VideoJob) -> _VideoJob:
+        """Enhance stage: summary and quotes (if enabled), then record the video as processed."""
+        assert job.transcript is not None
+        if self.enhance and self.summary_generator and self.quote_extractor:
+            try:
+                logger.info(f"Generating AI enhancements: {job.video_info.title}")
+
+                # Generate summary and extract quotes (or reuse them for audio seen before)
+                summary = self._summarize(job)
+                quotes = self._extract_quotes(job)
+
+                # Save combined insights document
+                self.storage.save_insights(
+                    summary=summary,
+                    quotes=quotes,
+                    title=job.video_info.title,
+                    output_dir=job.output_dir,
+                )
 
+                logger.info("✓ AI enhancements complete")
+            except Exception as e:
+                logger.warning(f"AI enhancement failed (transcript saved): {e}")
+
+        # Record success
+        result = VideoProcessingResult(
+            video_id=job.video_info.id,
+            source=job.source,
+            status="success",
+            output_dir=str(job.output_dir),
+            duration_seconds=job.video_info.duration,
+            cost_estimate=job.cost,
+        )
+        self.state.add_processed(result)
+
+        # Audio file is preserved in output directory (not cleaned up)
+        return job
+
+    def _run_step(self, step: Callable, item, source: str):
+        """Run one stage for one video, recording a failure instead of raising."""
+        try:
+            return step(item)
         except Exception as e:
             logger.error(f"Failed to process {source}: {e}")
 
@@ -168,8 +311,77 @@ class TranscriptionPipeline:
                 error=str(e),
             )
             self.state.add_failed(result)
+            return None
+
+    def _run_stages(self, sources: list[str]) -> None:
+        """Run sources through the download, transcribe and enhance stages concurrently.
+
+        Each stage has its own worker threads, connected by queues holding at
+        most ``queue_size`` videos, so downloads, ffmpeg, transcription and
+        enhancement of different videos overlap while a slow stage holds back
+        the ones before it instead of piling up audio on disk.
+        """
+        download_queue: queue.Queue = queue.Queue()
+        transcribe_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        enhance_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+
+        def stage(step, inbox: queue.Queue, outbox: queue.Queue | None, workers: int) -> list[threading.Thread]:
+            def work():
+                while (job := inbox.get()) is not _DONE:
+                    source = job if isinstance(job, str) else job.source
+                    result = self._run_step(step, job, source)
+                    if result is not None and outbox is not None:
+                        outbox.put(result)
+                inbox.put(_DONE)  # Let the stage's other workers stop too
+
+            threads = [threading.Thread(target=work, daemon=True) for _ in range(max(1, workers))]
+            for thread in threads:
+                thread.start()
+            return threads
+
+        stages = [
+            (stage(self._prepare, download_queue, transcribe_queue, self.download_workers), transcribe_queue),
+            (stage(self._transcribe, transcribe_queue, enhance_queue, self.transcribe_workers), enhance_queue),
+            (stage(self._finish, enhance_queue, None, self.enhance_workers), None),
+        ]
+
+        for source in sources:
+            download_queue.put(source)
+        download_queue.put(_DONE)
+
+        # Each stage is done once its inbox is drained; then the next one can finish
+        for threads, outbox in stages:
+            for thread in threads:
+                thread.join()
+            if outbox is not None:
+                outbox.put(_DONE)
+
+    def _transcribe_audio(self, audio_path: Path, prompt: str) -> tuple[Path, Transcript]:
+        """Transcribe audio of any length.
+
+        Long audio is split at silences and the chunks transcribed in parallel,
+        at full quality. With ``compress`` (or if splitting fails) it is instead
+        squeezed under the API limit and sent as one request.
 
-            return False
+        Returns:
+            The audio file to keep with the transcript, and the transcript
+        """
+        if not self.compress:
+            try:
+                chunks = self.audio_extractor.split_for_api(audio_path)
+            except ValueError as e:
+                logger.warning(f"Could not split audio, compressing instead: {e}")
+            else:
+                try:
+                    transcript = self.transcriber.transcribe_chunks(
+                        chunks, prompt=prompt, concurrency=self.chunk_concurrency
+                    )
+                finally:
+                    self.audio_extractor.cleanup_chunks(chunks, audio_path)
+                return audio_path, transcript
+
+        audio_path = self.audio_extractor.compress_for_api(audio_path)
+        return audio_path, self.transcriber.transcribe(audio_path, prompt=prompt)
 
     def run(self, sources: list[str], resume: bool = False) -> bool:
         """Run the transcription pipeline.
@@ -202,17 +414,12 @@ class TranscriptionPipeline:
 
         logger.info(f"Processing {len(sources_to_process)} videos")
         logger.info(f"Output directory: {self.storage.output_dir}")
+        self.state.update_stage("processing")
 
-        # Process each video
-        all_success = True
-        for i, source in enumerate(sources_to_process, 1):
-            logger.info(f"\n[{i}/{len(sources_to_process)}] {source}")
-
-            if not self.process_video(source):
-                all_success = False
-
-            # Save state after each video
-            self.state.save()
+        # Stream the videos through the stages; state is saved as each one advances
+        failed_before = len(self.state.state.failed_videos)
+        self._run_stages(sources_to_process)
+        all_success = len(self.state.state.failed_videos) == failed_before
 
         # Mark complete
         self.state.mark_complete()
@@ -264,6 +471,14 @@ def index():
 @click.option("--output-dir", type=click.Path(path_type=Path), help="Output directory for transcripts")
 @click.option("--no-enhance", is_flag=True, help="Skip AI enhancements (summaries/quotes)")
 @click.option("--force-download", is_flag=True, help="Skip cache and re-download audio even if it exists")
+@click.option("--chunk-concurrency", type=int, default=4, help="Chunks of a long recording transcribed at once")
+@click.option(
+    "--compress", is_flag=True, help="Lower the bitrate of long audio to send it in one request instead of splitting it"
+)
+@click.option("--no-cache", is_flag=True, help="Redo transcription and enhancement of audio processed before")
+@click.option("--download-workers", type=int, default=2, help="Videos downloaded or extracted at once")
+@click.option("--transcribe-workers", type=int, default=2, help="Videos transcribed at once")
+@click.option("--enhance-workers", type=int, default=2, help="Videos summarized and quoted at once")
 def transcribe(
     sources: tuple[str],
     resume: bool,
@@ -271,6 +486,12 @@ def transcribe(
     output_dir: Path | None,
     no_enhance: bool,
     force_download: bool,
+    chunk_concurrency: int,
+    compress: bool,
+    no_cache: bool,
+    download_workers: int,
+    transcribe_workers: int,
+    enhance_workers: int,
 ) -> int:
     """Transcribe videos or audio files.
 
@@ -287,7 +508,17 @@ def transcribe(
 
         # Create pipeline with enhancement setting
         enhance = not no_enhance
-        pipeline = TranscriptionPipeline(state_manager, enhance=enhance, force_download=force_download)
+        pipeline = TranscriptionPipeline(
+            state_manager,
+            enhance=enhance,
+            force_download=force_download,
+            chunk_concurrency=chunk_concurrency,
+            compress=compress,
+            download_workers=download_workers,
+            transcribe_workers=transcribe_workers,
+            enhance_workers=enhance_workers,
+            cache_dir=None if no_cache else DEFAULT_CACHE_DIR,
+        )
 
         # Override output directory if specified
         if output_dir:
@@ -30,6 +30,13 @@ class Quote:
     context: str  # Why this quote matters
 
 
+def timestamp_link(video_url: str | None, video_id: str, timestamp: float) -> str | None:
+    """YouTube link to a moment in the video, None for other sources."""
+    if video_url and "youtube.com" in video_url:
+        return f"https://youtube.com/watch?v={video_id}&t={int(timestamp)}s"
+    return None
+
+
 class QuoteExtractor:
     """Extract memorable quotes from transcripts using Claude."""
 
@@ -120,16 +127,11 @@ Please respond in JSON format with an array of quotes:
             # Convert to Quote objects with YouTube links if applicable
             quotes = []
             for quote_data in quotes_data:
-                timestamp_link = None
-                if video_url and "youtube.com" in video_url:
-                    seconds = int(quote_data.get("timestamp", 0))
-                    timestamp_link = f"https://youtube.com/watch?v={video_id}&t={seconds}s"
-
                 quotes.append(
                     Quote(
                         text=quote_data.get("text", ""),
                         timestamp=quote_data.get("timestamp", 0.0),
-                        timestamp_link=timestamp_link,
+                        timestamp_link=timestamp_link(video_url, video_id, quote_data.get("timestamp", 0)),
                         context=quote_data.get("context", ""),
                     )
                 )
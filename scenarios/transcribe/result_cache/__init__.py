@@ -0,0 +1,10 @@
+"""
+Result Cache Module
+
+Reuses transcripts, summaries and quotes for audio that was processed before.
+"""
+
+from .core import ResultCache
+from .core import audio_fingerprint
+
+__all__ = ["ResultCache", "audio_fingerprint"]
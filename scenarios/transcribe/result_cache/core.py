@@ -0,0 +1,109 @@
+"""
+Result Cache Core Implementation
+
+Stores transcripts and AI enhancements keyed by audio content, so the same
+media under another URL or file name is never transcribed or summarized twice.
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import asdict
+from pathlib import Path
+
+from amplifier.utils.logger import get_logger
+
+from ..quote_extractor.core import Quote
+from ..summary_generator.core import Summary
+from ..whisper_transcriber.core import Transcript
+from ..whisper_transcriber.core import TranscriptSegment
+
+logger = get_logger(__name__)
+
+# Bump when the stored format or the way results are produced changes
+CACHE_VERSION = 1
+
+
+def audio_fingerprint(audio_path: Path) -> str:
+    """SHA-256 of an audio file's bytes."""
+    digest = hashlib.sha256()
+    with open(audio_path, "rb") as f:
+        while block := f.read(1024 * 1024):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Transcripts, summaries and quotes on disk, one JSON file per result.
+
+    Keys combine the audio fingerprint with every parameter that shapes the
+    result (model, prompt, transcription mode), see key().
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory for cached results (created if missing)
+        """
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, base: str, **params) -> str:
+        """Cache key for a result derived from ``base`` (an audio fingerprint or another key) with ``params``."""
+        payload = json.dumps({"base": base, "version": CACHE_VERSION, **params}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def get_transcript(self, key: str) -> Transcript | None:
+        data = self._read("transcript", key)
+        if data is None:
+            return None
+        segments = [TranscriptSegment(**seg) for seg in data.pop("segments")]
+        return Transcript(**data, segments=segments)
+
+    def put_transcript(self, key: str, transcript: Transcript) -> None:
+        self._write("transcript", key, asdict(transcript))
+
+    def get_summary(self, key: str) -> Summary | None:
+        data = self._read("summary", key)
+        return Summary(**data) if data is not None else None
+
+    def put_summary(self, key: str, summary: Summary) -> None:
+        """Store a summary, unless it is the fallback for a failed generation."""
+        if not summary.failed:
+            self._write("summary", key, asdict(summary))
+
+    def get_quotes(self, key: str) -> list[Quote] | None:
+        data = self._read("quotes", key)
+        return [Quote(**quote) for quote in data] if data is not None else None
+
+    def put_quotes(self, key: str, quotes: list[Quote]) -> None:
+        """Store quotes, unless there are none (extraction failures return an empty list)."""
+        if quotes:
+            self._write("quotes", key, [asdict(quote) for quote in quotes])
+
+    def _path(self, kind: str, key: str) -> Path:
+        return self.cache_dir / kind / f"{key}.json"
+
+    def _read(self, kind: str, key: str):
+        path = self._path(kind, key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def _write(self, kind: str, key: str, value) -> None:
+        path = self._path(kind, key)
+        # Per-thread temporary name: two pipeline workers may store the same result at once
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {path}: {e}")
@@ -4,6 +4,7 @@ State Management Module
 Handles pipeline state persistence for resume capability.
 """
 
+import threading
 from dataclasses import asdict
 from dataclasses import dataclass
 from dataclasses import field
@@ -36,7 +37,7 @@ class PipelineState:
     """Complete pipeline state for persistence."""
 
     # Current status
-    stage: str = "initialized"  # initialized, loading, extracting, transcribing, saving, complete
+    stage: str = "initialized"  # initialized, processing, complete
     current_video: str | None = None
     total_videos: int = 0
 
@@ -44,9 +45,14 @@ class PipelineState:
     processed_videos: list[VideoProcessingResult] = field(default_factory=list)
     failed_videos: list[VideoProcessingResult] = field(default_factory=list)
 
+    # Videos still in the pipeline: source -> last stage completed ("downloaded", "transcribed") and its outputs
+    progress: dict[str, dict] = field(default_factory=dict)
+
     # Statistics
     total_duration_seconds: float = 0.0
     total_cost_estimate: float = 0.0
+    cache_hits: dict[str, int] = field(default_factory=dict)  # Result kind -> reused from the result cache
+    cost_avoided: float = 0.0  # Transcription cost not spent thanks to cached transcripts
 
     # Input parameters
     sources: list[str] = field(default_factory=list)
@@ -58,7 +64,10 @@ class PipelineState:
 
 
 class StateManager:
-    """Manages pipeline state with automatic persistence."""
+    """Manages pipeline state with automatic persistence.
+
+    Safe to update from several pipeline workers at once.
+    """
 
     def __init__(self, session_dir: Path | None = None):
         """Initialize state manager.
@@ -74,6 +83,7 @@ class StateManager:
         self.session_dir = session_dir
         self.session_dir.mkdir(parents=True, exist_ok=True)
         self.state_file = self.session_dir / "state.json"
+        self._lock = threading.RLock()
         self.state = self._load_state()
 
     def _load_state(self) -> PipelineState:
@@ -103,14 +113,15 @@ class StateManager:
 
     def save(self) -> None:
         """Save current state to file."""
-        self.state.updated_at = datetime.now().isoformat()
+        with self._lock:
+            self.state.updated_at = datetime.now().isoformat()
 
-        try:
-            state_dict = asdict(self.state)
-            write_json_with_retry(state_dict, self.state_file)
-            logger.debug(f"State saved to: {self.state_file}")
-        except Exception as e:
-            logger.error(f"Failed to save state: {e}")
+            try:
+                state_dict = asdict(self.state)
+                write_json_with_retry(state_dict, self.state_file)
+                logger.debug(f"State saved to: {self.state_file}")
+            except Exception as e:
+                logger.error(f"Failed to save state: {e}")
 
     def update_stage(self, stage: str, current_video: str | None = None) -> None:
         """Update pipeline stage."""
@@ -125,30 +136,57 @@ class StateManager:
 
         self.save()
 
+    def set_progress(self, source: str, stage: str, **details) -> None:
+        """Record that a video finished a pipeline stage, with what resuming from there needs."""
+        with self._lock:
+            entry = self.state.progress.setdefault(source, {})
+            entry.update(details, stage=stage)
+            self.save()
+
+        logger.info(f"Stage {stage}: {source}")
+
+    def get_progress(self, source: str) -> dict | None:
+        """Last completed stage of a video still in the pipeline, None if it has not started."""
+        with self._lock:
+            return self.state.progress.get(source)
+
     def add_processed(self, result: VideoProcessingResult) -> None:
         """Add successfully processed video."""
-        self.state.processed_videos.append(result)
-        self.state.total_duration_seconds += result.duration_seconds
-        self.state.total_cost_estimate += result.cost_estimate
-        self.save()
+        with self._lock:
+            self.state.processed_videos.append(result)
+            self.state.progress.pop(result.source, None)
+            self.state.total_duration_seconds += result.duration_seconds
+            self.state.total_cost_estimate += result.cost_estimate
+            self.save()
 
         logger.info(f"✓ Processed {len(self.state.processed_videos)}/{self.state.total_videos}: {result.video_id}")
 
     def add_failed(self, result: VideoProcessingResult) -> None:
         """Add failed video."""
-        self.state.failed_videos.append(result)
-        self.save()
+        with self._lock:
+            self.state.failed_videos.append(result)
+            self.state.progress.pop(result.source, None)
+            self.save()
 
         logger.warning(f"✗ Failed: {result.video_id} - {result.error}")
 
+    def record_cache_hit(self, kind: str, cost_avoided: float = 0.0) -> None:
+        """Count a result (transcript, summary, quotes) reused from the result cache."""
+        with self._lock:
+            self.state.cache_hits[kind] = self.state.cache_hits.get(kind, 0) + 1
+            self.state.cost_avoided += cost_avoided
+            self.save()
+
     def is_already_processed(self, video_id: str) -> bool:
         """Check if video was already processed."""
-        return any(result.video_id == video_id for result in self.state.processed_videos)
+        with self._lock:
+            return any(result.video_id == video_id for result in self.state.processed_videos)
 
     def get_pending_sources(self) -> list[str]:
-        """Get list of sources not yet processed."""
-        processed_sources = {r.source for r in self.state.processed_videos}
-        processed_sources.update({r.source for r in self.state.failed_videos})
+        """Get list of sources not yet processed (including those part way through the pipeline)."""
+        with self._lock:
+            processed_sources = {r.source for r in self.state.processed_videos}
+            processed_sources.update({r.source for r in self.state.failed_videos})
 
         return [s for s in self.state.sources if s not in processed_sources]
 
@@ -171,6 +209,9 @@ class StateManager:
             logger.info(f"  Failed: {failed} videos")
         logger.info(f"  Total Duration: {self.state.total_duration_seconds / 60:.1f} minutes")
         logger.info(f"  Estimated Cost: ${self.state.total_cost_estimate:.2f}")
+        if self.state.cache_hits:
+            hits = ", ".join(f"{count} {kind}" for kind, count in sorted(self.state.cache_hits.items()))
+            logger.info(f"  Reused from cache: {hits} (${self.state.cost_avoided:.2f} of transcription avoided)")
         logger.info("=" * 60)
 
     def reset(self) -> None:
@@ -13,6 +13,7 @@ from amplifier.utils.logger import get_logger
 
 from ..video_loader.core import VideoInfo
 from ..whisper_transcriber.core import Transcript
+from ..whisper_transcriber.core import TranscriptSegment
 
 logger = get_logger(__name__)
 
@@ -111,6 +112,28 @@ class TranscriptStorage:
         logger.info(f"Saved {len(saved_files)} files: {', '.join(saved_files)}")
         return video_dir  # Return content dir for compatibility
 
+    def load_transcript(self, video_id: str) -> Transcript | None:
+        """Load a transcript saved by save(), None if there is none or it is unreadable.
+
+        Args:
+            video_id: Video ID as passed in VideoInfo
+        """
+        json_path = self.data_dir / self._sanitize_filename(video_id) / "transcript.json"
+        try:
+            with open(json_path, encoding="utf-8") as f:
+                data = json.load(f)["transcript"]
+            return Transcript(
+                text=data["text"],
+                language=data.get("language"),
+                duration=data.get("duration"),
+                segments=[TranscriptSegment(**seg) for seg in data.get("segments", [])],
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not load saved transcript {json_path}: {e}")
+            return None
+
     def save_audio(self, audio_path: Path, output_dir: Path) -> Path:
         """Save audio file to output directory.
 
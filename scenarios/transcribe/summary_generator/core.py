@@ -26,6 +26,7 @@ class Summary:
     overview: str  # 2-3 sentence overview
     key_points: list[str]  # 3-5 bullet points
     themes: list[str]  # Main themes discussed
+    failed: bool = False  # Placeholder returned when generation failed
 
 
 class SummaryGenerator:
@@ -120,6 +121,7 @@ THEMES:
                 overview=f"Summary generation failed for '{title}'.",
                 key_points=["Unable to extract key points due to API error"],
                 themes=["Error occurred during processing"],
+                failed=True,
             )
 
     def _parse_summary(self, response_text: str) -> Summary:
@@ -6,12 +6,15 @@ Uses OpenAI Whisper API to transcribe audio files.
 
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
 
 from amplifier.utils.logger import get_logger
 
+from ..audio_extractor import AudioChunk
+
 try:
     from openai import OpenAI
 
@@ -111,27 +114,10 @@ class WhisperTranscriber:
 
                     response = self.client.audio.transcriptions.create(**kwargs)
 
-                # Convert response to Transcript
-                segments = []
-                if hasattr(response, "segments"):
-                    for seg in response.segments:
-                        segments.append(
-                            TranscriptSegment(
-                                id=getattr(seg, "id", 0),
-                                start=getattr(seg, "start", 0.0),
-                                end=getattr(seg, "end", 0.0),
-                                text=getattr(seg, "text", ""),
-                            )
-                        )
-
-                transcript = Transcript(
-                    text=response.text,
-                    language=getattr(response, "language", language),
-                    duration=getattr(response, "duration", None),
-                    segments=segments,
+                transcript = self._to_transcript(response, language)
+                logger.info(
+                    f"Transcription complete: {len(transcript.text)} chars, {len(transcript.segments)} segments"
                 )
-
-                logger.info(f"Transcription complete: {len(transcript.text)} chars, {len(segments)} segments")
                 return transcript
 
             except Exception as e:
@@ -144,6 +130,84 @@ class WhisperTranscriber:
 
         raise ValueError(f"Transcription failed after {max_retries} attempts: {last_error}")
 
+    def transcribe_chunks(
+        self,
+        chunks: list[AudioChunk],
+        language: str | None = None,
+        prompt: str | None = None,
+        max_retries: int = 3,
+        concurrency: int = 4,
+    ) -> Transcript:
+        """Transcribe the chunks of one recording in parallel and stitch the results.
+
+        Segment times are shifted by each chunk's offset into the recording and
+        segment ids renumbered, so the result reads as one transcript. Wall time
+        is roughly that of the slowest chunk per ``concurrency`` batch.
+
+        Args:
+            chunks: Chunks in recording order (see AudioExtractor.split_for_api)
+            language: Optional language code (e.g., 'en')
+            prompt: Optional prompt to guide transcription, sent with every chunk
+            max_retries: Maximum retry attempts per chunk
+            concurrency: Chunks transcribed at once
+
+        Returns:
+            Transcript of the whole recording
+
+        Raises:
+            ValueError: If any chunk fails to transcribe
+        """
+        if len(chunks) == 1:
+            return self.transcribe(chunks[0].path, language=language, prompt=prompt, max_retries=max_retries)
+
+        def transcribe_chunk(chunk: AudioChunk) -> Transcript:
+            return self.transcribe(chunk.path, language=language, prompt=prompt, max_retries=max_retries)
+
+        logger.info(f"Transcribing {len(chunks)} chunks, {concurrency} at a time")
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            parts = list(executor.map(transcribe_chunk, chunks))
+
+        segments = []
+        for chunk, part in zip(chunks, parts, strict=True):
+            for seg in part.segments:
+                segments.append(
+                    TranscriptSegment(
+                        id=len(segments),
+                        start=chunk.start + seg.start,
+                        end=chunk.start + seg.end,
+                        text=seg.text,
+                    )
+                )
+
+        last = chunks[-1]
+        return Transcript(
+            text=" ".join(part.text.strip() for part in parts if part.text.strip()),
+            language=next((part.language for part in parts if part.language), language),
+            duration=last.start + (parts[-1].duration or last.duration),
+            segments=segments,
+        )
+
+    def _to_transcript(self, response, language: str | None) -> Transcript:
+        """Convert a verbose_json API response to a Transcript."""
+        segments = []
+        if hasattr(response, "segments"):
+            for seg in response.segments or []:
+                segments.append(
+                    TranscriptSegment(
+                        id=getattr(seg, "id", 0),
+                        start=getattr(seg, "start", 0.0),
+                        end=getattr(seg, "end", 0.0),
+                        text=getattr(seg, "text", ""),
+                    )
+                )
+
+        return Transcript(
+            text=response.text,
+            language=getattr(response, "language", language),
+            duration=getattr(response, "duration", None),
+            segments=segments,
+        )
+
     def estimate_cost(self, duration_seconds: float) -> float:
         """Estimate transcription cost.
 
@@ -1,5 +1,6 @@
 """Converter module - HTML to Markdown conversion."""
 
 from .core import html_to_markdown
+from .core import page_to_markdown
 
-__all__ = ["html_to_markdown"]
+__all__ = ["html_to_markdown", "page_to_markdown"]
@@ -2,8 +2,9 @@
 
 import logging
 
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+from markdownify import MarkdownConverter
+
+from ..page import Page
 
 logger = logging.getLogger(__name__)
 
@@ -18,22 +19,34 @@ def html_to_markdown(html: str, base_url: str) -> str:
     Returns:
         Markdown formatted text
     """
+    return page_to_markdown(Page(url=base_url, html=html))
+
+
+def page_to_markdown(page: Page) -> str:
+    """Convert a parsed page to clean Markdown format.
+
+    Removes scripts, styles and other non-content elements from ``page.soup``.
+
+    Args:
+        page: Parsed page
+
+    Returns:
+        Markdown formatted text
+    """
+    html = page.html
     try:
-        # Pre-process HTML to remove unwanted elements
-        soup = BeautifulSoup(html, "html.parser")
+        # Pre-process the tree to remove unwanted elements
+        soup = page.soup
         for tag in soup(["script", "style", "meta", "link", "noscript", "title"]):
             tag.decompose()
 
-        cleaned_html = str(soup)
-
-        # Convert with markdownify settings optimized for readability
+        # Convert the tree directly, with markdownify settings optimized for readability
         # Note: wrap=False to avoid breaking links/inline elements awkwardly
-        markdown = md(
-            cleaned_html,
+        markdown = MarkdownConverter(
             heading_style="ATX",  # Use # style headings
             bullets="-",  # Use - for unordered lists
             code_language="",  # Don't add language hints to code blocks
-        )
+        ).convert_soup(soup)
 
         # Clean up extra whitespace
         lines = markdown.split("\n")
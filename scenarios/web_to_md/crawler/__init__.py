@@ -0,0 +1,6 @@
+"""Crawler module - Concurrent page and image fetching over pooled connections."""
+
+from .core import CrawlConfig
+from .core import Crawler
+
+__all__ = ["Crawler", "CrawlConfig"]
@@ -0,0 +1,299 @@
+"""Async crawl engine - one pooled HTTP client shared by all pages and images."""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+
+from ..fetcher import USER_AGENT
+from ..fetcher import page_metadata
+from ..http_cache import HttpCache
+from ..image_handler import find_image_urls
+from ..image_handler import image_filename
+from ..image_store import ImageStore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CrawlConfig:
+    """Limits for a crawl.
+
+    Attributes:
+        max_connections: Requests in flight across all hosts
+        per_host_connections: Requests in flight to any one host
+        host_interval: Minimum seconds between starting two requests to the same host
+        timeout: Page request timeout in seconds
+        image_timeout: Image request timeout in seconds
+        max_retries: Attempts per page before giving up
+    """
+
+    max_connections: int = 32
+    per_host_connections: int = 4
+    host_interval: float = 0.2
+    timeout: float = 30
+    image_timeout: float = 10
+    max_retries: int = 3
+
+
+class _Host:
+    """Admission state for one host."""
+
+    def __init__(self, connections: int):
+        self.slots = asyncio.Semaphore(connections)
+        self.lock = asyncio.Lock()
+        self.next_start = 0.0
+
+
+class Crawler:
+    """Fetches pages and images over one keep-alive connection pool.
+
+    Every request waits for a slot for its host, a global slot and the host's
+    polite interval, so any number of pages can be in flight at once without
+    hammering a single site. Images are downloaded concurrently, and an image
+    shared by several pages (a logo, say) is downloaded once per crawl.
+
+    With an HttpCache, pages and images fetched before are requested
+    conditionally; a 304 is answered from the cache and the page's metadata
+    carries ``not_modified=True``.
+
+    With an ImageStore, images go to the store instead of each page's
+    directory and bypass the HttpCache. Images the store has seen before are
+    not requested at all, so they are never revalidated: an image changed
+    behind the same URL keeps its stored copy until the store is cleared.
+
+    Use as an async context manager:
+
+        async with Crawler(CrawlConfig()) as crawler:
+            html, metadata = await crawler.fetch_page(url)
+    """
+
+    def __init__(
+        self,
+        config: CrawlConfig | None = None,
+        cache: HttpCache | None = None,
+        image_store: ImageStore | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initialize the crawler.
+
+        Args:
+            config: Crawl limits (default: CrawlConfig())
+            cache: Cache for conditional GETs, None to always fetch in full
+            image_store: Shared store for images, None to save them under each page's directory
+            transport: Transport for the HTTP client, for tests
+        """
+        self.config = config or CrawlConfig()
+        self.cache = cache
+        self.image_store = image_store
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._slots = asyncio.Semaphore(self.config.max_connections)
+        self._hosts: dict[str, _Host] = {}
+        self._images: dict[tuple[str, Path | None], asyncio.Task[Path | None]] = {}
+
+    async def __aenter__(self) -> "Crawler":
+        self._client = httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT},
+            timeout=self.config.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_connections,
+            ),
+            transport=self._transport,
+        )
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        for task in self._images.values():
+            task.cancel()
+        await asyncio.gather(*self._images.values(), return_exceptions=True)
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    @asynccontextmanager
+    async def _slot(self, url: str) -> AsyncIterator[None]:
+        """Wait for a host slot, a global slot and the host's polite interval.
+
+        The host slot comes first, so requests queued for one busy host hold
+        at most ``per_host_connections`` global slots and other hosts keep going.
+        """
+        host_name = urlparse(url).netloc
+        host = self._hosts.get(host_name)
+        if host is None:
+            host = self._hosts[host_name] = _Host(self.config.per_host_connections)
+
+        async with host.slots, self._slots:
+            # Measured once the global slot is held, so the interval is kept between actual starts
+            async with host.lock:
+                wait = host.next_start - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                host.next_start = time.monotonic() + self.config.host_interval
+            yield
+
+    async def _get(self, url: str, timeout: float, use_cache: bool = True) -> tuple[httpx.Response, bool]:
+        """GET a URL, conditionally if it is cached.
+
+        Args:
+            url: URL to fetch
+            timeout: Request timeout in seconds
+            use_cache: False to bypass the cache, for responses kept elsewhere
+
+        Returns:
+            Tuple of (response, not_modified); on 304 the response is rebuilt from the cache
+        """
+        if self._client is None:
+            raise RuntimeError("Crawler is not open, use 'async with Crawler(...)'")
+        cache = self.cache if use_cache else None
+        cached = cache.get(url) if cache else None
+        headers = cached.conditional_headers() if cached else None
+        async with self._slot(url):
+            response = await self._client.get(url, timeout=timeout, headers=headers)
+
+        if cached and cache and response.status_code == 304:
+            cache.touch(url)
+            cache.record(hit=True)
+            rebuilt = httpx.Response(
+                200,
+                headers={"content-type": cached.content_type},
+                content=cached.body,
+                request=httpx.Request("GET", cached.final_url),
+            )
+            return rebuilt, True
+
+        response.raise_for_status()
+        if cache is None:
+            return response, False
+        cache.record(hit=False)
+        cache.put(
+            url,
+            final_url=str(response.url),
+            content_type=response.headers.get("content-type", ""),
+            body=response.content,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        return response, False
+
+    async def fetch_page(self, url: str) -> tuple[str, dict[str, Any]]:
+        """Fetch a web page and extract metadata, retrying with exponential backoff.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Tuple of (html_content, metadata_dict)
+
+        Raises:
+            httpx.HTTPError: If all fetch attempts fail
+        """
+        max_retries = self.config.max_retries
+        retry_delay = 1
+        last_error = None
+
+        for attempt in range(max_retries):
+            try:
+                logger.debug(f"Fetching {url} (attempt {attempt + 1}/{max_retries})")
+                response, not_modified = await self._get(url, self.config.timeout)
+                metadata = page_metadata(url, response)
+                if not_modified:
+                    metadata["not_modified"] = True
+                    logger.info(f"Not modified: {url}")
+                else:
+                    logger.info(f"Fetched {url} ({len(response.text)} bytes)")
+                return response.text, metadata
+
+            except httpx.HTTPError as e:
+                last_error = e
+                logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
+
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 2  # Exponential backoff
+
+        # All retries failed
+        error_msg = f"Failed to fetch {url} after {max_retries} attempts: {last_error}"
+        logger.error(error_msg)
+        raise httpx.HTTPError(error_msg)
+
+    async def process_images(self, html: str, base_url: str, output_dir: Path) -> list[tuple[str, Path]]:
+        """Download a page's images concurrently.
+
+        Args:
+            html: HTML content to parse
+            base_url: Base URL for resolving relative image URLs
+            output_dir: Directory whose images/ subdirectory receives the images
+
+        Returns:
+            List of (original_url, local_path) tuples, in document order
+        """
+        return await self.download_images(find_image_urls(html, base_url), output_dir)
+
+    async def download_images(self, image_urls: list[str], output_dir: Path) -> list[tuple[str, Path]]:
+        """Download images concurrently.
+
+        Args:
+            image_urls: Absolute image URLs
+            output_dir: Directory whose images/ subdirectory receives the images, unless there is an image store
+
+        Returns:
+            List of (original_url, local_path) tuples for the images downloaded, in input order
+        """
+        if not image_urls:
+            return []
+
+        images_dir = output_dir / "images"
+        if self.image_store is None:
+            images_dir.mkdir(parents=True, exist_ok=True)
+
+        paths = await asyncio.gather(*(self._image_task(url, images_dir) for url in image_urls))
+        downloaded = [(url, path) for url, path in zip(image_urls, paths, strict=True) if path]
+        logger.info(f"Downloaded {len(downloaded)} of {len(image_urls)} images")
+        return downloaded
+
+    def _image_task(self, url: str, images_dir: Path) -> "asyncio.Task[Path | None]":
+        key = (url, None if self.image_store else images_dir)
+        task = self._images.get(key)
+        if task is None:
+            task = self._images[key] = asyncio.create_task(self.download_image(url, images_dir))
+        return task
+
+    async def download_image(self, url: str, images_dir: Path) -> Path | None:
+        """Download a single image.
+
+        Args:
+            url: Image URL to download
+            images_dir: Directory to save image, unless there is an image store
+
+        Returns:
+            Path to downloaded image or None if failed
+        """
+        try:
+            if self.image_store:
+                stored = self.image_store.lookup(url)
+                if stored:
+                    return stored
+                # The store keeps the bytes, a cache entry would only hold them twice and crowd out pages
+                response, _ = await self._get(url, self.config.image_timeout, use_cache=False)
+                content_type = response.headers.get("content-type", "")
+                return await asyncio.to_thread(self.image_store.add, url, response.content, content_type)
+
+            response, not_modified = await self._get(url, self.config.image_timeout)
+            local_path = images_dir / image_filename(url, response.headers.get("content-type", ""))
+            if not (not_modified and local_path.exists()):
+                await asyncio.to_thread(local_path.write_bytes, response.content)
+            return local_path
+
+        except Exception as e:
+            logger.warning(f"Failed to download image {url}: {e}")
+            return None
@@ -1,5 +1,6 @@
 """Enhancer module - AI-powered markdown enhancement."""
 
 from .core import enhance_markdown
+from .core import enhance_markdown_async
 
-__all__ = ["enhance_markdown"]
+__all__ = ["enhance_markdown", "enhance_markdown_async"]
@@ -30,6 +30,19 @@ except ImportError:
 def enhance_markdown(markdown: str, context: dict[str, Any]) -> str:
     """Enhance markdown content with AI assistance.
 
+    Args:
+        markdown: Raw markdown content
+        context: Context including metadata about the page
+
+    Returns:
+        Enhanced markdown with frontmatter and improved formatting
+    """
+    return asyncio.run(enhance_markdown_async(markdown, context))
+
+
+async def enhance_markdown_async(markdown: str, context: dict[str, Any]) -> str:
+    """Enhance markdown content with AI assistance, from within a running event loop.
+
     Args:
         markdown: Raw markdown content
         context: Context including metadata about the page
@@ -43,7 +56,7 @@ def enhance_markdown(markdown: str, context: dict[str, Any]) -> str:
     # If Claude Code SDK is available, use it for enhancement
     if CCSDK_AVAILABLE and len(markdown) > 100:
         try:
-            enhanced = asyncio.run(ai_enhance(markdown, context))
+            enhanced = await ai_enhance(markdown, context)
             return frontmatter + enhanced
         except Exception as e:
             logger.warning(f"AI enhancement failed, using basic formatting: {e}")
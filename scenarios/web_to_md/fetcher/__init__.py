@@ -1,5 +1,7 @@
 """Fetcher module - Downloads web pages and extracts metadata."""
 
+from .core import USER_AGENT
 from .core import fetch_page
+from .core import page_metadata
 
-__all__ = ["fetch_page"]
+__all__ = ["fetch_page", "page_metadata", "USER_AGENT"]
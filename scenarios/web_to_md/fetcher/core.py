@@ -9,6 +9,8 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+USER_AGENT = "Mozilla/5.0 (compatible; WebToMd/1.0; +https://github.com/amplifier/web_to_md)"
+
 
 def fetch_page(url: str, timeout: int = 30, max_retries: int = 3) -> tuple[str, dict[str, Any]]:
     """Fetch a web page and extract metadata.
@@ -24,7 +26,7 @@ def fetch_page(url: str, timeout: int = 30, max_retries: int = 3) -> tuple[str,
     Raises:
         httpx.HTTPError: If all fetch attempts fail
     """
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; WebToMd/1.0; +https://github.com/amplifier/web_to_md)"}
+    headers = {"User-Agent": USER_AGENT}
 
     retry_delay = 1
     last_error = None
@@ -36,23 +38,7 @@ def fetch_page(url: str, timeout: int = 30, max_retries: int = 3) -> tuple[str,
             with httpx.Client(timeout=timeout, follow_redirects=True) as client:
                 response = client.get(url, headers=headers)
                 response.raise_for_status()
-
-                # Extract metadata
-                final_url = str(response.url)
-                parsed = urlparse(final_url)
-                metadata = {
-                    "url": final_url,
-                    "original_url": url,
-                    "status_code": response.status_code,
-                    "content_type": response.headers.get("content-type", ""),
-                    "content_length": response.headers.get("content-length"),
-                    "domain": parsed.netloc,
-                    "path": parsed.path,
-                }
-
-                # Try to extract title from headers if present
-                if "content-disposition" in response.headers:
-                    metadata["content_disposition"] = response.headers["content-disposition"]
+                metadata = page_metadata(url, response)
 
                 logger.info(f"Successfully fetched {url} ({len(response.text)} bytes)")
                 return response.text, metadata
@@ -69,3 +55,32 @@ def fetch_page(url: str, timeout: int = 30, max_retries: int = 3) -> tuple[str,
     error_msg = f"Failed to fetch {url} after {max_retries} attempts: {last_error}"
     logger.error(error_msg)
     raise httpx.HTTPError(error_msg)
+
+
+def page_metadata(url: str, response: httpx.Response) -> dict[str, Any]:
+    """Extract page metadata from a successful response.
+
+    Args:
+        url: URL as requested, before redirects
+        response: Response for the page
+
+    Returns:
+        Metadata dict
+    """
+    final_url = str(response.url)
+    parsed = urlparse(final_url)
+    metadata = {
+        "url": final_url,
+        "original_url": url,
+        "status_code": response.status_code,
+        "content_type": response.headers.get("content-type", ""),
+        "content_length": response.headers.get("content-length"),
+        "domain": parsed.netloc,
+        "path": parsed.path,
+    }
+
+    # Try to extract title from headers if present
+    if "content-disposition" in response.headers:
+        metadata["content_disposition"] = response.headers["content-disposition"]
+
+    return metadata
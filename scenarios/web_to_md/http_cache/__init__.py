@@ -0,0 +1,7 @@
+"""HTTP cache module - Conditional GETs for unchanged pages and images."""
+
+from .core import DEFAULT_MAX_BYTES
+from .core import CachedResponse
+from .core import HttpCache
+
+__all__ = ["HttpCache", "CachedResponse", "DEFAULT_MAX_BYTES"]
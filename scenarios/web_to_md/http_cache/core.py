@@ -0,0 +1,160 @@
+"""On-disk HTTP cache - stores response bodies with their validators for conditional GETs."""
+
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    content_type TEXT NOT NULL,
+    final_url TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_last_used ON entries(last_used);
+"""
+
+
+@dataclass
+class CachedResponse:
+    """A stored response and the validators to revalidate it with."""
+
+    url: str
+    final_url: str
+    content_type: str
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that ask the server to answer 304 if the body is unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """SQLite-backed store of response bodies keyed by request URL.
+
+    Only responses carrying an ETag or Last-Modified are stored, since
+    nothing else can be revalidated. When the bodies exceed ``max_bytes``,
+    the least recently used entries are evicted. ``hits`` counts responses
+    answered 304 Not Modified, ``misses`` every other fetch.
+    """
+
+    def __init__(self, db_path: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Open (or create) the cache.
+
+        Args:
+            db_path: Database file, parent directories are created as needed
+            max_bytes: Upper bound for the total size of stored bodies
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Look up the stored response for a URL."""
+        row = self._conn.execute(
+            "SELECT final_url, content_type, body, etag, last_modified FROM entries WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(url, row[0], row[1], row[2], row[3], row[4])
+
+    def put(
+        self,
+        url: str,
+        final_url: str,
+        content_type: str,
+        body: bytes,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> bool:
+        """Store a response; returns False (and drops any old entry) when it has no validators."""
+        if not etag and not last_modified:
+            self.delete(url)
+            return False
+        if len(body) > self.max_bytes:
+            return False
+
+        with self._conn:
+            old = self._conn.execute("SELECT size FROM entries WHERE url = ?", (url,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries"
+                " (url, etag, last_modified, content_type, final_url, body, size, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, content_type, final_url, body, len(body), time.time()),
+            )
+        self._total_bytes += len(body) - (old[0] if old else 0)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+        return True
+
+    def touch(self, url: str) -> None:
+        """Mark an entry as just used (it was revalidated)."""
+        with self._conn:
+            self._conn.execute("UPDATE entries SET last_used = ? WHERE url = ?", (time.time(), url))
+
+    def delete(self, url: str) -> None:
+        with self._conn:
+            old = self._conn.execute("SELECT size FROM entries WHERE url = ?", (url,)).fetchone()
+            if old:
+                self._conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+                self._total_bytes -= old[0]
+
+    def record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters for this run plus on-disk totals."""
+        entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_evictions": self.evictions,
+            "cache_entries": entries,
+            "cache_bytes": self._total_bytes,
+        }
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the bodies fit in 90% of the budget."""
+        target = int(self.max_bytes * 0.9)
+        with self._conn:
+            rows = self._conn.execute("SELECT url, size FROM entries ORDER BY last_used").fetchall()
+            doomed = []
+            for url, size in rows:
+                if self._total_bytes <= target:
+                    break
+                doomed.append((url,))
+                self._total_bytes -= size
+            self._conn.executemany("DELETE FROM entries WHERE url = ?", doomed)
+        self.evictions += len(doomed)
+        logger.debug(f"Evicted {len(doomed)} cached responses from {self.db_path}")
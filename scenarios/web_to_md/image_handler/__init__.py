@@ -1,5 +1,17 @@
 """Image handler module - Downloads and processes images from HTML."""
 
+from .core import find_image_urls
+from .core import image_extension
+from .core import image_filename
+from .core import page_images
 from .core import process_images
+from .core import rewrite_image_refs
 
-__all__ = ["process_images"]
+__all__ = [
+    "process_images",
+    "find_image_urls",
+    "page_images",
+    "image_filename",
+    "image_extension",
+    "rewrite_image_refs",
+]
@@ -2,12 +2,14 @@
 
 import hashlib
 import logging
+import re
 from pathlib import Path
 from urllib.parse import urljoin
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+
+from ..page import Page
 
 logger = logging.getLogger(__name__)
 
@@ -23,10 +25,9 @@ def process_images(html: str, base_url: str, output_dir: Path) -> list[tuple[str
     Returns:
         List of (original_url, local_path) tuples
     """
-    soup = BeautifulSoup(html, "html.parser")
-    images = soup.find_all("img")
+    image_urls = find_image_urls(html, base_url)
 
-    if not images:
+    if not image_urls:
         logger.info("No images found in HTML")
         return []
 
@@ -36,17 +37,7 @@ def process_images(html: str, base_url: str, output_dir: Path) -> list[tuple[str
 
     downloaded = []
 
-    for img in images:
-        src = img.get("src")
-        if not src:
-            continue
-
-        # Convert to string (BeautifulSoup may return list or other types)
-        src_str = str(src) if not isinstance(src, str) else src
-
-        # Resolve relative URLs
-        absolute_url = urljoin(base_url, src_str)
-
+    for absolute_url in image_urls:
         try:
             # Download the image
             local_path = download_image(absolute_url, images_dir)
@@ -56,10 +47,121 @@ def process_images(html: str, base_url: str, output_dir: Path) -> list[tuple[str
         except Exception as e:
             logger.warning(f"Failed to download image {absolute_url}: {e}")
 
-    logger.info(f"Downloaded {len(downloaded)} of {len(images)} images")
+    logger.info(f"Downloaded {len(downloaded)} of {len(image_urls)} images")
     return downloaded
 
 
+def find_image_urls(html: str, base_url: str) -> list[str]:
+    """Find the absolute URLs of the images in HTML, each once, in document order.
+
+    Args:
+        html: HTML content to parse
+        base_url: Base URL for resolving relative image URLs
+
+    Returns:
+        List of absolute image URLs
+    """
+    return list(page_images(Page(url=base_url, html=html)))
+
+
+def page_images(page: Page) -> dict[str, list[str]]:
+    """Find the images of a parsed page.
+
+    Args:
+        page: Parsed page
+
+    Returns:
+        Absolute image URL -> src values as written in the page, in document order
+    """
+    images: dict[str, list[str]] = {}
+    for img in page.soup.find_all("img"):
+        src = img.get("src")
+        if not src:
+            continue
+
+        # Convert to string (BeautifulSoup may return list or other types)
+        src_str = str(src) if not isinstance(src, str) else src
+
+        # Resolve relative URLs
+        sources = images.setdefault(urljoin(page.url, src_str), [])
+        if src_str not in sources:
+            sources.append(src_str)
+    return images
+
+
+def rewrite_image_refs(markdown: str, replacements: dict[str, str]) -> str:
+    """Point image references at local copies in a single pass.
+
+    Only link and image targets are rewritten, never text that merely
+    contains a URL.
+
+    Args:
+        markdown: Markdown content
+        replacements: Image URL or src as written in the page -> local reference
+
+    Returns:
+        Markdown with image references replaced
+    """
+    if not replacements:
+        return markdown
+
+    # Link and image targets, ](target) or ](target "title"), matching the known URLs themselves
+    # (longest first) so URLs containing parentheses, like File_(a).png, are replaced whole
+    urls = "|".join(re.escape(url) for url in sorted(replacements, key=len, reverse=True))
+    link_target = re.compile(rf"\]\(({urls})(?=[)\s])")
+
+    return link_target.sub(lambda match: "](" + replacements[match.group(1)], markdown)
+
+
+def image_filename(url: str, content_type: str) -> str:
+    """Local filename for an image: a hash of its URL plus an extension.
+
+    Args:
+        url: Image URL
+        content_type: Content-Type of the image response, used when the URL has no extension
+
+    Returns:
+        Filename such as img_1a2b3c4d.png
+    """
+    # Generate filename from URL hash to avoid collisions
+    url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+    return f"img_{url_hash}.{image_extension(url, content_type)}"
+
+
+def image_extension(url: str, content_type: str) -> str:
+    """File extension for an image, from its URL or else its Content-Type.
+
+    Args:
+        url: Image URL
+        content_type: Content-Type of the image response
+
+    Returns:
+        Extension without the dot, "jpg" when unknown
+    """
+    # Try to get extension from URL or content-type
+    parsed = urlparse(url)
+    path_parts = parsed.path.split("/")
+    if path_parts and "." in path_parts[-1]:
+        ext = path_parts[-1].split(".")[-1].lower()
+        # Validate common image extensions
+        if ext not in ["jpg", "jpeg", "png", "gif", "svg", "webp", "bmp"]:
+            ext = "jpg"  # Default to jpg
+    else:
+        # Try to infer from content-type
+        if "png" in content_type:
+            ext = "png"
+        elif "gif" in content_type:
+            ext = "gif"
+        elif "svg" in content_type:
+            ext = "svg"
+        elif "webp" in content_type:
+            ext = "webp"
+        else:
+            ext = "jpg"  # Default
+
+    return ext
+
+
 def download_image(url: str, images_dir: Path, timeout: int = 10) -> Path | None:
     """Download a single image.
 
@@ -76,33 +178,7 @@ def download_image(url: str, images_dir: Path, timeout: int = 10) -> Path | None
             response = client.get(url)
             response.raise_for_status()
 
-            # Generate filename from URL hash to avoid collisions
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-
-            # Try to get extension from URL or content-type
-            parsed = urlparse(url)
-            path_parts = parsed.path.split("/")
-            if path_parts and "." in path_parts[-1]:
-                ext = path_parts[-1].split(".")[-1].lower()
-                # Validate common image extensions
-                if ext not in ["jpg", "jpeg", "png", "gif", "svg", "webp", "bmp"]:
-                    ext = "jpg"  # Default to jpg
-            else:
-                # Try to infer from content-type
-                content_type = response.headers.get("content-type", "")
-                if "png" in content_type:
-                    ext = "png"
-                elif "gif" in content_type:
-                    ext = "gif"
-                elif "svg" in content_type:
-                    ext = "svg"
-                elif "webp" in content_type:
-                    ext = "webp"
-                else:
-                    ext = "jpg"  # Default
-
-            filename = f"img_{url_hash}.{ext}"
-            local_path = images_dir / filename
+            local_path = images_dir / image_filename(url, response.headers.get("content-type", ""))
 
             # Save the image
             with open(local_path, "wb") as f:
@@ -0,0 +1,8 @@
+"""Image store module - Content-addressed, deduplicated image storage."""
+
+from .core import DEFAULT_SIMILAR_THRESHOLD
+from .core import PIL_AVAILABLE
+from .core import ImageStore
+from .core import perceptual_hash
+
+__all__ = ["ImageStore", "perceptual_hash", "PIL_AVAILABLE", "DEFAULT_SIMILAR_THRESHOLD"]
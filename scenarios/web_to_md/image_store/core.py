@@ -0,0 +1,200 @@
+"""Content-addressed image store - each distinct image is kept once, named by the SHA-256 of its bytes."""
+
+import hashlib
+import io
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from ..image_handler import image_extension
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIMILAR_THRESHOLD = 4
+
+# Perceptual hashing needs Pillow, which is optional
+try:
+    from PIL import Image  # type: ignore
+
+    PIL_AVAILABLE = True
+except ImportError:
+    Image = None  # type: ignore
+    PIL_AVAILABLE = False
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    ext TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    phash INTEGER,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL REFERENCES blobs(digest),
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+def perceptual_hash(content: bytes) -> int | None:
+    """64-bit difference hash (dHash) of an image, None if it can't be decoded.
+
+    Near-identical images (resized, recompressed, CDN variants) have hashes
+    a few bits apart.
+    """
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(content)) as image:
+            pixels = list(image.convert("L").resize((9, 8)).getdata())
+    except Exception:
+        return None
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            value = (value << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return value
+
+
+class ImageStore:
+    """Images stored once by content digest, with an index from image URL to digest.
+
+    A URL in the index whose blob is on disk is never downloaded again, in
+    this run or later ones: stored images do not expire and are not
+    revalidated, so refetching changed images means deleting the store. Bytes already stored under another URL are not
+    stored twice. With ``similar_threshold``, an image whose perceptual hash
+    is within that many bits of a stored image reuses the stored one.
+    """
+
+    def __init__(self, root: Path, similar_threshold: int | None = None, hardlink: bool = False):
+        """Open (or create) the store.
+
+        Args:
+            root: Directory holding the blobs and index.db
+            similar_threshold: Maximum perceptual hash distance treated as the same image,
+                None to dedupe exact bytes only (needs Pillow)
+            hardlink: Have place() hardlink images into page directories instead of referencing the store
+        """
+        root.mkdir(parents=True, exist_ok=True)
+        self.root = root
+        self.hardlink = hardlink
+        if similar_threshold is not None and not PIL_AVAILABLE:
+            logger.warning("Pillow is not installed, near-duplicate image detection is disabled")
+            similar_threshold = None
+        self.similar_threshold = similar_threshold
+        self.downloads = 0
+        self.downloaded_bytes = 0
+        self.index_hits = 0
+        self.duplicates = 0
+        self.similar = 0
+        self.saved_bytes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(root / "index.db", check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def blob_path(self, digest: str, ext: str) -> Path:
+        return self.root / f"{digest}.{ext}"
+
+    def lookup(self, url: str) -> Path | None:
+        """Stored image for a URL seen before, None if it must be downloaded."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT b.digest, b.ext FROM urls u JOIN blobs b ON b.digest = u.digest WHERE u.url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        path = self.blob_path(row[0], row[1])
+        if not path.exists():
+            return None
+        self.index_hits += 1
+        return path
+
+    def add(self, url: str, content: bytes, content_type: str) -> Path:
+        """Store downloaded image bytes (if new) and index the URL.
+
+        Returns:
+            Path of the stored image the URL now refers to
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            self.downloads += 1
+            self.downloaded_bytes += len(content)
+            row = self._conn.execute("SELECT ext FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if row and self.blob_path(digest, row[0]).exists():
+                self.duplicates += 1
+                self.saved_bytes += len(content)
+            else:
+                phash = perceptual_hash(content) if self.similar_threshold is not None else None
+                match = self._find_similar(phash) if phash is not None else None
+                if match:
+                    digest = match
+                    self.similar += 1
+                    self.saved_bytes += len(content)
+                else:
+                    ext = image_extension(url, content_type)
+                    self._write(self.blob_path(digest, ext), content)
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO blobs (digest, ext, size, phash, created_at) VALUES (?, ?, ?, ?, ?)",
+                        (digest, ext, len(content), phash, time.time()),
+                    )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO urls (url, digest, fetched_at) VALUES (?, ?, ?)", (url, digest, time.time())
+            )
+            self._conn.commit()
+            ext = self._conn.execute("SELECT ext FROM blobs WHERE digest = ?", (digest,)).fetchone()[0]
+        return self.blob_path(digest, ext)
+
+    def place(self, path: Path, page_dir: Path) -> Path:
+        """Where a page in ``page_dir`` should reference a stored image.
+
+        The stored file itself, or with ``hardlink`` a hardlink to it in
+        page_dir/images (a copy across filesystems).
+        """
+        if not self.hardlink:
+            return path
+        directory = page_dir / "images"
+        directory.mkdir(parents=True, exist_ok=True)
+        target = directory / path.name
+        if not target.exists():
+            try:
+                os.link(path, target)
+            except OSError:
+                shutil.copy2(path, target)
+        return target
+
+    def stats(self) -> dict[str, int]:
+        """Download and dedupe counters for this run plus disk usage of the store."""
+        with self._lock:
+            blobs, disk_bytes = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        return {
+            "image_downloads": self.downloads,
+            "image_downloaded_bytes": self.downloaded_bytes,
+            "image_index_hits": self.index_hits,
+            "image_duplicates": self.duplicates,
+            "image_similar": self.similar,
+            "image_saved_bytes": self.saved_bytes,
+            "image_blobs": blobs,
+            "image_disk_bytes": disk_bytes,
+        }
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _find_similar(self, phash: int) -> str | None:
+        assert self.similar_threshold is not None
+        for digest, ext, other in self._conn.execute("SELECT digest, ext, phash FROM blobs WHERE phash IS NOT NULL"):
+            if (phash ^ other).bit_count() <= self.similar_threshold and self.blob_path(digest, ext).exists():
+                return digest
+        return None
+
+    def _write(self, path: Path, content: bytes) -> None:
+        # Write then rename, so a crash never leaves a truncated blob under its final name
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(content)
+        tmp.replace(path)
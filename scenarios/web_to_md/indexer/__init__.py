@@ -1,5 +1,6 @@
 """Indexer module - Generates index of saved pages."""
 
 from .core import generate_index
+from .core import scan_pages
 
-__all__ = ["generate_index"]
+__all__ = ["generate_index", "scan_pages"]
@@ -1,13 +1,20 @@
 """Index generation - creates index.md for all saved pages."""
 
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 
 import yaml
 
+from amplifier.utils.file_io import load_manifest
+from amplifier.utils.file_io import save_manifest
+
 logger = logging.getLogger(__name__)
 
+# Per-page records from earlier runs, keyed by path relative to the sites directory
+MANIFEST_NAME = ".index_manifest.json"
+
 
 def generate_index(sites_dir: Path) -> str:
     """Generate markdown index of all saved pages.
@@ -24,30 +31,9 @@ def generate_index(sites_dir: Path) -> str:
 
     # Collect all markdown files by domain
     domains = {}
-
-    for domain_dir in sites_dir.iterdir():
-        if not domain_dir.is_dir():
-            continue
-
-        domain_name = domain_dir.name
-        md_files = list(domain_dir.glob("*.md"))
-
-        if md_files:
-            domains[domain_name] = []
-
-            for md_file in sorted(md_files):
-                # Try to extract metadata from frontmatter
-                metadata = extract_frontmatter(md_file)
-
-                domains[domain_name].append(
-                    {
-                        "file": md_file.name,
-                        "path": md_file.relative_to(sites_dir),
-                        "title": metadata.get("title", md_file.stem),
-                        "url": metadata.get("url", ""),
-                        "retrieved_at": metadata.get("retrieved_at", ""),
-                    }
-                )
+    for key, page in sorted(scan_pages(sites_dir).items()):
+        domain_name, _, file_name = key.partition("/")
+        domains.setdefault(domain_name, []).append({**page, "file": file_name, "path": Path(key)})
 
     # Generate markdown index
     lines = [
@@ -104,6 +90,48 @@ def generate_index(sites_dir: Path) -> str:
     return content
 
 
+def scan_pages(sites_dir: Path) -> dict[str, dict]:
+    """Title, URL and retrieval time of every saved page, keyed by relative path.
+
+    Only pages that are new or whose size or mtime changed since the last scan
+    are read; the rest come from the manifest, which is rewritten when anything
+    changed.
+    """
+    manifest_path = sites_dir / MANIFEST_NAME
+    manifest = load_manifest(manifest_path)
+    pages = {}
+    parsed = 0
+
+    for domain_entry in os.scandir(sites_dir):
+        if not domain_entry.is_dir():
+            continue
+        for entry in os.scandir(domain_entry.path):
+            if not entry.name.endswith(".md") or not entry.is_file():
+                continue
+            key = f"{domain_entry.name}/{entry.name}"
+            stat = entry.stat()
+            signature = [stat.st_mtime_ns, stat.st_size]
+
+            cached = manifest.get(key)
+            if cached and cached.get("signature") == signature:
+                pages[key] = cached
+                continue
+
+            metadata = extract_frontmatter(Path(entry.path))
+            pages[key] = {
+                "signature": signature,
+                "title": str(metadata.get("title", Path(entry.name).stem)),
+                "url": str(metadata.get("url", "")),
+                "retrieved_at": str(metadata.get("retrieved_at", "")),
+            }
+            parsed += 1
+
+    if pages != manifest:
+        save_manifest(manifest_path, pages)
+    logger.debug(f"Index scan: {parsed} of {len(pages)} pages parsed, the rest from the manifest")
+    return pages
+
+
 def extract_frontmatter(md_file: Path) -> dict:
     """Extract YAML frontmatter from markdown file.
 
@@ -1,6 +1,8 @@
 """Main CLI entry point for web_to_md tool."""
 
+import asyncio
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -9,15 +11,25 @@ import click
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from .converter import html_to_markdown
-from .enhancer import enhance_markdown
-from .fetcher import fetch_page
-from .image_handler import process_images
+from .converter import page_to_markdown
+from .crawler import CrawlConfig
+from .crawler import Crawler
+from .enhancer import enhance_markdown_async
+from .http_cache import DEFAULT_MAX_BYTES
+from .http_cache import HttpCache
+from .image_handler import page_images
+from .image_handler import rewrite_image_refs
+from .image_store import DEFAULT_SIMILAR_THRESHOLD
+from .image_store import ImageStore
 from .indexer import generate_index
 from .organizer import get_domain_dir
+from .organizer import page_path
 from .organizer import save_page
+from .page import CpuTimer
+from .page import Page
 from .state import WebToMdState
-from .validator import validate_content
+from .validator import ValidationResult
+from .validator import validate_page
 
 # Try to import amplifier utilities
 try:
@@ -33,70 +45,105 @@ except ImportError:
     paths = None  # type: ignore
 
 
-def process_url(url: str, output_dir: Path, state: WebToMdState) -> bool:
+def prepare_page(html: str, url: str, timer: CpuTimer) -> tuple[str, dict[str, list[str]], ValidationResult]:
+    """Parse a page once and derive its images, markdown and validation from that one tree.
+
+    Args:
+        html: Raw HTML of the page
+        url: URL of the page
+        timer: Receives the CPU time of each stage
+
+    Returns:
+        Tuple of (markdown, images as absolute URL -> src values, validation result)
+    """
+    page = Page(url=url, html=html)
+    with timer.measure("parse", url):
+        _ = page.soup  # Parse now, so parsing is timed on its own
+    with timer.measure("images", url):
+        images = page_images(page)  # Before conversion, which prunes the tree
+    with timer.measure("convert", url):
+        markdown = page_to_markdown(page)
+    with timer.measure("validate", url):
+        validation = validate_page(page, markdown)
+    return markdown, images, validation
+
+
+async def process_url(
+    url: str, output_dir: Path, state: WebToMdState, crawler: Crawler, timer: CpuTimer | None = None
+) -> bool:
     """Process a single URL.
 
     Args:
         url: URL to process
         output_dir: Output directory for files
         state: State manager
+        crawler: Crawler shared by all URLs of the run
+        timer: Receives per-stage CPU time (default: not reported)
 
     Returns:
         True if successful, False otherwise
     """
     try:
-        logger.info(f"\n{'=' * 60}")
         logger.info(f"Processing: {url}")
-        logger.info(f"{'=' * 60}")
 
         # Step 1: Fetch HTML and metadata
-        logger.info("Step 1/7: Fetching page...")
-        html, metadata = fetch_page(url)
-
-        # Step 2: Convert to markdown
-        logger.info("Step 2/7: Converting to markdown...")
-        markdown = html_to_markdown(html, url)
-
-        # Step 2.5: Validate content (check for paywalls/auth walls)
-        logger.info("Step 2.5/7: Validating content...")
-        validation_result = validate_content(html, markdown, url)
+        logger.debug(f"Step 1/7: Fetching page {url}")
+        html, metadata = await crawler.fetch_page(url)
+
+        # Unchanged since the last run: keep the page and images saved then
+        if metadata.get("not_modified") and page_path(url, output_dir).exists():
+            state.mark_processed(url)
+            logger.info(f"✓ Unchanged, kept: {page_path(url, output_dir)}")
+            return True
+
+        # Step 2: Parse once, convert to markdown and validate content (check for paywalls/auth walls)
+        # in a worker thread, so a multi-megabyte page doesn't stall every other page's I/O
+        logger.debug(f"Step 2/7: Converting and validating {url}")
+        timer = timer or CpuTimer()
+        markdown, images, validation_result = await asyncio.to_thread(prepare_page, html, url, timer)
         if not validation_result.is_valid:
-            logger.error(f"✗ Content validation failed: {validation_result.reason}")
+            logger.error(f"✗ Content validation failed for {url}: {validation_result.reason}")
             logger.error("  This page appears to be behind a paywall or requires authentication.")
             logger.error(f"  Detected pattern: {validation_result.detected_pattern}")
             state.mark_failed(url, f"Content validation failed: {validation_result.reason}")
             return False
 
         # Step 3: Process images
-        logger.info("Step 3/7: Processing images...")
+        logger.debug(f"Step 3/7: Processing images {url}")
         domain_dir = get_domain_dir(url, output_dir)
-        image_mappings = process_images(html, url, domain_dir)
+        image_mappings = await crawler.download_images(list(images), domain_dir)
 
         # Step 4: Enhance markdown with AI
-        logger.info("Step 4/7: Enhancing markdown...")
+        logger.debug(f"Step 4/7: Enhancing markdown {url}")
         # Add metadata for enhancement
         metadata["title"] = extract_title_from_markdown(markdown)
-        enhanced_markdown = enhance_markdown(markdown, metadata)
+        enhanced_markdown = await enhance_markdown_async(markdown, metadata)
 
         # Step 5: Update image references
         if image_mappings:
-            logger.info("Step 5/7: Updating image references...")
-            for original_url, local_path in image_mappings:
-                # Convert to relative path from markdown file location
-                relative_path = f"images/{local_path.name}"
-                enhanced_markdown = enhanced_markdown.replace(original_url, relative_path)
+            logger.debug(f"Step 5/7: Updating image references {url}")
+            with timer.measure("rewrite images", url):
+                # Relative path from the markdown file, for the absolute URL and each src as written
+                replacements = {}
+                for original_url, local_path in image_mappings:
+                    if crawler.image_store:
+                        local_path = crawler.image_store.place(local_path, domain_dir)
+                    relative_path = Path(os.path.relpath(local_path, domain_dir)).as_posix()
+                    for reference in [original_url, *images[original_url]]:
+                        replacements[reference] = relative_path
+                enhanced_markdown = rewrite_image_refs(enhanced_markdown, replacements)
         else:
-            logger.info("Step 5/7: No images to update")
+            logger.debug(f"Step 5/7: No images to update {url}")
 
         # Step 6: Save the page
-        logger.info("Step 6/7: Saving page...")
+        logger.debug(f"Step 6/7: Saving page {url}")
         saved_path = save_page(url, enhanced_markdown, output_dir)
 
         # Step 7: Mark as processed
-        logger.info("Step 7/7: Updating state...")
+        logger.debug(f"Step 7/7: Updating state {url}")
         state.mark_processed(url)
 
-        logger.info(f"✓ Successfully saved to: {saved_path}")
+        logger.info(f"✓ Saved {url} to: {saved_path}")
         return True
 
     except Exception as e:
@@ -105,6 +152,41 @@ def process_url(url: str, output_dir: Path, state: WebToMdState) -> bool:
         return False
 
 
+async def process_urls(
+    urls: list[str],
+    output_dir: Path,
+    state: WebToMdState,
+    config: CrawlConfig,
+    concurrency: int,
+    timer: CpuTimer | None = None,
+) -> tuple[int, int]:
+    """Process URLs with up to ``concurrency`` pages in flight.
+
+    Args:
+        urls: URLs to process
+        output_dir: Output directory for files
+        state: State manager, its HTTP cache and image store (if any) are used by the crawler
+        config: Connection limits shared by every page and image request
+        concurrency: Maximum pages in flight
+        timer: Receives per-stage CPU time
+
+    Returns:
+        Tuple of (processed_count, failed_count)
+    """
+    pages = asyncio.Semaphore(max(1, concurrency))
+
+    async with Crawler(config, cache=state.cache, image_store=state.image_store) as crawler:
+
+        async def run(url: str) -> bool:
+            async with pages:
+                return await process_url(url, output_dir, state, crawler, timer)
+
+        results = await asyncio.gather(*(run(url) for url in urls))
+
+    processed = sum(results)
+    return processed, len(results) - processed
+
+
 def extract_title_from_markdown(markdown: str) -> str:
     """Extract title from markdown content.
 
@@ -125,8 +207,34 @@ def extract_title_from_markdown(markdown: str) -> str:
 @click.option("--url", "-u", multiple=True, required=True, help="URL(s) to convert")
 @click.option("--output", "-o", type=click.Path(path_type=Path), help="Output directory")
 @click.option("--resume", is_flag=True, help="Resume from saved state")
+@click.option("--concurrency", "-c", type=click.IntRange(min=1), default=8, help="Pages processed at once (default: 8)")
+@click.option("--per-host", type=click.IntRange(min=1), default=4, help="Requests in flight to one host (default: 4)")
+@click.option("--host-interval", type=float, default=0.2, help="Seconds between requests to one host (default: 0.2)")
+@click.option("--no-cache", is_flag=True, help="Always download in full, without conditional requests")
+@click.option(
+    "--cache-size", type=click.IntRange(min=1), default=DEFAULT_MAX_BYTES // (1024 * 1024), help="HTTP cache size in MB"
+)
+@click.option(
+    "--image-links",
+    type=click.Choice(["relative", "hardlink"]),
+    default="relative",
+    help="Reference stored images by relative path, or hardlink them into each domain's images/",
+)
+@click.option("--dedupe-similar", is_flag=True, help="Store near-identical images once (needs Pillow)")
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
-def main(url: tuple, output: Path | None, resume: bool, verbose: bool):
+def main(
+    url: tuple,
+    output: Path | None,
+    resume: bool,
+    concurrency: int,
+    per_host: int,
+    host_interval: float,
+    no_cache: bool,
+    cache_size: int,
+    image_links: str,
+    dedupe_similar: bool,
+    verbose: bool,
+):
     """Convert web pages to markdown with AI enhancement.
 
     Examples:
@@ -134,6 +242,7 @@ def main(url: tuple, output: Path | None, resume: bool, verbose: bool):
         web_to_md --url https://example.com --url https://another.com
         web_to_md --url https://example.com --output ./my-sites
         web_to_md --url https://example.com --resume
+        web_to_md --url https://a.com/1 --url https://b.com/2 --concurrency 16 --per-host 2
     """
     # Set up logging
     if verbose:
@@ -161,29 +270,34 @@ def main(url: tuple, output: Path | None, resume: bool, verbose: bool):
         state_dir = paths.data_dir / "web_to_md"
         state_dir.mkdir(parents=True, exist_ok=True)
         state_file = state_dir / "state.json"
+        cache_file = state_dir / "http_cache.db"
     else:
         state_file = output_dir / ".web_to_md_state.json"
-
-    state = WebToMdState(state_file)
-
-    # Process URLs
-    urls_to_process = list(url)
-    processed_count = 0
-    failed_count = 0
+        cache_file = output_dir / ".web_to_md_cache.db"
+
+    cache = None if no_cache else HttpCache(cache_file, max_bytes=cache_size * 1024 * 1024)
+    image_store = ImageStore(
+        output_dir / "_images",
+        similar_threshold=DEFAULT_SIMILAR_THRESHOLD if dedupe_similar else None,
+        hardlink=image_links == "hardlink",
+    )
+    state = WebToMdState(state_file, cache=cache, image_store=image_store)
+
+    # Process URLs, skipping those already processed (for resume)
+    urls_to_process = []
     skipped_count = 0
-
-    for url_item in urls_to_process:
-        # Check if already processed (for resume)
+    for url_item in dict.fromkeys(url):
         if resume and state.is_processed(url_item):
             logger.info(f"Skipping (already processed): {url_item}")
             skipped_count += 1
-            continue
-
-        # Process the URL
-        if process_url(url_item, output_dir, state):
-            processed_count += 1
         else:
-            failed_count += 1
+            urls_to_process.append(url_item)
+
+    config = CrawlConfig(per_host_connections=per_host, host_interval=host_interval)
+    timer = CpuTimer()
+    processed_count, failed_count = asyncio.run(
+        process_urls(urls_to_process, output_dir, state, config, concurrency, timer)
+    )
 
     # Generate index
     if processed_count > 0 or (resume and state.processed_urls):
@@ -205,6 +319,18 @@ def main(url: tuple, output: Path | None, resume: bool, verbose: bool):
 
     stats = state.get_stats()
     logger.info(f"  Total in state: {stats['total']} ({stats['processed']} successful, {stats['failed']} failed)")
+    if cache:
+        logger.info(f"  HTTP cache: {stats['cache_hits']} not modified, {stats['cache_misses']} downloaded")
+        cache.close()
+    logger.info(
+        f"  Images: {stats['image_downloads']} downloaded, {stats['image_index_hits']} reused from the store, "
+        f"{stats['image_duplicates']} duplicate and {stats['image_similar']} near-identical; "
+        f"{stats['image_blobs']} stored in {stats['image_disk_bytes'] / 1024 / 1024:.1f} MB, "
+        f"{stats['image_saved_bytes'] / 1024 / 1024:.1f} MB not stored twice"
+    )
+    image_store.close()
+    for line in timer.report():
+        logger.info(f"  {line}")
     logger.info(f"{'=' * 60}")
 
     # Exit with error code if any failures
@@ -51,17 +51,11 @@ def save_page(url: str, content: str, base_dir: Path) -> Path:
     Returns:
         Path to saved file
     """
-    # Get domain directory
-    domain_dir = get_domain_dir(url, base_dir)
-
-    # Generate filename from URL
-    filename = url_to_filename(url)
-
     # Full path for the file
-    file_path = domain_dir / filename
+    file_path = page_path(url, base_dir)
 
     # Ensure directory exists
-    domain_dir.mkdir(parents=True, exist_ok=True)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Save the file
     write_file(file_path, content)
@@ -70,6 +64,19 @@ def save_page(url: str, content: str, base_dir: Path) -> Path:
     return file_path
 
 
+def page_path(url: str, base_dir: Path) -> Path:
+    """Get the path a page is saved to.
+
+    Args:
+        url: Original URL of the page
+        base_dir: Base directory for sites
+
+    Returns:
+        Path of the page's markdown file
+    """
+    return get_domain_dir(url, base_dir) / url_to_filename(url)
+
+
 def get_domain_dir(url: str, base_dir: Path) -> Path:
     """Get domain-based directory for a URL.
 
@@ -0,0 +1,8 @@
+"""Page module - Parse-once page model and per-stage CPU timing."""
+
+from .core import PARSER
+from .core import CpuTimer
+from .core import Page
+from .core import make_soup
+
+__all__ = ["Page", "CpuTimer", "make_soup", "PARSER"]
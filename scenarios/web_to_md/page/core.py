@@ -0,0 +1,82 @@
+"""Page model - the one parsed DOM a page's conversion, validation and image extraction share."""
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from functools import cached_property
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+# lxml builds the tree several times faster than the pure-Python parser
+try:
+    import lxml  # type: ignore  # noqa: F401
+
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+
+def make_soup(html: str) -> BeautifulSoup:
+    """Parse HTML with the fastest available parser."""
+    return BeautifulSoup(html, PARSER)
+
+
+@dataclass
+class Page:
+    """A fetched page, parsed at most once.
+
+    The converter removes elements from ``soup``, so read anything else you
+    need from it (images, for instance) before converting.
+    """
+
+    url: str
+    html: str
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        """The parsed DOM, built on first access."""
+        return make_soup(self.html)
+
+    @cached_property
+    def html_lower(self) -> str:
+        """Lowercased raw HTML, for case-insensitive pattern checks."""
+        return self.html.lower()
+
+
+@dataclass
+class CpuTimer:
+    """CPU seconds spent in each pipeline stage, summed over pages.
+
+    Uses the calling thread's CPU clock, so time another page spends on the
+    event loop while this one waits does not count.
+    """
+
+    totals: dict[str, float] = field(default_factory=dict)
+    slowest: dict[str, tuple[float, str]] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @contextmanager
+    def measure(self, stage: str, url: str) -> Iterator[None]:
+        started = time.thread_time()
+        try:
+            yield
+        finally:
+            seconds = time.thread_time() - started
+            with self._lock:
+                self.totals[stage] = self.totals.get(stage, 0.0) + seconds
+                if seconds > self.slowest.get(stage, (0.0, ""))[0]:
+                    self.slowest[stage] = (seconds, url)
+
+    def report(self) -> list[str]:
+        """One line per stage: total CPU time and the page that took longest."""
+        lines = []
+        for stage, total in self.totals.items():
+            seconds, url = self.slowest.get(stage, (0.0, ""))
+            lines.append(f"{stage}: {total:.2f}s CPU (slowest {seconds:.2f}s, {url})")
+        return lines
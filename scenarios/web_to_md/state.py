@@ -5,19 +5,26 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
+from .http_cache import HttpCache
+from .image_store import ImageStore
+
 logger = logging.getLogger(__name__)
 
 
 class WebToMdState:
     """Manages state for web_to_md conversion sessions."""
 
-    def __init__(self, state_file: Path):
+    def __init__(self, state_file: Path, cache: HttpCache | None = None, image_store: ImageStore | None = None):
         """Initialize state manager.
 
         Args:
             state_file: Path to state persistence file
+            cache: HTTP cache of the run, whose hit/miss counters are included in the stats
+            image_store: Image store of the run, whose download counts and disk usage are included in the stats
         """
         self.state_file = state_file
+        self.cache = cache
+        self.image_store = image_store
         self.processed_urls: set[str] = set()
         self.failed_urls: dict[str, str] = {}  # url -> error message
         self.session_start = datetime.now().isoformat()
@@ -93,10 +100,16 @@ class WebToMdState:
         """Get processing statistics.
 
         Returns:
-            Dictionary with processing stats
+            Dictionary with processing stats, plus cache_* counters when an HTTP cache is attached
+            and image_* counters when an image store is attached
         """
-        return {
+        stats = {
             "processed": len(self.processed_urls),
             "failed": len(self.failed_urls),
             "total": len(self.processed_urls) + len(self.failed_urls),
         }
+        if self.cache:
+            stats.update(self.cache.stats())
+        if self.image_store:
+            stats.update(self.image_store.stats())
+        return stats
@@ -3,5 +3,6 @@
 from .core import ContentValidationError
 from .core import ValidationResult
 from .core import validate_content
+from .core import validate_page
 
-__all__ = ["validate_content", "ValidationResult", "ContentValidationError"]
+__all__ = ["validate_content", "validate_page", "ValidationResult", "ContentValidationError"]
@@ -1,8 +1,11 @@
 """Content validation core functionality."""
 
 import logging
+import re
 from dataclasses import dataclass
 
+from ..page import Page
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +45,10 @@ PAYWALL_PATTERNS = [
     "exclusive content",
 ]
 
+# All paywall patterns, and auth-related class names, each found in one pass over the HTML
+_PAYWALL_RE = re.compile("|".join(re.escape(pattern) for pattern in PAYWALL_PATTERNS))
+_AUTH_CLASS_RE = re.compile(r"""class=(["'])(?:login|signin|signup|paywall|auth-wall)\1""")
+
 
 def validate_content(html: str, markdown: str, url: str) -> ValidationResult:
     """Validate that content is accessible and not behind a paywall.
@@ -57,19 +64,29 @@ def validate_content(html: str, markdown: str, url: str) -> ValidationResult:
     Raises:
         ContentValidationError: If content is behind paywall/auth wall
     """
+    return validate_page(Page(url=url, html=html), markdown)
+
+
+def validate_page(page: Page, markdown: str) -> ValidationResult:
+    """Validate that a parsed page is accessible and not behind a paywall.
+
+    Args:
+        page: Parsed page (only its raw HTML is checked)
+        markdown: Converted markdown content
+
+    Returns:
+        ValidationResult indicating if content is valid
+    """
     # Check for paywall patterns in HTML
-    html_lower = html.lower()
+    html_lower = page.html_lower
+    found = {match.group(0) for match in _PAYWALL_RE.finditer(html_lower)}
     for pattern in PAYWALL_PATTERNS:
-        if pattern in html_lower:
+        if pattern in found:
             return ValidationResult(is_valid=False, reason=f"Paywall detected: '{pattern}'", detected_pattern=pattern)
 
     # Check for common auth wall indicators in HTML structure
     # Count occurrences of auth-related class names in HTML
-    auth_class_patterns = ["login", "signin", "signup", "paywall", "auth-wall"]
-    auth_indicator_count = sum(
-        html_lower.count(f'class="{pattern}"') + html_lower.count(f"class='{pattern}'")
-        for pattern in auth_class_patterns
-    )
+    auth_indicator_count = sum(1 for _ in _AUTH_CLASS_RE.finditer(html_lower))
 
     # Check if there are multiple auth indicators (suggests auth wall)
     if auth_indicator_count >= 3:
@@ -0,0 +1,169 @@
+"""Tests for concurrent article processing in ArticleProcessor."""
+
+import asyncio
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+
+import pytest
+
+import amplifier.knowledge_synthesis.article_processor as article_processor
+from amplifier.content_loader import ContentItem
+from amplifier.knowledge_synthesis.article_processor import ArticleProcessor
+from amplifier.knowledge_synthesis.article_processor import ProcessingStatusStore
+
+
+@dataclass
+class FakeExtraction:
+    concepts: list = field(default_factory=lambda: [{"name": "concept"}])
+    relationships: list = field(default_factory=list)
+    key_insights: list = field(default_factory=lambda: ["insight"])
+    code_patterns: list = field(default_factory=list)
+
+
+class FakeExtractor:
+    """Unified extractor whose latency is set per article."""
+
+    def __init__(self, delays: dict[str, float]):
+        self.delays = delays
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def extract_from_text(self, text, title, source, document_type):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays[source])
+        finally:
+            self.in_flight -= 1
+        return FakeExtraction()
+
+
+def make_processor(temp_dir: Path, delays: dict[str, float], monkeypatch) -> tuple[ArticleProcessor, FakeExtractor]:
+    monkeypatch.setattr(article_processor, "truncate_to_tokens", lambda text: (text, 1, 1))
+    extractor = FakeExtractor(delays)
+    processor = ArticleProcessor(
+        extractor=extractor,  # type: ignore[arg-type]
+        status_store=ProcessingStatusStore(temp_dir / "status"),
+        use_focused_extractors=False,
+    )
+
+    async def classify(text, title=""):
+        return "general"
+
+    monkeypatch.setattr(processor, "_classify_document", classify)
+    monkeypatch.setattr(processor, "_save_extraction_data", lambda article_id, data: None)
+    return processor, extractor
+
+
+def make_articles(count: int) -> list[ContentItem]:
+    return [
+        ContentItem(content_id=f"a{i}", title=f"Article {i}", content="text", source_path=f"a{i}.md", format="md")
+        for i in range(count)
+    ]
+
+
+def test_commits_in_input_order_with_articles_in_flight(temp_dir, monkeypatch):
+    """The slow first article finishes last but is still committed first."""
+    articles = make_articles(4)
+    processor, extractor = make_processor(temp_dir, {"a0": 0.2, "a1": 0.01, "a2": 0.01, "a3": 0.01}, monkeypatch)
+    committed = []
+
+    def on_complete(item, status):
+        committed.append(item.content_id)
+
+    statuses = asyncio.run(processor.process_articles(articles, concurrency=3, on_complete=on_complete))
+
+    assert committed == ["a0", "a1", "a2", "a3"]
+    assert [s.article_id for s in statuses] == committed
+    assert all(s.is_complete for s in statuses)
+    assert extractor.max_in_flight == 3
+
+
+def test_cancellation_saves_started_articles_only(temp_dir, monkeypatch):
+    """Cancelled in-flight articles are saved as failed, unstarted ones are left alone."""
+    articles = make_articles(4)
+    processor, _ = make_processor(temp_dir, {"a0": 0.01, "a1": 10, "a2": 10, "a3": 10}, monkeypatch)
+
+    async def run_and_cancel():
+        task = asyncio.create_task(processor.process_articles(articles, concurrency=2))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(run_and_cancel())
+
+    store = ProcessingStatusStore(temp_dir / "status")
+    finished = store.load_status("a0")
+    assert finished is not None
+    assert finished.is_complete
+    # a2 took a0's slot, a3 never started
+    for article_id in ("a1", "a2"):
+        cancelled = store.load_status(article_id)
+        assert cancelled is not None
+        assert not cancelled.is_complete
+        assert {r.status for r in cancelled.processor_results.values()} == {"failed"}
+    assert store.load_status("a3") is None
+
+
+def test_failing_article_does_not_stop_the_batch(temp_dir, monkeypatch):
+    """Extraction and save errors fail only their own article, the rest are committed in order."""
+    articles = make_articles(4)
+    processor, _ = make_processor(temp_dir, {"a0": 0.01, "a1": 0.01, "a2": 0.01, "a3": 0.01}, monkeypatch)
+
+    def save_extraction_data(article_id, data):
+        if article_id == "a2":
+            raise OSError("disk full")
+
+    # The unified extractor's own errors are caught per processor, fail before it instead
+    async def classify(text, title=""):
+        if title == "Article 1":
+            raise RuntimeError("classifier crashed")
+        return "general"
+
+    monkeypatch.setattr(processor, "_save_extraction_data", save_extraction_data)
+    monkeypatch.setattr(processor, "_classify_document", classify)
+    committed = []
+
+    def on_complete(item, status):
+        committed.append(item.content_id)
+        if item.content_id == "a3":
+            raise ValueError("callback crashed")
+
+    statuses = asyncio.run(processor.process_articles(articles, concurrency=2, on_complete=on_complete))
+
+    assert committed == ["a0", "a1", "a2", "a3"]
+    assert [s.is_complete for s in statuses] == [True, False, False, True]
+    store = ProcessingStatusStore(temp_dir / "status")
+    for article_id, error in (("a1", "classifier crashed"), ("a2", "disk full")):
+        failed = store.load_status(article_id)
+        assert failed is not None
+        assert not failed.is_complete
+        assert all(error in (r.error_message or "") for r in failed.processor_results.values())
+    assert processor.stats["failed"] == 2
+
+
+def test_finished_articles_waiting_on_a_slow_head_are_bounded(temp_dir, monkeypatch):
+    """Fast articles stop starting once the window ahead of the uncommitted head is full."""
+    articles = make_articles(20)
+    delays = {article.content_id: 0.01 for article in articles}
+    processor, extractor = make_processor(temp_dir, {**delays, "a0": 0.3}, monkeypatch)
+    started, committed, waiting = [], [], []
+
+    original = extractor.extract_from_text
+
+    async def extract_from_text(text, title, source, document_type):
+        started.append(source)
+        waiting.append(len(started) - len(committed))
+        return await original(text, title, source, document_type)
+
+    monkeypatch.setattr(extractor, "extract_from_text", extract_from_text)
+
+    def on_complete(item, status):
+        committed.append(item.content_id)
+
+    asyncio.run(processor.process_articles(articles, concurrency=2, on_complete=on_complete))
+
+    assert committed == [article.content_id for article in articles]
+    assert max(waiting) == 2 * article_processor.REORDER_WINDOW
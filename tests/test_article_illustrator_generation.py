@@ -0,0 +1,93 @@
+"""Tests for concurrent, budgeted image generation in article_illustrator."""
+
+import asyncio
+import time
+
+import pytest
+
+# The scenario logs through amplifier's rich-based logger
+pytest.importorskip("rich")
+
+from scenarios.article_illustrator.image_generation import ImageGenerator  # noqa: E402
+from scenarios.article_illustrator.models import IllustrationPoint  # noqa: E402
+from scenarios.article_illustrator.models import ImagePrompt  # noqa: E402
+
+
+class FakeClient:
+    def __init__(self, seconds: float, cost: float):
+        self.seconds = seconds
+        self.cost = cost
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self.closed = False
+
+    async def check_availability(self) -> bool:
+        return True
+
+    def estimate_cost(self, params=None) -> float:
+        return self.cost
+
+    async def generate(self, prompt, output_path, params=None):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.seconds)
+        self.in_flight -= 1
+        output_path.write_bytes(b"png")
+        return f"file://{output_path}", self.cost
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def make_prompts(count: int) -> list[ImagePrompt]:
+    point = IllustrationPoint(
+        section_title="Intro",
+        section_index=0,
+        line_number=1,
+        context_before="",
+        context_after="",
+        importance="high",
+        suggested_placement="after_intro",
+    )
+    return [
+        ImagePrompt(illustration_id=f"ill-{n}", point=point, base_prompt=f"Scene {n}", full_prompt=f"Scene {n}")
+        for n in range(count)
+    ]
+
+
+def test_prompts_run_concurrently_within_per_api_limits(temp_dir):
+    generator = ImageGenerator(apis=[], output_dir=temp_dir, api_concurrency={"dalle": 2, "gptimage": 3})
+    dalle, gptimage = FakeClient(seconds=0.1, cost=0.04), FakeClient(seconds=0.05, cost=0.04)
+    generator.clients = {"dalle": dalle, "gptimage": gptimage}
+    saves = []
+
+    async def save_callback(images, total_cost):
+        saves.append(len(images))
+
+    started = time.monotonic()
+    results = asyncio.run(generator.generate_images(make_prompts(6), save_callback=save_callback))
+    elapsed = time.monotonic() - started
+
+    # One prompt at a time would take 6 x 0.1s; two dalle slots bring it to 3 x 0.1s
+    assert elapsed < 0.5
+    assert (dalle.max_in_flight, gptimage.max_in_flight) == (2, 3)
+    assert [r.illustration_id for r in results] == [f"ill-{n}" for n in range(6)]
+    assert all(r.primary.api == "dalle" and r.alternatives[0].api == "gptimage" for r in results)
+    assert saves == [1, 2, 3, 4, 5, 6]
+    assert generator.total_cost == pytest.approx(0.48)
+    assert dalle.closed and gptimage.closed
+
+
+def test_cost_limit_stops_new_requests_before_it_is_exceeded(temp_dir):
+    generator = ImageGenerator(apis=[], output_dir=temp_dir, cost_limit=0.2, api_concurrency={"gptimage": 4})
+    client = FakeClient(seconds=0.05, cost=0.04)
+    generator.clients = {"gptimage": client}
+
+    results = asyncio.run(generator.generate_images(make_prompts(10)))
+
+    # Four requests start at once; the budget counts them before they finish
+    assert client.calls == 5
+    assert len(results) == 5
+    assert generator.total_cost == pytest.approx(0.2)
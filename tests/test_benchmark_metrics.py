@@ -0,0 +1,38 @@
+"""Tests for the benchmark perf gate."""
+
+from amplifier.benchmarks.metrics import BenchmarkResult
+from amplifier.benchmarks.metrics import find_regressions
+from amplifier.benchmarks.metrics import percentile
+
+
+def make_result(items_per_sec: float, p95_ms: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        name="article_processor",
+        unit="articles",
+        items=10,
+        seconds=10 / items_per_sec,
+        items_per_sec=items_per_sec,
+        peak_rss_mb=100.0,
+        bytes_written=1000,
+        llm_calls=40,
+        llm_errors=0,
+        stages={"extract article": {"count": 10, "p50_ms": p95_ms / 2, "p95_ms": p95_ms}},
+    )
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 50) == 50.0
+    assert percentile([], 95) == 0.0
+
+
+def test_regressions_only_beyond_allowance():
+    baseline = {"article_processor": make_result(items_per_sec=4.0, p95_ms=400.0)}
+
+    assert find_regressions([make_result(3.5, 480.0)], baseline, max_regression=0.25) == []
+
+    problems = find_regressions([make_result(2.0, 600.0)], baseline, max_regression=0.25)
+    assert len(problems) == 2
+    assert "articles/sec" in problems[0]
+    assert "extract article p95 ms" in problems[1]
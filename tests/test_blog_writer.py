@@ -0,0 +1,86 @@
+"""Tests for the blog writer's concurrent reviews and cached style profiles, with stand-ins for the LLM calls."""
+
+import asyncio
+
+import pytest
+
+# The scenario logs through amplifier's rich-based logger
+pytest.importorskip("rich")
+
+from scenarios.blog_writer.main import BlogPostPipeline  # noqa: E402
+from scenarios.blog_writer.state import StateManager  # noqa: E402
+from scenarios.blog_writer.style_extractor import StyleExtractor  # noqa: E402
+from scenarios.blog_writer.style_extractor import StyleProfile  # noqa: E402
+
+
+class CountingExtractor(StyleExtractor):
+    def __init__(self, cache_dir):
+        super().__init__(cache_dir=cache_dir)
+        self.analyses = 0
+
+    async def _analyze_with_ai(self, samples):
+        self.analyses += 1
+        return StyleProfile(
+            tone=f"tone {self.analyses}",
+            vocabulary_level="moderate",
+            sentence_structure="varied",
+            paragraph_length="short",
+            voice="active",
+        )
+
+
+def test_style_profile_reused_until_writings_change(temp_dir):
+    writings = temp_dir / "writings"
+    (writings / "older").mkdir(parents=True)
+    (writings / "post.md").write_text("# Post\n\nShort sentences. Plain words.")
+    (writings / "older" / "note.md").write_text("An older note.")
+    cache_dir = temp_dir / "cache"
+
+    first = CountingExtractor(cache_dir)
+    profile = asyncio.run(first.extract_style(writings))
+    assert first.analyses == 1
+
+    # A new session on the same writings skips the analysis
+    second = CountingExtractor(cache_dir)
+    assert asyncio.run(second.extract_style(writings)) == profile
+    assert second.analyses == 0
+
+    (writings / "older" / "note.md").write_text("An older note, edited.")
+    third = CountingExtractor(cache_dir)
+    assert asyncio.run(third.extract_style(writings))["tone"] == "tone 1"
+    assert third.analyses == 1
+
+
+class SlowReviewer:
+    def __init__(self, delay, review):
+        self.delay = delay
+        self.review = review
+
+    async def review_sources(self, draft, brain_dump, additional_instructions=None, user_feedback_history=None):
+        await asyncio.sleep(self.delay)
+        return self.review
+
+    async def review_style(self, draft, style_profile):
+        await asyncio.sleep(self.delay)
+        return self.review
+
+
+def test_reviews_run_concurrently_and_record_in_order(temp_dir, monkeypatch):
+    state = StateManager(temp_dir / "session")
+    pipeline = BlogPostPipeline(state, style_cache_dir=None)
+    # The style review finishes first, yet the source review is still recorded first
+    monkeypatch.setattr(
+        pipeline, "source_reviewer", SlowReviewer(0.3, {"needs_revision": True, "issues": ["unsupported claim"]})
+    )
+    monkeypatch.setattr(pipeline, "style_reviewer", SlowReviewer(0.1, {"needs_revision": False, "issues": []}))
+
+    async def review():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await pipeline._review_draft()
+        return loop.time() - started
+
+    assert asyncio.run(review()) < 0.38
+    assert state.state.source_review["issues"] == ["unsupported claim"]
+    assert state.state.style_review["needs_revision"] is False
+    assert [entry["type"] for entry in state.state.iteration_history] == ["source_review", "style_review"]
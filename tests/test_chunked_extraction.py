@@ -0,0 +1,116 @@
+"""Tests for splitting long documents into chunks and merging per-chunk extractions."""
+
+import pytest
+
+from amplifier.knowledge_synthesis import chunked_extraction
+from amplifier.knowledge_synthesis.chunked_extraction import chunk_markdown
+from amplifier.knowledge_synthesis.chunked_extraction import merge_items
+from amplifier.knowledge_synthesis.chunked_extraction import split_sections
+
+
+class CharEncoding:
+    """One token per character, so budgets are easy to reason about and no BPE download is needed."""
+
+    def encode(self, text: str) -> list[str]:
+        return list(text)
+
+    def decode(self, tokens: list[str]) -> str:
+        return "".join(tokens)
+
+
+@pytest.fixture(autouse=True)
+def char_tokens(monkeypatch):
+    monkeypatch.setattr(chunked_extraction, "_encoding", CharEncoding)
+
+
+def test_split_sections_starts_each_section_at_a_heading():
+    text = "Intro line\n# One\nbody\n```\n# not a heading\n```\n## Two\nmore\n"
+    assert split_sections(text) == ["Intro line\n", "# One\nbody\n```\n# not a heading\n```\n", "## Two\nmore\n"]
+    assert "".join(split_sections(text)) == text
+
+
+def test_document_within_budget_is_one_chunk():
+    text = "# One\nshort\n"
+    chunks = chunk_markdown(text, max_tokens=len(text), overlap_tokens=4)
+    assert [(c.index, c.text, c.tokens) for c in chunks] == [(0, text, len(text))]
+
+
+def test_chunks_hold_whole_sections_and_overlap():
+    sections = [f"# Section {i}\n" + f"line {i}\n" * 3 for i in range(6)]
+    text = "".join(sections)
+    chunks = chunk_markdown(text, max_tokens=80, overlap_tokens=10)
+
+    assert len(chunks) > 1
+    assert all(chunk.tokens <= 80 for chunk in chunks)
+    assert [chunk.index for chunk in chunks] == list(range(len(chunks)))
+
+    # Each chunk after the first repeats the previous chunk's tail, the rest are whole sections in order
+    bodies = [chunk.body for chunk in chunks]
+    assert chunks[0].overlap == ""
+    assert "".join(bodies) == text
+    for previous, chunk in zip(bodies, chunks[1:], strict=False):
+        assert chunk.overlap == previous[-10:]
+        assert chunk.text == chunk.overlap + chunk.body
+        assert chunk.body.startswith("# Section")
+
+
+def test_an_edit_only_moves_the_chunks_around_it():
+    sections = [f"# Section {i}\n" + f"fact {i * 7919 % 1000}\n" * (i % 5 + 1) for i in range(80)]
+    edited = sections.copy()
+    edited[40] = "# Section 40\nA much longer rewrite of this section.\n" * 2
+
+    before = [chunk.body for chunk in chunk_markdown("".join(sections), max_tokens=200, overlap_tokens=20)]
+    after = [chunk.body for chunk in chunk_markdown("".join(edited), max_tokens=200, overlap_tokens=20)]
+
+    # Greedy packing would shift every later cut; here all but the edited stretch keep their text
+    assert len(before) > 10
+    assert len(set(before) - set(after)) <= 2
+
+
+def test_oversized_section_falls_back_to_paragraphs_then_tokens():
+    paragraph = "word " * 8 + "\n\n"
+    long_paragraph = "x" * 100
+    text = "# Big\n" + paragraph * 3 + long_paragraph
+    chunks = chunk_markdown(text, max_tokens=50, overlap_tokens=0)
+
+    assert all(chunk.tokens <= 50 for chunk in chunks)
+    assert "".join(chunk.text for chunk in chunks) == text
+    assert [chunk.text for chunk in chunks[-2:]] == ["x" * 50, "x" * 50]
+
+
+def test_merge_keeps_best_scored_duplicate_in_first_appearance_order():
+    merged = merge_items(
+        "concepts",
+        [
+            [{"name": "Caching", "importance": 0.4}, {"name": "Latency", "importance": 0.9}],
+            [{"name": "  caching.", "importance": 0.8}, {"name": "", "importance": 1.0}, {"name": "Retries"}],
+        ],
+    )
+    assert merged == [
+        {"name": "  caching.", "importance": 0.8},
+        {"name": "Latency", "importance": 0.9},
+        {"name": "Retries"},
+    ]
+
+
+def test_merge_keys_relationships_patterns_and_plain_items():
+    relationships = merge_items(
+        "relationships",
+        [
+            [{"subject": "Cache", "predicate": "reduces", "object": "Latency", "confidence": 0.5}],
+            [
+                {"subject": "cache", "predicate": "Reduces", "object": "latency!", "confidence": 0.7},
+                {"subject": "Cache", "predicate": "increases", "object": "Memory"},
+                {"subject": "", "predicate": "", "object": ""},
+            ],
+        ],
+    )
+    assert [(r["predicate"], r.get("confidence")) for r in relationships] == [("Reduces", 0.7), ("increases", None)]
+
+    patterns = merge_items("patterns", [[{"code": "P1"}, {"name": "Retry", "code": "P2"}], [{"code": "p1"}]])
+    assert patterns == [{"code": "P1"}, {"name": "Retry", "code": "P2"}]
+
+    assert merge_items("insights", [["Measure first.", "Cache hot paths"], ["measure first"]]) == [
+        "Measure first.",
+        "Cache hot paths",
+    ]
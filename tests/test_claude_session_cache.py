@@ -0,0 +1,104 @@
+"""Tests for response caching across the turns of a ClaudeSession, on the offline stand-in client."""
+
+import asyncio
+
+import pytest
+
+# ClaudeSession builds the SDK's options object even when the offline client answers
+pytest.importorskip("claude_code_sdk")
+
+from amplifier.ccsdk_toolkit.core import offline  # noqa: E402
+from amplifier.ccsdk_toolkit.core import session as session_module  # noqa: E402
+from amplifier.ccsdk_toolkit.core.cache import ResponseCache  # noqa: E402
+from amplifier.ccsdk_toolkit.core.cache import cache_key  # noqa: E402
+from amplifier.ccsdk_toolkit.core.cache import set_response_cache  # noqa: E402
+from amplifier.ccsdk_toolkit.core.models import SessionOptions  # noqa: E402
+from amplifier.ccsdk_toolkit.core.offline import OfflineClaudeClient  # noqa: E402
+from amplifier.ccsdk_toolkit.core.offline import OfflineLLM  # noqa: E402
+from amplifier.ccsdk_toolkit.core.offline import OfflineLLMConfig  # noqa: E402
+from amplifier.ccsdk_toolkit.core.session import ClaudeSession  # noqa: E402
+
+
+class RecordingClient(OfflineClaudeClient):
+    """Offline client that remembers every prompt it was sent, i.e. its conversation history."""
+
+    histories: list[list[str]] = []
+
+    async def __aenter__(self) -> "RecordingClient":
+        self.history: list[str] = []
+        RecordingClient.histories.append(self.history)
+        await super().__aenter__()
+        return self
+
+    async def query(self, prompt: str) -> None:
+        self.history.append(prompt)
+        await super().query(prompt)
+
+
+@pytest.fixture
+def offline_session(temp_dir, monkeypatch):
+    monkeypatch.setenv(offline.BACKEND_ENV, "offline")
+    monkeypatch.setattr(session_module, "get_client_class", lambda: RecordingClient)
+    RecordingClient.histories = []
+    offline.set_offline_llm(OfflineLLM(OfflineLLMConfig(latency="fixed:0", connect_seconds=0, tokens_per_second=0)))
+    cache = ResponseCache(temp_dir / "responses.db")
+    set_response_cache(cache)
+    yield cache
+    set_response_cache(None)
+    offline.set_offline_llm(None)
+    cache.close()
+
+
+def converse(prompts: list[str]) -> list[tuple[str, bool]]:
+    async def run():
+        answers = []
+        async with ClaudeSession(SessionOptions(retry_attempts=1)) as session:
+            for prompt in prompts:
+                response = await session.query(prompt)
+                answers.append((response.content, response.metadata.get("cached", False)))
+        return answers
+
+    return asyncio.run(run())
+
+
+def test_two_turn_conversation_is_replayed_from_cache(offline_session):
+    first = converse(["Name a color.", "Now name a fruit of that color."])
+    assert [cached for _, cached in first] == [False, False]
+    assert RecordingClient.histories == [["Name a color.", "Now name a fruit of that color."]]
+
+    # The same conversation is answered from the cache without starting a client
+    second = converse(["Name a color.", "Now name a fruit of that color."])
+    assert second == [(answer, True) for answer, _ in first]
+    assert len(RecordingClient.histories) == 1
+
+
+def test_live_turn_after_cached_turns_sees_the_conversation(offline_session):
+    first = converse(["Name a color.", "Now name a fruit of that color."])
+
+    # Turn 1 is cached, turn 2 diverges and has to go live
+    diverged = converse(["Name a color.", "Now name a vegetable of that color."])
+    assert diverged[0] == (first[0][0], True)
+    assert diverged[1][1] is False
+    live_prompt = RecordingClient.histories[-1][0]
+    assert "Name a color." in live_prompt
+    assert first[0][0] in live_prompt
+    assert live_prompt.endswith("Now name a vegetable of that color.")
+
+    # The live answer was cached under this conversation, not under a fresh one
+    assert converse(["Name a color.", "Now name a vegetable of that color."]) == [
+        (first[0][0], True),
+        (diverged[1][0], True),
+    ]
+    assert converse(["Now name a vegetable of that color."])[0][1] is False
+
+
+def test_no_cached_turns_after_a_live_one(offline_session):
+    prompts = ["Summarize retries.", "Summarize caching."]
+    converse(prompts)
+    options = SessionOptions()
+    offline_session.discard(cache_key(prompts[0], options.system_prompt, options.max_turns, options.model))
+
+    # Turn 2 is still cached, but the live client must see it to keep its history complete
+    answers = converse(prompts)
+    assert [cached for _, cached in answers] == [False, False]
+    assert RecordingClient.histories[-1] == prompts
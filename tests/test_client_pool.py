@@ -0,0 +1,150 @@
+"""Tests for the pool of warm Claude clients, on the offline stand-in client."""
+
+import asyncio
+import contextlib
+
+import pytest
+
+# Pooled clients build the SDK's options object even when the offline client answers
+pytest.importorskip("claude_code_sdk")
+
+from amplifier.ccsdk_toolkit.core import governor  # noqa: E402
+from amplifier.ccsdk_toolkit.core import offline  # noqa: E402
+from amplifier.ccsdk_toolkit.core.client import query_claude  # noqa: E402
+from amplifier.ccsdk_toolkit.core.governor import LaneConfig  # noqa: E402
+from amplifier.ccsdk_toolkit.core.governor import LLMGovernor  # noqa: E402
+from amplifier.ccsdk_toolkit.core.models import SessionOptions  # noqa: E402
+from amplifier.ccsdk_toolkit.core.offline import OfflineClaudeClient  # noqa: E402
+from amplifier.ccsdk_toolkit.core.offline import OfflineLLM  # noqa: E402
+from amplifier.ccsdk_toolkit.core.offline import OfflineLLMConfig  # noqa: E402
+from amplifier.ccsdk_toolkit.core.pool import ClientPool  # noqa: E402
+from amplifier.ccsdk_toolkit.core.session import ClaudeSession  # noqa: E402
+
+
+class RecordingClient(OfflineClaudeClient):
+    """Offline client that remembers its prompts and dies on any prompt containing "crash"."""
+
+    histories: list[list[str]] = []
+
+    async def __aenter__(self) -> "RecordingClient":
+        self.history: list[str] = []
+        RecordingClient.histories.append(self.history)
+        await super().__aenter__()
+        return self
+
+    async def query(self, prompt: str) -> None:
+        self.history.append(prompt)
+        if "crash" in prompt:
+            raise ConnectionError("CLI exited")
+        await super().query(prompt)
+
+
+@pytest.fixture(autouse=True)
+def offline_client(monkeypatch):
+    monkeypatch.setenv(offline.BACKEND_ENV, "offline")
+    monkeypatch.setattr(offline, "get_client_class", lambda: RecordingClient)
+    RecordingClient.histories = []
+    offline.set_offline_llm(OfflineLLM(OfflineLLMConfig(latency="fixed:0", connect_seconds=0, tokens_per_second=0)))
+    yield
+    offline.set_offline_llm(None)
+
+
+def run_queries(pool: ClientPool, requests: list[tuple[str, str]]) -> None:
+    """Send (system_prompt, prompt) pairs one after another, ignoring failures."""
+
+    async def run():
+        async with pool:
+            for system_prompt, prompt in requests:
+                with contextlib.suppress(ConnectionError):
+                    await pool.query(prompt, system_prompt=system_prompt)
+
+    asyncio.run(run())
+
+
+def test_client_is_reset_and_reused_between_leases():
+    pool = ClientPool(max_size=2)
+    run_queries(pool, [("extract", "first"), ("extract", "second"), ("summarize", "third")])
+
+    # One client per system prompt, cleared before it serves the next lease
+    assert RecordingClient.histories == [["first", "/clear", "second", "/clear"], ["third", "/clear"]]
+    assert (pool.stats.requests, pool.stats.created, pool.stats.reused) == (3, 2, 1)
+
+
+def test_lease_holds_one_client_for_several_queries():
+    async def run():
+        async with ClientPool(max_size=1) as pool:
+            async with pool.lease("chat") as client:
+                await client.query("hello")
+                await client.query("and again")
+            async with pool.lease("chat") as client:
+                await client.query("new conversation")
+
+    asyncio.run(run())
+    assert RecordingClient.histories == [["hello", "and again", "/clear", "new conversation", "/clear"]]
+
+
+def test_dead_client_is_replaced():
+    pool = ClientPool(max_size=1)
+    run_queries(pool, [("extract", "first"), ("extract", "crash"), ("extract", "third")])
+
+    assert RecordingClient.histories == [["first", "/clear", "crash"], ["third", "/clear"]]
+    assert (pool.stats.created, pool.stats.failed) == (2, 1)
+
+
+def test_oldest_idle_client_is_evicted_when_full():
+    pool = ClientPool(max_size=2)
+    run_queries(pool, [("a", "1"), ("b", "2"), ("c", "3"), ("b", "4")])
+
+    # "a" was idle longest and made room for "c"; "b" stayed warm
+    assert [history[0] for history in RecordingClient.histories] == ["1", "2", "3"]
+    assert RecordingClient.histories[1] == ["2", "/clear", "4", "/clear"]
+    assert (pool.stats.created, pool.stats.reused, pool.stats.failed) == (3, 1, 0)
+
+
+def test_clients_are_recycled_after_max_uses_and_idle_timeout():
+    pool = ClientPool(max_size=1, max_uses=2)
+    run_queries(pool, [("extract", str(i)) for i in range(5)])
+    assert [len(history) for history in RecordingClient.histories] == [3, 3, 2]
+
+    RecordingClient.histories = []
+    pool = ClientPool(max_size=1, max_idle_seconds=-1)
+    run_queries(pool, [("extract", "first"), ("extract", "second")])
+    assert RecordingClient.histories == [["first", "/clear"], ["second", "/clear"]]
+    assert pool.stats.reused == 0
+
+
+def test_session_between_turns_and_a_query_do_not_wait_on_each_other(monkeypatch):
+    # One client and one slot: the session keeps its lease between turns while the query queues
+    monkeypatch.setattr(governor, "_governor", LLMGovernor(LaneConfig(initial_concurrency=1, max_concurrency=1)))
+
+    async def conversation():
+        async with ClaudeSession(SessionOptions(retry_attempts=1, use_cache=False)) as session:
+            assert (await session.query("turn 1")).success
+            await asyncio.sleep(0.05)
+            assert (await session.query("turn 2")).success
+
+    async def run():
+        async with ClientPool(max_size=1):
+            query = query_claude("one-off", system_prompt="extract", use_cache=False)
+            await asyncio.wait_for(asyncio.gather(conversation(), query), timeout=5)
+
+    asyncio.run(run())
+    assert RecordingClient.histories == [["turn 1", "turn 2", "/clear"], ["one-off", "/clear"]]
+
+
+@pytest.mark.parametrize("pooled", [True, False])
+def test_query_timeout_starts_once_the_governor_admits_it(monkeypatch, pooled):
+    monkeypatch.setattr(governor, "_governor", LLMGovernor(LaneConfig(initial_concurrency=1, max_concurrency=1)))
+    offline.set_offline_llm(OfflineLLM(OfflineLLMConfig(latency="fixed:0.2", connect_seconds=0, tokens_per_second=0)))
+
+    async def run():
+        async with contextlib.AsyncExitStack() as stack:
+            if pooled:
+                await stack.enter_async_context(ClientPool(max_size=3))
+            # One at a time: the last call queues for 0.4s, longer than its timeout, and still succeeds
+            queries = [query_claude(f"q{n}", system_prompt="extract", use_cache=False, timeout=0.3) for n in range(3)]
+            assert all(await asyncio.gather(*queries))
+            with pytest.raises(TimeoutError):
+                await query_claude("slow", system_prompt="extract", use_cache=False, timeout=0.1)
+
+    asyncio.run(run())
@@ -0,0 +1,97 @@
+"""Tests for the incremental event rollups behind events-summary."""
+
+import json
+from pathlib import Path
+
+from amplifier.knowledge_synthesis.event_rollups import BUCKET_SECONDS
+from amplifier.knowledge_synthesis.event_rollups import EventRollups
+from amplifier.knowledge_synthesis.events import EventEmitter
+
+
+def write_events(path: Path, events: list[dict]) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+def test_catch_up_resumes_from_the_persisted_offset(temp_dir: Path):
+    emitter = EventEmitter(temp_dir / "events.jsonl", flush_interval=0)
+    for i in range(5):
+        emitter.emit("extraction_started", source_id=str(i), stage="extract")
+
+    with EventRollups(temp_dir / "rollups.db") as rollups:
+        assert rollups.catch_up(emitter) == 5
+        assert rollups.catch_up(emitter) == 0
+
+    # A half-written line is left for the next call
+    with open(emitter.path, "a", encoding="utf-8") as f:
+        f.write('{"timestamp": 1.0, "event": "extraction_succeeded"')
+
+    with EventRollups(temp_dir / "rollups.db") as rollups:
+        assert rollups.catch_up(emitter) == 0
+        with open(emitter.path, "a", encoding="utf-8") as f:
+            f.write(', "source_id": "1", "stage": "extract"}\n')
+        assert rollups.catch_up(emitter) == 1
+        assert rollups.summarize().by_type == {"extraction_started": 5, "extraction_succeeded": 1}
+
+
+def test_catch_up_finishes_rotated_segments_without_double_counting(temp_dir: Path):
+    emitter = EventEmitter(temp_dir / "events.jsonl", flush_interval=0, max_bytes=1500, backups=20)
+    with EventRollups(temp_dir / "rollups.db") as rollups:
+        total = 0
+        for batch in range(4):
+            for i in range(30):
+                emitter.emit("content_skipped", source_id=f"{batch}-{i}", data={"reason": f"reason {i % 3}"})
+            # Each batch rotates the log at least once between catch-ups
+            total += rollups.catch_up(emitter)
+        assert len(emitter.segments()) > 4
+
+        assert total == 120
+        summary = rollups.summarize()
+        assert summary.by_type == {"content_skipped": 120}
+        assert summary.skipped_reasons == {"reason 0": 40, "reason 1": 40, "reason 2": 40}
+
+
+def test_last_run_pairs_extraction_durations(temp_dir: Path):
+    path = temp_dir / "events.jsonl"
+    write_events(
+        path,
+        [
+            {"timestamp": 100.0, "event": "sync_started", "stage": "sync"},
+            {"timestamp": 101.0, "event": "extraction_started", "source_id": "a", "stage": "extract"},
+            {"timestamp": 104.0, "event": "extraction_succeeded", "source_id": "a", "stage": "extract"},
+            {"timestamp": 105.0, "event": "extraction_started", "source_id": "b", "stage": "extract"},
+            {"timestamp": 106.0, "event": "extraction_failed", "source_id": "b", "stage": "extract"},
+            {"timestamp": 110.0, "event": "sync_finished", "stage": "sync", "data": {"processed": 1}},
+        ],
+    )
+
+    with EventRollups(temp_dir / "rollups.db") as rollups:
+        rollups.catch_up(EventEmitter(path, flush_interval=0))
+        run = rollups.last_run()
+
+    assert run is not None
+    assert run.duration_s == 10.0
+    assert run.run_summary == {"processed": 1}
+    assert run.by_stage["extract"] == {"count": 4, "failures": 1, "avg_duration": 2.0}
+
+
+def test_summarize_covers_whole_buckets(temp_dir: Path):
+    path = temp_dir / "events.jsonl"
+    base = 10 * BUCKET_SECONDS
+    write_events(
+        path,
+        [
+            {"timestamp": base + 10, "event": "early"},
+            {"timestamp": base + BUCKET_SECONDS + 10, "event": "middle"},
+            {"timestamp": base + 2 * BUCKET_SECONDS + 10, "event": "late"},
+        ],
+    )
+
+    with EventRollups(temp_dir / "rollups.db") as rollups:
+        rollups.catch_up(EventEmitter(path, flush_interval=0))
+        # since and until fall inside the first and second buckets, both of which are included
+        ranged = rollups.summarize(since=base + 20, until=base + BUCKET_SECONDS + 5)
+        assert ranged.by_type == {"early": 1, "middle": 1}
+        on_boundary = rollups.summarize(since=base + BUCKET_SECONDS, until=base + 2 * BUCKET_SECONDS)
+        assert on_boundary.by_type == {"middle": 1}
@@ -0,0 +1,56 @@
+"""Tests for the buffered, rotating knowledge pipeline event log."""
+
+from pathlib import Path
+
+from amplifier.knowledge_synthesis import events
+from amplifier.knowledge_synthesis.events import EventEmitter
+
+
+def test_tail_filters_before_limiting(temp_dir: Path):
+    """tail(n, filter) returns n matches even when they are sparse in the log."""
+    emitter = EventEmitter(temp_dir / "events.jsonl", flush_interval=0)
+    for i in range(200):
+        emitter.emit("extraction_failed" if i % 50 == 0 else "extraction_started", source_id=str(i))
+
+    rows = emitter.tail(n=3, event_filter="extraction_failed")
+
+    assert [ev.source_id for ev in rows] == ["50", "100", "150"]
+
+
+def tick_numbers(events) -> list[int]:
+    numbers = []
+    for ev in events:
+        assert ev.data is not None
+        numbers.append(ev.data["i"])
+    return numbers
+
+
+def test_buffered_events_are_flushed_on_close(temp_dir: Path):
+    """Buffered events reach disk on close and survive rotation into gzip segments."""
+    path = temp_dir / "events.jsonl"
+    with EventEmitter(path, flush_interval=60, max_buffer=10, max_bytes=2000, backups=10) as emitter:
+        for i in range(95):
+            emitter.emit("tick", data={"i": i})
+
+    reader = EventEmitter(path, flush_interval=0, backups=10)
+    assert len(reader.segments()) > 1
+    assert tick_numbers(reader.iter_events()) == list(range(95))
+    assert tick_numbers(reader.tail(2)) == [93, 94]
+
+
+def test_only_buffering_emitters_register_an_exit_hook(temp_dir: Path, monkeypatch):
+    registered = []
+    monkeypatch.setattr(events.atexit, "register", registered.append)
+    monkeypatch.setattr(events.atexit, "unregister", registered.remove)
+    path = temp_dir / "events.jsonl"
+
+    reader = EventEmitter(path)
+    reader.tail(5)
+    reader.close()
+    assert registered == []
+
+    emitter = EventEmitter(path, flush_interval=60)
+    emitter.emit("tick")
+    assert registered == [emitter.close]
+    emitter.close()
+    assert registered == []
@@ -0,0 +1,155 @@
+"""Tests for the focused, combined and hybrid extraction strategies, on the offline stand-in client."""
+
+import asyncio
+import json
+
+import pytest
+
+# The extractors report "Claude SDK not available" without it, even on the offline client
+pytest.importorskip("claude_code_sdk")
+
+from amplifier.ccsdk_toolkit.core import offline  # noqa: E402
+from amplifier.ccsdk_toolkit.core.cache import ResponseCache  # noqa: E402
+from amplifier.ccsdk_toolkit.core.cache import set_response_cache  # noqa: E402
+from amplifier.ccsdk_toolkit.core.client import UsageStats  # noqa: E402
+from amplifier.ccsdk_toolkit.core.client import track_usage  # noqa: E402
+from amplifier.ccsdk_toolkit.core.offline import OfflineLLM  # noqa: E402
+from amplifier.ccsdk_toolkit.core.offline import OfflineLLMConfig  # noqa: E402
+from amplifier.knowledge_synthesis.article_processor import ArticleProcessor  # noqa: E402
+from amplifier.knowledge_synthesis.article_processor import ProcessingStatusStore  # noqa: E402
+from amplifier.knowledge_synthesis.article_processor import StrategyStats  # noqa: E402
+from amplifier.knowledge_synthesis.chunked_extraction import Chunk  # noqa: E402
+from amplifier.knowledge_synthesis.chunked_extraction import ChunkedExtractor  # noqa: E402
+from amplifier.knowledge_synthesis.focused_extractors import EXTRACTION_TYPES  # noqa: E402
+from amplifier.knowledge_synthesis.focused_extractors import FocusedExtractionResult  # noqa: E402
+from amplifier.knowledge_synthesis.focused_extractors import FocusedKnowledgeExtractor  # noqa: E402
+
+COMBINED_PROMPT = "extract its knowledge in four separate sections"
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    monkeypatch.setenv(offline.BACKEND_ENV, "offline")
+    monkeypatch.setenv("AMPLIFIER_LLM_CACHE", "off")
+    stand_in = OfflineLLM(OfflineLLMConfig(latency="fixed:0", connect_seconds=0, tokens_per_second=0))
+    offline.set_offline_llm(stand_in)
+    yield stand_in
+    offline.set_offline_llm(None)
+
+
+def extract(strategy: str) -> tuple[dict[str, FocusedExtractionResult], UsageStats]:
+    async def run():
+        with track_usage() as usage:
+            results = await FocusedKnowledgeExtractor(strategy).extract_all("Caching cuts latency.", "Caching")
+        return results, usage
+
+    return asyncio.run(run())
+
+
+def test_focused_and_combined_strategies_return_every_type(llm):
+    focused, focused_usage = extract("focused")
+    combined, combined_usage = extract("combined")
+
+    assert (focused_usage.calls, combined_usage.calls) == (4, 1)
+    for results in (focused, combined):
+        assert sorted(results) == sorted(EXTRACTION_TYPES)
+        assert all(result.data and not result.error and not result.fallback for result in results.values())
+    assert combined_usage.prompt_tokens < focused_usage.prompt_tokens
+
+
+def test_hybrid_reruns_only_empty_sections(llm):
+    sections = {"concepts": [{"name": "Caching"}], "relationships": [], "insights": ["Measure first"], "patterns": []}
+    llm.add_fixture(COMBINED_PROMPT, json.dumps(sections))
+
+    results, usage = extract("hybrid")
+
+    assert usage.calls == 3
+    assert {name: result.fallback for name, result in results.items()} == {
+        "concepts": False,
+        "relationships": True,
+        "insights": False,
+        "patterns": True,
+    }
+    assert results["concepts"].data == [{"name": "Caching"}]
+    assert results["relationships"].data and results["patterns"].data
+
+
+def test_hybrid_falls_back_to_focused_when_combined_fails(llm):
+    llm.add_fixture(COMBINED_PROMPT, '{"concepts": []}')
+
+    combined, _ = extract("combined")
+    assert all("missing sections" in (result.error or "") for result in combined.values())
+
+    results, usage = extract("hybrid")
+    assert usage.calls == 5
+    assert all(result.fallback and result.data and not result.error for result in results.values())
+
+
+def test_strategy_stats_accounting(temp_dir, llm):
+    processor = ArticleProcessor(status_store=ProcessingStatusStore(temp_dir / "status"), strategy="hybrid")
+    sections = {"concepts": [{"name": "A"}, {"name": "B"}], "relationships": [], "insights": ["C"], "patterns": []}
+    llm.add_fixture(COMBINED_PROMPT, json.dumps(sections))
+    results, usage = extract("hybrid")
+    results["patterns"] = FocusedExtractionResult("patterns", [], 0.0, error="timed out", fallback=True)
+
+    processor._record_strategy(usage, results, elapsed=3.0)
+    processor._record_strategy(
+        UsageStats(calls=0, cached=3, prompt_tokens=0),
+        {name: FocusedExtractionResult(name, [], 0.0) for name in EXTRACTION_TYPES},
+        elapsed=0.0,
+    )
+
+    stats = processor.strategy_stats["hybrid"]
+    assert list(processor.strategy_stats) == ["hybrid"]
+    assert (stats.articles, stats.llm_calls, stats.cached_calls) == (2, 3, 3)
+    assert stats.prompt_tokens == usage.prompt_tokens
+    assert (stats.extracted_items, stats.empty_sections, stats.failed_sections, stats.fallbacks) == (
+        3 + len(results["relationships"].data),
+        4,
+        1,
+        2,
+    )
+    report = stats.to_dict()
+    assert report["calls_per_article"] == 1.5
+    assert report["seconds_per_article"] == 1.5
+    assert StrategyStats().to_dict()["items_per_1k_tokens"] == 0.0
+
+
+@pytest.mark.parametrize("strategy", ["focused", "combined"])
+def test_items_are_reported_while_streaming(llm, strategy):
+    streamed = []
+
+    async def run():
+        extractor = FocusedKnowledgeExtractor(strategy)
+        tasks = extractor.start("Caching cuts latency.", "Caching", on_item=lambda key, item: streamed.append(key))
+        return {name: await task for name, task in tasks.items()}
+
+    results = asyncio.run(run())
+    assert sorted(streamed) == sorted(name for name, result in results.items() for _ in result.data)
+
+
+def test_chunk_whose_overlap_changed_is_answered_from_the_cache(llm, temp_dir, monkeypatch):
+    monkeypatch.setenv("AMPLIFIER_LLM_CACHE", "on")
+    cache = ResponseCache(temp_dir / "responses.db")
+    set_response_cache(cache)
+    body = "# Retries\nRetry with backoff.\n"
+
+    def run(first_chunk: str, overlap: str) -> UsageStats:
+        chunks = [Chunk(0, first_chunk, 0), Chunk(1, overlap + body, 0, overlap=overlap)]
+
+        async def go():
+            with track_usage() as usage:
+                tasks = ChunkedExtractor(FocusedKnowledgeExtractor("combined")).start(chunks, "Caching")
+                await asyncio.gather(*tasks.values())
+            return usage
+
+        return asyncio.run(go())
+
+    try:
+        assert run("# Caching\nCache hot paths.\n", "paths.\n").calls == 2
+        # Editing the end of the first chunk changes the overlap the second one starts with
+        usage = run("# Caching\nCache hot reads.\n", "reads.\n")
+    finally:
+        set_response_cache(None)
+        cache.close()
+    assert (usage.calls, usage.cached) == (1, 1)
@@ -0,0 +1,145 @@
+"""Tests for the SQLite-backed knowledge_mining and knowledge_integration stores."""
+
+import json
+
+from amplifier.knowledge_integration.knowledge_store import UnifiedKnowledgeStore
+from amplifier.knowledge_integration.models import Relationship
+from amplifier.knowledge_integration.models import UnifiedExtraction
+from amplifier.knowledge_mining.knowledge_extractor import Concept
+from amplifier.knowledge_mining.knowledge_extractor import Extraction
+from amplifier.knowledge_mining.knowledge_extractor import Relationship as ConceptLink
+from amplifier.knowledge_mining.knowledge_store import KnowledgeStore
+
+
+def count_statements(conn, action):
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        action()
+    finally:
+        conn.set_trace_callback(None)
+    return len(statements)
+
+
+def test_mining_store_merges_concepts_and_persists(temp_dir):
+    store = KnowledgeStore(temp_dir / "store.db")
+    store.add_extraction(
+        Extraction(
+            title="A",
+            source="a.md",
+            concepts=[Concept("Caching", "Keep results", "technique"), Concept("Latency", "Delay", "concept")],
+            relationships=[ConceptLink("Caching", "Latency", "reduces")],
+            key_insights=["Measure first"],
+        )
+    )
+    store.add_extraction(
+        Extraction(title="B", source="b.md", concepts=[Concept("Caching", "Avoid recomputation", "technique")])
+    )
+    store.close()
+
+    store = KnowledgeStore(temp_dir / "store.db")
+    caching = store.nodes[store.concept_index["Caching"]]
+    assert caching.sources == ["a.md", "b.md"]
+    assert caching.content["description"] == "Keep results | Avoid recomputation"
+    assert caching.connections == [store.concept_index["Latency"]]
+    assert store.is_source_processed("b.md")
+    assert [node.type for node in store.query(query_type="insight")] == ["insight"]
+    assert store.get_statistics()["concepts"] == 2
+
+    # values() loads every node in a fixed number of queries, not one per node
+    ids = list(store.nodes)
+    assert [node.id for node in store.nodes.values()] == ids
+    before = count_statements(store._conn, lambda: list(store.nodes.values()))
+    store.add_extraction(Extraction(title="C", source="c.md", key_insights=[f"Insight {i}" for i in range(10)]))
+    assert count_statements(store._conn, lambda: list(store.nodes.values())) == before
+    store.close()
+
+
+def test_mining_store_imports_legacy_json_once(temp_dir):
+    node = {
+        "id": "concept_1",
+        "type": "concept",
+        "content": {"name": "Caching", "description": "Keep results"},
+        "sources": ["a.md"],
+        "created_at": "2025-01-01T00:00:00",
+        "connections": [],
+        "metadata": {"category": "technique"},
+    }
+    legacy = {
+        "nodes": {"concept_1": node},
+        "concept_index": {"Caching": "concept_1"},
+        "processed_sources": ["a.md"],
+        "next_id": 2,
+    }
+    (temp_dir / "store.json").write_text(json.dumps(legacy))
+
+    store = KnowledgeStore(temp_dir / "store.db")
+    assert store.concept_index["Caching"] == "concept_1"
+    assert store.nodes["concept_1"].sources == ["a.md"]
+    assert store.is_source_processed("a.md")
+    assert store.next_id == 2
+    store.add_extraction(Extraction(title="B", source="b.md", concepts=[Concept("Latency", "Delay", "concept")]))
+    store.close()
+
+    # The database is authoritative once it has data
+    store = KnowledgeStore(temp_dir / "store.db")
+    assert len(store.nodes) == 2
+    assert store.concept_index["Latency"] == "concept_2"
+    store.close()
+
+
+def test_unified_store_relationships_and_nodes(temp_dir):
+    store = UnifiedKnowledgeStore(temp_dir / "graph.db", use_entity_resolution=False)
+    extraction = UnifiedExtraction(
+        title="A",
+        source="a.md",
+        concepts=[{"name": "Caching", "description": "Keep results"}],
+        relationships=[Relationship("Caching", "reduces", "Latency")],
+    )
+    summary = store.add_extraction(extraction)
+    assert summary["nodes_added"] == 1
+    assert summary["relationships_added"] == 1
+
+    relationships = store.relationships
+    assert store.relationships is relationships
+    assert [str(rel) for rel in relationships] == ["Caching --reduces--> Latency"]
+
+    # A new relationship is visible on the next access
+    store.add_extraction(
+        UnifiedExtraction(title="B", source="b.md", relationships=[Relationship("Latency", "hurts", "Users")])
+    )
+    assert len(store.relationships) == 2
+
+    latency = store.get_node_by_name("Latency")
+    assert latency is not None
+    assert latency.type == "entity"
+    assert [rel.predicate for rel in latency.relationships_as_object] == ["reduces"]
+    assert [rel.predicate for rel in latency.relationships_as_subject] == ["hurts"]
+    assert [node.name for node in store.nodes.values()] == ["Caching", "Latency", "Users"]
+    before = count_statements(store._conn, lambda: dict(store.nodes.items()))
+    store.add_extraction(
+        UnifiedExtraction(title="C", source="c.md", concepts=[{"name": f"Concept {i}"} for i in range(10)])
+    )
+    assert count_statements(store._conn, lambda: dict(store.nodes.items())) == before
+    store.close()
+
+
+def test_unified_store_imports_legacy_json(temp_dir):
+    legacy = {
+        "nodes": [
+            {"id": "node_1", "name": "Caching", "type": "concept", "definition": "Keep results", "sources": ["a.md"]},
+            {"id": "node_2", "name": "Latency", "type": "entity", "definition": "Delay", "sources": ["a.md"]},
+        ],
+        "relationships": [{"subject": "Caching", "predicate": "reduces", "object": "Latency", "confidence": 0.9}],
+        "processed_sources": ["a.md"],
+        "next_id": 3,
+    }
+    (temp_dir / "graph.json").write_text(json.dumps(legacy))
+
+    store = UnifiedKnowledgeStore(temp_dir / "graph.db", use_entity_resolution=False)
+    assert store.name_to_id["Latency"] == "node_2"
+    assert store.relationships[0].confidence == 0.9
+    assert store.get_relationships_for_node("Caching")[0].object == "Latency"
+    assert store.is_source_processed("a.md")
+    assert store.next_id == 3
+    store.close()
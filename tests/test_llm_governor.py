@@ -0,0 +1,162 @@
+"""Tests for the LLM concurrency governor and rate limiter, on a fake clock."""
+
+import asyncio
+
+import pytest
+
+from amplifier.ccsdk_toolkit.core import governor
+from amplifier.ccsdk_toolkit.core.governor import LaneConfig
+from amplifier.ccsdk_toolkit.core.governor import LLMGovernor
+from amplifier.ccsdk_toolkit.core.governor import Priority
+from amplifier.ccsdk_toolkit.core.governor import TokenBucket
+
+
+class FakeClock:
+    """Stands in for the ``time`` module inside the governor, advanced by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    # Only the governor's clock, asyncio keeps the real one
+    monkeypatch.setattr(governor, "time", fake)
+    return fake
+
+
+def lane_config(**overrides) -> LaneConfig:
+    values = {"max_concurrency": 8, "requests_per_minute": None, "tokens_per_minute": None, "cooldown": 5.0}
+    return LaneConfig(**{**values, **overrides})
+
+
+async def call(llm: LLMGovernor, fail: bool = False) -> None:
+    try:
+        async with llm.slot():
+            if fail:
+                raise TimeoutError
+    except TimeoutError:
+        pass
+
+
+def limit(llm: LLMGovernor) -> float:
+    return llm.metrics()[0].limit
+
+
+def test_limit_halves_once_per_cooldown_and_recovers_additively(clock):
+    llm = LLMGovernor(lane_config(initial_concurrency=4))
+
+    async def run():
+        await call(llm, fail=True)
+        assert limit(llm) == 2
+        # Failures inside the cooldown belong to the same congestion event
+        await call(llm, fail=True)
+        assert limit(llm) == 2
+        clock.now += 5
+        await call(llm, fail=True)
+        assert limit(llm) == 1
+        clock.now += 5
+        await call(llm, fail=True)
+        assert limit(llm) == 1  # min_concurrency
+
+        # +1 per window of successes at the current limit
+        await call(llm)
+        assert limit(llm) == 2
+        for _ in range(2):
+            await call(llm)
+        assert limit(llm) == pytest.approx(2.9)
+        for _ in range(100):
+            await call(llm)
+        assert limit(llm) == 8  # max_concurrency
+
+    asyncio.run(run())
+    assert (llm.metrics()[0].completed, llm.metrics()[0].failed) == (103, 4)
+
+
+def test_waiters_are_served_by_priority(clock):
+    llm = LLMGovernor(lane_config(initial_concurrency=1, max_concurrency=1))
+    order = []
+
+    async def worker(name: str, priority: int, started: asyncio.Event | None = None, release=None):
+        async with llm.slot(priority=priority):
+            order.append(name)
+            if started:
+                started.set()
+            if release:
+                await release.wait()
+
+    async def run():
+        started, release = asyncio.Event(), asyncio.Event()
+        holder = asyncio.create_task(worker("holder", Priority.BULK, started, release))
+        await started.wait()
+        waiters = [
+            asyncio.create_task(worker(name, priority))
+            for name, priority in [
+                ("bulk", Priority.BULK),
+                ("extraction", Priority.EXTRACTION),
+                ("classification", Priority.CLASSIFICATION),
+                ("bulk-2", Priority.BULK),
+            ]
+        ]
+        await asyncio.sleep(0)
+        assert llm.metrics()[0].queued == 4
+        release.set()
+        await asyncio.gather(holder, *waiters)
+
+    asyncio.run(run())
+    # Equal priorities keep arrival order
+    assert order == ["holder", "classification", "extraction", "bulk", "bulk-2"]
+
+
+def test_token_bucket_refills_at_the_configured_rate(clock):
+    bucket = TokenBucket(per_minute=60, burst=2)
+    assert [bucket.reserve(1) for _ in range(4)] == [0.0, 0.0, 1.0, 2.0]
+
+    # Three seconds pay back the two-token debt and refill one token
+    clock.now += 3
+    assert bucket.reserve(1) == 0.0
+    assert bucket.reserve(1) == 1.0
+
+    # Refill never exceeds the burst
+    clock.now += 60
+    assert [bucket.reserve(1) for _ in range(3)] == [0.0, 0.0, 1.0]
+
+    assert TokenBucket(per_minute=None).reserve(1000) == 0.0
+
+
+def test_rate_limited_slot_waits_for_its_reservation(clock, monkeypatch):
+    llm = LLMGovernor(lane_config(requests_per_minute=60))
+    llm._lane(None).requests = TokenBucket(per_minute=60, burst=1)
+    sleeps = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(governor.asyncio, "sleep", fake_sleep)
+
+    async def run():
+        for _ in range(3):
+            await call(llm)
+
+    asyncio.run(run())
+    assert sleeps == [1.0, 2.0]
+
+
+def test_retry_delay_respects_the_lane_cooldown(clock, monkeypatch):
+    llm = LLMGovernor(lane_config())
+    monkeypatch.setattr(governor.random, "uniform", lambda low, high: high)
+    assert [llm.retry_delay(attempt, base_delay=0.5) for attempt in range(3)] == [1.0, 2.0, 4.0]
+
+    asyncio.run(call(llm, fail=True))
+    # Retries wait out the cooldown the failure started
+    assert llm.retry_delay(0, base_delay=0.5) == 5.0
+    clock.now += 4
+    assert llm.retry_delay(0, base_delay=0.5) == 1.0
+    assert llm.retry_delay(0, base_delay=0.5, model="other") == 1.0
@@ -0,0 +1,88 @@
+"""Parity tests for the sparse-matrix and pure Python PatternFinder backends."""
+
+import random
+
+import pytest
+
+pytest.importorskip("scipy")
+
+from amplifier.knowledge_mining.knowledge_extractor import Concept  # noqa: E402
+from amplifier.knowledge_mining.knowledge_extractor import Extraction  # noqa: E402
+from amplifier.knowledge_mining.knowledge_extractor import Relationship  # noqa: E402
+from amplifier.knowledge_mining.pattern_finder import Pattern  # noqa: E402
+from amplifier.knowledge_mining.pattern_finder import PatternFinder  # noqa: E402
+from amplifier.knowledge_mining.pattern_finder import create_pattern_finder  # noqa: E402
+from amplifier.knowledge_mining.sparse_pattern_finder import SparsePatternFinder  # noqa: E402
+
+CONCEPTS = [
+    *(f"caching technique {i}" for i in range(4)),
+    *(f"retry pattern {i}" for i in range(4)),
+    *(f"Principle of locality {i}" for i in range(3)),
+    *(f"latency {i}" for i in range(9)),
+]
+
+
+def random_extractions(seed: int, count: int = 60) -> list[Extraction]:
+    rng = random.Random(seed)
+    extractions = []
+    for _ in range(count):
+        # Sources repeat and arrive out of order, so insertion order differs from source id order
+        source = f"article_{rng.randrange(25)}.md"
+        names = rng.sample(CONCEPTS, rng.randint(1, 6))
+        pairs = [rng.sample(CONCEPTS, 2) for _ in range(rng.randint(0, 6))]
+        links = [Relationship(source=a, target=b, relationship_type="relates") for a, b in pairs]
+        extractions.append(
+            Extraction(
+                title=source, source=source, concepts=[Concept(n, "", "concept") for n in names], relationships=links
+            )
+        )
+    return extractions
+
+
+def comparable(pattern: Pattern) -> tuple:
+    """Everything the base class produces in a deterministic order (it builds some lists from sets)"""
+    occurrences = pattern.occurrences
+    if pattern.pattern_type == "recurring_concept":
+        occurrences = sorted(occurrences, key=lambda o: o["source"])
+    # Cluster and principle descriptions name the first few related concepts of a set
+    set_based = pattern.pattern_type in ("concept_cluster", "principle_application")
+    description = "" if set_based else pattern.description
+    return (
+        pattern.pattern_type,
+        description,
+        pattern.strength,
+        pattern.concepts_involved[0],
+        sorted(pattern.concepts_involved[1:]),
+        occurrences,
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sparse_backend_matches_python_backend(seed):
+    python, sparse = PatternFinder(), SparsePatternFinder()
+    for extraction in random_extractions(seed):
+        python.add_extraction(extraction)
+        sparse.add_extraction(extraction)
+
+    for min_occurrences in (1, 3):
+        expected = [comparable(p) for p in python.find_patterns(min_occurrences)]
+        assert [comparable(p) for p in sparse.find_patterns(min_occurrences)] == expected
+
+    for cluster_py, cluster_sp in zip(python._find_concept_clusters(), sparse._find_concept_clusters(), strict=True):
+        assert cluster_sp.core_concept == cluster_py.core_concept
+        assert cluster_sp.shared_contexts == cluster_py.shared_contexts
+        assert sorted(cluster_sp.related_concepts) == sorted(cluster_py.related_concepts)
+
+    for concept in CONCEPTS:
+        assert sparse.find_related_concepts(concept) == python.find_related_concepts(concept)
+        expected_context = python.get_concept_context(concept)
+        context = sparse.get_concept_context(concept)
+        assert sorted(context["sources"]) == sorted(expected_context["sources"])
+        assert sorted(context["related_concepts"]) == sorted(expected_context["related_concepts"])
+        assert context["occurrence_count"] == expected_context["occurrence_count"]
+        assert context["co_occurrences"] == expected_context["co_occurrences"]
+
+
+def test_auto_backend_prefers_sparse():
+    assert isinstance(create_pattern_finder("auto"), SparsePatternFinder)
+    assert type(create_pattern_finder("python")) is PatternFinder
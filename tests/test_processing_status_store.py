@@ -0,0 +1,58 @@
+"""Tests for the SQLite-backed ProcessingStatusStore."""
+
+import json
+from datetime import UTC
+from datetime import datetime
+
+from amplifier.knowledge_synthesis.article_processor import ArticleProcessingStatus
+from amplifier.knowledge_synthesis.article_processor import ProcessingStatusStore
+from amplifier.knowledge_synthesis.article_processor import ProcessorResult
+
+
+def make_status(article_id: str, statuses: dict[str, str]) -> ArticleProcessingStatus:
+    return ArticleProcessingStatus(
+        article_id=article_id,
+        title=f"Title {article_id}",
+        last_processed=datetime(2025, 1, 1, tzinfo=UTC),
+        processor_results={
+            name: ProcessorResult(name, status, error_message="boom" if status == "failed" else None)
+            for name, status in statuses.items()
+        },
+        is_complete=all(status in ["success", "empty"] for status in statuses.values()),
+    )
+
+
+def test_legacy_json_statuses_are_imported_once(temp_dir):
+    status_dir = temp_dir / "status"
+    status_dir.mkdir()
+    legacy = make_status("old", {"concepts": "success", "insights": "failed"})
+    (status_dir / "old.json").write_text(json.dumps(legacy.to_dict()))
+
+    store = ProcessingStatusStore(status_dir)
+    loaded = store.load_status("old")
+    assert loaded is not None
+    assert loaded.processor_results["insights"].error_message == "boom"
+
+    # Later saves win over the legacy file on reopen
+    store.save_status(make_status("old", {"concepts": "success", "insights": "success"}))
+    store.close()
+    reopened = ProcessingStatusStore(status_dir).load_status("old")
+    assert reopened is not None
+    assert reopened.is_complete
+
+
+def test_queries_and_aggregates(temp_dir):
+    store = ProcessingStatusStore(temp_dir / "status")
+    store.save_status(make_status("complete", {"concepts": "success", "patterns": "empty"}))
+    store.save_status(make_status("partial", {"concepts": "success", "patterns": "failed"}))
+    store.save_status(make_status("failed", {"concepts": "failed", "patterns": "failed"}))
+
+    assert store.summary() == {"total_articles": 3, "complete": 1, "partial": 1, "failed": 1, "needs_retry": 2}
+    assert store.processor_stats() == {
+        "concepts": {"success": 2, "failed": 1},
+        "patterns": {"empty": 1, "failed": 2},
+    }
+    assert {s.article_id for s in store.get_incomplete()} == {"partial", "failed"}
+    assert {s.article_id for s in store.get_needs_retry()} == {"partial", "failed"}
+    assert [s.article_id for s in store.get_failed("concepts")] == ["failed"]
+    assert [s.article_id for s in store.get_by_state("failed")] == ["failed"]
@@ -0,0 +1,67 @@
+"""Tests for incremental window counters and heavy-hitter sketches in knowledge synthesis."""
+
+import json
+from collections import Counter
+from pathlib import Path
+
+from amplifier.knowledge_synthesis.heavy_hitters import SpaceSaving
+from amplifier.knowledge_synthesis.stream_reader import StreamReader
+from amplifier.knowledge_synthesis.stream_reader import WindowCounter
+
+
+def test_space_saving_exact_under_capacity():
+    """Below capacity the sketch is an exact counter."""
+    sketch = SpaceSaving(capacity=10)
+    items = ["a", "b", "a", "c", "a", "b"]
+    sketch.update(items)
+
+    assert sketch.most_common(2) == [("a", 3), ("b", 2)]
+    assert sketch.get("c") == 1
+    assert sketch.get("missing") == 0
+    assert sketch.total == len(items)
+
+
+def test_space_saving_keeps_heavy_hitters_within_capacity():
+    """Frequent items survive a long tail of one-off items without growing memory."""
+    sketch = SpaceSaving(capacity=20)
+    for i in range(5000):
+        sketch.add("hot")
+        sketch.add(f"rare-{i}")
+
+    assert len(sketch) == 20
+    assert sketch.most_common(1)[0][0] == "hot"
+    assert sketch.get("hot") - sketch.error("hot") <= 5000 <= sketch.get("hot")
+
+
+def test_window_counter_subtracts_evicted_batches():
+    """Counts only reflect the last `size` batches."""
+    window = WindowCounter(size=2)
+    window.push(["a", "b"])
+    window.push(["a"])
+    window.push(["c"])
+
+    assert window.counts == Counter({"a": 1, "c": 1})
+
+
+def test_stream_reader_window_matches_recount(temp_dir: Path):
+    """Incrementally maintained window statistics equal a full recount of the window."""
+    path = temp_dir / "extractions.jsonl"
+    articles = [
+        {
+            "source_id": f"article-{i}",
+            "concepts": [{"name": f"concept-{(i + j) % 7}"} for j in range(3)],
+            "relationships": [{"subject": f"concept-{i % 3}", "predicate": "uses", "object": "concept-0"}],
+        }
+        for i in range(25)
+    ]
+    path.write_text("\n".join(json.dumps(a) for a in articles) + "\n")
+
+    reader = StreamReader(path=path, window_size=5)
+    list(reader.stream_articles())
+
+    expected = Counter(c["name"] for a in articles[-5:] for c in a["concepts"])
+    context = reader.get_window_context()
+    assert context["window_size"] == 5
+    assert context["concepts"] == dict(expected.most_common(20))
+    assert context["temporal_order"] == [a["source_id"] for a in articles[-5:]]
+    assert sum(reader.recent_concepts.counts.values()) == 9
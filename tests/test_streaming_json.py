@@ -0,0 +1,92 @@
+"""Tests for the incremental JSON parser and the LLM response parsing built on it."""
+
+import json
+
+import pytest
+
+from amplifier.ccsdk_toolkit.defensive.llm_parsing import parse_llm_json
+from amplifier.ccsdk_toolkit.defensive.streaming_json import StreamingJSONParser
+from amplifier.ccsdk_toolkit.defensive.streaming_json import parse_first_json
+
+RESPONSE = """Here is the extraction you asked for [see below]:
+
+```json
+{
+  "concepts": [
+    {"name": "Caching", "description": "Keep \\"hot\\" results, e.g. {a: [1]}"},
+    {"name": "Retries", "tags": ["io", "network",],},
+  ],
+  "insights": ["Measure first", "Cache, then measure again"],
+  "count": 2
+}
+```
+
+Let me know if you need more."""
+
+EXPECTED = {
+    "concepts": [
+        {"name": "Caching", "description": 'Keep "hot" results, e.g. {a: [1]}'},
+        {"name": "Retries", "tags": ["io", "network"]},
+    ],
+    "insights": ["Measure first", "Cache, then measure again"],
+    "count": 2,
+}
+
+
+def stream(text: str, size: int) -> tuple[StreamingJSONParser, list]:
+    items = []
+    parser = StreamingJSONParser(on_item=lambda key, item: items.append((key, item)))
+    fed = []
+    for i in range(0, len(text), size):
+        fed.extend(parser.feed(text[i : i + size]))
+    assert fed == items
+    return parser, items
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(RESPONSE)])
+def test_chunk_boundaries_do_not_change_the_result(size):
+    parser, items = stream(RESPONSE, size)
+
+    assert parser.done
+    assert parser.result() == EXPECTED
+    assert parser.text() == RESPONSE
+    assert items == [("concepts", item) for item in EXPECTED["concepts"]] + [
+        ("insights", item) for item in EXPECTED["insights"]
+    ]
+
+
+def test_items_are_reported_before_the_response_ends():
+    parser, items = stream(RESPONSE[: RESPONSE.index('"insights"')], 5)
+    assert not parser.done
+    assert [item["name"] for _, item in items] == ["Caching", "Retries"]
+    with pytest.raises(ValueError):
+        parser.result()
+
+
+def test_top_level_array_and_preamble_brackets():
+    parser, items = stream('Notes: see [below]: [{"a": 1}, [2, 3], "x",]\nDone.', 4)
+    assert parser.result() == [{"a": 1}, [2, 3], "x"]
+    assert items == [(None, {"a": 1}), (None, [2, 3]), (None, "x")]
+
+
+def test_whitespace_between_tokens_is_kept():
+    with pytest.raises(ValueError):
+        parse_first_json("[1 2]")
+    assert parse_first_json('{"a" :\n [1 ,\t2 , ] }') == {"a": [1, 2]}
+    assert parse_first_json('[ "a b",  "c" ]') == ["a b", "c"]
+
+
+def test_fenced_value_wins_over_brackets_in_the_preamble():
+    response = 'As noted in [1], here it is:\n```json\n{"concepts": [{"name": "Caching"},]}\n```'
+    assert parse_first_json(response) == {"concepts": [{"name": "Caching"}]}
+    assert parse_llm_json(response) == {"concepts": [{"name": "Caching"}]}
+    assert parse_llm_json('As noted in [1], here it is:\n```\n{"a": 1}\n```') == {"a": 1}
+
+    # Without a fence the first value is the answer
+    assert parse_first_json("As noted in [1], that is all.") == [1]
+
+
+def test_parse_llm_json_falls_back_and_defaults():
+    assert parse_llm_json(json.dumps(EXPECTED)) == EXPECTED
+    assert parse_llm_json(RESPONSE) == EXPECTED
+    assert parse_llm_json("no json here", default={}) == {}
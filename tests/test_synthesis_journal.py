@@ -0,0 +1,99 @@
+"""Tests for the snapshot plus append-only journal behind idea synthesis resume."""
+
+import shutil
+from pathlib import Path
+
+from amplifier.ccsdk_toolkit.examples.idea_synthesis.journal import SynthesisJournal
+from amplifier.ccsdk_toolkit.examples.idea_synthesis.models import CrossCuttingTheme
+from amplifier.ccsdk_toolkit.examples.idea_synthesis.models import ExpandedIdea
+from amplifier.ccsdk_toolkit.examples.idea_synthesis.models import FileSummary
+from amplifier.ccsdk_toolkit.examples.idea_synthesis.models import SynthesisState
+
+
+def make_summary(path: str, point: str = "point") -> FileSummary:
+    return FileSummary(file_path=Path(path), key_points=[point], main_ideas=["idea"], important_quotes=["quote"])
+
+
+def record_session(journal: SynthesisJournal, state: SynthesisState) -> None:
+    for path in ("docs/a.md", "docs/b.md"):
+        summary = make_summary(path)
+        state.summaries.append(summary)
+        journal.record_summary(state, summary)
+    state.themes = [CrossCuttingTheme("Caching", "Keep results", ["fast"], [Path("docs/a.md")], 0.8)]
+    journal.record_themes(state)
+    idea = ExpandedIdea("Cache it", "Synthesis", state.themes, [(Path("docs/a.md"), "quote")], ["measure"])
+    state.expanded_ideas.append(idea)
+    journal.record_idea(state, idea)
+    state.current_stage = "expander"
+    journal.record_stage(state)
+
+
+def test_replay_rebuilds_the_state(temp_dir):
+    journal = SynthesisJournal(temp_dir / "state.json")
+    record_session(journal, SynthesisState(session_id="s1"))
+    assert not journal.state_file.exists()
+
+    state = SynthesisJournal(temp_dir / "state.json").load("s1")
+    assert state is not None
+    assert [s.file_path for s in state.summaries] == [Path("docs/a.md"), Path("docs/b.md")]
+    assert state.processed_files == 2
+    assert [t.theme for t in state.themes] == ["Caching"]
+    assert state.expanded_ideas[0].themes[0] is state.themes[0]
+    assert state.expanded_ideas[0].supporting_quotes == [(Path("docs/a.md"), "quote")]
+    assert state.current_stage == "expander"
+
+    assert journal.load("other") is None
+
+
+def test_replay_is_idempotent(temp_dir):
+    journal = SynthesisJournal(temp_dir / "state.json")
+    state = SynthesisState(session_id="s1")
+    record_session(journal, state)
+
+    # A crash between writing the snapshot and truncating the journal replays entries already in it
+    shutil.copy(journal.journal_file, temp_dir / "journal.bak")
+    journal.snapshot(state)
+    shutil.copy(temp_dir / "journal.bak", journal.journal_file)
+    # A re-summarized file replaces its earlier summary, a cut-off line is skipped
+    journal.record_summary(state, make_summary("docs/a.md", "revised"))
+    with open(journal.journal_file, "a", encoding="utf-8") as f:
+        f.write('{"session_id": "s1", "kind": "summ')
+
+    loaded = journal.load("s1")
+    assert loaded is not None
+    assert [(str(s.file_path), s.key_points) for s in loaded.summaries] == [
+        ("docs/a.md", ["revised"]),
+        ("docs/b.md", ["point"]),
+    ]
+    assert len(loaded.themes) == 1
+    assert len(loaded.expanded_ideas) == 1
+
+
+def test_snapshot_every_n_entries_truncates_the_journal(temp_dir):
+    journal = SynthesisJournal(temp_dir / "state.json", snapshot_every=3)
+    state = SynthesisState(session_id="s1", total_files=4)
+    for i in range(4):
+        summary = make_summary(f"docs/{i}.md")
+        state.summaries.append(summary)
+        journal.record_summary(state, summary)
+        # The third entry triggers a snapshot and starts an empty journal
+        assert journal.journal_file.exists() == (i != 2)
+
+    assert len(journal._read_entries()) == 1
+    state = journal.load("s1")
+    assert state is not None
+    assert state.total_files == 4
+    assert [s.file_path.name for s in state.summaries] == ["0.md", "1.md", "2.md", "3.md"]
+
+
+def test_resume_skips_files_by_path(temp_dir):
+    journal = SynthesisJournal(temp_dir / "state.json")
+    record_session(journal, SynthesisState(session_id="s1"))
+    # Another session's entries in the same journal are ignored
+    journal.record_summary(SynthesisState(session_id="s2"), make_summary("docs/c.md"))
+
+    state = journal.load("s1")
+    assert state is not None
+    processed = {s.file_path for s in state.summaries}
+    pending = [path for path in (Path("docs/a.md"), Path("docs/b.md"), Path("docs/c.md")) if path not in processed]
+    assert pending == [Path("docs/c.md")]
@@ -0,0 +1,116 @@
+"""Tests for chunked transcription against a local stand-in for the transcription API."""
+
+import json
+import re
+import threading
+import time
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+# The transcriber drives the real OpenAI client, and the scenario logs through amplifier's rich-based logger
+pytest.importorskip("openai")
+pytest.importorskip("rich")
+
+from scenarios.transcribe.audio_extractor import AudioChunk  # noqa: E402
+from scenarios.transcribe.audio_extractor import plan_chunks  # noqa: E402
+from scenarios.transcribe.whisper_transcriber import WhisperTranscriber  # noqa: E402
+
+
+class WhisperServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), WhisperHandler)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class WhisperHandler(BaseHTTPRequestHandler):
+    """Answers /v1/audio/transcriptions with two segments per uploaded "chunk-N" file."""
+
+    protocol_version = "HTTP/1.1"
+    server: WhisperServer
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        time.sleep(0.2)
+        with self.server.lock:
+            self.server.in_flight -= 1
+
+        match = re.search(rb"chunk-(\d+)", body)
+        assert match
+        n = int(match.group(1))
+        payload = json.dumps(
+            {
+                "text": f" Part {n}. ",
+                "language": "english",
+                "duration": 9.5,
+                "segments": [
+                    {"id": 0, "start": 0.0, "end": 4.0, "text": f"Part {n}"},
+                    {"id": 1, "start": 4.0, "end": 9.5, "text": "."},
+                ],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        """Keep request logs out of the test output."""
+
+
+@pytest.fixture
+def whisper_server(monkeypatch) -> Generator[WhisperServer, None, None]:
+    server = WhisperServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_BASE_URL", server.base_url)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_plan_chunks_cuts_in_silences_within_the_limit():
+    silences = [(280.0, 282.0), (590.0, 591.0), (800.0, 802.0)]
+    assert plan_chunks(1000.0, silences, max_seconds=300) == [
+        (0.0, 281.0),
+        (281.0, 581.0),  # No silence in the second half of the window: hard cut
+        (581.0, 801.0),
+        (801.0, 1000.0),
+    ]
+    assert plan_chunks(120.0, silences, max_seconds=300) == [(0.0, 120.0)]
+
+
+def test_chunks_are_transcribed_concurrently_and_stitched(whisper_server, temp_dir):
+    chunks = []
+    for n in range(6):
+        path = temp_dir / f"chunk_{n:03d}.mp3"
+        path.write_bytes(f"chunk-{n}".encode())
+        chunks.append(AudioChunk(path=path, start=n * 10.0, duration=10.0))
+
+    transcriber = WhisperTranscriber(api_key="test-key")
+    started = time.monotonic()
+    transcript = transcriber.transcribe_chunks(chunks, concurrency=3)
+    elapsed = time.monotonic() - started
+
+    assert whisper_server.max_in_flight == 3
+    assert elapsed < 6 * 0.2
+    assert transcript.text == "Part 0. Part 1. Part 2. Part 3. Part 4. Part 5."
+    assert transcript.language == "english"
+    assert transcript.duration == 59.5
+    assert [seg.id for seg in transcript.segments] == list(range(12))
+    assert [(seg.start, seg.end) for seg in transcript.segments[2:4]] == [(10.0, 14.0), (14.0, 19.5)]
+    assert transcript.segments[-1].text == "."
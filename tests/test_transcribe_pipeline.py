@@ -0,0 +1,196 @@
+"""Tests for the staged transcription pipeline, with stand-ins for downloads and the transcription API."""
+
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+# The scenario logs through amplifier's rich-based logger and builds the OpenAI client on startup
+pytest.importorskip("openai")
+pytest.importorskip("rich")
+
+import scenarios.transcribe.audio_extractor.core as audio_core  # noqa: E402
+import scenarios.transcribe.main as transcribe_main  # noqa: E402
+from amplifier.config.paths import paths  # noqa: E402
+from scenarios.transcribe.audio_extractor import AudioExtractor  # noqa: E402
+from scenarios.transcribe.quote_extractor import Quote  # noqa: E402
+from scenarios.transcribe.state import StateManager  # noqa: E402
+from scenarios.transcribe.storage import TranscriptStorage  # noqa: E402
+from scenarios.transcribe.summary_generator import Summary  # noqa: E402
+from scenarios.transcribe.video_loader import VideoInfo  # noqa: E402
+from scenarios.transcribe.whisper_transcriber import Transcript  # noqa: E402
+from scenarios.transcribe.whisper_transcriber.core import TranscriptSegment  # noqa: E402
+
+
+class FakeLoader:
+    def __init__(self):
+        self.calls = 0
+
+    def load(self, source):
+        self.calls += 1
+        video_id = source.rsplit("=", 1)[-1]
+        return VideoInfo(source=source, type="url", title=f"Video {video_id}", id=video_id, duration=60.0)
+
+    def download_audio(self, source, output_dir, output_filename, use_cache):
+        self.calls += 1
+        time.sleep(0.1)
+        path = output_dir / output_filename
+        path.write_bytes(b"audio")
+        return path
+
+
+class FakeTranscriber:
+    model = "whisper-test"
+
+    def __init__(self):
+        self.calls = 0
+
+    def estimate_cost(self, duration_seconds):
+        return 0.01
+
+    def transcribe(self, audio_path, prompt=None):
+        self.calls += 1
+        time.sleep(0.1)
+        segments = [TranscriptSegment(id=0, start=0.0, end=1.0, text="Hi")]
+        return Transcript(text=f"{prompt}.", language="en", duration=1.0, segments=segments)
+
+
+class ChunkedLoader(FakeLoader):
+    """Downloads differ per video, so chunks mixed up between videos show in the transcripts."""
+
+    def download_audio(self, source, output_dir, output_filename, use_cache):
+        path = super().download_audio(source, output_dir, output_filename, use_cache)
+        path.write_text(f"audio of {source}")
+        return path
+
+
+class ChunkTranscriber(FakeTranscriber):
+    def transcribe_chunks(self, chunks, prompt=None, concurrency=4):
+        self.calls += 1
+        time.sleep(0.1)
+        segments = [
+            TranscriptSegment(id=n, start=chunk.start, end=chunk.start + chunk.duration, text=chunk.path.read_text())
+            for n, chunk in enumerate(chunks)
+        ]
+        text = " ".join(seg.text for seg in segments)
+        return Transcript(text=text, language="en", duration=segments[-1].end, segments=segments)
+
+
+def fake_ffmpeg_cut(cmd, **kwargs):
+    """Writes each chunk as the text of its source plus its start offset."""
+    source = Path(cmd[cmd.index("-i") + 1])
+    Path(cmd[-1]).write_text(f"{source.read_text()} from {cmd[cmd.index('-ss') + 1]}")
+    return subprocess.CompletedProcess(cmd, 0)
+
+
+class FakeEnhancer:
+    model = "claude-test"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, transcript_text, title):
+        self.calls += 1
+        return Summary(overview=f"About {title}", key_points=["Point"], themes=["Theme"])
+
+    def extract(self, transcript, video_url, video_id):
+        self.calls += 1
+        return [Quote(text="Hi", timestamp=0.5, timestamp_link=f"{video_url}&t=0s", context="Greeting")]
+
+
+@pytest.fixture
+def make_pipeline(temp_dir, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(paths, "_data_dir", temp_dir / "data")
+    monkeypatch.setattr(transcribe_main, "TranscriptStorage", lambda: TranscriptStorage(output_dir=temp_dir / "out"))
+
+    def make(**options):
+        state = StateManager(temp_dir / "session")
+        # compress: small audio goes to the transcriber as is, no ffmpeg needed
+        options.setdefault("compress", True)
+        options.setdefault("cache_dir", temp_dir / "cache")
+        pipeline = transcribe_main.TranscriptionPipeline(state, enhance=False, **options)
+        monkeypatch.setattr(pipeline, "video_loader", FakeLoader())
+        monkeypatch.setattr(pipeline, "transcriber", FakeTranscriber())
+        return pipeline
+
+    return make
+
+
+def test_stages_overlap_across_videos(make_pipeline, temp_dir):
+    pipeline = make_pipeline(download_workers=2, transcribe_workers=2)
+    sources = [f"video{n}" for n in range(6)]
+
+    started = time.monotonic()
+    assert pipeline.run(sources)
+    elapsed = time.monotonic() - started
+
+    # In sequence: 6 x (0.1s download + 0.1s transcription)
+    assert elapsed < 0.9
+    assert {result.source for result in pipeline.state.state.processed_videos} == set(sources)
+    assert pipeline.state.state.progress == {}
+    assert all((temp_dir / "out" / source / "transcript.md").exists() for source in sources)
+
+
+def test_long_videos_transcribed_at_once_keep_their_own_chunks(make_pipeline, monkeypatch):
+    # Every download is saved as audio.mp3; each 1500s recording is cut into three 600s-or-less chunks
+    monkeypatch.setattr(AudioExtractor, "probe_duration", lambda self, audio_path: 1500.0)
+    monkeypatch.setattr(AudioExtractor, "detect_silences", lambda self, audio_path, *args: [])
+    monkeypatch.setattr(audio_core.subprocess, "run", fake_ffmpeg_cut)
+    pipeline = make_pipeline(compress=False, cache_dir=None, download_workers=2, transcribe_workers=2)
+    monkeypatch.setattr(pipeline, "video_loader", ChunkedLoader())
+    monkeypatch.setattr(pipeline, "transcriber", ChunkTranscriber())
+
+    assert pipeline.run(["video0", "video1"])
+
+    assert pipeline.transcriber.calls == 2
+    for source in ("video0", "video1"):
+        transcript = pipeline.storage.load_transcript(source)
+        assert transcript is not None
+        assert transcript.text == " ".join(
+            f"audio of {source} from {start}" for start in ("0.000", "600.000", "1200.000")
+        )
+    assert not list(pipeline.audio_extractor.temp_dir.glob("*_chunks_*"))
+
+
+def test_resume_picks_up_after_the_last_completed_stage(make_pipeline):
+    first = make_pipeline(cache_dir=None)
+    first.state.state.sources = ["downloaded", "transcribed"]
+    first.state.state.total_videos = 2
+    first._prepare("downloaded")
+    first._transcribe(first._prepare("transcribed"))
+    assert {source: entry["stage"] for source, entry in first.state.state.progress.items()} == {
+        "downloaded": "downloaded",
+        "transcribed": "transcribed",
+    }
+
+    # Interrupted here; the resumed run neither downloads again nor re-transcribes
+    resumed = make_pipeline(cache_dir=None)
+    assert resumed.run([], resume=True)
+    assert resumed.video_loader.calls == 0
+    assert resumed.transcriber.calls == 1
+    assert {result.source for result in resumed.state.state.processed_videos} == {"downloaded", "transcribed"}
+    assert resumed.state.state.progress == {}
+
+
+def test_same_audio_under_another_source_reuses_cached_results(make_pipeline):
+    pipeline = make_pipeline(download_workers=1, transcribe_workers=1)
+    pipeline.enhance = True
+    pipeline.summary_generator = FakeEnhancer()
+    pipeline.quote_extractor = FakeEnhancer()
+
+    # Both downloads produce the same bytes
+    assert pipeline.run(["https://youtube.com/watch?v=a"])
+    assert pipeline.run(["https://youtube.com/watch?v=b"])
+
+    assert pipeline.transcriber.calls == 1
+    assert pipeline.summary_generator.calls == 1
+    assert pipeline.quote_extractor.calls == 1
+    assert pipeline.state.state.cache_hits == {"transcripts": 1, "summaries": 1, "quote sets": 1}
+    assert pipeline.state.state.cost_avoided == pytest.approx(0.01)
+
+    # The cached transcript was saved for the second video, with quote links pointing at it
+    transcript = pipeline.storage.load_transcript("b")
+    assert transcript is not None and transcript.segments[0].text == "Hi"
+    assert "watch?v=b&t=0s" in (pipeline.storage.output_dir / "b" / "insights.md").read_text()
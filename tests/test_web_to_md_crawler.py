@@ -0,0 +1,214 @@
+"""Tests for the web_to_md crawl engine against a local HTTP server."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+import pytest
+
+from scenarios.web_to_md.crawler import CrawlConfig
+from scenarios.web_to_md.crawler import Crawler
+from scenarios.web_to_md.http_cache import HttpCache
+from scenarios.web_to_md.image_store import ImageStore
+
+
+class SiteServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SiteHandler)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.paths: list[str] = []
+        self.starts: list[float] = []
+        self.connections: set[tuple[str, int]] = set()
+        self.not_modified = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    server: SiteServer
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.paths.append(self.path)
+            server.starts.append(time.monotonic())
+            server.connections.add(self.client_address)
+        time.sleep(0.02)
+
+        if self.path.startswith("/page/"):
+            n = self.path.rsplit("/", 1)[1]
+            body = f'<html><body><h1>Page {n}</h1><img src="/img/logo.png"><img src="/img/{n}.png"></body></html>'
+            payload, content_type = body.encode(), "text/html"
+        else:
+            payload, content_type = b"\x89PNG fake", "image/png"
+
+        etag = f'"{len(payload)}"'
+        with server.lock:
+            server.in_flight -= 1
+            if self.headers.get("If-None-Match") == etag:
+                server.not_modified += 1
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        """Keep request logs out of the test output."""
+
+
+@pytest.fixture
+def site() -> Generator[SiteServer, None, None]:
+    server = SiteServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+async def crawl(
+    site: SiteServer,
+    config: CrawlConfig,
+    pages: int,
+    output_dir: Path,
+    cache: HttpCache | None = None,
+    image_store: ImageStore | None = None,
+) -> list[list[tuple[str, Path]]]:
+    async with Crawler(config, cache=cache, image_store=image_store) as crawler:
+
+        async def page(n: int) -> list[tuple[str, Path]]:
+            html, metadata = await crawler.fetch_page(f"{site.base_url}/page/{n}")
+            assert metadata["status_code"] == 200
+            assert f"Page {n}" in html
+            assert metadata.get("not_modified", False) == (site.not_modified > 0)
+            return await crawler.process_images(html, metadata["url"], output_dir)
+
+        return await asyncio.gather(*(page(n) for n in range(pages)))
+
+
+def test_per_host_limit_keep_alive_and_shared_images(site, temp_dir):
+    config = CrawlConfig(per_host_connections=2, host_interval=0)
+    results = asyncio.run(crawl(site, config, pages=10, output_dir=temp_dir))
+
+    assert site.max_in_flight <= 2
+    # 10 pages + 10 page images + 1 shared logo, over at most 2 kept-alive connections
+    assert len(site.paths) == 21
+    assert site.paths.count("/img/logo.png") == 1
+    assert len(site.connections) <= 2
+
+    for n, images in enumerate(results):
+        assert [url.rsplit("/", 1)[1] for url, _ in images] == ["logo.png", f"{n}.png"]
+        assert all(path.read_bytes() == b"\x89PNG fake" for _, path in images)
+
+
+def test_polite_interval_between_requests_to_a_host(site, temp_dir):
+    config = CrawlConfig(per_host_connections=4, host_interval=0.05)
+    asyncio.run(crawl(site, config, pages=3, output_dir=temp_dir))
+
+    starts = sorted(site.starts)
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:], strict=False)]
+    assert min(gaps) >= 0.04
+
+
+def test_busy_host_does_not_starve_other_hosts(temp_dir):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, content=b"\x89PNG fake", headers={"Content-Type": "image/png"})
+
+    config = CrawlConfig(max_connections=2, per_host_connections=1, host_interval=0)
+
+    async def run() -> float:
+        async with Crawler(config, transport=httpx.MockTransport(handler)) as crawler:
+            # Ten images one at a time from the busy host take 0.5s
+            busy = asyncio.ensure_future(
+                crawler.download_images([f"http://busy.test/{n}.png" for n in range(10)], temp_dir / "busy")
+            )
+            await asyncio.sleep(0.01)
+            started = time.monotonic()
+            assert await crawler.download_images(["http://other.test/a.png"], temp_dir / "other")
+            elapsed = time.monotonic() - started
+            assert len(await busy) == 10
+            return elapsed
+
+    assert asyncio.run(run()) < 0.2
+
+
+def test_conditional_get_answers_unchanged_responses_from_cache(site, temp_dir):
+    cache = HttpCache(temp_dir / "cache.db")
+    config = CrawlConfig(host_interval=0)
+    first = asyncio.run(crawl(site, config, pages=3, output_dir=temp_dir / "out", cache=cache))
+    assert cache.stats()["cache_misses"] == 7
+    assert cache.stats()["cache_entries"] == 7
+
+    # The second crawl is conditional: every response is a 304 with no body
+    site.not_modified = 1
+    second = asyncio.run(crawl(site, config, pages=3, output_dir=temp_dir / "out", cache=cache))
+    assert second == first
+    assert site.not_modified == 1 + 7
+    assert cache.stats()["cache_hits"] == 7
+
+
+def test_image_store_keeps_identical_images_once_and_skips_known_urls(site, temp_dir):
+    store = ImageStore(temp_dir / "_images")
+    cache = HttpCache(temp_dir / "cache.db")
+    config = CrawlConfig(host_interval=0)
+    first = asyncio.run(crawl(site, config, pages=3, output_dir=temp_dir / "out", cache=cache, image_store=store))
+    # Only the pages go into the HTTP cache, the store holds the images
+    assert cache.stats()["cache_entries"] == 3
+
+    # Every image URL serves the same bytes: 4 downloads, 1 blob
+    stats = store.stats()
+    assert stats["image_downloads"] == 4
+    assert stats["image_duplicates"] == 3
+    assert stats["image_blobs"] == 1
+    assert {path for images in first for _, path in images} == set(store.root.glob("*.png"))
+    assert not (temp_dir / "out").exists()
+
+    # A later crawl finds every image URL in the index and requests pages only
+    site.paths.clear()
+    second = asyncio.run(crawl(site, config, pages=3, output_dir=temp_dir / "out", cache=cache, image_store=store))
+    assert second == first
+    assert all(path.startswith("/page/") for path in site.paths)
+    assert store.stats()["image_index_hits"] == 4
+
+    placed = ImageStore(store.root, hardlink=True).place(first[0][0][1], temp_dir / "page")
+    assert placed == temp_dir / "page" / "images" / first[0][0][1].name
+    assert placed.read_bytes() == b"\x89PNG fake"
+
+
+def test_cache_evicts_least_recently_used(temp_dir):
+    cache = HttpCache(temp_dir / "cache.db", max_bytes=100)
+    for n in range(3):
+        cache.put(f"http://x/{n}", f"http://x/{n}", "text/html", b"x" * 30, etag=f'"{n}"', last_modified=None)
+        time.sleep(0.01)
+    cache.touch("http://x/0")
+    cache.put("http://x/3", "http://x/3", "text/html", b"x" * 30, etag='"3"', last_modified=None)
+
+    assert cache.stats()["cache_bytes"] == 90
+    assert cache.get("http://x/0") is not None
+    assert cache.get("http://x/1") is None
+    assert cache.get("http://x/3") is not None
+    # Nothing to revalidate with, so not stored
+    assert not cache.put("http://x/5", "http://x/5", "text/html", b"x", etag=None, last_modified=None)
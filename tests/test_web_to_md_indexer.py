@@ -0,0 +1,33 @@
+"""Tests for incremental web_to_md index generation."""
+
+from scenarios.web_to_md.indexer import core as indexer
+
+
+def write_page(path, title):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\ntitle: {title}\nurl: https://{path.parent.name}/{path.stem}\n---\n\nBody\n")
+
+
+def test_index_reparses_only_new_or_changed_pages(temp_dir, monkeypatch):
+    for n in range(3):
+        write_page(temp_dir / "example.com" / f"page{n}.md", f"Page {n}")
+    first = indexer.generate_index(temp_dir)
+    assert "[Page 2](example.com/page2.md) - [Original](https://example.com/page2)" in first
+
+    parsed = []
+    extract = indexer.extract_frontmatter
+    monkeypatch.setattr(indexer, "extract_frontmatter", lambda path: parsed.append(path.name) or extract(path))
+
+    write_page(temp_dir / "example.com" / "page1.md", "Page one, revised")
+    write_page(temp_dir / "other.org" / "new.md", "New")
+    (temp_dir / "example.com" / "page2.md").unlink()
+    second = indexer.generate_index(temp_dir)
+
+    assert sorted(parsed) == ["new.md", "page1.md"]
+    assert "[Page one, revised](example.com/page1.md)" in second
+    assert "page2.md" not in second
+    assert "- Total pages: 3" in second
+
+    parsed.clear()
+    assert indexer.generate_index(temp_dir).split("\n")[3:] == second.split("\n")[3:]
+    assert parsed == []
@@ -0,0 +1,68 @@
+"""Tests for the web_to_md parse-once page pipeline."""
+
+from scenarios.web_to_md.converter import page_to_markdown
+from scenarios.web_to_md.image_handler import page_images
+from scenarios.web_to_md.image_handler import rewrite_image_refs
+from scenarios.web_to_md.page import Page
+from scenarios.web_to_md.validator import validate_page
+
+HTML = """<html><head><title>T</title><script>var x = 1;</script></head><body>
+<h1>Notes</h1>
+<p>Plenty of words here to make the content long enough for the validator to accept it as a real page.</p>
+<p><img src="img/a.png" alt="a"> <img src="https://cdn.example.com/b.png" alt="b"> <img src="img/a.png"></p>
+<p>See https://cdn.example.com/b.png for the original, or <a href="img/a.png">the file</a>.</p>
+</body></html>"""
+
+
+def test_one_tree_feeds_images_markdown_and_validation():
+    page = Page(url="https://example.com/post/", html=HTML)
+
+    images = page_images(page)
+    assert images == {
+        "https://example.com/post/img/a.png": ["img/a.png"],
+        "https://cdn.example.com/b.png": ["https://cdn.example.com/b.png"],
+    }
+
+    markdown = page_to_markdown(page)
+    assert "# Notes" in markdown
+    assert "var x" not in markdown
+    assert validate_page(page, markdown).is_valid
+
+    replacements = {
+        "https://example.com/post/img/a.png": "images/img_1.png",
+        "img/a.png": "images/img_1.png",
+        "https://cdn.example.com/b.png": "images/img_2.png",
+    }
+    rewritten = rewrite_image_refs(markdown, replacements)
+    assert "![a](images/img_1.png)" in rewritten
+    assert "![b](images/img_2.png)" in rewritten
+    # Only link targets change, not URLs mentioned in text
+    assert "See https://cdn.example.com/b.png" in rewritten
+
+
+def test_image_urls_with_parentheses_are_rewritten_whole():
+    replacements = {
+        "https://upload.wikimedia.org/File_(a).png": "images/img_1.png",
+        "https://upload.wikimedia.org/File_(a).png?width=2": "images/img_2.png",
+    }
+    markdown = (
+        "![a](https://upload.wikimedia.org/File_(a).png) "
+        '![b](https://upload.wikimedia.org/File_(a).png?width=2 "Wide") '
+        "[other](https://upload.wikimedia.org/File_(a).pngx)"
+    )
+    assert rewrite_image_refs(markdown, replacements) == (
+        '![a](images/img_1.png) ![b](images/img_2.png "Wide") [other](https://upload.wikimedia.org/File_(a).pngx)'
+    )
+
+
+def test_paywall_patterns_and_auth_classes():
+    paywalled = Page(url="https://example.com/", html=HTML.replace("Plenty", "Member-only story. Plenty"))
+    result = validate_page(paywalled, page_to_markdown(paywalled))
+    assert not result.is_valid
+    assert result.detected_pattern == "member-only story"
+
+    walled = HTML.replace(
+        "<h1>", '<div class="login"></div><div class=\'signin\'></div><div class="paywall"></div><h1>'
+    )
+    page = Page(url="https://example.com/", html=walled)
+    assert validate_page(page, page_to_markdown(page)).detected_pattern == "auth_forms"